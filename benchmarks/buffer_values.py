@@ -0,0 +1,61 @@
+"""Measures the Python-level memory used to prepare multi-megabyte buffer values for sending.
+
+Values held in a bytearray, memoryview or other buffer are prepared the way the client does
+for a `set`, once as a caller that first copies the buffer into bytes would, and once passing
+the buffer directly. The peak traced allocation is reported relative to the value size. Since
+protobuf messages only accept bytes, an uncompressed buffer is still copied once; with
+compression enabled the compressor reads the buffer directly. No server is needed; nothing is sent.
+
+    python benchmarks/buffer_values.py --size-mb 16
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tracemalloc
+from functools import partial
+from typing import Callable, Optional, Union
+
+from momento.config import CompressionConfiguration
+from momento.internal._utilities import _as_bytes
+from momento.internal._utilities._compression import _Compressor
+from momento.internal._utilities._data_validation import _as_buffer
+
+
+def _prepare(value: Union[bytes, bytearray, memoryview], compressor: Optional[_Compressor]) -> bytes:
+    # Mirrors how the data client builds the value it sends.
+    if compressor is None:
+        return _as_bytes(value)
+    return compressor.compress(_as_buffer(value))
+
+
+def _prepare_copy(value: bytearray, compressor: Optional[_Compressor]) -> bytes:
+    return _prepare(bytes(value), compressor)
+
+
+def _peak_bytes(prepare: Callable[[], bytes]) -> int:
+    tracemalloc.start()
+    try:
+        prepare()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(size_mb: int) -> None:
+    size = size_mb * 1024 * 1024
+    # Half random, half repetitive, so compression keeps some of the value's size.
+    buffer = bytearray(os.urandom(size // 2) + b"momento" * (size // 14) + b"\0" * (size - size // 2 - size // 14 * 7))
+    compressor = _Compressor(CompressionConfiguration(level=1))
+    print(f"{size_mb} MB value; peak traced allocation while preparing it")
+    for name, active_compressor in (("uncompressed", None), ("compressed", compressor)):
+        copied = _peak_bytes(partial(_prepare_copy, buffer, active_compressor))
+        direct = _peak_bytes(partial(_prepare, buffer, active_compressor))
+        print(f"{name:<14} bytes(buffer): {copied / size:5.2f}x   buffer: {direct / size:5.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=16)
+    args = parser.parse_args()
+    main(args.size_mb)
@@ -0,0 +1,75 @@
+"""Measures the CPU cost of value compression against the bytes it saves.
+
+Each available algorithm compresses and decompresses representative payloads: an HTML
+fragment, a JSON document and incompressible random bytes, which are sent unchanged.
+Zstandard and LZ4 are only measured when the `zstandard` and `lz4` packages are installed.
+No server is needed; nothing is sent.
+
+    python benchmarks/compression.py --iterations 200
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import timeit
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+
+from momento.config import CompressionAlgorithm, CompressionConfiguration
+from momento.internal._utilities._compression import _Compressor
+
+_HTML_FRAGMENT = "".join(
+    f"<li class='product' data-id='{i}'><a href='/products/{i}'>Product {i}</a><span>${i * 3}.99</span></li>\n"
+    for i in range(600)
+).encode("utf-8")
+_JSON_DOCUMENT = json.dumps(
+    [{"id": i, "name": f"user-{i}", "email": f"user-{i}@example.com", "roles": ["reader"]} for i in range(2500)]
+).encode("utf-8")
+_PAYLOADS: Dict[str, bytes] = {
+    "html fragment": _HTML_FRAGMENT,
+    "json document": _JSON_DOCUMENT,
+    "random bytes": os.urandom(100_000),
+}
+
+
+def _settings() -> List[Tuple[str, CompressionAlgorithm, Optional[int]]]:
+    settings: List[Tuple[str, CompressionAlgorithm, Optional[int]]] = [
+        ("zlib level 1", CompressionAlgorithm.ZLIB, 1),
+        ("zlib level 6", CompressionAlgorithm.ZLIB, 6),
+        ("zlib level 9", CompressionAlgorithm.ZLIB, 9),
+    ]
+    if importlib.util.find_spec("zstandard") is not None:
+        settings.append(("zstd level 3", CompressionAlgorithm.ZSTD, 3))
+    else:
+        print("zstandard is not installed; skipping zstd")
+    if importlib.util.find_spec("lz4") is not None:
+        settings.append(("lz4", CompressionAlgorithm.LZ4, None))
+    else:
+        print("lz4 is not installed; skipping lz4")
+    return settings
+
+
+def main(iterations: int) -> None:
+    settings = _settings()
+    print(f"{'':<30} {'compress':>14} {'decompress':>16} {'size':>18}")
+    for payload_name, payload in _PAYLOADS.items():
+        for setting_name, algorithm, level in settings:
+            compressor = _Compressor(CompressionConfiguration(algorithm, threshold_bytes=1, level=level))
+            compressed = compressor.compress(payload)
+            compress_seconds = timeit.timeit(partial(compressor.compress, payload), number=iterations)
+            decompress_seconds = timeit.timeit(partial(compressor.decompress, compressed), number=iterations)
+            print(
+                f"{payload_name + ', ' + setting_name:<30} "
+                f"{compress_seconds / iterations * 1e6:8.1f} us/op "
+                f"{decompress_seconds / iterations * 1e6:10.1f} us/op "
+                f"{len(payload):7d} -> {len(compressed):7d} bytes"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.iterations)
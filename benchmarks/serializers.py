@@ -0,0 +1,71 @@
+"""Compares the throughput of the built-in serializers used by the `*_object` methods.
+
+Each serializer round-trips a few representative payloads: a small flat record, a nested
+document and a list of records. MessagePack is only measured when the `msgpack` package is
+installed. No server is needed; nothing is sent.
+
+    python benchmarks/serializers.py --iterations 100000
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, List
+
+from momento.serialization import JsonSerializer, MsgpackSerializer, PickleSerializer, Serializer
+
+
+@dataclass
+class _Order:
+    order_id: int
+    customer: str
+    total: float
+    items: List[str] = field(default_factory=list)
+
+
+_PAYLOADS: Dict[str, object] = {
+    "flat record": {"id": 12345, "name": "momento", "active": True, "score": 98.6},
+    "nested document": {
+        "user": {"id": 1, "name": "ada", "roles": ["admin", "dev"]},
+        "settings": {"theme": "dark", "notifications": {"email": True, "sms": False}},
+        "history": [{"ts": 1_700_000_000 + i, "event": "login"} for i in range(10)],
+    },
+    "100 dataclasses": [_Order(i, f"customer-{i}", i * 1.5, ["a", "b", "c"]) for i in range(100)],
+}
+
+
+def _serializers() -> Dict[str, Serializer]:
+    serializers: Dict[str, Serializer] = {"json": JsonSerializer(), "pickle": PickleSerializer()}
+    try:
+        serializers["msgpack"] = MsgpackSerializer()
+    except ImportError:
+        print("msgpack is not installed; skipping MsgpackSerializer")
+    return serializers
+
+
+def _round_trip(serializer: Serializer, payload: object) -> object:
+    return serializer.deserialize(serializer.serialize(payload))
+
+
+def _report(label: str, seconds: float, iterations: int, size: int) -> None:
+    print(f"{label:<32} {seconds / iterations * 1e6:8.2f} us/round trip {size:8d} bytes")
+
+
+def main(iterations: int) -> None:
+    serializers = _serializers()
+    for payload_name, payload in _PAYLOADS.items():
+        for serializer_name, serializer in serializers.items():
+            data = serializer.serialize(payload)
+            # Dataclasses are read back as dicts by the JSON and MessagePack serializers;
+            # deserializing is measured either way.
+            seconds = timeit.timeit(partial(_round_trip, serializer, payload), number=iterations)
+            _report(f"{payload_name}, {serializer_name}", seconds, iterations, len(data))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+    main(args.iterations)
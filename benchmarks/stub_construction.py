@@ -0,0 +1,42 @@
+"""Measures the per-request cost of getting a gRPC stub from the aio data manager.
+
+A stub holds one multicallable per RPC in the service, so building one for every
+request (as the data client used to) is far more expensive than reusing a stub
+built when the channel is created. No server is needed; nothing is sent.
+
+    python benchmarks/stub_construction.py --iterations 100000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import timeit
+
+from momento import Configurations, CredentialProvider
+from momento.internal.aio._scs_grpc_manager import _DataGrpcManager
+from momento_wire_types import cacheclient_pb2_grpc as cache_client
+
+
+def _report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<28} {seconds / iterations * 1e6:8.3f} us/call")
+
+
+async def main(iterations: int) -> None:
+    manager = _DataGrpcManager(Configurations.Laptop.latest(), CredentialProvider.for_momento_local())
+    channel = manager._channels[0]
+    try:
+        per_call = timeit.timeit(lambda: cache_client.ScsStub(channel), number=iterations)
+        cached = timeit.timeit(manager.async_stub, number=iterations)
+    finally:
+        await manager.close()
+
+    _report("new ScsStub per request", per_call, iterations)
+    _report("cached stub", cached, iterations)
+    print(f"speedup: {per_call / cached:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,57 @@
+"""Measures the request logging overhead the data client adds to each get/set while TRACE is disabled.
+
+Every data client operation logs once when issuing the request and once when the response
+arrives. This compares the previous implementation, which built the arguments and the
+message eagerly, with the current one, which formats nothing unless TRACE is enabled.
+No server is needed; nothing is sent.
+
+    python benchmarks/trace_logging.py --iterations 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import timeit
+from datetime import timedelta
+
+from momento import Configurations, CredentialProvider, logs
+from momento.internal.synchronous._scs_data_client import _ScsDataClient
+
+
+def _report(label: str, seconds: float, iterations: int) -> None:
+    print(f"{label:<24} {seconds / iterations * 1e9:8.1f} ns/operation")
+
+
+def main(iterations: int) -> None:
+    logs.logger.setLevel(logging.INFO)
+    client = _ScsDataClient(Configurations.Laptop.latest(), CredentialProvider.for_momento_local(), timedelta(60))
+    logger = logs.logger
+    key = b"a-cache-key"
+
+    def eager() -> None:
+        # What each operation used to do, whatever the log level.
+        request_args = {"key": str(key)}
+        logger.log(logs.TRACE, f"Issuing a Get request with {request_args}")
+        request_args = {"key": str(key)}
+        logger.log(logs.TRACE, f"Received a Get response for {request_args}")
+
+    def lazy() -> None:
+        client._log_issuing_request("Get", key=key)
+        client._log_received_response("Get", key=key)
+
+    try:
+        eager_seconds = timeit.timeit(eager, number=iterations)
+        lazy_seconds = timeit.timeit(lazy, number=iterations)
+    finally:
+        client.close()
+
+    _report("eager formatting", eager_seconds, iterations)
+    _report("lazy, level-checked", lazy_seconds, iterations)
+    print(f"speedup: {eager_seconds / lazy_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=1_000_000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,62 @@
+"""Compares the traffic of extending an item's TTL with `update_ttl` vs. `get` followed by `set`.
+
+For each value size the request and response messages of both approaches are built the way the
+client builds them, and their serialized sizes are added up, including the 5-byte gRPC message
+prefix. HTTP/2 headers and metadata, which are about the same for every request, are left out.
+The time to build and serialize the messages is reported as well. No server is needed; nothing is sent.
+
+    python benchmarks/ttl_extension.py --sizes-kb 1 16 256
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from datetime import timedelta
+from functools import partial
+from typing import List
+
+from momento.internal._utilities import _timedelta_to_ms
+from momento_wire_types import cacheclient_pb2 as cache_pb
+
+_GRPC_MESSAGE_PREFIX = 5
+_KEY = b"session:6f1c2e9a"
+_TTL = timedelta(minutes=30)
+
+
+def _get_and_set(value: bytes) -> List[bytes]:
+    get_request = cache_pb._GetRequest(cache_key=_KEY)
+    get_response = cache_pb._GetResponse(result=cache_pb.Hit, cache_body=value)
+    set_request = cache_pb._SetRequest(cache_key=_KEY, cache_body=value, ttl_milliseconds=_timedelta_to_ms(_TTL))
+    set_response = cache_pb._SetResponse()
+    return [message.SerializeToString() for message in (get_request, get_response, set_request, set_response)]
+
+
+def _update_ttl(value: bytes) -> List[bytes]:
+    request = cache_pb._UpdateTtlRequest(cache_key=_KEY, overwrite_to_milliseconds=_timedelta_to_ms(_TTL))
+    response = cache_pb._UpdateTtlResponse(set=cache_pb._UpdateTtlResponse._Set())
+    return [message.SerializeToString() for message in (request, response)]
+
+
+def _wire_bytes(messages: List[bytes]) -> int:
+    return sum(_GRPC_MESSAGE_PREFIX + len(message) for message in messages)
+
+
+def main(sizes_kb: List[int], number: int) -> None:
+    print(f"{'value':>8} {'get+set bytes':>14} {'update_ttl bytes':>17} {'get+set us':>11} {'update_ttl us':>14}")
+    for size_kb in sizes_kb:
+        value = b"v" * (size_kb * 1024)
+        get_and_set_seconds = timeit.timeit(partial(_get_and_set, value), number=number) / number
+        update_ttl_seconds = timeit.timeit(partial(_update_ttl, value), number=number) / number
+        print(
+            f"{size_kb:>6}KB {_wire_bytes(_get_and_set(value)):>14} {_wire_bytes(_update_ttl(value)):>17}"
+            f" {get_and_set_seconds * 1e6:>11.1f} {update_ttl_seconds * 1e6:>14.1f}"
+        )
+    print("get+set takes two round trips per extension; update_ttl takes one.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes-kb", type=int, nargs="+", default=[1, 16, 256])
+    parser.add_argument("--number", type=int, default=1000)
+    args = parser.parse_args()
+    main(args.sizes_kb, args.number)
@@ -1,6 +1,8 @@
 """Momento client library.
 
 Instantiate a client with `CacheClient` or `CacheClientAsync` (for asyncio).
+Wrap a `CacheClientAsync` in an `AutoBatcher` to combine single-element collection writes.
+Use `CounterAggregator` or `CounterAggregatorAsync` to sum frequent increments before writing them.
 Use `CredentialProvider` to read credentials for the client.
 Use `Configurations` for pre-built network configurations.
 """
@@ -12,9 +14,13 @@ from momento import logs
 from .auth import CredentialProvider
 from .auth_client import AuthClient
 from .auth_client_async import AuthClientAsync
+from .auto_batcher import AutoBatcher
 from .cache_client import CacheClient
 from .cache_client_async import CacheClientAsync
 from .config import Configurations, TopicConfigurations
+from .counter_aggregation import CounterAggregatorStats, CounterDeliveryPolicy
+from .counter_aggregator import CounterAggregator
+from .counter_aggregator_async import CounterAggregatorAsync
 from .topic_client import TopicClient
 from .topic_client_async import TopicClientAsync
 
@@ -29,6 +35,11 @@ __all__ = [
     "TopicConfigurations",
     "CacheClient",
     "CacheClientAsync",
+    "AutoBatcher",
+    "CounterAggregator",
+    "CounterAggregatorAsync",
+    "CounterAggregatorStats",
+    "CounterDeliveryPolicy",
     "TopicClient",
     "TopicClientAsync",
     "AuthClient",
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import asyncio
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from types import TracebackType
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, cast
+
+from momento import logs
+from momento.cache_client_async import CacheClientAsync
+from momento.errors import SdkException, UnknownException, convert_error
+from momento.internal._utilities import _as_bytes, _validate_positive_int, _validate_timedelta_ttl
+from momento.internal._utilities._data_validation import _validate_sorted_set_score
+from momento.internal.services import Service
+from momento.requests import CollectionTtl
+from momento.responses import (
+    CacheDictionarySetField,
+    CacheDictionarySetFieldResponse,
+    CacheDictionarySetFields,
+    CacheListConcatenateBack,
+    CacheListPushBack,
+    CacheListPushBackResponse,
+    CacheSetAddElement,
+    CacheSetAddElementResponse,
+    CacheSetAddElements,
+    CacheSortedSetPutElement,
+    CacheSortedSetPutElementResponse,
+    CacheSortedSetPutElements,
+)
+from momento.responses.response import CacheResponse
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
+
+# The operation, cache name, collection name, TTL and refresh flag, and list truncation size of a batch.
+_BatchKey = Tuple[str, str, str, Optional[timedelta], bool, Optional[int]]
+
+
+class _Batch(ABC):
+    """The elements buffered for one collection and the callers waiting for them to be written."""
+
+    def __init__(self, cache_name: str, collection_name: str, ttl: CollectionTtl):
+        self.cache_name = cache_name
+        self.collection_name = collection_name
+        self.ttl = ttl
+        self.size = 0
+        self.waiters: List[asyncio.Future[CacheResponse]] = []
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+    @abstractmethod
+    async def send(self, client: CacheClientAsync) -> CacheResponse:
+        """Writes the buffered elements with a single request."""
+
+    @abstractmethod
+    def error(self, exception: SdkException) -> CacheResponse:
+        """Returns the error response of the request made by `send`."""
+
+
+class _SortedSetBatch(_Batch):
+    def __init__(self, cache_name: str, collection_name: str, ttl: CollectionTtl):
+        super().__init__(cache_name, collection_name, ttl)
+        self.elements: Dict[bytes, float] = {}
+
+    async def send(self, client: CacheClientAsync) -> CacheResponse:
+        return await client.sorted_set_put_elements(self.cache_name, self.collection_name, self.elements, ttl=self.ttl)
+
+    def error(self, exception: SdkException) -> CacheResponse:
+        return CacheSortedSetPutElements.Error(exception)
+
+
+class _DictionaryBatch(_Batch):
+    def __init__(self, cache_name: str, collection_name: str, ttl: CollectionTtl):
+        super().__init__(cache_name, collection_name, ttl)
+        self.items: Dict[bytes, bytes] = {}
+
+    async def send(self, client: CacheClientAsync) -> CacheResponse:
+        return await client.dictionary_set_fields(self.cache_name, self.collection_name, self.items, ttl=self.ttl)
+
+    def error(self, exception: SdkException) -> CacheResponse:
+        return CacheDictionarySetFields.Error(exception)
+
+
+class _SetBatch(_Batch):
+    def __init__(self, cache_name: str, collection_name: str, ttl: CollectionTtl):
+        super().__init__(cache_name, collection_name, ttl)
+        self.elements: List[bytes] = []
+
+    async def send(self, client: CacheClientAsync) -> CacheResponse:
+        return await client.set_add_elements(self.cache_name, self.collection_name, self.elements, ttl=self.ttl)
+
+    def error(self, exception: SdkException) -> CacheResponse:
+        return CacheSetAddElements.Error(exception)
+
+
+class _ListBatch(_Batch):
+    def __init__(
+        self, cache_name: str, collection_name: str, ttl: CollectionTtl, truncate_front_to_size: Optional[int]
+    ):
+        super().__init__(cache_name, collection_name, ttl)
+        self.truncate_front_to_size = truncate_front_to_size
+        self.values: List[bytes] = []
+
+    async def send(self, client: CacheClientAsync) -> CacheResponse:
+        return await client.list_concatenate_back(
+            self.cache_name,
+            self.collection_name,
+            self.values,
+            ttl=self.ttl,
+            truncate_front_to_size=self.truncate_front_to_size,
+        )
+
+    def error(self, exception: SdkException) -> CacheResponse:
+        return CacheListConcatenateBack.Error(exception)
+
+
+TBatch = TypeVar("TBatch", bound=_Batch)
+
+
+class AutoBatcher:
+    """Combines single-element collection writes made through a `CacheClientAsync` into batch writes.
+
+    Calls to `sorted_set_put_element`, `dictionary_set_field`, `set_add_element` and `list_push_back`
+    are buffered per cache, collection and TTL. A buffer is written with one `sorted_set_put_elements`,
+    `dictionary_set_fields`, `set_add_elements` or `list_concatenate_back` request once it holds
+    `max_batch_size` elements, or `max_delay` after its first element was buffered, whichever comes
+    first. Every call in a batch then returns the result of that request.
+
+    Elements are written in the order the calls were made, so the outcome is the same as that of
+    writing them one at a time: for dictionaries and sorted sets, the last value or score given for
+    a field or element wins. The batches of a collection are written one at a time for this reason,
+    so a batch that fills up waits for the previous one. Calls with different TTL options are
+    buffered separately and are only ordered relative to calls with the same options. A call that
+    is cancelled while waiting is still written.
+
+    Example:
+        async with AutoBatcher(client) as batcher:
+            await asyncio.gather(*(batcher.set_add_element(cache_name, "seen", event) for event in events))
+    """
+
+    def __init__(
+        self,
+        client: CacheClientAsync,
+        *,
+        max_delay: timedelta = timedelta(microseconds=500),
+        max_batch_size: int = 100,
+    ):
+        """Instantiate an auto batcher.
+
+        Args:
+            client (CacheClientAsync): The client that writes the batches. Closing the batcher does not close it.
+            max_delay (timedelta): How long the first element of a batch waits for more before the batch is written.
+            max_batch_size (int): The number of elements that causes a batch to be written right away.
+        """
+        _validate_timedelta_ttl(max_delay, "Max delay")
+        _validate_positive_int(max_batch_size, "Max batch size")
+        self._logger = logs.logger
+        self._client = client
+        self._max_delay_seconds = max_delay.total_seconds()
+        self._max_batch_size = max_batch_size
+        self._batches: Dict[_BatchKey, _Batch] = {}
+        self._sending: Set[asyncio.Future[None]] = set()
+        # The latest write of each collection, by operation, cache name and collection name.
+        self._latest_sends: Dict[Tuple[str, str, str], asyncio.Future[None]] = {}
+
+    async def __aenter__(self) -> AutoBatcher:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def sorted_set_put_element(
+        self,
+        cache_name: str,
+        sorted_set_name: str,
+        value: str | bytes,
+        score: float,
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+    ) -> CacheSortedSetPutElementResponse:
+        """Puts an element in a sorted set as part of the next batch for that sorted set.
+
+        See `CacheClientAsync.sorted_set_put_element` for the arguments.
+        """
+        try:
+            value_bytes = _as_bytes(value, "Unsupported type for value: ")
+            score = _validate_sorted_set_score(score)
+        except Exception as e:
+            return CacheSortedSetPutElement.Error(convert_error(e, Service.CACHE))
+        key: _BatchKey = ("SortedSetPutElements", cache_name, sorted_set_name, ttl.ttl, ttl.refresh_ttl, None)
+        batch = self._batch(
+            key,
+            lambda: _SortedSetBatch(cache_name, sorted_set_name, ttl),
+        )
+        batch.elements[value_bytes] = score
+        response = await self._wait(key, batch)
+        if isinstance(response, CacheSortedSetPutElements.Success):
+            return CacheSortedSetPutElement.Success()
+        elif isinstance(response, CacheSortedSetPutElements.Error):
+            return CacheSortedSetPutElement.Error(response.inner_exception)
+        else:
+            return CacheSortedSetPutElement.Error(UnknownException(f"Unknown put elements response: {response}"))
+
+    async def dictionary_set_field(
+        self,
+        cache_name: str,
+        dictionary_name: str,
+        field: str | bytes,
+        value: str | bytes,
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+    ) -> CacheDictionarySetFieldResponse:
+        """Sets a dictionary field as part of the next batch for that dictionary.
+
+        See `CacheClientAsync.dictionary_set_field` for the arguments.
+        """
+        try:
+            field_bytes = _as_bytes(field, "Unsupported type for field: ")
+            value_bytes = _as_bytes(value, "Unsupported type for value: ")
+        except Exception as e:
+            return CacheDictionarySetField.Error(convert_error(e, Service.CACHE))
+        key: _BatchKey = ("DictionarySetFields", cache_name, dictionary_name, ttl.ttl, ttl.refresh_ttl, None)
+        batch = self._batch(
+            key,
+            lambda: _DictionaryBatch(cache_name, dictionary_name, ttl),
+        )
+        batch.items[field_bytes] = value_bytes
+        response = await self._wait(key, batch)
+        if isinstance(response, CacheDictionarySetFields.Success):
+            return CacheDictionarySetField.Success()
+        elif isinstance(response, CacheDictionarySetFields.Error):
+            return CacheDictionarySetField.Error(response.inner_exception)
+        else:
+            return CacheDictionarySetField.Error(UnknownException(f"Unknown set fields response: {response}"))
+
+    async def set_add_element(
+        self,
+        cache_name: str,
+        set_name: str,
+        element: str | bytes | Buffer,
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+    ) -> CacheSetAddElementResponse:
+        """Adds an element to a set as part of the next batch for that set.
+
+        See `CacheClientAsync.set_add_element` for the arguments.
+        """
+        try:
+            element_bytes = _as_bytes(element, "Unsupported type for element: ")
+        except Exception as e:
+            return CacheSetAddElement.Error(convert_error(e, Service.CACHE))
+        key: _BatchKey = ("SetAddElements", cache_name, set_name, ttl.ttl, ttl.refresh_ttl, None)
+        batch = self._batch(
+            key,
+            lambda: _SetBatch(cache_name, set_name, ttl),
+        )
+        batch.elements.append(element_bytes)
+        response = await self._wait(key, batch)
+        if isinstance(response, CacheSetAddElements.Success):
+            return CacheSetAddElement.Success()
+        elif isinstance(response, CacheSetAddElements.Error):
+            return CacheSetAddElement.Error(response.inner_exception)
+        else:
+            return CacheSetAddElement.Error(UnknownException(f"Unknown add elements response: {response}"))
+
+    async def list_push_back(
+        self,
+        cache_name: str,
+        list_name: str,
+        value: str | bytes | Buffer,
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+        truncate_front_to_size: Optional[int] = None,
+    ) -> CacheListPushBackResponse:
+        """Pushes a value to the back of a list as part of the next batch for that list.
+
+        See `CacheClientAsync.list_push_back` for the arguments. The list length of a successful
+        response is the length of the list after the whole batch was written.
+        """
+        try:
+            value_bytes = _as_bytes(value, "Unsupported type for value: ")
+        except Exception as e:
+            return CacheListPushBack.Error(convert_error(e, Service.CACHE))
+        key: _BatchKey = (
+            "ListConcatenateBack",
+            cache_name,
+            list_name,
+            ttl.ttl,
+            ttl.refresh_ttl,
+            truncate_front_to_size,
+        )
+        batch = self._batch(
+            key,
+            lambda: _ListBatch(cache_name, list_name, ttl, truncate_front_to_size),
+        )
+        batch.values.append(value_bytes)
+        response = await self._wait(key, batch)
+        if isinstance(response, CacheListConcatenateBack.Success):
+            return CacheListPushBack.Success(response.list_length)
+        elif isinstance(response, CacheListConcatenateBack.Error):
+            return CacheListPushBack.Error(response.inner_exception)
+        else:
+            return CacheListPushBack.Error(UnknownException(f"Unknown concatenate back response: {response}"))
+
+    async def flush(self) -> None:
+        """Writes all buffered elements now and waits until every batch was written."""
+        for key in list(self._batches):
+            self._flush(key)
+        while self._sending:
+            await asyncio.gather(*self._sending)
+
+    async def close(self) -> None:
+        """Writes all buffered elements. The client is left open."""
+        await self.flush()
+
+    def _batch(self, key: _BatchKey, new_batch: Callable[[], TBatch]) -> TBatch:
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = new_batch()
+            batch.timer = asyncio.get_running_loop().call_later(self._max_delay_seconds, self._flush, key)
+        return cast(TBatch, batch)
+
+    async def _wait(self, key: _BatchKey, batch: _Batch) -> CacheResponse:
+        """Waits for the write of the element just added to `batch`."""
+        waiter: asyncio.Future[CacheResponse] = asyncio.get_running_loop().create_future()
+        batch.waiters.append(waiter)
+        batch.size += 1
+        if batch.size >= self._max_batch_size:
+            self._flush(key)
+        return await waiter
+
+    def _flush(self, key: _BatchKey) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        collection = (key[0], key[1], key[2])
+        sending = asyncio.ensure_future(self._send(batch, self._latest_sends.get(collection)))
+        self._latest_sends[collection] = sending
+        self._sending.add(sending)
+        sending.add_done_callback(lambda done: self._on_sent(collection, done))
+
+    def _on_sent(self, collection: Tuple[str, str, str], sending: asyncio.Future[None]) -> None:
+        self._sending.discard(sending)
+        if self._latest_sends.get(collection) is sending:
+            del self._latest_sends[collection]
+
+    async def _send(self, batch: _Batch, previous: Optional[asyncio.Future[None]]) -> None:
+        if previous is not None:
+            # A collection's batches are written one at a time, so a full batch cannot overtake
+            # the one before it.
+            await asyncio.wait((previous,))
+        try:
+            response = await batch.send(self._client)
+        except Exception as e:
+            self._logger.exception("Error writing a batch of %d elements", batch.size)
+            response = batch.error(convert_error(e, Service.CACHE))
+        for waiter in batch.waiters:
+            if not waiter.done():
+                waiter.set_result(response)
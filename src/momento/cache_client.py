@@ -1,15 +1,19 @@
 from __future__ import annotations
 
+import os
 from datetime import timedelta
 from types import TracebackType
-from typing import Iterable, Optional, Type
+from typing import TYPE_CHECKING, Iterable, Iterator, Mapping, Optional, Type
 
 from momento import logs
 from momento.auth import CredentialProvider
-from momento.config import Configuration
-from momento.errors import UnknownException
-from momento.internal._utilities import _validate_eager_connection_timeout
+from momento.config import Configuration, HedgingStats, NearCacheStats
+from momento.errors import InvalidArgumentException, SerializationException, UnknownException
+from momento.internal._utilities import _decode_field, _deserialize, _serialize, _validate_eager_connection_timeout
+from momento.internal._utilities._large_values import DEFAULT_LARGE_VALUE_CHUNK_SIZE, _FileReplacement, _mapped_file
+from momento.internal.services import Service
 from momento.requests import CollectionTtl, SortOrder
+from momento.serialization import Serializer
 from momento.utilities.shared_sync_asyncio import (
     DEFAULT_EAGER_CONNECTION_TIMEOUT_SECONDS,
 )
@@ -40,7 +44,11 @@ except ImportError as e:
     raise e
 
 from momento.responses import (
+    CacheDecreaseTtlResponse,
     CacheDeleteResponse,
+    CacheDictionaryFetch,
+    CacheDictionaryFetchObjects,
+    CacheDictionaryFetchObjectsResponse,
     CacheDictionaryFetchResponse,
     CacheDictionaryGetField,
     CacheDictionaryGetFieldResponse,
@@ -56,10 +64,25 @@ from momento.responses import (
     CacheDictionarySetFields,
     CacheDictionarySetFieldsResponse,
     CacheFlushResponse,
+    CacheGet,
+    CacheGetBatchResponse,
+    CacheGetLarge,
+    CacheGetLargeResponse,
+    CacheGetObject,
+    CacheGetObjectResponse,
     CacheGetResponse,
+    CacheIncreaseTtlResponse,
     CacheIncrementResponse,
+    CacheItemGetTtlResponse,
+    CacheItemGetTypeResponse,
+    CacheKeyExistsResponse,
+    CacheKeysExistResponse,
+    CacheListConcatenateBack,
     CacheListConcatenateBackResponse,
     CacheListConcatenateFrontResponse,
+    CacheListFetch,
+    CacheListFetchObjects,
+    CacheListFetchObjectsResponse,
     CacheListFetchResponse,
     CacheListLengthResponse,
     CacheListPopBackResponse,
@@ -67,12 +90,26 @@ from momento.responses import (
     CacheListPushBackResponse,
     CacheListPushFrontResponse,
     CacheListRemoveValueResponse,
+    CacheListRetainResponse,
+    CacheSet,
     CacheSetAddElement,
     CacheSetAddElementResponse,
     CacheSetAddElements,
     CacheSetAddElementsResponse,
+    CacheSetBatchResponse,
+    CacheSetFetch,
+    CacheSetFetchObjects,
+    CacheSetFetchObjectsResponse,
     CacheSetFetchResponse,
+    CacheSetIfAbsentOrEqualResponse,
+    CacheSetIfAbsentResponse,
+    CacheSetIfEqualResponse,
+    CacheSetIfNotEqualResponse,
     CacheSetIfNotExistsResponse,
+    CacheSetIfPresentAndNotEqualResponse,
+    CacheSetIfPresentResponse,
+    CacheSetLarge,
+    CacheSetLargeResponse,
     CacheSetRemoveElement,
     CacheSetRemoveElementResponse,
     CacheSetRemoveElements,
@@ -93,6 +130,7 @@ from momento.responses import (
     CacheSortedSetRemoveElementResponse,
     CacheSortedSetRemoveElements,
     CacheSortedSetRemoveElementsResponse,
+    CacheUpdateTtlResponse,
     CreateCacheResponse,
     CreateSigningKeyResponse,
     DeleteCacheResponse,
@@ -100,7 +138,10 @@ from momento.responses import (
     ListSigningKeysResponse,
     RevokeSigningKeyResponse,
 )
-from momento.typing import TDictionaryItems, TSortedSetElements
+from momento.typing import TDictionaryItems, TLargeValueDestination, TSetBatchItems, TSortedSetElements
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
 
 
 class CacheClient:
@@ -131,20 +172,6 @@ class CacheClient:
             raise Exception("This should never happen")
     """
 
-    _NUM_CLIENTS = 1
-    """(async client only) For high load, we might get better performance with multiple clients,
-    because the server is configured to allow a max of 100 streams per connection.
-`
-    In the javascript SDK, multiple clients resulted in an obvious performance improvement.
-    However, in the python SDK I have not yet been able to observe a clear benefit.
-    So for now, we are putting the plumbing in place so that we can more easily test performance
-    with multiple connections in the future, but we are leaving the default value set to 1.
-
-    We are hard-coding the value for now, because we haven't yet designed the API for
-    users to use to configure tunables:
-    https://github.com/momentohq/dev-eco-issue-tracker/issues/85
-    """
-
     def __init__(self, configuration: Configuration, credential_provider: CredentialProvider, default_ttl: timedelta):
         """Instantiate a client.
 
@@ -168,12 +195,10 @@ class CacheClient:
         """
         _validate_request_timeout(configuration.get_transport_strategy().get_grpc_configuration().get_deadline())
         self._logger = logs.logger
-        self._next_client_index = 0
         self._control_client = _ScsControlClient(configuration, credential_provider)
         self._cache_endpoint = credential_provider.cache_endpoint
-        self._data_clients = [
-            _ScsDataClient(configuration, credential_provider, default_ttl) for _ in range(CacheClient._NUM_CLIENTS)
-        ]
+        self._data_client = _ScsDataClient(configuration, credential_provider, default_ttl)
+        self._serializer = configuration.get_serializer()
 
     @staticmethod
     def create(
@@ -210,8 +235,7 @@ class CacheClient:
         # an explicit 0 means that the client disabled eager connections
         if eager_connection_timeout.total_seconds() != 0:
             client = CacheClient(configuration, credential_provider, default_ttl)
-            for data_client in client._data_clients:
-                data_client.connect(eager_connection_timeout)
+            client._data_client.connect(eager_connection_timeout)
         return client
 
     def __enter__(self) -> CacheClient:
@@ -224,8 +248,40 @@ class CacheClient:
         traceback: Optional[TracebackType],
     ) -> None:
         self._control_client.close()
-        for data_client in self._data_clients:
-            data_client.close()
+        self._data_client.close()
+
+    def get_near_cache_stats(self) -> Optional[NearCacheStats]:
+        """Returns the hit, miss and eviction counters of the near cache.
+
+        Returns:
+            Optional[NearCacheStats]: a snapshot of the counters, or None if the Configuration
+            does not enable the near cache.
+        """
+        return self._data_client.near_cache_stats()
+
+    def get_coalesced_request_count(self) -> int:
+        """Returns how many reads were answered by an identical request already in flight.
+
+        Always 0 unless the Configuration enables request coalescing.
+        """
+        return self._data_client.coalesced_request_count()
+
+    def get_in_flight_counts(self) -> list[int]:
+        """Returns the number of requests in flight on each data channel.
+
+        Requests are sent on the channel with the fewest in flight, so uneven counts mean the
+        channels are saturated or some are slower than others.
+        """
+        return self._data_client.in_flight_counts()
+
+    def get_hedging_stats(self) -> Optional[HedgingStats]:
+        """Returns how many reads were hedged and how many hedges answered first.
+
+        Returns:
+            Optional[HedgingStats]: a snapshot of the counters, or None if the Configuration
+            does not set a hedging policy.
+        """
+        return self._data_client.hedging_stats()
 
     def create_cache(self, cache_name: str) -> CreateCacheResponse:
         """Creates a cache if it doesn't exist.
@@ -323,16 +379,17 @@ class CacheClient:
     def set(
         self,
         cache_name: str,
-        key: str | bytes,
-        value: str | bytes,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
         ttl: Optional[timedelta] = None,
     ) -> CacheSetResponse:
         """Set the value in cache with a given time to live (TTL) seconds.
 
         Args:
             cache_name (str): Name of the cache to store the item in.
-            key (str | bytes): The key to set.
-            value (str | bytes): The value to be stored.
+            key (str | bytes | Buffer): The key to set. Besides str and bytes, any object supporting the
+            buffer protocol, such as a bytearray, memoryview or mmap, may be passed without copying it first.
+            value (str | bytes | Buffer): The value to be stored. Buffers are accepted as for the key.
             ttl (Optional[timedelta], optional): TTL for the item in cache.
             This TTL takes precedence over the TTL used when initializing a cache client.
             Defaults to client TTL. If specified must be strictly positive.
@@ -342,19 +399,44 @@ class CacheClient:
         """
         return self._data_client.set(cache_name, key, value, ttl)
 
+    def set_batch(
+        self,
+        cache_name: str,
+        items: TSetBatchItems,
+        ttl: Optional[timedelta] = None,
+    ) -> CacheSetBatchResponse:
+        """Set many cache values, streaming the items to the server in batches.
+
+        The items are consumed lazily, so inputs too large to fit in memory can be stored.
+        They are sent in several requests; if one fails, the remaining items are not sent
+        and an error is returned, but items sent by earlier requests stay stored.
+
+        Args:
+            cache_name (str): Name of the cache to store the items in.
+            items (TSetBatchItems): The items to store. Each is a `(key, value)` tuple,
+            or a `(key, value, ttl)` tuple to give the item its own TTL.
+            ttl (Optional[timedelta], optional): TTL for the items that do not specify one.
+            Defaults to client TTL. If specified must be strictly positive.
+
+        Returns:
+            CacheSetBatchResponse: on success, holds a `CacheSetResponse` per item,
+            in the same order as `items`.
+        """
+        return self._data_client.set_batch(cache_name, items, ttl)
+
     def set_if_not_exists(
         self,
         cache_name: str,
-        key: str | bytes,
-        value: str | bytes,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
         ttl: Optional[timedelta] = None,
     ) -> CacheSetIfNotExistsResponse:
         """Like `set`, but it will only set if the key does not already exist.
 
         Args:
             cache_name (str): Name of the cache to store the item in.
-            key (str | bytes): The key to set.
-            value (str | bytes): The value to be stored if the key does not exist.
+            key (str | bytes | Buffer): The key to set.
+            value (str | bytes | Buffer): The value to be stored if the key does not exist.
             ttl (Optional[timedelta], optional): TTL for the item in cache.
             This TTL takes precedence over the TTL used when initializing a cache client.
             Defaults to client TTL. If specified must be strictly positive.
@@ -364,6 +446,230 @@ class CacheClient:
         """
         return self._data_client.set_if_not_exists(cache_name, key, value, ttl)
 
+    def set_if_absent(
+        self,
+        cache_name: str,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
+        ttl: Optional[timedelta] = None,
+    ) -> CacheSetIfAbsentResponse:
+        """Like `set`, but only if the key does not exist.
+
+        The condition is checked and the value written in a single atomic request.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes | Buffer): The key to set.
+            value (str | bytes | Buffer): The value to be stored.
+            ttl (Optional[timedelta], optional): TTL for the item in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+
+        Returns:
+            CacheSetIfAbsentResponse:
+        """
+        return self._data_client.set_if_absent(cache_name, key, value, ttl)
+
+    def set_if_present(
+        self,
+        cache_name: str,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
+        ttl: Optional[timedelta] = None,
+    ) -> CacheSetIfPresentResponse:
+        """Like `set`, but only if the key exists.
+
+        The condition is checked and the value written in a single atomic request.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes | Buffer): The key to set.
+            value (str | bytes | Buffer): The value to be stored.
+            ttl (Optional[timedelta], optional): TTL for the item in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+
+        Returns:
+            CacheSetIfPresentResponse:
+        """
+        return self._data_client.set_if_present(cache_name, key, value, ttl)
+
+    def set_if_equal(
+        self,
+        cache_name: str,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
+        equal: str | bytes | Buffer,
+        ttl: Optional[timedelta] = None,
+    ) -> CacheSetIfEqualResponse:
+        """Like `set`, but only if the key's value is equal to `equal`.
+
+        The condition is checked and the value written in a single atomic request.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes | Buffer): The key to set.
+            value (str | bytes | Buffer): The value to be stored.
+            equal (str | bytes | Buffer): The value to compare the key's value with.
+            ttl (Optional[timedelta], optional): TTL for the item in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+
+        Returns:
+            CacheSetIfEqualResponse:
+        """
+        return self._data_client.set_if_equal(cache_name, key, value, equal, ttl)
+
+    def set_if_not_equal(
+        self,
+        cache_name: str,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
+        not_equal: str | bytes | Buffer,
+        ttl: Optional[timedelta] = None,
+    ) -> CacheSetIfNotEqualResponse:
+        """Like `set`, but only if the key does not exist or its value is not equal to `not_equal`.
+
+        The condition is checked and the value written in a single atomic request.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes | Buffer): The key to set.
+            value (str | bytes | Buffer): The value to be stored.
+            not_equal (str | bytes | Buffer): The value to compare the key's value with.
+            ttl (Optional[timedelta], optional): TTL for the item in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+
+        Returns:
+            CacheSetIfNotEqualResponse:
+        """
+        return self._data_client.set_if_not_equal(cache_name, key, value, not_equal, ttl)
+
+    def set_if_present_and_not_equal(
+        self,
+        cache_name: str,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
+        not_equal: str | bytes | Buffer,
+        ttl: Optional[timedelta] = None,
+    ) -> CacheSetIfPresentAndNotEqualResponse:
+        """Like `set`, but only if the key exists and its value is not equal to `not_equal`.
+
+        The condition is checked and the value written in a single atomic request.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes | Buffer): The key to set.
+            value (str | bytes | Buffer): The value to be stored.
+            not_equal (str | bytes | Buffer): The value to compare the key's value with.
+            ttl (Optional[timedelta], optional): TTL for the item in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+
+        Returns:
+            CacheSetIfPresentAndNotEqualResponse:
+        """
+        return self._data_client.set_if_present_and_not_equal(cache_name, key, value, not_equal, ttl)
+
+    def set_if_absent_or_equal(
+        self,
+        cache_name: str,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
+        equal: str | bytes | Buffer,
+        ttl: Optional[timedelta] = None,
+    ) -> CacheSetIfAbsentOrEqualResponse:
+        """Like `set`, but only if the key does not exist or its value is equal to `equal`.
+
+        The condition is checked and the value written in a single atomic request.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes | Buffer): The key to set.
+            value (str | bytes | Buffer): The value to be stored.
+            equal (str | bytes | Buffer): The value to compare the key's value with.
+            ttl (Optional[timedelta], optional): TTL for the item in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+
+        Returns:
+            CacheSetIfAbsentOrEqualResponse:
+        """
+        return self._data_client.set_if_absent_or_equal(cache_name, key, value, equal, ttl)
+
+    def set_large(
+        self,
+        cache_name: str,
+        key: str | bytes | Buffer,
+        value: str | bytes | Buffer,
+        ttl: Optional[timedelta] = None,
+        *,
+        chunk_size: int = DEFAULT_LARGE_VALUE_CHUNK_SIZE,
+    ) -> CacheSetLargeResponse:
+        """Set a value too large for a single request, such as one over the gRPC max message size.
+
+        The value is split into chunks of `chunk_size` bytes, which are stored concurrently under keys
+        derived from `key`, and a manifest describing them is then stored under `key` itself. Read the
+        value back with `get_large`. A value of at most `chunk_size` bytes is stored under `key` as is,
+        unless it is binary and starts with the bytes 0xFF "ML", which mark manifests: it is then stored
+        behind a 4 byte header that `get_large` removes.
+
+        When `set_large` overwrites a chunked value, it deletes the old chunks once the new value is
+        stored, so a `get_large` racing the overwrite may miss. `delete` only removes the manifest;
+        use `delete_large` to remove the chunks as well. `update_ttl`, `increase_ttl` and
+        `decrease_ttl` only change the TTL of the manifest, and the chunks keep the TTL they were
+        written with, so a value read with `get_large` misses once its chunks expire. To change
+        the TTL of a chunked value, write it again.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes | Buffer): The key to set.
+            value (str | bytes | Buffer): The value to be stored.
+            ttl (Optional[timedelta], optional): TTL for the item and its chunks in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+            chunk_size (int, optional): The size of the chunks in bytes. Defaults to 4,000,000, which
+            suits the default gRPC max message size.
+
+        Returns:
+            CacheSetLargeResponse:
+        """
+        return self._data_client.set_large(cache_name, key, value, ttl, chunk_size)
+
+    def set_large_from_file(
+        self,
+        cache_name: str,
+        key: str | bytes,
+        path: str | os.PathLike[str],
+        ttl: Optional[timedelta] = None,
+        *,
+        chunk_size: int = DEFAULT_LARGE_VALUE_CHUNK_SIZE,
+    ) -> CacheSetLargeResponse:
+        """Set the contents of a file as a value, as `set_large` does.
+
+        The file is memory-mapped and each chunk is read from the map as it is sent, so the
+        contents are never held in memory as a whole. An open `mmap` can also be passed to
+        `set_large` or, if it fits in a single request, to `set` directly.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes): The key to set.
+            path (str | os.PathLike[str]): The file to read the value from.
+            ttl (Optional[timedelta], optional): TTL for the item and its chunks in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+            chunk_size (int, optional): The size of the chunks in bytes. Defaults to 4,000,000.
+
+        Returns:
+            CacheSetLargeResponse:
+        """
+        try:
+            with _mapped_file(path) as value:
+                return self.set_large(cache_name, key, value, ttl, chunk_size=chunk_size)
+        except OSError as e:
+            return CacheSetLarge.Error(InvalidArgumentException(f"Could not read {path}: {e}", Service.CACHE))
+
     def get(self, cache_name: str, key: str | bytes) -> CacheGetResponse:
         """Get the cache value stored for the given key.
 
@@ -376,9 +682,170 @@ class CacheClient:
         """
         return self._data_client.get(cache_name, key)
 
+    def set_object(
+        self,
+        cache_name: str,
+        key: str | bytes,
+        value: object,
+        ttl: Optional[timedelta] = None,
+        *,
+        serializer: Optional[Serializer] = None,
+    ) -> CacheSetResponse:
+        """Serialize a value and set it in the cache.
+
+        Args:
+            cache_name (str): Name of the cache to store the item in.
+            key (str | bytes): The key to set.
+            value (object): The value to be serialized and stored.
+            ttl (Optional[timedelta], optional): TTL for the item in cache.
+            This TTL takes precedence over the TTL used when initializing a cache client.
+            Defaults to client TTL. If specified must be strictly positive.
+            serializer (Optional[Serializer], optional): Converts the value to bytes.
+            Defaults to the serializer of the client's Configuration.
+
+        Returns:
+            CacheSetResponse:
+        """
+        try:
+            data = _serialize(serializer or self._serializer, value)
+        except SerializationException as e:
+            return CacheSet.Error(e)
+        return self.set(cache_name, key, data, ttl)
+
+    def get_object(
+        self, cache_name: str, key: str | bytes, *, serializer: Optional[Serializer] = None
+    ) -> CacheGetObjectResponse:
+        """Get the cache value stored for the given key and deserialize it.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            key (str | bytes): The key to lookup.
+            serializer (Optional[Serializer], optional): Converts the stored bytes back to a value.
+            Defaults to the serializer of the client's Configuration.
+
+        Returns:
+            CacheGetObjectResponse:
+        """
+        get_response = self.get(cache_name, key)
+        if isinstance(get_response, CacheGet.Hit):
+            try:
+                return CacheGetObject.Hit(_deserialize(serializer or self._serializer, get_response.value_bytes))
+            except SerializationException as e:
+                return CacheGetObject.Error(e)
+        elif isinstance(get_response, CacheGet.Miss):
+            return CacheGetObject.Miss()
+        elif isinstance(get_response, CacheGet.Error):
+            return CacheGetObject.Error(get_response.inner_exception)
+        else:
+            return CacheGetObject.Error(UnknownException(f"Unknown get response: {get_response}"))
+
+    def get_large(
+        self, cache_name: str, key: str | bytes, destination: Optional[TLargeValueDestination] = None
+    ) -> CacheGetLargeResponse:
+        """Get a value stored with `set_large`.
+
+        The chunks of the value are read concurrently, checked against the checksums in its
+        manifest and written to `destination` in order. Values stored with `set` are read as well,
+        except binary values that start with the bytes 0xFF "ML", which are reserved for manifests.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            key (str | bytes): The key to lookup.
+            destination (Optional[TLargeValueDestination], optional): A writable buffer at least as large
+            as the value, such as a bytearray or mmap, or a binary file to write the value to. If it is
+            not given, the value is returned in the response.
+
+        Returns:
+            CacheGetLargeResponse: a miss if the value or any of its chunks is not in the cache. The
+            destination may then have been partly written.
+        """
+        return self._data_client.get_large(cache_name, key, destination)
+
+    def get_large_to_file(
+        self, cache_name: str, key: str | bytes, path: str | os.PathLike[str]
+    ) -> CacheGetLargeResponse:
+        """Get a value stored with `set_large` or `set_large_from_file` and write it to a file.
+
+        Chunks are written to a temporary file in the same directory as they arrive, and that
+        file replaces `path` once the whole value was written and verified. `path` is left as it
+        was on a miss or an error. A file created this way is only readable by its owner. To write
+        into an existing `mmap`, pass it to `get_large`.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            key (str | bytes): The key to lookup.
+            path (str | os.PathLike[str]): The file to write the value to.
+
+        Returns:
+            CacheGetLargeResponse: a hit holds the size of the value but not the value itself.
+        """
+        try:
+            replacement = _FileReplacement(path)
+        except OSError as e:
+            return CacheGetLarge.Error(InvalidArgumentException(f"Could not write {path}: {e}", Service.CACHE))
+        try:
+            get_response = self.get_large(cache_name, key, replacement.file)
+        except BaseException:
+            replacement.discard()
+            raise
+        if not isinstance(get_response, CacheGetLarge.Hit):
+            replacement.discard()
+            return get_response
+        try:
+            replacement.commit()
+        except OSError as e:
+            return CacheGetLarge.Error(InvalidArgumentException(f"Could not write {path}: {e}", Service.CACHE))
+        return get_response
+
+    def delete_large(self, cache_name: str, key: str | bytes) -> CacheDeleteResponse:
+        """Remove a value stored with `set_large`, along with its chunks.
+
+        Values stored with `set` are removed as well.
+
+        Args:
+            cache_name (str): Name of the cache to delete the value from.
+            key (str | bytes): The key to delete.
+
+        Returns:
+            CacheDeleteResponse:
+        """
+        return self._data_client.delete_large(cache_name, key)
+
+    def get_batch(self, cache_name: str, keys: Iterable[str | bytes]) -> CacheGetBatchResponse:
+        """Get the cache values stored for the given keys in a single request.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            keys (Iterable[str | bytes]): The keys to lookup.
+
+        Returns:
+            CacheGetBatchResponse: on success, holds a `CacheGetResponse` per key,
+            in the same order as `keys`.
+        """
+        return self._data_client.get_batch(cache_name, keys)
+
+    def get_batch_stream(self, cache_name: str, keys: Iterable[str | bytes]) -> Iterator[CacheGetResponse]:
+        """Get the cache values stored for the given keys, yielding each result as it arrives.
+
+        Results are yielded in the same order as `keys`. Unlike `get_batch`, the
+        first results can be consumed before the whole batch has been received.
+        If the request fails, a `CacheGet.Error` is yielded for each key that has
+        not yet been answered.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            keys (Iterable[str | bytes]): The keys to lookup.
+
+        Returns:
+            An iterator of CacheGetResponse, one per key.
+        """
+        return self._data_client.get_batch_stream(cache_name, keys)
+
     def delete(self, cache_name: str, key: str | bytes) -> CacheDeleteResponse:
         """Remove the key from the cache.
 
+        For a value stored with `set_large`, this removes its manifest but not its chunks; use `delete_large`.
+
         Args:
             cache_name (str): Name of the cache to delete the key from.
             key (str | bytes): The key to delete.
@@ -388,6 +855,99 @@ class CacheClient:
         """
         return self._data_client.delete(cache_name, key)
 
+    def keys_exist(self, cache_name: str, keys: Iterable[str | bytes]) -> CacheKeysExistResponse:
+        """Check whether keys exist in the cache, without fetching their values.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            keys (Iterable[str | bytes]): The keys to check.
+
+        Returns:
+            CacheKeysExistResponse: on success, holds whether each key exists, in the same order as `keys`.
+        """
+        return self._data_client.keys_exist(cache_name, keys)
+
+    def key_exists(self, cache_name: str, key: str | bytes) -> CacheKeyExistsResponse:
+        """Check whether a key exists in the cache, without fetching its value.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            key (str | bytes): The key to check.
+
+        Returns:
+            CacheKeyExistsResponse: on success, holds whether the key exists.
+        """
+        return self._data_client.key_exists(cache_name, key)
+
+    def item_get_ttl(self, cache_name: str, key: str | bytes) -> CacheItemGetTtlResponse:
+        """Get how long until an item expires, without fetching its value.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            key (str | bytes): The key of the item.
+
+        Returns:
+            CacheItemGetTtlResponse: a hit holds the remaining TTL.
+        """
+        return self._data_client.item_get_ttl(cache_name, key)
+
+    def item_get_type(self, cache_name: str, key: str | bytes) -> CacheItemGetTypeResponse:
+        """Get the type of data stored under a key, without fetching it.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            key (str | bytes): The key of the item.
+
+        Returns:
+            CacheItemGetTypeResponse: a hit holds the `ItemType`: scalar, dictionary, list, set or sorted set.
+        """
+        return self._data_client.item_get_type(cache_name, key)
+
+    def update_ttl(self, cache_name: str, key: str | bytes, ttl: timedelta) -> CacheUpdateTtlResponse:
+        """Set the TTL of an item, without rewriting its value.
+
+        For a value stored with `set_large`, only the manifest's TTL changes; see `set_large`.
+
+        Args:
+            cache_name (str): Name of the cache the item is in.
+            key (str | bytes): The key of the item.
+            ttl (timedelta): The new TTL, counted from now. Must be strictly positive.
+
+        Returns:
+            CacheUpdateTtlResponse:
+        """
+        return self._data_client.update_ttl(cache_name, key, ttl)
+
+    def increase_ttl(self, cache_name: str, key: str | bytes, ttl: timedelta) -> CacheIncreaseTtlResponse:
+        """Set the TTL of an item if that makes it expire later, without rewriting its value.
+
+        For a value stored with `set_large`, only the manifest's TTL changes; see `set_large`.
+
+        Args:
+            cache_name (str): Name of the cache the item is in.
+            key (str | bytes): The key of the item.
+            ttl (timedelta): The new TTL, counted from now. Must be strictly positive.
+
+        Returns:
+            CacheIncreaseTtlResponse: `NotSet` if the item would expire sooner with the new TTL.
+        """
+        return self._data_client.increase_ttl(cache_name, key, ttl)
+
+    def decrease_ttl(self, cache_name: str, key: str | bytes, ttl: timedelta) -> CacheDecreaseTtlResponse:
+        """Set the TTL of an item if that makes it expire sooner, without rewriting its value.
+
+        For a value stored with `set_large`, only the manifest's TTL changes; see `set_large`.
+
+        Args:
+            cache_name (str): Name of the cache the item is in.
+            key (str | bytes): The key of the item.
+            ttl (timedelta): The new TTL, counted from now. Must be strictly positive.
+
+        Returns:
+            CacheDecreaseTtlResponse: `NotSet` if the item would expire later with the new TTL.
+        """
+        return self._data_client.decrease_ttl(cache_name, key, ttl)
+
     # DICTIONARY COLLECTION METHODS
     def dictionary_fetch(self, cache_name: str, dictionary_name: str) -> CacheDictionaryFetchResponse:
         """Fetch the entire dictionary from the cache.
@@ -564,12 +1124,79 @@ class CacheClient:
         """
         return self._data_client.dictionary_set_fields(cache_name, dictionary_name, items, ttl)
 
+    def dictionary_set_object_fields(
+        self,
+        cache_name: str,
+        dictionary_name: str,
+        items: Mapping[str | bytes, object],
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+        serializer: Optional[Serializer] = None,
+    ) -> CacheDictionarySetFieldsResponse:
+        """Serialize several values and set them as dictionary fields in the cache.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            dictionary_name (str): Name of the dictionary to set.
+            items (Mapping[str | bytes, object]): Fields and the values to serialize and store for them.
+            ttl (CollectionTtl, optional): TTL for the dictionary in cache.
+                This TTL takes precedence over the TTL used when initializing a cache client.
+                Defaults to CollectionTtl.from_cache_ttl().
+            serializer (Optional[Serializer], optional): Converts the values to bytes.
+                Defaults to the serializer of the client's Configuration.
+
+        Returns:
+            CacheDictionarySetFieldsResponse: result of the set fields operation.
+        """
+        serializer = serializer or self._serializer
+        try:
+            serialized_items = {field: _serialize(serializer, value) for field, value in items.items()}
+        except SerializationException as e:
+            return CacheDictionarySetFields.Error(e)
+        return self.dictionary_set_fields(cache_name, dictionary_name, serialized_items, ttl=ttl)
+
+    def dictionary_fetch_objects(
+        self, cache_name: str, dictionary_name: str, *, serializer: Optional[Serializer] = None
+    ) -> CacheDictionaryFetchObjectsResponse:
+        """Fetch the entire dictionary from the cache and deserialize its values.
+
+        Args:
+            cache_name (str): Name of the cache to perform the lookup in.
+            dictionary_name (str): The name of the dictionary to fetch.
+            serializer (Optional[Serializer], optional): Converts the stored bytes back to values.
+                Defaults to the serializer of the client's Configuration.
+
+        Returns:
+            CacheDictionaryFetchObjectsResponse: the deserialized items, keyed by utf-8 decoded field.
+            A field that is not valid utf-8 is returned as an Error; use `dictionary_fetch` to read it as bytes.
+        """
+        fetch_response = self.dictionary_fetch(cache_name, dictionary_name)
+        if isinstance(fetch_response, CacheDictionaryFetch.Hit):
+            serializer = serializer or self._serializer
+            try:
+                return CacheDictionaryFetchObjects.Hit(
+                    {
+                        _decode_field(field): _deserialize(serializer, value)
+                        for field, value in fetch_response.value_dictionary_bytes_bytes.items()
+                    }
+                )
+            except SerializationException as e:
+                return CacheDictionaryFetchObjects.Error(e)
+        elif isinstance(fetch_response, CacheDictionaryFetch.Miss):
+            return CacheDictionaryFetchObjects.Miss()
+        elif isinstance(fetch_response, CacheDictionaryFetch.Error):
+            return CacheDictionaryFetchObjects.Error(fetch_response.inner_exception)
+        else:
+            return CacheDictionaryFetchObjects.Error(
+                UnknownException(f"Unknown dictionary fetch response: {fetch_response}")
+            )
+
     # LIST COLLECTION METHODS
     def list_concatenate_back(
         self,
         cache_name: str,
         list_name: str,
-        values: Iterable[str | bytes],
+        values: Iterable[str | bytes | Buffer],
         *,
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
         truncate_front_to_size: Optional[int] = None,
@@ -579,7 +1206,7 @@ class CacheClient:
         Args:
             cache_name (str): The cache where the list is.
             list_name (str): The name of the list to concatenate.
-            values: (Iterable[str | bytes]): The values to concatenate.
+            values: (Iterable[str | bytes | Buffer]): The values to concatenate.
             ttl: (CollectionTtl, optional): How to treat the list's TTL. Defaults to `CollectionTtl.from_cache_ttl()`
             truncate_front_to_size (Optional[int]): If the list exceeds this size, remove values from
             the start of the list.
@@ -589,11 +1216,45 @@ class CacheClient:
         """
         return self._data_client.list_concatenate_back(cache_name, list_name, values, ttl, truncate_front_to_size)
 
+    def list_concatenate_back_objects(
+        self,
+        cache_name: str,
+        list_name: str,
+        values: Iterable[object],
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+        truncate_front_to_size: Optional[int] = None,
+        serializer: Optional[Serializer] = None,
+    ) -> CacheListConcatenateBackResponse:
+        """Serialize values and add them to the end of the list.
+
+        Args:
+            cache_name (str): The cache where the list is.
+            list_name (str): The name of the list to concatenate.
+            values: (Iterable[object]): The values to serialize and concatenate.
+            ttl: (CollectionTtl, optional): How to treat the list's TTL. Defaults to `CollectionTtl.from_cache_ttl()`
+            truncate_front_to_size (Optional[int]): If the list exceeds this size, remove values from
+            the start of the list.
+            serializer (Optional[Serializer], optional): Converts the values to bytes.
+            Defaults to the serializer of the client's Configuration.
+
+        Returns:
+            CacheListConcatenateBackResponse:
+        """
+        serializer = serializer or self._serializer
+        try:
+            serialized_values = [_serialize(serializer, value) for value in values]
+        except SerializationException as e:
+            return CacheListConcatenateBack.Error(e)
+        return self.list_concatenate_back(
+            cache_name, list_name, serialized_values, ttl=ttl, truncate_front_to_size=truncate_front_to_size
+        )
+
     def list_concatenate_front(
         self,
         cache_name: str,
         list_name: str,
-        values: Iterable[str | bytes],
+        values: Iterable[str | bytes | Buffer],
         *,
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
         truncate_back_to_size: Optional[int] = None,
@@ -603,7 +1264,7 @@ class CacheClient:
         Args:
             cache_name (str): The cache where the list is.
             list_name (str): The name of the list to concatenate.
-            values: (Iterable[str | bytes]): The values to concatenate.
+            values: (Iterable[str | bytes | Buffer]): The values to concatenate.
             ttl: (CollectionTtl, optional): How to treat the list's TTL. Defaults to `CollectionTtl.from_cache_ttl()`
             truncate_back_to_size (Optional[int], optional): If the list exceeds this size, remove values from
                 the end of the list.
@@ -613,17 +1274,67 @@ class CacheClient:
         """
         return self._data_client.list_concatenate_front(cache_name, list_name, values, ttl, truncate_back_to_size)
 
-    def list_fetch(self, cache_name: str, list_name: str) -> CacheListFetchResponse:
-        """Gets all values from the list.
+    def list_fetch(
+        self,
+        cache_name: str,
+        list_name: str,
+        start_index: Optional[int] = None,
+        end_index: Optional[int] = None,
+    ) -> CacheListFetchResponse:
+        """Gets the values from the list, or the values in an index range of it.
+
+        Negative indices count from the end of the list, so `start_index=-10` fetches the last ten values.
 
         Args:
             cache_name (str): The cache where the list is.
             list_name (str): The name of the list to fetch.
+            start_index (Optional[int]): The index of the first value to fetch.
+                If None, fetches from the beginning of the list. Defaults to None.
+            end_index (Optional[int]): The index after the last value to fetch; the value at it is not fetched.
+                If None, fetches until the end of the list. Defaults to None.
 
         Returns:
             CacheListFetchResponse:
         """
-        return self._data_client.list_fetch(cache_name, list_name)
+        return self._data_client.list_fetch(cache_name, list_name, start_index, end_index)
+
+    def list_fetch_objects(
+        self,
+        cache_name: str,
+        list_name: str,
+        start_index: Optional[int] = None,
+        end_index: Optional[int] = None,
+        *,
+        serializer: Optional[Serializer] = None,
+    ) -> CacheListFetchObjectsResponse:
+        """Gets the values from the list, or the values in an index range of it, and deserializes them.
+
+        Args:
+            cache_name (str): The cache where the list is.
+            list_name (str): The name of the list to fetch.
+            start_index (Optional[int]): The index of the first value to fetch. See `list_fetch`.
+            end_index (Optional[int]): The index after the last value to fetch. See `list_fetch`.
+            serializer (Optional[Serializer], optional): Converts the stored bytes back to values.
+            Defaults to the serializer of the client's Configuration.
+
+        Returns:
+            CacheListFetchObjectsResponse:
+        """
+        fetch_response = self.list_fetch(cache_name, list_name, start_index, end_index)
+        if isinstance(fetch_response, CacheListFetch.Hit):
+            serializer = serializer or self._serializer
+            try:
+                return CacheListFetchObjects.Hit(
+                    [_deserialize(serializer, value) for value in fetch_response.value_list_bytes]
+                )
+            except SerializationException as e:
+                return CacheListFetchObjects.Error(e)
+        elif isinstance(fetch_response, CacheListFetch.Miss):
+            return CacheListFetchObjects.Miss()
+        elif isinstance(fetch_response, CacheListFetch.Error):
+            return CacheListFetchObjects.Error(fetch_response.inner_exception)
+        else:
+            return CacheListFetchObjects.Error(UnknownException(f"Unknown list fetch response: {fetch_response}"))
 
     def list_length(self, cache_name: str, list_name: str) -> CacheListLengthResponse:
         """Gets the number of values in the list.
@@ -665,7 +1376,7 @@ class CacheClient:
         self,
         cache_name: str,
         list_name: str,
-        value: str | bytes,
+        value: str | bytes | Buffer,
         *,
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
         truncate_front_to_size: Optional[int] = None,
@@ -675,7 +1386,7 @@ class CacheClient:
         Args:
             cache_name (str): The cache where the list is.
             list_name (str): The name of the list to push to.
-            value: (str | bytes): The value to push.
+            value: (str | bytes | Buffer): The value to push.
             ttl: (CollectionTtl, optional): How to treat the list's TTL. Defaults to `CollectionTtl.from_cache_ttl()`
             truncate_front_to_size (Optional[int]): If the list exceeds this size, remove values from
             the start of the list.
@@ -689,7 +1400,7 @@ class CacheClient:
         self,
         cache_name: str,
         list_name: str,
-        value: str | bytes,
+        value: str | bytes | Buffer,
         *,
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
         truncate_back_to_size: Optional[int] = None,
@@ -699,7 +1410,7 @@ class CacheClient:
         Args:
             cache_name (str): The cache where the list is.
             list_name (str): The name of the list to push to.
-            value: (str | bytes): The value to push.
+            value: (str | bytes | Buffer): The value to push.
             ttl: (CollectionTtl, optional): How to treat the list's TTL. Defaults to `CollectionTtl.from_cache_ttl()`
             truncate_back_to_size (Optional[int]): If the list exceeds this size, remove values from
                 the end of the list.
@@ -713,7 +1424,7 @@ class CacheClient:
         self,
         cache_name: str,
         list_name: str,
-        value: str | bytes,
+        value: str | bytes | Buffer,
     ) -> CacheListRemoveValueResponse:
         """Removes all matching values from the list.
 
@@ -728,19 +1439,56 @@ class CacheClient:
         Args:
             cache_name (str): The cache where the list is.
             list_name (str): The name of the list to remove values from.
-            value: (str | bytes): The value to remove.
+            value: (str | bytes | Buffer): The value to remove.
 
         Returns:
             CacheListRemoveValueResponse
         """
         return self._data_client.list_remove_value(cache_name, list_name, value)
 
+    def list_retain(
+        self,
+        cache_name: str,
+        list_name: str,
+        start_index: Optional[int] = None,
+        end_index: Optional[int] = None,
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+    ) -> CacheListRetainResponse:
+        """Removes the values outside an index range from the list, keeping the rest in place.
+
+        The indices are those of `list_fetch`: negative indices count from the end of the list,
+        and the value at `end_index` is removed.
+
+        Example:
+            client.list_concatenate_back(cache_name, list_name, ['a', 'b', 'c', 'd', 'e'])
+            client.list_retain(cache_name, list_name, 1, -1)
+            fetch_resp = client.list_fetch(cache_name, list_name)
+
+            # ['b', 'c', 'd']
+            print(fetch_resp.values_string)
+
+        Args:
+            cache_name (str): The cache where the list is.
+            list_name (str): The name of the list to trim.
+            start_index (Optional[int]): The index of the first value to keep.
+                If None, keeps from the beginning of the list. Defaults to None.
+            end_index (Optional[int]): The index after the last value to keep.
+                If None, keeps until the end of the list. Defaults to None.
+            ttl (CollectionTtl, optional): TTL for the list in cache. This TTL takes precedence
+                over the TTL used when initializing a cache client. Defaults to client TTL.
+
+        Returns:
+            CacheListRetainResponse:
+        """
+        return self._data_client.list_retain(cache_name, list_name, start_index, end_index, ttl)
+
     # SET COLLECTION METHODS
     def set_add_element(
         self,
         cache_name: str,
         set_name: str,
-        element: str | bytes,
+        element: str | bytes | Buffer,
         *,
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
     ) -> CacheSetAddElementResponse:
@@ -749,7 +1497,7 @@ class CacheClient:
         Args:
             cache_name (str): The cache name with the set.
             set_name (str): The name of the set to add to.
-            element (str | bytes): The element to add.
+            element (str | bytes | Buffer): The element to add.
             ttl: (CollectionTtl, optional): How to treat the set's TTL. Defaults to `CollectionTtl.from_cache_ttl()`
 
         Returns:
@@ -768,7 +1516,7 @@ class CacheClient:
         self,
         cache_name: str,
         set_name: str,
-        elements: Iterable[str | bytes],
+        elements: Iterable[str | bytes | Buffer],
         *,
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
     ) -> CacheSetAddElementsResponse:
@@ -777,7 +1525,7 @@ class CacheClient:
         Args:
             cache_name (str): The cache name with the set.
             set_name (str): The name of the set to add to.
-            elements (Iterable[str | bytes]): The element to add.
+            elements (Iterable[str | bytes | Buffer]): The element to add.
             ttl: (CollectionTtl, optional): How to treat the set's TTL. Defaults to `CollectionTtl.from_cache_ttl()`
 
         Returns:
@@ -785,6 +1533,38 @@ class CacheClient:
         """
         return self._data_client.set_add_elements(cache_name, set_name, elements, ttl)
 
+    def set_add_object_elements(
+        self,
+        cache_name: str,
+        set_name: str,
+        elements: Iterable[object],
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+        serializer: Optional[Serializer] = None,
+    ) -> CacheSetAddElementsResponse:
+        """Serialize elements and add them to a set.
+
+        Set membership is decided on the serialized bytes, so the serializer must convert equal
+        values to equal bytes for the set to hold them once. `JsonSerializer` sorts object keys to that end.
+
+        Args:
+            cache_name (str): The cache name with the set.
+            set_name (str): The name of the set to add to.
+            elements (Iterable[object]): The elements to serialize and add.
+            ttl: (CollectionTtl, optional): How to treat the set's TTL. Defaults to `CollectionTtl.from_cache_ttl()`
+            serializer (Optional[Serializer], optional): Converts the elements to bytes.
+            Defaults to the serializer of the client's Configuration.
+
+        Returns:
+            CacheSetAddElementsResponse
+        """
+        serializer = serializer or self._serializer
+        try:
+            serialized_elements = [_serialize(serializer, element) for element in elements]
+        except SerializationException as e:
+            return CacheSetAddElements.Error(e)
+        return self.set_add_elements(cache_name, set_name, serialized_elements, ttl=ttl)
+
     def set_fetch(
         self,
         cache_name: str,
@@ -801,6 +1581,40 @@ class CacheClient:
         """
         return self._data_client.set_fetch(cache_name, set_name)
 
+    def set_fetch_objects(
+        self,
+        cache_name: str,
+        set_name: str,
+        *,
+        serializer: Optional[Serializer] = None,
+    ) -> CacheSetFetchObjectsResponse:
+        """Fetches a set and deserializes its elements.
+
+        Args:
+            cache_name (str): The cache name with the set.
+            set_name (str): The name of the set to fetch.
+            serializer (Optional[Serializer], optional): Converts the stored bytes back to elements.
+            Defaults to the serializer of the client's Configuration.
+
+        Returns:
+            CacheSetFetchObjectsResponse
+        """
+        fetch_response = self.set_fetch(cache_name, set_name)
+        if isinstance(fetch_response, CacheSetFetch.Hit):
+            serializer = serializer or self._serializer
+            try:
+                return CacheSetFetchObjects.Hit(
+                    [_deserialize(serializer, element) for element in fetch_response.value_set_bytes]
+                )
+            except SerializationException as e:
+                return CacheSetFetchObjects.Error(e)
+        elif isinstance(fetch_response, CacheSetFetch.Miss):
+            return CacheSetFetchObjects.Miss()
+        elif isinstance(fetch_response, CacheSetFetch.Error):
+            return CacheSetFetchObjects.Error(fetch_response.inner_exception)
+        else:
+            return CacheSetFetchObjects.Error(UnknownException(f"Unknown set fetch response: {fetch_response}"))
+
     def set_remove_element(self, cache_name: str, set_name: str, element: str | bytes) -> CacheSetRemoveElementResponse:
         """Remove an element from a set.
 
@@ -1074,9 +1888,3 @@ class CacheClient:
             CacheSortedSetIncrementScoreResponse: the status and associated score for each value.
         """
         return self._data_client.sorted_set_increment_score(cache_name, sorted_set_name, value, score, ttl)
-
-    @property
-    def _data_client(self) -> _ScsDataClient:
-        client = self._data_clients[self._next_client_index]
-        self._next_client_index = (self._next_client_index + 1) % len(self._data_clients)
-        return client
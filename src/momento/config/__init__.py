@@ -1,13 +1,24 @@
 """Momento network configuration module."""
 
+from .circuit_breaker import CircuitBreakerPolicy
+from .compression import CompressionAlgorithm, CompressionConfiguration
 from .configuration import Configuration
 from .configurations import Configurations
+from .hedging import HedgingPolicy, HedgingStats
+from .near_cache import NearCacheConfiguration, NearCacheStats
 from .topic_configuration import TopicConfiguration
 from .topic_configurations import TopicConfigurations
 
 __all__ = [
+    "CircuitBreakerPolicy",
+    "CompressionAlgorithm",
+    "CompressionConfiguration",
     "Configuration",
     "Configurations",
+    "HedgingPolicy",
+    "HedgingStats",
+    "NearCacheConfiguration",
+    "NearCacheStats",
     "TopicConfiguration",
     "TopicConfigurations",
 ]
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from momento.errors import InvalidArgumentException
+from momento.internal._utilities import _validate_positive_int, _validate_timedelta_ttl
+from momento.internal.services import Service
+
+
+class CircuitBreakerPolicy:
+    """Configuration options for the per-channel circuit breaker.
+
+    Each data channel tracks the fraction of its requests that failed with an unavailable,
+    deadline exceeded, internal or unknown error over a rolling `window`. Once at least
+    `minimum_requests` were sent in the window and the failure rate reaches `failure_rate_threshold`,
+    the circuit opens and requests are sent on the other channels instead. Only when every channel's
+    circuit is open do requests fail fast with a `CircuitBreakerOpenException` instead of waiting for
+    their deadline. After `open_duration`, up to `half_open_max_probes` trial requests
+    are sent; a successful one closes the circuit and a failed one opens it again. Cancelled
+    requests, such as the losing attempts of hedged reads, are not counted either way.
+
+    State changes are reported to the `on_circuit_breaker_state_change` method of the configured middleware.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        minimum_requests: int = 20,
+        window: timedelta = timedelta(seconds=10),
+        open_duration: timedelta = timedelta(seconds=5),
+        half_open_max_probes: int = 1,
+    ):
+        """Instantiate a circuit breaker policy.
+
+        Args:
+            failure_rate_threshold (float): the fraction of failed requests in the window that opens the circuit.
+            Must be greater than 0 and at most 1.
+            minimum_requests (int): the number of requests in the window below which the circuit stays closed.
+            window (timedelta): how far back requests are counted towards the failure rate.
+            open_duration (timedelta): how long the circuit stays open before trial requests are sent.
+            half_open_max_probes (int): the number of trial requests that may be in flight at once.
+        """
+        if not 0 < failure_rate_threshold <= 1:
+            raise InvalidArgumentException(
+                "Failure rate threshold must be greater than 0 and at most 1.", Service.CACHE
+            )
+        _validate_positive_int(minimum_requests, "Minimum requests")
+        _validate_timedelta_ttl(window, "Window")
+        _validate_timedelta_ttl(open_duration, "Open duration")
+        _validate_positive_int(half_open_max_probes, "Half-open max probes")
+        self._failure_rate_threshold = failure_rate_threshold
+        self._minimum_requests = minimum_requests
+        self._window = window
+        self._open_duration = open_duration
+        self._half_open_max_probes = half_open_max_probes
+
+    def get_failure_rate_threshold(self) -> float:
+        return self._failure_rate_threshold
+
+    def get_minimum_requests(self) -> int:
+        return self._minimum_requests
+
+    def get_window(self) -> timedelta:
+        return self._window
+
+    def get_open_duration(self) -> timedelta:
+        return self._open_duration
+
+    def get_half_open_max_probes(self) -> int:
+        return self._half_open_max_probes
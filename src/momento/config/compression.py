@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import enum
+import importlib.util
+from typing import Optional
+
+from momento.internal._utilities import _validate_positive_int
+
+
+class CompressionAlgorithm(enum.Enum):
+    """The algorithms values can be compressed with."""
+
+    ZLIB = "zlib"
+    """zlib from the Python standard library. Always available."""
+    ZSTD = "zstd"
+    """Zstandard, which compresses faster and smaller than zlib. Requires `pip install zstandard`."""
+    LZ4 = "lz4"
+    """LZ4, which trades some compression for the fastest compression and decompression. Requires `pip install lz4`."""
+
+
+_ALGORITHM_PACKAGES = {CompressionAlgorithm.ZSTD: "zstandard", CompressionAlgorithm.LZ4: "lz4"}
+
+
+class CompressionConfiguration:
+    """Configuration options for compressing values on the client.
+
+    Scalar values, dictionary field values and list values of at least `threshold_bytes` are
+    compressed before they are sent, unless compressing does not make them smaller. Compressed
+    values start with a short header naming the algorithm, and reads decompress them automatically,
+    whichever algorithm wrote them. Set elements and sorted set values identify members, so they
+    are never compressed.
+
+    Other clients read compressed values as the raw compressed bytes, so every client that reads
+    values written with compression must enable it too. Binary values that clients without
+    compression write are passed through on read unless they start with the header, the bytes
+    0xFF "MC" followed by 0 to 3, in which case they are read as compressed.
+
+    The values `list_remove_value` and the `set_if_*` methods compare against are compressed like
+    the values they are compared with, because the server compares the bytes it stores. They only
+    match values of at least `threshold_bytes` written with the same algorithm and level.
+    """
+
+    def __init__(
+        self,
+        algorithm: CompressionAlgorithm = CompressionAlgorithm.ZLIB,
+        *,
+        threshold_bytes: int = 1024,
+        level: Optional[int] = None,
+    ):
+        """Instantiate a compression configuration.
+
+        Args:
+            algorithm (CompressionAlgorithm): the algorithm to compress values with.
+            threshold_bytes (int): the size below which values are sent uncompressed. Must be positive.
+            level (Optional[int]): the compression level, whose range depends on the algorithm.
+            The algorithm's default level is used when None.
+
+        Raises:
+            ImportError: if the package the algorithm needs is not installed.
+        """
+        package = _ALGORITHM_PACKAGES.get(algorithm)
+        if package is not None and importlib.util.find_spec(package) is None:
+            raise ImportError(f"{algorithm.value} compression requires the {package} package: pip install {package}")
+        _validate_positive_int(threshold_bytes, "Threshold bytes")
+        self._algorithm = algorithm
+        self._threshold_bytes = threshold_bytes
+        self._level = level
+
+    def get_algorithm(self) -> CompressionAlgorithm:
+        return self._algorithm
+
+    def get_threshold_bytes(self) -> int:
+        return self._threshold_bytes
+
+    def get_level(self) -> Optional[int]:
+        return self._level
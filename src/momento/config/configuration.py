@@ -5,9 +5,14 @@ from pathlib import Path
 from typing import List, Optional
 
 import momento.config.middleware.aio
-from momento.retry import RetryStrategy
+from momento.retry import RetryBudget, RetryStrategy
+from momento.serialization import JsonSerializer, Serializer
 
+from .circuit_breaker import CircuitBreakerPolicy
+from .compression import CompressionConfiguration
+from .hedging import HedgingPolicy
 from .middleware import Middleware
+from .near_cache import NearCacheConfiguration
 from .transport.transport_strategy import TransportStrategy
 
 
@@ -19,6 +24,13 @@ class Configuration:
         transport_strategy: TransportStrategy,
         retry_strategy: RetryStrategy,
         middlewares: Optional[List[Middleware]] = None,
+        near_cache_configuration: Optional[NearCacheConfiguration] = None,
+        request_coalescing: bool = False,
+        retry_budget: Optional[RetryBudget] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        circuit_breaker_policy: Optional[CircuitBreakerPolicy] = None,
+        serializer: Optional[Serializer] = None,
+        compression_configuration: Optional[CompressionConfiguration] = None,
     ):
         """Instantiate a Configuration.
 
@@ -27,10 +39,30 @@ class Configuration:
             the Momento service.
             retry_strategy (RetryStrategy): the strategy to use when determining whether to retry a grpc call.
             middlewares: Middleware that can intercept Momento calls. May be aio or synchronous.
+            near_cache_configuration (Optional[NearCacheConfiguration]): Configuration options for the
+            in-process near cache. The near cache is disabled when None.
+            request_coalescing (bool): Whether concurrent identical reads share a single request.
+            retry_budget (Optional[RetryBudget]): Caps retries to a fraction of recent request volume.
+            Retries are only limited by the retry strategy when None.
+            hedging_policy (Optional[HedgingPolicy]): When to send a second attempt of a slow idempotent read.
+            Reads are not hedged when None.
+            circuit_breaker_policy (Optional[CircuitBreakerPolicy]): When to fail requests fast on an unhealthy
+            data channel. There is no circuit breaker when None.
+            serializer (Optional[Serializer]): Converts values to and from bytes for the `*_object` methods.
+            Values are serialized as JSON when None.
+            compression_configuration (Optional[CompressionConfiguration]): When and how to compress values.
+            Values are not compressed when None.
         """
         self._transport_strategy = transport_strategy
         self._retry_strategy = retry_strategy
         self._middlewares: List[Middleware] = list(middlewares or [])
+        self._near_cache_configuration = near_cache_configuration
+        self._request_coalescing = request_coalescing
+        self._retry_budget = retry_budget
+        self._hedging_policy = hedging_policy
+        self._circuit_breaker_policy = circuit_breaker_policy
+        self._serializer = serializer or JsonSerializer()
+        self._compression_configuration = compression_configuration
 
     def get_retry_strategy(self) -> RetryStrategy:
         """Access the retry strategy.
@@ -49,7 +81,18 @@ class Configuration:
         Returns:
             Configuration: the new Configuration with the specified RetryStrategy.
         """
-        return Configuration(self._transport_strategy, retry_strategy, self._middlewares)
+        return Configuration(
+            self._transport_strategy,
+            retry_strategy,
+            self._middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
 
     def get_transport_strategy(self) -> TransportStrategy:
         """Access the transport strategy.
@@ -68,7 +111,18 @@ class Configuration:
         Returns:
             Configuration: the new Configuration with the specified TransportStrategy.
         """
-        return Configuration(transport_strategy, self._retry_strategy, self._middlewares)
+        return Configuration(
+            transport_strategy,
+            self._retry_strategy,
+            self._middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
 
     def with_client_timeout(self, client_timeout: timedelta) -> Configuration:
         """Copies the Configuration and sets the new client-side timeout in the copy's TransportStrategy.
@@ -83,6 +137,13 @@ class Configuration:
             self._transport_strategy.with_client_timeout(client_timeout),
             self._retry_strategy,
             self._middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
         )
 
     def with_root_certificates_pem(self, root_certificates_pem_path: Path) -> Configuration:
@@ -100,6 +161,23 @@ class Configuration:
         transport_strategy = self._transport_strategy.with_grpc_configuration(grpc_configuration)
         return self.with_transport_strategy(transport_strategy)
 
+    def with_num_channels(self, num_channels: int) -> Configuration:
+        """Copies the Configuration and sets the number of data channels in the copy's TransportStrategy.
+
+        Each channel is a separate connection to the server, which caps the number of concurrent
+        requests per connection. Under high concurrency, more channels let requests proceed
+        instead of queueing; each request is sent on the channel with the fewest requests in flight.
+
+        Args:
+            num_channels (int): the number of data channels to open. Must be positive.
+
+        Returns:
+            Configuration: the new Configuration.
+        """
+        grpc_configuration = self._transport_strategy.get_grpc_configuration().with_num_channels(num_channels)
+        transport_strategy = self._transport_strategy.with_grpc_configuration(grpc_configuration)
+        return self.with_transport_strategy(transport_strategy)
+
     def with_middlewares(self, middlewares: List[Middleware]) -> Configuration:
         """Copies the Configuration and replaces the middleware with the given middleware list.
 
@@ -109,7 +187,18 @@ class Configuration:
         Returns:
             Configuration: the new Configuration.
         """
-        return Configuration(self._transport_strategy, self._retry_strategy, middlewares)
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
 
     def add_middleware(self, middleware: Middleware) -> Configuration:
         """Copies the Configuration and adds the new middleware to the end of the list.
@@ -122,7 +211,240 @@ class Configuration:
             Configuration: the new Configuration.
         """
         new_middlewares = self._middlewares.copy() + [middleware]
-        return Configuration(self._transport_strategy, self._retry_strategy, new_middlewares)
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            new_middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
+
+    def get_near_cache_configuration(self) -> Optional[NearCacheConfiguration]:
+        """Access the near cache configuration.
+
+        Returns:
+            Optional[NearCacheConfiguration]: the near cache configuration, or None if the near cache is disabled.
+        """
+        return self._near_cache_configuration
+
+    def with_near_cache(self, near_cache_configuration: Optional[NearCacheConfiguration]) -> Configuration:
+        """Copies the Configuration and enables the in-process near cache with the given options.
+
+        Hits for `get`, `dictionary_fetch` and `set_fetch` are served from memory for up to the
+        configured max staleness, so reads may not reflect writes made by other clients within
+        that window. Writes made through this client invalidate the entries they touch.
+
+        Args:
+            near_cache_configuration (Optional[NearCacheConfiguration]): the near cache options,
+            or None to disable the near cache.
+
+        Returns:
+            Configuration: the new Configuration.
+        """
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            self._middlewares,
+            near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
+
+    def get_request_coalescing(self) -> bool:
+        """Check whether request coalescing is enabled.
+
+        Returns:
+            bool: True if concurrent identical reads share a single request.
+        """
+        return self._request_coalescing
+
+    def with_request_coalescing(self, request_coalescing: bool = True) -> Configuration:
+        """Copies the Configuration and enables or disables request coalescing.
+
+        With coalescing enabled, a `get`, `dictionary_get_fields`, `list_fetch` or `sorted_set_fetch_*`
+        call made while an identical call from the same client is still in flight does not issue
+        its own request; it waits for the in-flight one and receives the same response object.
+
+        Args:
+            request_coalescing (bool): whether concurrent identical reads share a single request.
+
+        Returns:
+            Configuration: the new Configuration.
+        """
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            self._middlewares,
+            self._near_cache_configuration,
+            request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
+
+    def get_retry_budget(self) -> Optional[RetryBudget]:
+        """Access the retry budget.
+
+        Returns:
+            Optional[RetryBudget]: the retry budget, or None if retries are not budgeted.
+        """
+        return self._retry_budget
+
+    def with_retry_budget(self, retry_budget: Optional[RetryBudget]) -> Configuration:
+        """Copies the Configuration and sets the budget capping retries across all of a client's requests.
+
+        Args:
+            retry_budget (Optional[RetryBudget]): the new retry budget, or None to only limit retries
+            by the retry strategy.
+
+        Returns:
+            Configuration: the new Configuration.
+        """
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            self._middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
+
+    def get_hedging_policy(self) -> Optional[HedgingPolicy]:
+        """Access the hedging policy.
+
+        Returns:
+            Optional[HedgingPolicy]: the hedging policy, or None if reads are not hedged.
+        """
+        return self._hedging_policy
+
+    def with_hedging_policy(self, hedging_policy: Optional[HedgingPolicy]) -> Configuration:
+        """Copies the Configuration and sets the policy for hedging slow idempotent reads.
+
+        Args:
+            hedging_policy (Optional[HedgingPolicy]): the new hedging policy, or None to disable hedging.
+
+        Returns:
+            Configuration: the new Configuration.
+        """
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            self._middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
+
+    def get_circuit_breaker_policy(self) -> Optional[CircuitBreakerPolicy]:
+        """Access the circuit breaker policy.
+
+        Returns:
+            Optional[CircuitBreakerPolicy]: the circuit breaker policy, or None if there is no circuit breaker.
+        """
+        return self._circuit_breaker_policy
+
+    def with_circuit_breaker(self, circuit_breaker_policy: Optional[CircuitBreakerPolicy]) -> Configuration:
+        """Copies the Configuration and sets the policy for failing requests fast on an unhealthy data channel.
+
+        Args:
+            circuit_breaker_policy (Optional[CircuitBreakerPolicy]): the new circuit breaker policy,
+            or None to disable the circuit breaker.
+
+        Returns:
+            Configuration: the new Configuration.
+        """
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            self._middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            circuit_breaker_policy,
+            self._serializer,
+            self._compression_configuration,
+        )
+
+    def get_serializer(self) -> Serializer:
+        """Access the serializer.
+
+        Returns:
+            Serializer: the serializer the `*_object` methods use unless a call passes its own.
+        """
+        return self._serializer
+
+    def with_serializer(self, serializer: Serializer) -> Configuration:
+        """Copies the Configuration and sets the serializer used by the `*_object` methods.
+
+        Args:
+            serializer (Serializer): the new serializer.
+
+        Returns:
+            Configuration: the new Configuration.
+        """
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            self._middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            serializer,
+            self._compression_configuration,
+        )
+
+    def get_compression_configuration(self) -> Optional[CompressionConfiguration]:
+        """Access the compression configuration.
+
+        Returns:
+            Optional[CompressionConfiguration]: the compression configuration, or None if values are not compressed.
+        """
+        return self._compression_configuration
+
+    def with_compression(self, compression_configuration: Optional[CompressionConfiguration]) -> Configuration:
+        """Copies the Configuration and sets when and how values are compressed.
+
+        Args:
+            compression_configuration (Optional[CompressionConfiguration]): the compression options,
+            or None to disable compression.
+
+        Returns:
+            Configuration: the new Configuration.
+        """
+        return Configuration(
+            self._transport_strategy,
+            self._retry_strategy,
+            self._middlewares,
+            self._near_cache_configuration,
+            self._request_coalescing,
+            self._retry_budget,
+            self._hedging_policy,
+            self._circuit_breaker_policy,
+            self._serializer,
+            compression_configuration,
+        )
 
     def get_middlewares(self) -> List[Middleware]:
         """Access the middleware list.
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from momento.errors import InvalidArgumentException
+from momento.internal.services import Service
+
+
+class HedgingPolicy:
+    """Configuration options for hedging idempotent reads.
+
+    When a hedged read has not completed after the configured percentile of recent latencies for
+    its RPC, a second attempt is sent on a different data channel, and whichever completes first
+    is returned while the other is cancelled. `get`, `dictionary_fetch` and the `sorted_set_fetch_*`
+    methods are hedged, provided their RPC is in the retry eligibility list of idempotent requests.
+
+    No read is hedged until its RPC has enough recent latency samples to estimate the percentile.
+    Hedging at the 95th percentile sends roughly 5% more requests.
+    """
+
+    def __init__(self, *, latency_percentile: float = 95.0, min_delay: timedelta = timedelta(milliseconds=1)):
+        """Instantiate a hedging policy.
+
+        Args:
+            latency_percentile (float): the percentile of recent latencies after which a read is hedged.
+            Must be between 0 and 100, exclusive.
+            min_delay (timedelta): the shortest time a read waits before it is hedged.
+        """
+        if not 0 < latency_percentile < 100:
+            raise InvalidArgumentException("Latency percentile must be between 0 and 100.", Service.CACHE)
+        if min_delay < timedelta(0):
+            raise InvalidArgumentException("Min delay must not be negative.", Service.CACHE)
+        self._latency_percentile = latency_percentile
+        self._min_delay = min_delay
+
+    def get_latency_percentile(self) -> float:
+        return self._latency_percentile
+
+    def get_min_delay(self) -> timedelta:
+        return self._min_delay
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """A snapshot of the hedging counters."""
+
+    requests: int
+    """Hedgeable reads issued."""
+    hedges: int
+    """Reads for which a second attempt was sent."""
+    hedge_wins: int
+    """Hedged reads answered by the second attempt."""
+
+    @property
+    def hedge_rate(self) -> float:
+        """The fraction of hedgeable reads that sent a second attempt, i.e. the extra load."""
+        return self.hedges / self.requests if self.requests else 0.0
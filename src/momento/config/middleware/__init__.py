@@ -2,6 +2,8 @@ from typing import Union
 
 from momento.config.middleware.aio import Middleware as AsyncMiddleware
 from momento.config.middleware.models import (
+    CircuitBreakerState,
+    CircuitBreakerStateChange,
     MiddlewareMessage,
     MiddlewareRequestHandlerContext,
     MiddlewareStatus,
@@ -11,6 +13,8 @@ from momento.config.middleware.synchronous import Middleware as SyncMiddleware
 Middleware = Union[SyncMiddleware, AsyncMiddleware]
 
 __all__ = [
+    "CircuitBreakerState",
+    "CircuitBreakerStateChange",
     "Middleware",
     "MiddlewareMessage",
     "MiddlewareStatus",
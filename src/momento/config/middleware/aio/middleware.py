@@ -1,7 +1,12 @@
 import abc
 
 from momento.config.middleware.aio.middleware_metadata import MiddlewareMetadata
-from momento.config.middleware.models import MiddlewareMessage, MiddlewareRequestHandlerContext, MiddlewareStatus
+from momento.config.middleware.models import (
+    CircuitBreakerStateChange,
+    MiddlewareMessage,
+    MiddlewareRequestHandlerContext,
+    MiddlewareStatus,
+)
 
 
 class MiddlewareRequestHandler(abc.ABC):
@@ -34,3 +39,8 @@ class Middleware(abc.ABC):
     # noinspection PyMethodMayBeStatic
     def close(self) -> None:
         return None
+
+    # noinspection PyMethodMayBeStatic
+    def on_circuit_breaker_state_change(self, state_change: CircuitBreakerStateChange) -> None:
+        """Called when the circuit breaker of a data channel opens, closes or starts probing the server."""
+        return None
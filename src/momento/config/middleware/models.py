@@ -1,3 +1,4 @@
+import enum
 from dataclasses import dataclass
 from typing import Dict
 
@@ -36,3 +37,24 @@ class MiddlewareRequestHandlerContext:
     """Context for middleware request handlers."""
 
     context: Dict[str, str]
+
+
+class CircuitBreakerState(enum.Enum):
+    """The state of a data channel's circuit breaker."""
+
+    CLOSED = "closed"
+    """Requests are sent normally."""
+    OPEN = "open"
+    """Requests fail fast without being sent."""
+    HALF_OPEN = "half_open"
+    """A limited number of trial requests are sent to find out whether the server has recovered."""
+
+
+@dataclass(frozen=True)
+class CircuitBreakerStateChange:
+    """A transition of a data channel's circuit breaker."""
+
+    channel_index: int
+    """The index of the data channel whose circuit breaker changed state."""
+    previous_state: CircuitBreakerState
+    state: CircuitBreakerState
@@ -1,6 +1,11 @@
 import abc
 
-from momento.config.middleware.models import MiddlewareMessage, MiddlewareRequestHandlerContext, MiddlewareStatus
+from momento.config.middleware.models import (
+    CircuitBreakerStateChange,
+    MiddlewareMessage,
+    MiddlewareRequestHandlerContext,
+    MiddlewareStatus,
+)
 from momento.config.middleware.synchronous.middleware_metadata import MiddlewareMetadata
 
 
@@ -34,3 +39,8 @@ class Middleware(abc.ABC):
     # noinspection PyMethodMayBeStatic
     def close(self) -> None:
         return None
+
+    # noinspection PyMethodMayBeStatic
+    def on_circuit_breaker_state_change(self, state_change: CircuitBreakerStateChange) -> None:
+        """Called when the circuit breaker of a data channel opens, closes or starts probing the server."""
+        return None
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+
+from momento.internal._utilities import _validate_positive_int, _validate_timedelta_ttl
+
+
+class NearCacheConfiguration:
+    """Configuration options for the optional in-process near cache.
+
+    The near cache keeps recent `get`, `dictionary_fetch` and `set_fetch` hits in memory, so
+    repeated reads of hot keys are answered without a round trip to Momento. An entry is
+    served for at most `max_staleness` after it was read from the server, and not past the TTL
+    the same client last wrote the item with. Writes made through the same client invalidate the
+    entries they touch. Least recently used entries are evicted to stay within `max_entries`
+    and `max_size_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_staleness: timedelta,
+        max_entries: int = 10_000,
+        max_size_bytes: int = 64 * 1024 * 1024,
+    ):
+        """Instantiate a near cache configuration.
+
+        Args:
+            max_staleness (timedelta): How long an entry may be served after it was read from the server.
+            max_entries (int): The maximum number of entries held.
+            max_size_bytes (int): The maximum total size of the keys and values held.
+        """
+        _validate_timedelta_ttl(max_staleness, "Max staleness")
+        _validate_positive_int(max_entries, "Max entries")
+        _validate_positive_int(max_size_bytes, "Max size in bytes")
+        self._max_staleness = max_staleness
+        self._max_entries = max_entries
+        self._max_size_bytes = max_size_bytes
+
+    def get_max_staleness(self) -> timedelta:
+        return self._max_staleness
+
+    def with_max_staleness(self, max_staleness: timedelta) -> NearCacheConfiguration:
+        return NearCacheConfiguration(max_staleness, self._max_entries, self._max_size_bytes)
+
+    def get_max_entries(self) -> int:
+        return self._max_entries
+
+    def with_max_entries(self, max_entries: int) -> NearCacheConfiguration:
+        return NearCacheConfiguration(self._max_staleness, max_entries, self._max_size_bytes)
+
+    def get_max_size_bytes(self) -> int:
+        return self._max_size_bytes
+
+    def with_max_size_bytes(self, max_size_bytes: int) -> NearCacheConfiguration:
+        return NearCacheConfiguration(self._max_staleness, self._max_entries, max_size_bytes)
+
+
+@dataclass(frozen=True)
+class NearCacheStats:
+    """A snapshot of the near cache counters."""
+
+    hits: int
+    """Reads answered from the near cache."""
+    misses: int
+    """Reads that went to the server because no fresh entry was held."""
+    evictions: int
+    """Entries removed to stay within the entry and size limits."""
+    entries: int
+    """Entries currently held."""
+    size_bytes: int
+    """Total size of the keys and values currently held."""
@@ -5,6 +5,9 @@ from datetime import timedelta
 from pathlib import Path
 from typing import Optional
 
+from momento.errors import InvalidArgumentException
+from momento.internal.services import Service
+
 
 class GrpcConfiguration(ABC):
     @abstractmethod
@@ -42,3 +45,19 @@ class GrpcConfiguration(ABC):
     @abstractmethod
     def get_keepalive_timeout(self) -> Optional[timedelta]:
         pass
+
+    def get_num_channels(self) -> int:
+        """Returns the number of channels data requests are spread across. Defaults to 1."""
+        return 1
+
+    def with_num_channels(self, num_channels: int) -> GrpcConfiguration:
+        """Copy constructor for the number of channels.
+
+        Configurations that do not override this method only support their own number of channels.
+
+        Raises:
+            InvalidArgumentException: if the configuration does not support `num_channels`.
+        """
+        if num_channels == self.get_num_channels():
+            return self
+        raise InvalidArgumentException(f"{type(self).__name__} does not support {num_channels} channels", Service.CACHE)
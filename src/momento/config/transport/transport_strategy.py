@@ -5,7 +5,9 @@ from datetime import timedelta
 from pathlib import Path
 from typing import Optional
 
-from momento.internal._utilities import _validate_request_timeout
+from momento.errors import InvalidArgumentException
+from momento.internal._utilities import _validate_num_channels, _validate_request_timeout, _validate_timedelta_ttl
+from momento.internal.services import Service
 
 from .grpc_configuration import GrpcConfiguration
 
@@ -57,7 +59,9 @@ class StaticGrpcConfiguration(GrpcConfiguration):
         keepalive_permit_without_calls: Optional[bool] = True,
         keepalive_time: Optional[timedelta] = timedelta(milliseconds=5000),
         keepalive_timeout: Optional[timedelta] = timedelta(milliseconds=1000),
+        num_channels: int = 1,
     ):
+        _validate_num_channels(num_channels)
         self._deadline = deadline
         self._root_certificates_pem = root_certificates_pem
         self._max_send_message_length = max_send_message_length
@@ -65,13 +69,14 @@ class StaticGrpcConfiguration(GrpcConfiguration):
         self._keepalive_permit_without_calls = keepalive_permit_without_calls
         self._keepalive_time = keepalive_time
         self._keepalive_timeout = keepalive_timeout
+        self._num_channels = num_channels
 
     def get_deadline(self) -> timedelta:
         return self._deadline
 
     def with_deadline(self, deadline: timedelta) -> GrpcConfiguration:
         _validate_request_timeout(deadline)
-        return StaticGrpcConfiguration(deadline, self._root_certificates_pem)
+        return self._copy(deadline=deadline)
 
     def with_root_certificates_pem(self, root_certificates_pem_path: Path) -> GrpcConfiguration:
         try:
@@ -80,7 +85,7 @@ class StaticGrpcConfiguration(GrpcConfiguration):
             raise FileNotFoundError(f"Root certificate file not found at path: {root_certificates_pem_path}") from e
         except PermissionError as e:
             raise PermissionError(f"Root certificate file not readable at path: {root_certificates_pem_path}") from e
-        return StaticGrpcConfiguration(self._deadline, root_certificates_pem_bytes)
+        return self._copy(root_certificates_pem=root_certificates_pem_bytes)
 
     def get_root_certificates_pem(self) -> Optional[bytes]:
         return self._root_certificates_pem
@@ -100,6 +105,31 @@ class StaticGrpcConfiguration(GrpcConfiguration):
     def get_keepalive_timeout(self) -> Optional[timedelta]:
         return self._keepalive_timeout
 
+    def get_num_channels(self) -> int:
+        return self._num_channels
+
+    def with_num_channels(self, num_channels: int) -> GrpcConfiguration:
+        return self._copy(num_channels=num_channels)
+
+    def _copy(
+        self,
+        deadline: Optional[timedelta] = None,
+        root_certificates_pem: Optional[bytes] = None,
+        num_channels: Optional[int] = None,
+    ) -> StaticGrpcConfiguration:
+        return StaticGrpcConfiguration(
+            deadline=deadline if deadline is not None else self._deadline,
+            root_certificates_pem=(
+                root_certificates_pem if root_certificates_pem is not None else self._root_certificates_pem
+            ),
+            max_send_message_length=self._max_send_message_length,
+            max_receive_message_length=self._max_receive_message_length,
+            keepalive_permit_without_calls=self._keepalive_permit_without_calls,
+            keepalive_time=self._keepalive_time,
+            keepalive_timeout=self._keepalive_timeout,
+            num_channels=num_channels if num_channels is not None else self._num_channels,
+        )
+
 
 class StaticTransportStrategy(TransportStrategy):
     def __init__(self, grpc_configuration: GrpcConfiguration):
@@ -113,3 +143,68 @@ class StaticTransportStrategy(TransportStrategy):
 
     def with_client_timeout(self, client_timeout: timedelta) -> TransportStrategy:
         return self.with_grpc_configuration(self._grpc_configuration.with_deadline(client_timeout))
+
+
+class AdaptiveTransportStrategy(TransportStrategy):
+    """Derives the deadline of each idempotent data request from recently observed latencies.
+
+    Latencies are tracked per RPC method. Once a method has enough samples, each attempt gets a
+    deadline of the configured latency percentile times `deadline_factor`, clamped between
+    `min_deadline` and the gRPC configuration's deadline. An attempt abandoned at that shorter
+    deadline is sent again right away with the rest of the configured deadline, so a stalled
+    request is retried instead of waiting out the full client timeout. Like any other retry, the
+    re-send spends a token of the configured retry budget, and is skipped when the budget is exhausted.
+
+    Requests that are not idempotent always use the configured deadline, since abandoning them
+    early could leave the caller unsure whether the write happened.
+    """
+
+    def __init__(
+        self,
+        grpc_configuration: GrpcConfiguration,
+        *,
+        latency_percentile: float = 99.0,
+        deadline_factor: float = 2.0,
+        min_deadline: timedelta = timedelta(milliseconds=50),
+    ):
+        """Instantiate an adaptive transport strategy.
+
+        Args:
+            grpc_configuration (GrpcConfiguration): the gRPC settings. Its deadline caps the adaptive deadline.
+            latency_percentile (float): the percentile of recent latencies the deadline is derived from.
+            Must be between 0 and 100, exclusive.
+            deadline_factor (float): the multiple of that percentile used as the deadline. Must be at least 1.
+            min_deadline (timedelta): the shortest deadline an attempt is given.
+        """
+        if not 0 < latency_percentile < 100:
+            raise InvalidArgumentException("Latency percentile must be between 0 and 100.", Service.CACHE)
+        if deadline_factor < 1:
+            raise InvalidArgumentException("Deadline factor must be at least 1.", Service.CACHE)
+        _validate_timedelta_ttl(min_deadline, "Min deadline")
+        self._grpc_configuration = grpc_configuration
+        self._latency_percentile = latency_percentile
+        self._deadline_factor = deadline_factor
+        self._min_deadline = min_deadline
+
+    def get_grpc_configuration(self) -> GrpcConfiguration:
+        return self._grpc_configuration
+
+    def with_grpc_configuration(self, grpc_configuration: GrpcConfiguration) -> TransportStrategy:
+        return AdaptiveTransportStrategy(
+            grpc_configuration,
+            latency_percentile=self._latency_percentile,
+            deadline_factor=self._deadline_factor,
+            min_deadline=self._min_deadline,
+        )
+
+    def with_client_timeout(self, client_timeout: timedelta) -> TransportStrategy:
+        return self.with_grpc_configuration(self._grpc_configuration.with_deadline(client_timeout))
+
+    def get_latency_percentile(self) -> float:
+        return self._latency_percentile
+
+    def get_deadline_factor(self) -> float:
+        return self._deadline_factor
+
+    def get_min_deadline(self) -> timedelta:
+        return self._min_deadline
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
+
+
+class CounterDeliveryPolicy(Enum):
+    """What a counter aggregator does with increments whose flush request fails."""
+
+    AT_MOST_ONCE = "at_most_once"
+    """Drop them. An increment is never applied twice, but may be lost."""
+    AT_LEAST_ONCE = "at_least_once"
+    """Keep them for the next flush, unless the error means a retry cannot succeed. An increment is never
+    lost to a transient error, but is applied twice if the failed request reached the server, such as
+    when it timed out waiting for the response."""
+
+
+@dataclass(frozen=True)
+class CounterAggregatorStats:
+    """A snapshot of the counter aggregator counters."""
+
+    increments: int
+    """Calls to `increment` and `dictionary_increment`."""
+    pending_increments: int
+    """Increments waiting for the next flush."""
+    flushes: int
+    """Flushes that sent at least one request."""
+    requests: int
+    """Increment requests sent by flushes."""
+    flushed_increments: int
+    """Increments summed into those requests. An increment retried under AT_LEAST_ONCE counts once per request."""
+    failed_requests: int
+    """Requests that returned an error."""
+    dropped_increments: int
+    """Increments never applied, because their request failed or they were still pending on close."""
+    last_flush_latency: timedelta
+    """How long the last flush took to send its requests and receive their responses."""
+    max_flush_latency: timedelta
+    """The longest flush."""
+    total_flush_latency: timedelta
+    """The time spent in all flushes."""
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """The mean number of increments summed into one request. Unaggregated, each would have been a request."""
+        return self.flushed_increments / self.requests if self.requests else 0.0
+
+    @property
+    def mean_flush_latency(self) -> timedelta:
+        return self.total_flush_latency / self.flushes if self.flushes else timedelta(0)
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from types import TracebackType
+from typing import Optional, Type
+
+from momento import logs
+from momento.cache_client import CacheClient
+from momento.counter_aggregation import CounterAggregatorStats, CounterDeliveryPolicy
+from momento.errors import SdkException, convert_error
+from momento.internal._utilities import (
+    _as_bytes,
+    _validate_cache_name,
+    _validate_dictionary_name,
+    _validate_positive_int,
+    _validate_timedelta_ttl,
+    _validate_ttl,
+)
+from momento.internal._utilities._pending_counters import _Counter, _PendingCounters, _validate_amount
+from momento.internal.services import Service
+from momento.requests import CollectionTtl
+from momento.responses.mixins import ErrorResponseMixin
+from momento.responses.response import CacheResponse
+
+# How many requests a flush has in flight at once.
+_MAX_CONCURRENT_REQUESTS = 16
+
+
+class CounterAggregator:
+    """Sums `increment` and `dictionary_increment` calls in-process and writes each sum with one request.
+
+    Increments are summed per cache, key or dictionary field, and TTL. The sums are written by a
+    background thread every `flush_interval`, or as soon as `flush_threshold` increments are
+    pending, with one `increment` or `dictionary_increment` request per key or field. Up to 16 of a
+    flush's requests are in flight at once. Callers do not wait for the write and do not see the
+    resulting value.
+
+    Increment requests are not retried by the client, because a retry may apply an increment twice.
+    What happens to the increments of a failed request instead is set by `delivery`.
+
+    Example:
+        with CounterAggregator(client) as counters:
+            for request in requests:
+                counters.increment(cache_name, f"page-views:{request.path}")
+    """
+
+    def __init__(
+        self,
+        client: CacheClient,
+        *,
+        flush_interval: timedelta = timedelta(seconds=1),
+        flush_threshold: int = 10_000,
+        delivery: CounterDeliveryPolicy = CounterDeliveryPolicy.AT_MOST_ONCE,
+        flush_on_close: bool = True,
+    ):
+        """Instantiate a counter aggregator and start its flush thread.
+
+        Args:
+            client (CacheClient): The client that writes the sums. Closing the aggregator does not close it.
+            flush_interval (timedelta): How often pending sums are written.
+            flush_threshold (int): The number of pending increments that causes the sums to be written right away.
+            delivery (CounterDeliveryPolicy): What to do with the increments of a failed request.
+            flush_on_close (bool): Whether `close` writes the pending sums, or drops them.
+        """
+        _validate_timedelta_ttl(flush_interval, "Flush interval")
+        _validate_positive_int(flush_threshold, "Flush threshold")
+        self._logger = logs.logger
+        self._client = client
+        self._flush_interval_seconds = flush_interval.total_seconds()
+        self._flush_threshold = flush_threshold
+        self._flush_on_close = flush_on_close
+        self._pending = _PendingCounters(delivery)
+        self._flush_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=_MAX_CONCURRENT_REQUESTS, thread_name_prefix="momento-counter-aggregator-send"
+        )
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="momento-counter-aggregator", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> CounterAggregator:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def increment(self, cache_name: str, key: str | bytes, amount: int = 1, ttl: Optional[timedelta] = None) -> None:
+        """Adds to a value with the next flush.
+
+        See `CacheClient.increment` for the arguments.
+
+        Raises:
+            InvalidArgumentException: If an argument is invalid.
+            FailedPreconditionException: If the aggregator is closed.
+        """
+        _validate_cache_name(cache_name)
+        _validate_ttl(ttl)
+        _validate_amount(amount)
+        self._add(cache_name, None, _as_bytes(key, "Unsupported type for key: "), amount, ttl, True)
+
+    def dictionary_increment(
+        self,
+        cache_name: str,
+        dictionary_name: str,
+        field: str | bytes,
+        amount: int = 1,
+        *,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+    ) -> None:
+        """Adds to a dictionary value with the next flush.
+
+        See `CacheClient.dictionary_increment` for the arguments.
+
+        Raises:
+            InvalidArgumentException: If an argument is invalid.
+            FailedPreconditionException: If the aggregator is closed.
+        """
+        _validate_cache_name(cache_name)
+        _validate_dictionary_name(dictionary_name)
+        _validate_amount(amount)
+        field_bytes = _as_bytes(field, "Unsupported type for field: ")
+        self._add(cache_name, dictionary_name, field_bytes, amount, ttl.ttl, ttl.refresh_ttl)
+
+    def flush(self) -> None:
+        """Writes the pending sums now, returning once every request has a response."""
+        with self._flush_lock:
+            counters = self._pending.take()
+            if not counters:
+                return
+            start = time.monotonic()
+            errors = list(self._executor.map(self._send, counters))
+            for counter, error in zip(counters, errors):
+                self._pending.record_response(counter, error)
+            latency = time.monotonic() - start
+            self._pending.record_flush(latency)
+            self._logger.debug("Flushed %d counters in %.3f seconds", len(counters), latency)
+
+    def close(self) -> None:
+        """Stops the flush thread, then writes or drops the pending sums as set by `flush_on_close`."""
+        if self._pending.closed:
+            return
+        self._pending.close()
+        self._wake.set()
+        self._thread.join()
+        if self._flush_on_close:
+            self.flush()
+        self._pending.drop_pending()
+        self._executor.shutdown()
+
+    def get_stats(self) -> CounterAggregatorStats:
+        """Returns the increment, request and flush latency counters of the aggregator."""
+        return self._pending.stats()
+
+    def _add(
+        self,
+        cache_name: str,
+        dictionary_name: Optional[str],
+        key: bytes,
+        amount: int,
+        ttl: Optional[timedelta],
+        refresh_ttl: bool,
+    ) -> None:
+        if self._pending.add(cache_name, dictionary_name, key, amount, ttl, refresh_ttl) >= self._flush_threshold:
+            self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self._flush_interval_seconds)
+            self._wake.clear()
+            if self._pending.closed:
+                return
+            try:
+                self.flush()
+            except Exception:
+                self._logger.exception("Error flushing counters")
+
+    def _send(self, counter: _Counter) -> Optional[SdkException]:
+        response: CacheResponse
+        try:
+            if counter.dictionary_name is None:
+                response = self._client.increment(counter.cache_name, counter.key, counter.amount, counter.ttl)
+            else:
+                response = self._client.dictionary_increment(
+                    counter.cache_name,
+                    counter.dictionary_name,
+                    counter.key,
+                    counter.amount,
+                    ttl=counter.collection_ttl,
+                )
+        except Exception as e:
+            return convert_error(e, Service.CACHE)
+        return response.inner_exception if isinstance(response, ErrorResponseMixin) else None
@@ -15,6 +15,7 @@ from .exceptions import (
     AuthenticationException,
     BadRequestException,
     CancelledException,
+    CircuitBreakerOpenException,
     FailedPreconditionException,
     InternalServerException,
     InvalidArgumentException,
@@ -22,6 +23,7 @@ from .exceptions import (
     NotFoundException,
     PermissionDeniedException,
     SdkException,
+    SerializationException,
     ServerUnavailableException,
     TimeoutException,
     UnknownException,
@@ -40,6 +42,7 @@ __all__ = [
     "AuthenticationException",
     "BadRequestException",
     "CancelledException",
+    "CircuitBreakerOpenException",
     "FailedPreconditionException",
     "InternalServerException",
     "InvalidArgumentException",
@@ -47,6 +50,7 @@ __all__ = [
     "NotFoundException",
     "PermissionDeniedException",
     "SdkException",
+    "SerializationException",
     "ServerUnavailableException",
     "TimeoutException",
     "UnknownException",
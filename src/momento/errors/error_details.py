@@ -44,6 +44,10 @@ class MomentoErrorCode(enum.Enum):
     """Unknown error has occurred"""
     CONNECTION_ERROR = 16
     """Connection to the Momento server failed"""
+    CIRCUIT_BREAKER_OPEN_ERROR = 17
+    """Requests are failing fast because too many recent requests on the connection failed"""
+    SERIALIZATION_ERROR = 18
+    """A value could not be serialized to or deserialized from bytes"""
 
 
 @dataclass
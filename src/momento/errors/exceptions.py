@@ -124,6 +124,42 @@ class CancelledException(SdkException):
         )
 
 
+class CircuitBreakerOpenException(SdkException):
+    """The request was not sent because too many recent requests on its connection failed."""
+
+    def __init__(
+        self,
+        message: str,
+        service: Service,
+        transport_details: Optional[MomentoErrorTransportDetails] = None,
+    ):
+        super().__init__(
+            message,
+            MomentoErrorCode.CIRCUIT_BREAKER_OPEN_ERROR,
+            service,
+            transport_details,
+            message_wrapper="Circuit breaker is open; the request failed fast without being sent to the server",
+        )
+
+
+class SerializationException(SdkException):
+    """A value could not be converted to or from bytes by the serializer."""
+
+    def __init__(
+        self,
+        message: str,
+        service: Service,
+        transport_details: Optional[MomentoErrorTransportDetails] = None,
+    ):
+        super().__init__(
+            message,
+            MomentoErrorCode.SERIALIZATION_ERROR,
+            service,
+            transport_details,
+            message_wrapper="The serializer failed to convert a value",
+        )
+
+
 class ConnectionException(SdkException):
     """Connection to the Momento server failed."""
 
@@ -10,6 +10,8 @@ from ._data_validation import (
     _validate_disposable_token_expiry,
     _validate_eager_connection_timeout,
     _validate_list_name,
+    _validate_num_channels,
+    _validate_positive_int,
     _validate_request_timeout,
     _validate_set_name,
     _validate_timedelta_ttl,
@@ -17,4 +19,5 @@ from ._data_validation import (
     _validate_ttl,
 )
 from ._python_runtime_version import PYTHON_RUNTIME_VERSION
+from ._serialization import _decode_field, _deserialize, _serialize
 from ._time import _timedelta_to_ms
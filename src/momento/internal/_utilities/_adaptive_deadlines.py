@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Dict
+
+import grpc
+
+from momento.config.transport.transport_strategy import AdaptiveTransportStrategy
+from momento.internal._utilities._latency_histogram import _LatencyHistogram
+from momento.retry.default_eligibility_strategy import RETRYABLE_REQUEST_TYPES
+
+
+class _AdaptiveDeadlines:
+    """Per-method latencies and the attempt deadlines derived from them, shared by a client's data channels."""
+
+    # Latency samples a method needs before its deadline adapts.
+    _MIN_SAMPLES = 100
+
+    def __init__(self, transport_strategy: AdaptiveTransportStrategy):
+        self._latency_percentile = transport_strategy.get_latency_percentile()
+        self._deadline_factor = transport_strategy.get_deadline_factor()
+        self._min_deadline_seconds = transport_strategy.get_min_deadline().total_seconds()
+        self._latencies: Dict[str, _LatencyHistogram] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def is_adaptive(method: str) -> bool:
+        # Only idempotent requests, which are the ones eligible for retries, can safely be abandoned and sent again.
+        return method in RETRYABLE_REQUEST_TYPES
+
+    def attempt_timeout(self, method: str, timeout: float) -> float:
+        """Returns the timeout in seconds for an attempt that may take at most `timeout` seconds."""
+        if not self.is_adaptive(method):
+            return timeout
+        histogram = self._histogram(method)
+        if histogram.count < self._MIN_SAMPLES:
+            return timeout
+        latency = histogram.percentile(self._latency_percentile)
+        if latency is None:
+            return timeout
+        return min(timeout, max(self._min_deadline_seconds, latency * self._deadline_factor))
+
+    def record(self, method: str, status_code: grpc.StatusCode, seconds: float) -> None:
+        # Attempts that timed out are counted at their deadline, so that a deadline that is too
+        # short raises the percentile rather than hiding the slow responses it cut off.
+        if status_code in (grpc.StatusCode.OK, grpc.StatusCode.DEADLINE_EXCEEDED) and self.is_adaptive(method):
+            self._histogram(method).record(seconds)
+
+    def _histogram(self, method: str) -> _LatencyHistogram:
+        histogram = self._latencies.get(method)
+        if histogram is None:
+            with self._lock:
+                histogram = self._latencies.setdefault(method, _LatencyHistogram())
+        return histogram
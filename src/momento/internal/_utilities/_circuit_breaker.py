@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import time
+from threading import Lock
+from typing import Callable, Optional, Sequence
+
+import grpc
+
+from momento import logs
+from momento.config.circuit_breaker import CircuitBreakerPolicy
+from momento.config.middleware.models import CircuitBreakerState, CircuitBreakerStateChange
+from momento.errors.exceptions import CircuitBreakerOpenException
+from momento.internal.services import Service
+
+# Status codes that suggest the server or the connection to it is unhealthy. Any other status,
+# including errors such as NOT_FOUND or INVALID_ARGUMENT, means the server answered.
+_FAILURE_STATUS_CODES = {
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.UNKNOWN,
+}
+
+
+class _CircuitBreaker:
+    """The circuit breaker state of one data channel, shared by the aio and synchronous interceptors.
+
+    Requests and failures are counted in buckets that each cover a tenth of the window, so the
+    failure rate covers the last window give or take a bucket and counting stays O(1) per request.
+    """
+
+    _NUM_WINDOW_BUCKETS = 10
+
+    def __init__(
+        self,
+        policy: CircuitBreakerPolicy,
+        channel_index: int,
+        listeners: Sequence[Callable[[CircuitBreakerStateChange], None]],
+    ):
+        self._logger = logs.logger
+        self._failure_rate_threshold = policy.get_failure_rate_threshold()
+        self._minimum_requests = policy.get_minimum_requests()
+        self._bucket_seconds = policy.get_window().total_seconds() / self._NUM_WINDOW_BUCKETS
+        self._open_seconds = policy.get_open_duration().total_seconds()
+        self._half_open_max_probes = policy.get_half_open_max_probes()
+        self._channel_index = channel_index
+        self._listeners = listeners
+        self._lock = Lock()
+        self._state = CircuitBreakerState.CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._bucket_ids = [-1] * self._NUM_WINDOW_BUCKETS
+        self._requests = [0] * self._NUM_WINDOW_BUCKETS
+        self._failures = [0] * self._NUM_WINDOW_BUCKETS
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        return self._state
+
+    def is_accepting_requests(self) -> bool:
+        """Returns whether `acquire` would admit a request now, without changing the state."""
+        if self._state == CircuitBreakerState.OPEN:
+            return time.monotonic() - self._opened_at >= self._open_seconds
+        if self._state == CircuitBreakerState.HALF_OPEN:
+            return self._probes_in_flight < self._half_open_max_probes
+        return True
+
+    def acquire(self) -> bool:
+        """Admits a request, returning whether it is a half-open probe.
+
+        Raises:
+            CircuitBreakerOpenException: if the circuit is open, or half-open with all probes in flight.
+        """
+        state_change = None
+        with self._lock:
+            if self._state == CircuitBreakerState.OPEN and time.monotonic() - self._opened_at >= self._open_seconds:
+                state_change = self._transition(CircuitBreakerState.HALF_OPEN)
+            if self._state == CircuitBreakerState.CLOSED:
+                probe = False
+            elif self._state == CircuitBreakerState.HALF_OPEN and self._probes_in_flight < self._half_open_max_probes:
+                self._probes_in_flight += 1
+                probe = True
+            else:
+                probe = None
+        self._notify(state_change)
+        if probe is None:
+            raise CircuitBreakerOpenException(
+                f"Too many recent requests on data channel {self._channel_index} failed", Service.CACHE
+            )
+        return probe
+
+    def record(self, status_code: grpc.StatusCode, probe: bool) -> None:
+        """Records the outcome of a request admitted by `acquire`.
+
+        A cancelled request, such as the losing attempt of a hedged read, says nothing about the
+        health of the server: it only frees its probe slot and is not counted.
+        """
+        failed = status_code in _FAILURE_STATUS_CODES
+        cancelled = status_code == grpc.StatusCode.CANCELLED
+        state_change = None
+        with self._lock:
+            if probe:
+                self._probes_in_flight -= 1
+                if self._state == CircuitBreakerState.HALF_OPEN and not cancelled:
+                    state_change = self._open() if failed else self._close()
+            elif self._state == CircuitBreakerState.CLOSED and not cancelled and self._count(failed):
+                state_change = self._open()
+        self._notify(state_change)
+
+    def _count(self, failed: bool) -> bool:
+        """Counts a request in the current bucket, returning whether the failure rate calls for opening."""
+        bucket_id = int(time.monotonic() / self._bucket_seconds)
+        bucket = bucket_id % self._NUM_WINDOW_BUCKETS
+        if self._bucket_ids[bucket] != bucket_id:
+            self._bucket_ids[bucket] = bucket_id
+            self._requests[bucket] = 0
+            self._failures[bucket] = 0
+        self._requests[bucket] += 1
+        if not failed:
+            return False
+        self._failures[bucket] += 1
+
+        oldest_bucket_id = bucket_id - self._NUM_WINDOW_BUCKETS
+        requests = failures = 0
+        for index in range(self._NUM_WINDOW_BUCKETS):
+            if self._bucket_ids[index] > oldest_bucket_id:
+                requests += self._requests[index]
+                failures += self._failures[index]
+        return requests >= self._minimum_requests and failures >= requests * self._failure_rate_threshold
+
+    def _open(self) -> CircuitBreakerStateChange:
+        self._opened_at = time.monotonic()
+        return self._transition(CircuitBreakerState.OPEN)
+
+    def _close(self) -> CircuitBreakerStateChange:
+        self._bucket_ids = [-1] * self._NUM_WINDOW_BUCKETS
+        return self._transition(CircuitBreakerState.CLOSED)
+
+    def _transition(self, state: CircuitBreakerState) -> CircuitBreakerStateChange:
+        state_change = CircuitBreakerStateChange(self._channel_index, self._state, state)
+        self._state = state
+        return state_change
+
+    def _notify(self, state_change: Optional[CircuitBreakerStateChange]) -> None:
+        if state_change is None:
+            return
+        self._logger.warning(
+            "Circuit breaker of data channel %d changed from %s to %s",
+            state_change.channel_index,
+            state_change.previous_state.value,
+            state_change.state.value,
+        )
+        for listener in self._listeners:
+            try:
+                listener(state_change)
+            except Exception:
+                self._logger.exception("Error in circuit breaker state change listener")
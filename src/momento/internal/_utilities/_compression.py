@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import zlib
+from typing import Dict, Optional, Union, cast
+
+from momento.config.compression import CompressionAlgorithm, CompressionConfiguration
+from momento.errors import SerializationException
+from momento.internal.services import Service
+
+# Compressed values start with this marker followed by a byte identifying the algorithm.
+# 0xFF never occurs in UTF-8, so text values are never mistaken for compressed ones.
+_MAGIC = b"\xffMC"
+_HEADER_LENGTH = len(_MAGIC) + 1
+# Uncompressed binary values that happen to start with the marker are sent behind this header,
+# so reads do not mistake them for compressed ones.
+_STORED_HEADER = _MAGIC + b"\x00"
+_ALGORITHM_IDS: Dict[CompressionAlgorithm, int] = {
+    CompressionAlgorithm.ZLIB: 1,
+    CompressionAlgorithm.ZSTD: 2,
+    CompressionAlgorithm.LZ4: 3,
+}
+_ALGORITHMS_BY_ID = {algorithm_id: algorithm for algorithm, algorithm_id in _ALGORITHM_IDS.items()}
+
+
+class _Compressor:
+    """Compresses the values a data client sends and decompresses the values it receives."""
+
+    def __init__(self, configuration: CompressionConfiguration):
+        self._algorithm = configuration.get_algorithm()
+        self._threshold_bytes = configuration.get_threshold_bytes()
+        self._level = configuration.get_level()
+        self._header = _MAGIC + bytes([_ALGORITHM_IDS[self._algorithm]])
+
+    def compress(self, data: Union[bytes, memoryview]) -> bytes:
+        """Returns the value to send for `data`: compressed and tagged, or unchanged if that does not pay off."""
+        if len(data) >= self._threshold_bytes:
+            compressed = _compress(self._algorithm, self._level, data)
+            if len(compressed) + _HEADER_LENGTH < len(data):
+                return self._header + compressed
+        value = data if isinstance(data, bytes) else data.tobytes()
+        return _STORED_HEADER + value if value.startswith(_MAGIC) else value
+
+    def decompress(self, data: bytes) -> bytes:
+        """Returns the original value of a received value, which may or may not be compressed.
+
+        Raises:
+            SerializationException: if the value is tagged as compressed but cannot be decompressed.
+        """
+        if not data.startswith(_MAGIC) or len(data) < _HEADER_LENGTH:
+            return data
+        if data.startswith(_STORED_HEADER):
+            return data[_HEADER_LENGTH:]
+        algorithm = _ALGORITHMS_BY_ID.get(data[len(_MAGIC)])
+        if algorithm is None:
+            return data
+        try:
+            return _decompress(algorithm, memoryview(data)[_HEADER_LENGTH:])
+        except Exception as e:
+            raise SerializationException(
+                f"Could not decompress a {len(data)} byte value tagged as {algorithm.value}: {e}", Service.CACHE
+            ) from e
+
+
+def _compress(algorithm: CompressionAlgorithm, level: Optional[int], data: Union[bytes, memoryview]) -> bytes:
+    if algorithm == CompressionAlgorithm.ZSTD:
+        import zstandard
+
+        # Compressor objects are not thread safe, so one is made per value.
+        return cast(bytes, zstandard.ZstdCompressor(level=level if level is not None else 3).compress(data))
+    if algorithm == CompressionAlgorithm.LZ4:
+        import lz4.frame
+
+        return cast(bytes, lz4.frame.compress(data, compression_level=level if level is not None else 0))
+    return zlib.compress(data, level if level is not None else zlib.Z_DEFAULT_COMPRESSION)
+
+
+def _decompress(algorithm: CompressionAlgorithm, data: memoryview) -> bytes:
+    if algorithm == CompressionAlgorithm.ZSTD:
+        import zstandard
+
+        return cast(bytes, zstandard.ZstdDecompressor().decompress(data))
+    if algorithm == CompressionAlgorithm.LZ4:
+        import lz4.frame
+
+        return cast(bytes, lz4.frame.decompress(data))
+    return zlib.decompress(data)
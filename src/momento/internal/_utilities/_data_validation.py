@@ -2,15 +2,15 @@ from __future__ import annotations
 
 import collections.abc
 from datetime import timedelta
-from typing import Iterable, Optional, Tuple
+from typing import Iterable, Optional, Tuple, Union
 
 from momento.errors import InvalidArgumentException
 from momento.internal.services import Service
 from momento.typing import (
+    TBytesLike,
     TDictionaryFields,
     TDictionaryItems,
-    TListValuesInput,
-    TSetElementsInput,
+    TScalarKeys,
     TSetElementsInputBytes,
     TSortedSetElements,
     TSortedSetValues,
@@ -18,6 +18,7 @@ from momento.typing import (
 from momento.utilities import ExpiresIn
 
 DEFAULT_BYTES_CONVERSION_ERROR = "Could not convert the given type to bytes: "
+DEFAULT_SCALAR_KEYS_CONVERSION_ERROR = "The given type is not Iterable[str | bytes]: "
 DEFAULT_LIST_CONVERSION_ERROR = "The given type is not list[str | bytes]: "
 DEFAULT_DICTIONARY_CONVERSION_ERROR = "The given type is not a valid Mapping: "
 DEFAULT_DICTIONARY_FIELDS_CONVERSION_ERROR = "The given type is not Iterable[str | bytes]: "
@@ -63,24 +64,60 @@ def _validate_sorted_set_score(score: float) -> float:
 
 
 def _as_bytes(
-    data: str | bytes,
+    data: TBytesLike,
     error_message: Optional[str] = DEFAULT_BYTES_CONVERSION_ERROR,
 ) -> bytes:
+    buffer = _as_buffer(data, error_message)
+    # Protobuf messages only accept bytes, so other buffers are copied here, once.
+    return buffer if isinstance(buffer, bytes) else buffer.tobytes()
+
+
+def _as_buffer(
+    data: TBytesLike,
+    error_message: Optional[str] = DEFAULT_BYTES_CONVERSION_ERROR,
+) -> Union[bytes, memoryview]:
+    """Returns `data` as bytes, or as a flat byte view of its buffer where that avoids a copy.
+
+    Besides str and bytes, any object supporting the buffer protocol is accepted, such as
+    bytearray, memoryview, array.array, mmap and numpy arrays. Their bytes are read in C order.
+    """
     if isinstance(data, str):
         return data.encode("utf-8")
     if isinstance(data, bytes):
         return data
-    raise InvalidArgumentException(f"{error_message}{type(data)}", Service.CACHE)
-
-
-def _gen_iterable_as_bytes(values: Iterable[str | bytes], error_message: str) -> Iterable[bytes]:
+    try:
+        view = memoryview(data)
+    except TypeError:
+        raise InvalidArgumentException(f"{error_message}{type(data)}", Service.CACHE) from None
+    if isinstance(view.obj, bytes) and view.c_contiguous and view.nbytes == len(view.obj):
+        # A view of a whole bytes object, such as memoryview(b"..."), is that object.
+        return view.obj
+    if not view.c_contiguous:
+        return view.tobytes()
+    if view.ndim == 1 and view.format == "B":
+        return view
+    try:
+        return view.cast("B")
+    except (TypeError, ValueError):
+        return view.tobytes()
+
+
+def _gen_iterable_as_bytes(values: Iterable[TBytesLike], error_message: str) -> Iterable[bytes]:
     if not isinstance(values, collections.abc.Iterable):
         raise InvalidArgumentException(f"{error_message}{type(values)}", Service.CACHE)
     for value in values:
         yield _as_bytes(value)
 
 
-def _gen_list_as_bytes(values: TListValuesInput, error_message: str = DEFAULT_LIST_CONVERSION_ERROR) -> Iterable[bytes]:
+def _gen_scalar_keys_as_bytes(
+    keys: TScalarKeys, error_message: str = DEFAULT_SCALAR_KEYS_CONVERSION_ERROR
+) -> Iterable[bytes]:
+    yield from _gen_iterable_as_bytes(keys, error_message)
+
+
+def _gen_list_as_bytes(
+    values: Iterable[TBytesLike], error_message: str = DEFAULT_LIST_CONVERSION_ERROR
+) -> Iterable[bytes]:
     yield from _gen_iterable_as_bytes(values, error_message)
 
 
@@ -100,7 +137,7 @@ def _gen_dictionary_fields_as_bytes(
 
 
 def _gen_set_input_as_bytes(
-    elements: TSetElementsInput, error_message: str = DEFAULT_SET_CONVERSION_ERROR
+    elements: Iterable[TBytesLike], error_message: str = DEFAULT_SET_CONVERSION_ERROR
 ) -> TSetElementsInputBytes:
     # NB: the set input does not need to be unique
     yield from _gen_iterable_as_bytes(elements, error_message)
@@ -140,6 +177,15 @@ def _validate_request_timeout(request_timeout: Optional[timedelta]) -> None:
     _validate_timedelta_ttl(ttl=request_timeout, field_name="Request timeout")
 
 
+def _validate_positive_int(value: int, field_name: str) -> None:
+    if not isinstance(value, int) or value < 1:
+        raise InvalidArgumentException(f"{field_name} must be a positive integer.", Service.CACHE)
+
+
+def _validate_num_channels(num_channels: int) -> None:
+    _validate_positive_int(num_channels, "Number of channels")
+
+
 def _validate_eager_connection_timeout(timeout: timedelta) -> None:
     if timeout.total_seconds() < 0:
         raise ValueError("The eager connection timeout must be greater than or equal to 0 seconds.")
@@ -91,6 +91,11 @@ def grpc_data_channel_options_from_grpc_config(grpc_config: GrpcConfiguration) -
     if keepalive_timeout is not None:
         channel_options.append(("grpc.keepalive_timeout_ms", _timedelta_to_ms(keepalive_timeout)))
 
+    # Channels with the same target and arguments otherwise share a single connection,
+    # which would defeat the purpose of opening several of them.
+    if grpc_config.get_num_channels() > 1:
+        channel_options.append(("grpc.use_local_subchannel_pool", 1))
+
     return channel_options
 
 
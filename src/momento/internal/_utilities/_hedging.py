@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from threading import Lock
+from typing import Dict, Optional
+
+from momento.config.hedging import HedgingPolicy, HedgingStats
+from momento.internal._utilities._latency_histogram import _LatencyHistogram
+from momento.retry.default_eligibility_strategy import RETRYABLE_REQUEST_TYPES
+
+
+class _HedgingState:
+    """The latency samples and counters behind the aio and synchronous hedgers."""
+
+    # Latency samples an RPC needs before its reads are hedged.
+    _MIN_SAMPLES = 100
+
+    def __init__(self, policy: HedgingPolicy):
+        self._latency_percentile = policy.get_latency_percentile()
+        self._min_delay_seconds = policy.get_min_delay().total_seconds()
+        self._latencies: Dict[str, _LatencyHistogram] = {}
+        self._lock = Lock()
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+
+    @staticmethod
+    def is_hedgeable(rpc_name: str) -> bool:
+        # Only idempotent requests, which are the ones eligible for retries, can safely be sent twice.
+        return f"/cache_client.Scs/{rpc_name}" in RETRYABLE_REQUEST_TYPES
+
+    def hedge_delay(self, rpc_name: str) -> Optional[float]:
+        """Returns how long to wait in seconds before hedging a read, or None if it should not be hedged yet."""
+        histogram = self._histogram(rpc_name)
+        if histogram.count < self._MIN_SAMPLES:
+            return None
+        delay = histogram.percentile(self._latency_percentile)
+        return max(self._min_delay_seconds, delay) if delay is not None else None
+
+    def record(self, rpc_name: str, seconds: float, hedged: bool, hedge_won: bool) -> None:
+        self._histogram(rpc_name).record(seconds)
+        with self._lock:
+            self._requests += 1
+            self._hedges += hedged
+            self._hedge_wins += hedge_won
+
+    def stats(self) -> HedgingStats:
+        with self._lock:
+            return HedgingStats(requests=self._requests, hedges=self._hedges, hedge_wins=self._hedge_wins)
+
+    def _histogram(self, rpc_name: str) -> _LatencyHistogram:
+        histogram = self._latencies.get(rpc_name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._latencies.setdefault(rpc_name, _LatencyHistogram())
+        return histogram
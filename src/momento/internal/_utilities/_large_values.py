@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import tempfile
+import uuid
+import zlib
+from contextlib import contextmanager
+from typing import IO, TYPE_CHECKING, Iterator, List, Optional, Union, cast
+
+from momento.errors import InvalidArgumentException, SerializationException
+from momento.internal.services import Service
+from momento.typing import TLargeValueDestination
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
+
+# Below the default gRPC max message size, and the 4 MiB a server accepts by default,
+# to leave room for the key and the rest of the request.
+DEFAULT_LARGE_VALUE_CHUNK_SIZE = 4_000_000
+
+# A manifest starts with this marker followed by a version byte. Like the compression marker
+# it begins with 0xFF, which never occurs in UTF-8, so text values are never mistaken for manifests.
+_MAGIC = b"\xffML"
+_MANIFEST_MAGIC = _MAGIC + b"\x01"
+# Binary values stored as is that happen to start with the marker are stored behind this header,
+# so reads do not mistake them for manifests.
+_STORED_HEADER = _MAGIC + b"\x00"
+
+
+def escape_stored_value(data: memoryview) -> Union[bytes, memoryview]:
+    """Returns the value to store under a key for a value small enough to be stored as is."""
+    return _STORED_HEADER + data.tobytes() if data[: len(_MAGIC)] == _MAGIC else data
+
+
+def unescape_stored_value(data: bytes) -> bytes:
+    """Returns the original value of a value stored as is, which is not a manifest."""
+    return data[len(_STORED_HEADER) :] if data.startswith(_STORED_HEADER) else data
+
+
+class _LargeValueManifest:
+    """Describes a value stored by `set_large` as chunks under keys derived from its own key.
+
+    The manifest is stored under the value's key once all chunks are stored. Each write uses a
+    fresh id in its chunk keys, so a reader never mixes chunks of two writes of the same key.
+    """
+
+    def __init__(self, write_id: str, size: int, chunk_size: int, checksums: List[int]):
+        self.write_id = write_id
+        self.size = size
+        self.chunk_size = chunk_size
+        self.checksums = checksums
+
+    @staticmethod
+    def for_value(data: memoryview, chunk_size: int) -> _LargeValueManifest:
+        checksums = [zlib.crc32(data[start : start + chunk_size]) for start in range(0, len(data), chunk_size)]
+        return _LargeValueManifest(uuid.uuid4().hex, len(data), chunk_size, checksums)
+
+    @property
+    def num_chunks(self) -> int:
+        return len(self.checksums)
+
+    def chunk(self, data: memoryview, index: int) -> memoryview:
+        return data[index * self.chunk_size : (index + 1) * self.chunk_size]
+
+    def chunk_key(self, key: bytes, index: int) -> bytes:
+        return b"%s\x00chunk\x00%s\x00%d" % (key, self.write_id.encode("ascii"), index)
+
+    def verify_chunk(self, index: int, data: bytes) -> None:
+        """Raises a SerializationException if a chunk read back is not the one that was written."""
+        expected_length = min(self.chunk_size, self.size - index * self.chunk_size)
+        if len(data) != expected_length or zlib.crc32(data) != self.checksums[index]:
+            raise SerializationException(
+                f"Chunk {index} of a {self.size} byte value does not match its checksum", Service.CACHE
+            )
+
+    def encode(self) -> bytes:
+        document = {"id": self.write_id, "size": self.size, "chunk_size": self.chunk_size, "crc32": self.checksums}
+        return _MANIFEST_MAGIC + json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+    @staticmethod
+    def is_manifest(data: bytes) -> bool:
+        return data.startswith(_MANIFEST_MAGIC)
+
+    @staticmethod
+    def decode(data: bytes) -> _LargeValueManifest:
+        """Parses a manifest, raising a SerializationException if it is malformed."""
+        try:
+            document = json.loads(data[len(_MANIFEST_MAGIC) :].decode("utf-8"))
+            manifest = _LargeValueManifest(
+                str(document["id"]),
+                int(document["size"]),
+                int(document["chunk_size"]),
+                [int(checksum) for checksum in document["crc32"]],
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            raise SerializationException(f"Could not read the manifest of a large value: {e}", Service.CACHE) from e
+        if manifest.chunk_size < 1 or manifest.num_chunks != -(-manifest.size // manifest.chunk_size):
+            raise SerializationException("The manifest of a large value is inconsistent", Service.CACHE)
+        return manifest
+
+
+class _LargeValueWriter:
+    """Receives the chunks of a value in order and writes them to where `get_large` was asked to put them.
+
+    The destination may be a writable buffer at least as large as the value, such as a bytearray
+    or mmap, or a binary file. Without a destination the chunks are joined into bytes.
+    """
+
+    def __init__(self, destination: Optional[TLargeValueDestination], size: int):
+        self._parts: List[bytes] = []
+        self._file: Optional[IO[bytes]] = None
+        self._view: Optional[memoryview] = None
+        self._offset = 0
+        if destination is None:
+            return
+        try:
+            view = memoryview(cast("Buffer", destination))
+        except TypeError:
+            if not callable(getattr(destination, "write", None)):
+                raise InvalidArgumentException(
+                    f"The destination must be a writable buffer or a binary file, not {type(destination)}",
+                    Service.CACHE,
+                ) from None
+            self._file = cast(IO[bytes], destination)
+            return
+        if view.readonly or not view.c_contiguous:
+            raise InvalidArgumentException("The destination buffer must be writable and contiguous", Service.CACHE)
+        if view.nbytes < size:
+            raise InvalidArgumentException(
+                f"The destination buffer holds {view.nbytes} bytes but the value has {size}", Service.CACHE
+            )
+        self._view = view.cast("B") if view.format != "B" or view.ndim != 1 else view
+
+    def write(self, data: bytes) -> None:
+        if self._view is not None:
+            self._view[self._offset : self._offset + len(data)] = data
+        elif self._file is not None:
+            self._file.write(data)
+        else:
+            self._parts.append(data)
+        self._offset += len(data)
+
+    def value(self) -> Optional[bytes]:
+        """Returns the value if there is no destination to hold it."""
+        if self._view is not None or self._file is not None:
+            return None
+        return self._parts[0] if len(self._parts) == 1 else b"".join(self._parts)
+
+
+@contextmanager
+def _mapped_file(path: Union[str, os.PathLike[str]]) -> Iterator[Buffer]:
+    """Maps a file read-only, so that its contents are paged in as they are read rather than loaded at once."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            # Empty files cannot be mapped.
+            yield b""
+            return
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield mapped
+        finally:
+            try:
+                mapped.close()
+            except BufferError:
+                # A view of the map is still referenced, such as from the traceback of an error
+                # response. The map is closed once that is collected.
+                pass
+
+
+class _FileReplacement:
+    """A temporary file next to `path` that either replaces it on `commit` or is removed on `discard`.
+
+    Readers of `path` never see a partly written value.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike[str]]):
+        self._path = path
+        directory = os.path.dirname(os.path.abspath(path))
+        self.file: IO[bytes] = tempfile.NamedTemporaryFile(dir=directory, prefix=".momento-", delete=False)
+
+    def commit(self) -> None:
+        try:
+            self.file.close()
+            os.replace(self.file.name, self._path)
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        self.file.close()
+        try:
+            os.unlink(self.file.name)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import math
+from threading import Lock
+from typing import Optional
+
+
+class _LatencyHistogram:
+    """Recent latencies counted in log-spaced buckets, for cheap percentile estimates.
+
+    Bucket bounds grow by 10%, so an estimate is within 10% of the true value. Once `max_count`
+    samples have been recorded all counts are halved, which keeps the estimate weighted
+    towards recent traffic.
+    """
+
+    _MIN_SECONDS = 0.0001
+    _GROWTH = 1.1
+    _NUM_BUCKETS = 180  # the last bucket starts at about 40 minutes
+
+    def __init__(self, max_count: int = 10_000):
+        self._max_count = max_count
+        self._counts = [0] * self._NUM_BUCKETS
+        self._count = 0
+        self._lock = Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def record(self, seconds: float) -> None:
+        if seconds <= self._MIN_SECONDS:
+            bucket = 0
+        else:
+            bucket = min(self._NUM_BUCKETS - 1, int(math.log(seconds / self._MIN_SECONDS, self._GROWTH)) + 1)
+        with self._lock:
+            self._counts[bucket] += 1
+            self._count += 1
+            if self._count >= self._max_count:
+                self._counts = [count // 2 for count in self._counts]
+                self._count = sum(self._counts)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Returns an upper bound in seconds for the given percentile, or None if nothing was recorded."""
+        with self._lock:
+            if self._count == 0:
+                return None
+            rank = math.ceil(self._count * percentile / 100)
+            seen = 0
+            for bucket, count in enumerate(self._counts):
+                seen += count
+                if seen >= rank:
+                    return self._MIN_SECONDS * self._GROWTH**bucket
+        return self._MIN_SECONDS * self._GROWTH ** (self._NUM_BUCKETS - 1)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from threading import Lock
+from typing import Optional, Tuple, Type, TypeVar, cast
+
+from momento.config.near_cache import NearCacheConfiguration, NearCacheStats
+from momento.responses import CacheDictionaryFetch, CacheResponse, CacheSetFetch
+
+TResponse = TypeVar("TResponse", bound=CacheResponse)
+
+
+class _NearCacheEntry:
+    __slots__ = ("response", "size_bytes", "expires_at")
+
+    def __init__(self, response: CacheResponse, size_bytes: int, expires_at: float):
+        self.response = response
+        self.size_bytes = size_bytes
+        self.expires_at = expires_at
+
+
+class _NearCache:
+    """A thread-safe, size-bounded LRU of read responses keyed by cache name and item key.
+
+    Entries expire `max_staleness` after they are stored, or sooner if the item itself expires
+    sooner by the TTL this client last wrote it with. Callers may change the sets and dicts of
+    the responses they get, so collection responses are copied on the way in and out.
+    """
+
+    def __init__(self, configuration: NearCacheConfiguration):
+        self._max_staleness_seconds = configuration.get_max_staleness().total_seconds()
+        self._max_entries = configuration.get_max_entries()
+        self._max_size_bytes = configuration.get_max_size_bytes()
+        self._entries: OrderedDict[Tuple[str, bytes], _NearCacheEntry] = OrderedDict()
+        # When the items this client wrote expire, by the TTL of the last write to each.
+        self._write_expiries: OrderedDict[Tuple[str, bytes], float] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, cache_name: str, key: bytes, response_type: Type[TResponse]) -> Optional[TResponse]:
+        """Returns the fresh entry for the key if it holds a `response_type`, else None."""
+        with self._lock:
+            entry = self._entries.get((cache_name, key))
+            if entry is None:
+                self._misses += 1
+                return None
+            if entry.expires_at <= time.monotonic() or not isinstance(entry.response, response_type):
+                self._remove((cache_name, key))
+                self._misses += 1
+                return None
+            self._entries.move_to_end((cache_name, key))
+            self._hits += 1
+            return cast(TResponse, _copy(entry.response))
+
+    def put(self, cache_name: str, key: bytes, response: CacheResponse, value_size_bytes: int) -> None:
+        size_bytes = len(key) + value_size_bytes
+        with self._lock:
+            self._remove((cache_name, key))
+            if size_bytes > self._max_size_bytes:
+                return
+            now = time.monotonic()
+            expires_at = now + self._max_staleness_seconds
+            write_expiry = self._write_expiries.get((cache_name, key))
+            if write_expiry is not None:
+                if write_expiry > now:
+                    expires_at = min(expires_at, write_expiry)
+                else:
+                    # What this client wrote has expired, so the value read was written by someone else.
+                    del self._write_expiries[(cache_name, key)]
+            self._entries[(cache_name, key)] = _NearCacheEntry(_copy(response), size_bytes, expires_at)
+            self._size_bytes += size_bytes
+            while len(self._entries) > self._max_entries or self._size_bytes > self._max_size_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size_bytes
+                self._evictions += 1
+
+    def invalidate(self, cache_name: str, key: bytes, ttl: Optional[timedelta] = None) -> None:
+        """Removes the entry for a key this client wrote.
+
+        `ttl` is the TTL the write gave the item, if it is known. Later entries for the key then
+        expire no later than the item does. A write of unknown TTL forgets the key's expiry.
+        """
+        with self._lock:
+            self._remove((cache_name, key))
+            self._write_expiries.pop((cache_name, key), None)
+            if ttl is None:
+                return
+            self._write_expiries[(cache_name, key)] = time.monotonic() + ttl.total_seconds()
+            # Forgetting an expiry only lets entries for the key live up to `max_staleness`.
+            if len(self._write_expiries) > self._max_entries:
+                self._write_expiries.popitem(last=False)
+
+    def stats(self) -> NearCacheStats:
+        with self._lock:
+            return NearCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+            )
+
+    def _remove(self, entry_key: Tuple[str, bytes]) -> None:
+        entry = self._entries.pop(entry_key, None)
+        if entry is not None:
+            self._size_bytes -= entry.size_bytes
+
+
+def _copy(response: CacheResponse) -> CacheResponse:
+    """Returns a response that shares no set or dict with `response`. Get hits hold immutable bytes."""
+    if isinstance(response, CacheSetFetch.Hit):
+        return CacheSetFetch.Hit(set(response.value_set_bytes))
+    if isinstance(response, CacheDictionaryFetch.Hit):
+        return CacheDictionaryFetch.Hit(dict(response.value_dictionary_bytes_bytes))
+    return response
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+from momento import logs
+from momento.counter_aggregation import CounterAggregatorStats, CounterDeliveryPolicy
+from momento.errors import FailedPreconditionException, InvalidArgumentException, MomentoErrorCode, SdkException
+from momento.internal.services import Service
+from momento.requests import CollectionTtl
+
+# The cache name, dictionary name (None for scalar counters), key or field, TTL and refresh flag of a counter.
+_CounterKey = Tuple[str, Optional[str], bytes, Optional[timedelta], bool]
+
+# Errors after which sending the same increment again cannot succeed, so it is dropped even under AT_LEAST_ONCE.
+_PERMANENT_ERRORS = {
+    MomentoErrorCode.INVALID_ARGUMENT_ERROR,
+    MomentoErrorCode.UNKNOWN_SERVICE_ERROR,
+    MomentoErrorCode.ALREADY_EXISTS_ERROR,
+    MomentoErrorCode.NOT_FOUND_ERROR,
+    MomentoErrorCode.PERMISSION_ERROR,
+    MomentoErrorCode.AUTHENTICATION_ERROR,
+    MomentoErrorCode.BAD_REQUEST_ERROR,
+    MomentoErrorCode.FAILED_PRECONDITION_ERROR,
+    MomentoErrorCode.SERIALIZATION_ERROR,
+}
+
+
+def _validate_amount(amount: int) -> None:
+    if not isinstance(amount, int) or isinstance(amount, bool):
+        raise InvalidArgumentException("Amount must be an integer", Service.CACHE)
+
+
+class _Counter:
+    """The sum of the increments made to one key or dictionary field since the last flush."""
+
+    __slots__ = ("cache_name", "dictionary_name", "key", "ttl", "refresh_ttl", "amount", "increments")
+
+    def __init__(
+        self, cache_name: str, dictionary_name: Optional[str], key: bytes, ttl: Optional[timedelta], refresh_ttl: bool
+    ):
+        self.cache_name = cache_name
+        self.dictionary_name = dictionary_name
+        self.key = key
+        self.ttl = ttl
+        self.refresh_ttl = refresh_ttl
+        self.amount = 0
+        self.increments = 0
+
+    @property
+    def collection_ttl(self) -> CollectionTtl:
+        return CollectionTtl(self.ttl, self.refresh_ttl)
+
+
+class _PendingCounters:
+    """The counters waiting to be flushed by a counter aggregator, and its statistics.
+
+    Safe to use from several threads. Flushing takes all counters at once, so increments made
+    while a flush is in progress go to the next one.
+    """
+
+    def __init__(self, delivery: CounterDeliveryPolicy):
+        self._logger = logs.logger
+        self._delivery = delivery
+        self._lock = Lock()
+        self._counters: Dict[_CounterKey, _Counter] = {}
+        self._closed = False
+        self._increments = 0
+        self._pending_increments = 0
+        self._flushes = 0
+        self._requests = 0
+        self._flushed_increments = 0
+        self._failed_requests = 0
+        self._dropped_increments = 0
+        self._last_flush_seconds = 0.0
+        self._max_flush_seconds = 0.0
+        self._total_flush_seconds = 0.0
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def pending_increments(self) -> int:
+        return self._pending_increments
+
+    def add(
+        self,
+        cache_name: str,
+        dictionary_name: Optional[str],
+        key: bytes,
+        amount: int,
+        ttl: Optional[timedelta],
+        refresh_ttl: bool,
+    ) -> int:
+        """Adds an increment and returns the number of increments now pending."""
+        counter_key: _CounterKey = (cache_name, dictionary_name, key, ttl, refresh_ttl)
+        with self._lock:
+            if self._closed:
+                raise FailedPreconditionException("The counter aggregator is closed", Service.CACHE)
+            counter = self._counters.get(counter_key)
+            if counter is None:
+                counter = self._counters[counter_key] = _Counter(cache_name, dictionary_name, key, ttl, refresh_ttl)
+            counter.amount += amount
+            counter.increments += 1
+            self._increments += 1
+            self._pending_increments += 1
+            return self._pending_increments
+
+    def take(self) -> List[_Counter]:
+        """Removes and returns all pending counters, to be sent by a flush."""
+        with self._lock:
+            counters = list(self._counters.values())
+            self._counters = {}
+            self._pending_increments = 0
+            return counters
+
+    def record_response(self, counter: _Counter, error: Optional[SdkException]) -> None:
+        """Records the outcome of sending a counter taken by `take`, keeping it for the next flush if it should be retried."""
+        with self._lock:
+            self._requests += 1
+            self._flushed_increments += counter.increments
+            if error is None:
+                return
+            self._failed_requests += 1
+            if self._delivery is CounterDeliveryPolicy.AT_LEAST_ONCE and error.error_code not in _PERMANENT_ERRORS:
+                counter_key: _CounterKey = (
+                    counter.cache_name,
+                    counter.dictionary_name,
+                    counter.key,
+                    counter.ttl,
+                    counter.refresh_ttl,
+                )
+                pending = self._counters.get(counter_key)
+                if pending is None:
+                    self._counters[counter_key] = counter
+                else:
+                    pending.amount += counter.amount
+                    pending.increments += counter.increments
+                self._pending_increments += counter.increments
+                return
+            self._dropped_increments += counter.increments
+        self._logger.warning(
+            "Dropping %d increments totalling %d in cache %s: %s",
+            counter.increments,
+            counter.amount,
+            counter.cache_name,
+            error,
+        )
+
+    def record_flush(self, seconds: float) -> None:
+        with self._lock:
+            self._flushes += 1
+            self._last_flush_seconds = seconds
+            self._max_flush_seconds = max(self._max_flush_seconds, seconds)
+            self._total_flush_seconds += seconds
+
+    def close(self) -> None:
+        """Rejects further increments."""
+        with self._lock:
+            self._closed = True
+
+    def drop_pending(self) -> None:
+        """Discards the counters still pending, such as those of a closed aggregator."""
+        counters = self.take()
+        dropped = sum(counter.increments for counter in counters)
+        if dropped == 0:
+            return
+        with self._lock:
+            self._dropped_increments += dropped
+        self._logger.warning("Dropping %d increments that were not flushed", dropped)
+
+    def stats(self) -> CounterAggregatorStats:
+        with self._lock:
+            return CounterAggregatorStats(
+                increments=self._increments,
+                pending_increments=self._pending_increments,
+                flushes=self._flushes,
+                requests=self._requests,
+                flushed_increments=self._flushed_increments,
+                failed_requests=self._failed_requests,
+                dropped_increments=self._dropped_increments,
+                last_flush_latency=timedelta(seconds=self._last_flush_seconds),
+                max_flush_latency=timedelta(seconds=self._max_flush_seconds),
+                total_flush_latency=timedelta(seconds=self._total_flush_seconds),
+            )
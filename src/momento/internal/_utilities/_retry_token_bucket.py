@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from threading import Lock
+
+from momento.retry import RetryBudget
+
+
+class _RetryTokenBucket:
+    """The token bucket enforcing a RetryBudget, shared by all channels of a client."""
+
+    def __init__(self, retry_budget: RetryBudget):
+        self._retry_ratio = retry_budget.get_retry_ratio()
+        self._max_tokens = retry_budget.get_max_tokens()
+        self._tokens = self._max_tokens
+        self._lock = Lock()
+
+    def record_request(self) -> None:
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._retry_ratio)
+
+    def try_acquire_retry(self) -> bool:
+        """Spends a token for a retry; returns False if the budget is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
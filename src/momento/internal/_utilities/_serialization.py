@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from momento.errors import SerializationException
+from momento.internal.services import Service
+from momento.serialization import Serializer
+
+
+def _serialize(serializer: Serializer, value: object) -> bytes:
+    try:
+        return serializer.serialize(value)
+    except Exception as e:
+        raise SerializationException(
+            f"{type(serializer).__name__} could not serialize a value of type {type(value).__name__}: {e}",
+            Service.CACHE,
+        ) from e
+
+
+def _deserialize(serializer: Serializer, data: bytes) -> object:
+    try:
+        return serializer.deserialize(data)
+    except Exception as e:
+        raise SerializationException(
+            f"{type(serializer).__name__} could not deserialize {len(data)} bytes: {e}", Service.CACHE
+        ) from e
+
+
+def _decode_field(field: bytes) -> str:
+    try:
+        return field.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise SerializationException(
+            f"Dictionary field {field!r} is not valid utf-8; use dictionary_fetch to read it as bytes", Service.CACHE
+        ) from e
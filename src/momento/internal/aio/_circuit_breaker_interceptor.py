@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import grpc
+
+from momento.internal._utilities._circuit_breaker import _CircuitBreaker
+from momento.internal.aio._utilities import await_status_code
+
+
+class CircuitBreakerInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Fails calls fast while the channel's circuit breaker is open.
+
+    It sits outside the retry interceptor, so a call, its retries and its adaptive re-send count as one request.
+    """
+
+    def __init__(self, circuit_breaker: _CircuitBreaker):
+        self._circuit_breaker = circuit_breaker
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[
+            [grpc.aio._interceptor.ClientCallDetails, grpc.aio._typing.RequestType],
+            grpc.aio._call.UnaryUnaryCall,
+        ],
+        client_call_details: grpc.aio._interceptor.ClientCallDetails,
+        request: grpc.aio._typing.RequestType,
+    ) -> grpc.aio._call.UnaryUnaryCall | grpc.aio._typing.ResponseType:
+        probe = self._circuit_breaker.acquire()
+        # A call that is abandoned before it completes, such as the losing attempt of a hedged read,
+        # says nothing about the server's health.
+        status_code = grpc.StatusCode.CANCELLED
+        try:
+            call = await continuation(client_call_details, request)
+            status_code = await await_status_code(call)
+            return call
+        finally:
+            self._circuit_breaker.record(status_code, probe)
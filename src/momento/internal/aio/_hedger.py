@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional
+
+from google.protobuf.message import Message
+from grpc.aio import Metadata
+
+from momento.config.hedging import HedgingPolicy, HedgingStats
+from momento.internal._utilities._hedging import _HedgingState
+from momento.internal.aio._scs_grpc_manager import _DataGrpcManager
+
+
+class _Hedger:
+    """Sends a second attempt of a slow idempotent read on another data channel.
+
+    Whichever attempt succeeds first is returned and the other is cancelled. If the first attempt
+    to complete failed, the other one is awaited instead.
+    """
+
+    def __init__(self, policy: HedgingPolicy, grpc_manager: _DataGrpcManager):
+        self._state = _HedgingState(policy)
+        self._grpc_manager = grpc_manager
+
+    def stats(self) -> HedgingStats:
+        return self._state.stats()
+
+    async def call(self, rpc_name: str, request: Message, metadata: Metadata, timeout: float) -> Message:
+        primary_stub = self._grpc_manager.async_stub()
+        if not self._state.is_hedgeable(rpc_name):
+            return await getattr(primary_stub, rpc_name)(request, metadata=metadata, timeout=timeout)
+
+        delay = self._state.hedge_delay(rpc_name)
+        start = time.monotonic()
+        primary = asyncio.ensure_future(getattr(primary_stub, rpc_name)(request, metadata=metadata, timeout=timeout))
+        hedge: Optional[asyncio.Future[object]] = None
+        pending = {primary}
+        try:
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, timeout=delay if hedge is None else None, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # The primary attempt is slower than the hedge delay.
+                    hedge_stub = self._grpc_manager.async_stub(avoid=primary_stub)
+                    hedge = asyncio.ensure_future(
+                        getattr(hedge_stub, rpc_name)(request, metadata=metadata, timeout=timeout)
+                    )
+                    pending.add(hedge)
+                    continue
+                succeeded = [attempt for attempt in done if attempt.exception() is None]
+                if succeeded or not pending:
+                    winner = succeeded[0] if succeeded else done.pop()
+                    break
+        finally:
+            for attempt in pending:
+                attempt.cancel()
+
+        self._state.record(rpc_name, time.monotonic() - start, hedge is not None, winner is hedge)
+        return winner.result()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import grpc
+
+from momento.internal.aio._utilities import await_status_code
+
+
+class InFlightCountInterceptor(grpc.aio.UnaryUnaryClientInterceptor, grpc.aio.UnaryStreamClientInterceptor):
+    """Counts the calls on a channel that have started but not yet completed.
+
+    It must be the outermost interceptor so that retries count as part of the original call.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+
+    def _on_done(self, _call: object) -> None:
+        self.in_flight -= 1
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[
+            [grpc.aio._interceptor.ClientCallDetails, grpc.aio._typing.RequestType],
+            grpc.aio._call.UnaryUnaryCall,
+        ],
+        client_call_details: grpc.aio._interceptor.ClientCallDetails,
+        request: grpc.aio._typing.RequestType,
+    ) -> grpc.aio._call.UnaryUnaryCall | grpc.aio._typing.ResponseType:
+        self.in_flight += 1
+        try:
+            call = await continuation(client_call_details, request)
+            await await_status_code(call)
+            return call
+        finally:
+            self.in_flight -= 1
+
+    async def intercept_unary_stream(
+        self,
+        continuation: Callable[
+            [grpc.aio._interceptor.ClientCallDetails, grpc.aio._typing.RequestType],
+            grpc.aio._call.UnaryStreamCall,
+        ],
+        client_call_details: grpc.aio._interceptor.ClientCallDetails,
+        request: grpc.aio._typing.RequestType,
+    ) -> grpc.aio._call.UnaryStreamCall | grpc.aio._typing.ResponseType:
+        self.in_flight += 1
+        try:
+            call = await continuation(client_call_details, request)
+        except BaseException:
+            self.in_flight -= 1
+            raise
+        # The stream is consumed by the caller after we return, so count it until it completes.
+        call.add_done_callback(self._on_done)
+        return call
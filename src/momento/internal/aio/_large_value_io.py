@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Callable, List, Sequence
+
+from momento_wire_types import cacheclient_pb2 as cache_pb
+from momento_wire_types import cacheclient_pb2_grpc as cache_grpc
+
+from momento.internal.aio._utilities import make_metadata
+
+
+async def set_chunks(
+    build_stub: Callable[[], cache_grpc.ScsStub],
+    cache_name: str,
+    requests: Sequence[cache_pb._SetRequest],
+    timeout: float,
+) -> None:
+    """Stores the chunks of a large value concurrently, spread over the data channels.
+
+    Raises the error of the first request to fail once all of them completed.
+    """
+    metadata = make_metadata(cache_name)
+    await asyncio.gather(*(build_stub().Set(request, metadata=metadata, timeout=timeout) for request in requests))
+
+
+async def get_chunks(
+    build_stub: Callable[[], cache_grpc.ScsStub],
+    cache_name: str,
+    keys: Sequence[bytes],
+    timeout: float,
+) -> List[cache_pb._GetResponse]:
+    """Reads the chunks of a large value concurrently, returning the responses in the order of `keys`."""
+    metadata = make_metadata(cache_name)
+    return list(
+        await asyncio.gather(
+            *(build_stub().Get(cache_pb._GetRequest(cache_key=key), metadata=metadata, timeout=timeout) for key in keys)
+        )
+    )
+
+
+async def delete_chunks(
+    build_stub: Callable[[], cache_grpc.ScsStub],
+    cache_name: str,
+    keys: Sequence[bytes],
+    timeout: float,
+) -> None:
+    """Deletes the chunks of a large value concurrently, spread over the data channels."""
+    metadata = make_metadata(cache_name)
+    await asyncio.gather(
+        *(
+            build_stub().Delete(cache_pb._DeleteRequest(cache_key=key), metadata=metadata, timeout=timeout)
+            for key in keys
+        )
+    )
@@ -2,11 +2,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import Callable
+from typing import Callable, Optional
 
 import grpc
 
+from momento.internal._utilities._adaptive_deadlines import _AdaptiveDeadlines
+from momento.internal._utilities._retry_token_bucket import _RetryTokenBucket
+from momento.internal.aio._utilities import await_status_code
 from momento.retry import RetryableProps, RetryStrategy
 
 # TODO: This is very duplicative of the synchronous retry interceptor; we need to
@@ -18,13 +22,18 @@ logger = logging.getLogger("retry-interceptor")
 # TODO: We need to send retry count information to the server so that we
 # will have some visibility into how often this is happening to customers:
 # https://github.com/momentohq/client-sdk-javascript/issues/80
-# TODO: we need to add backoff/jitter for the retries:
-# https://github.com/momentohq/client-sdk-javascript/issues/81
 
 
 class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
-    def __init__(self, retry_strategy: RetryStrategy):
+    def __init__(
+        self,
+        retry_strategy: RetryStrategy,
+        retry_token_bucket: Optional[_RetryTokenBucket] = None,
+        adaptive_deadlines: Optional[_AdaptiveDeadlines] = None,
+    ):
         self._retry_strategy = retry_strategy
+        self._retry_token_bucket = retry_token_bucket
+        self._adaptive_deadlines = adaptive_deadlines
 
     async def intercept_unary_unary(
         self,
@@ -40,39 +49,106 @@ class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
         # The overall deadline is calculated from the timeout set on the client call details.
         # That value is set in our gRPC configurations and, while typed as optional, will never be None here.
         overall_deadline = datetime.now() + timedelta(seconds=client_call_details.timeout or 0.0)
+        # Calls made without a timeout, such as token requests, have no overall budget to enforce.
+        has_deadline = client_call_details.timeout is not None
         # variable to capture the penultimate call to a deadline-aware retry strategy, which
         # will hold the call object before a terminal DEADLINE_EXCEEDED response is returned
         last_call = None
+        retry_time: Optional[float] = None
+        if self._retry_token_bucket is not None:
+            self._retry_token_bucket.record_request()
 
         while True:
             if attempt_number > 1:
                 retry_deadline = self._retry_strategy.calculate_retry_deadline(overall_deadline)
                 if retry_deadline is not None:
-                    client_call_details = grpc.aio._interceptor.ClientCallDetails(
-                        client_call_details.method,
-                        retry_deadline,
-                        client_call_details.metadata,
-                        client_call_details.credentials,
-                        client_call_details.wait_for_ready,
-                    )
                     last_call = call
+                if has_deadline:
+                    # Every attempt shares the overall deadline, so a retry only gets the time that is left.
+                    remaining = (overall_deadline - datetime.now()).total_seconds()
+                    retry_deadline = remaining if retry_deadline is None else min(retry_deadline, remaining)
+                if retry_deadline is not None:
+                    client_call_details = _with_timeout(client_call_details, retry_deadline)
 
-            call = await continuation(client_call_details, request)
-            response_code = await call.code()
+            call = await self._attempt(continuation, client_call_details, request)
+            response_code = await await_status_code(call)
 
             if response_code == grpc.StatusCode.OK:
                 return call
 
-            retryTime = self._retry_strategy.determine_when_to_retry(
+            retry_time = self._retry_strategy.determine_when_to_retry(
                 # Note: the async interceptor gets `client_call_details.method` as a binary string that needs to be decoded
                 # but the sync interceptor gets it as a string.
                 RetryableProps(
-                    response_code, client_call_details.method.decode("utf-8"), attempt_number, overall_deadline
+                    response_code,
+                    client_call_details.method.decode("utf-8"),
+                    attempt_number,
+                    overall_deadline,
+                    retry_time,
                 )
             )
 
-            if retryTime is None:
+            if retry_time is None:
+                return last_call or call
+            if has_deadline and datetime.now() + timedelta(seconds=retry_time) >= overall_deadline:
+                logger.debug("Overall deadline would pass before retrying %s; not retrying", client_call_details.method)
+                return last_call or call
+            if not self._try_acquire_retry(client_call_details.method.decode("utf-8")):
                 return last_call or call
 
             attempt_number += 1
-            await asyncio.sleep(retryTime)
+            await asyncio.sleep(retry_time)
+
+    async def _attempt(
+        self,
+        continuation: Callable[
+            [grpc.aio._interceptor.ClientCallDetails, grpc.aio._typing.RequestType],
+            grpc.aio._call.UnaryUnaryCall,
+        ],
+        client_call_details: grpc.aio._interceptor.ClientCallDetails,
+        request: grpc.aio._typing.RequestType,
+    ) -> grpc.aio._call.UnaryUnaryCall:
+        """Sends an attempt, abandoning it at its adaptive deadline and sending it again once if need be."""
+        if self._adaptive_deadlines is None:
+            return await continuation(client_call_details, request)
+
+        method = client_call_details.method.decode("utf-8")
+        timeout = client_call_details.timeout or 0.0
+        attempt_timeout = self._adaptive_deadlines.attempt_timeout(method, timeout)
+        start = time.monotonic()
+        call = await continuation(_with_timeout(client_call_details, attempt_timeout), request)
+        response_code = await await_status_code(call)
+        elapsed = time.monotonic() - start
+        self._adaptive_deadlines.record(method, response_code, elapsed)
+        if (
+            response_code != grpc.StatusCode.DEADLINE_EXCEEDED
+            or attempt_timeout >= timeout
+            or elapsed >= timeout
+            or not self._try_acquire_retry(method)
+        ):
+            return call
+
+        # The attempt is slower than recent ones; try again with the rest of its deadline.
+        start = time.monotonic()
+        call = await continuation(_with_timeout(client_call_details, timeout - elapsed), request)
+        self._adaptive_deadlines.record(method, await await_status_code(call), time.monotonic() - start)
+        return call
+
+    def _try_acquire_retry(self, method: str) -> bool:
+        """Spends a token of the retry budget, if any, for another attempt; returns False if it is exhausted."""
+        if self._retry_token_bucket is not None and not self._retry_token_bucket.try_acquire_retry():
+            logger.debug("Retry budget exhausted; not retrying %s", method)
+            return False
+        return True
+
+
+def _with_timeout(
+    client_call_details: grpc.aio._interceptor.ClientCallDetails, timeout: float
+) -> grpc.aio._interceptor.ClientCallDetails:
+    return grpc.aio._interceptor.ClientCallDetails(
+        client_call_details.method,
+        timeout,
+        client_call_details.metadata,
+        client_call_details.credentials,
+        client_call_details.wait_for_ready,
+    )
@@ -13,16 +13,20 @@ from momento_wire_types import token_pb2_grpc as token_client
 from momento.auth import CredentialProvider
 from momento.config import Configuration, TopicConfiguration
 from momento.config.auth_configuration import AuthConfiguration
+from momento.config.transport.transport_strategy import AdaptiveTransportStrategy
 from momento.errors.exceptions import ClientResourceExhaustedException, ConnectionException
 from momento.internal._utilities import PYTHON_RUNTIME_VERSION, ClientType
+from momento.internal._utilities._adaptive_deadlines import _AdaptiveDeadlines
 from momento.internal._utilities._channel_credentials import (
     channel_credentials_from_root_certs_or_default,
 )
+from momento.internal._utilities._circuit_breaker import _CircuitBreaker
 from momento.internal._utilities._grpc_channel_options import (
     grpc_control_channel_options_from_grpc_config,
     grpc_data_channel_options_from_grpc_config,
     grpc_topic_channel_options_from_grpc_config,
 )
+from momento.internal._utilities._retry_token_bucket import _RetryTokenBucket
 from momento.internal.services import Service
 
 from ... import logs
@@ -35,6 +39,8 @@ from ._add_header_client_interceptor import (
     AddHeaderStreamingClientInterceptor,
     Header,
 )
+from ._circuit_breaker_interceptor import CircuitBreakerInterceptor
+from ._in_flight_count_interceptor import InFlightCountInterceptor
 from ._middleware_interceptor import MiddlewareInterceptor
 from ._retry_interceptor import RetryInterceptor
 
@@ -43,6 +49,7 @@ class _ControlGrpcManager:
     """Internal gRPC control manager."""
 
     def __init__(self, configuration: Configuration, credential_provider: CredentialProvider):
+        retry_token_bucket = _retry_token_bucket(configuration)
         if credential_provider.port == 443:
             self._channel = grpc.aio.secure_channel(
                 target=credential_provider.control_endpoint,
@@ -52,6 +59,7 @@ class _ControlGrpcManager:
                     ClientType.CACHE,
                     configuration.get_async_middlewares(),
                     configuration.get_retry_strategy(),
+                    retry_token_bucket,
                 ),
                 options=grpc_control_channel_options_from_grpc_config(
                     grpc_config=configuration.get_transport_strategy().get_grpc_configuration(),
@@ -65,34 +73,82 @@ class _ControlGrpcManager:
                     ClientType.CACHE,
                     configuration.get_async_middlewares(),
                     configuration.get_retry_strategy(),
+                    retry_token_bucket,
                 ),
                 options=grpc_control_channel_options_from_grpc_config(
                     grpc_config=configuration.get_transport_strategy().get_grpc_configuration(),
                 ),
             )
 
+        self._stub = control_client.ScsControlStub(self._channel)  # type: ignore[no-untyped-call]
+
     async def close(self) -> None:
         await self._channel.close()
 
     def async_stub(self) -> control_client.ScsControlStub:
-        return control_client.ScsControlStub(self._channel)  # type: ignore[no-untyped-call]
+        return self._stub
 
 
 class _DataGrpcManager:
-    """Internal gRPC data manager."""
+    """Internal gRPC data manager.
+
+    Holds the configured number of data channels and sends each request on the channel
+    with the fewest requests in flight, skipping channels whose circuit breaker is open.
+    """
 
     def __init__(self, configuration: Configuration, credential_provider: CredentialProvider):
         self._logger = logs.logger
+        num_channels = configuration.get_transport_strategy().get_grpc_configuration().get_num_channels()
+        self._in_flight_counters = [InFlightCountInterceptor() for _ in range(num_channels)]
+        # One bucket for all channels, so the retry budget applies to the client as a whole.
+        retry_token_bucket = _retry_token_bucket(configuration)
+        # One set of latencies for all channels, since they all reach the same server.
+        adaptive_deadlines = _adaptive_deadlines(configuration)
+        self._circuit_breakers = [
+            _circuit_breaker(configuration, channel_index) for channel_index in range(num_channels)
+        ]
+        self._channels = [
+            self._create_channel(
+                configuration,
+                credential_provider,
+                in_flight_counter,
+                retry_token_bucket,
+                circuit_breaker,
+                adaptive_deadlines,
+            )
+            for in_flight_counter, circuit_breaker in zip(self._in_flight_counters, self._circuit_breakers)
+        ]
+        self._stubs = [cache_client.ScsStub(channel) for channel in self._channels]  # type: ignore[no-untyped-call]
+        # Where the search for the least loaded channel starts, so ties are spread across the channels.
+        self._next_channel_index = 0
+
+    @staticmethod
+    def _create_channel(
+        configuration: Configuration,
+        credential_provider: CredentialProvider,
+        in_flight_counter: InFlightCountInterceptor,
+        retry_token_bucket: Optional[_RetryTokenBucket],
+        circuit_breaker: Optional[_CircuitBreaker],
+        adaptive_deadlines: Optional[_AdaptiveDeadlines],
+    ) -> grpc.aio.Channel:
+        interceptors = [
+            in_flight_counter,
+            *_interceptors(
+                credential_provider.auth_token,
+                ClientType.CACHE,
+                configuration.get_async_middlewares(),
+                configuration.get_retry_strategy(),
+                retry_token_bucket,
+                circuit_breaker,
+                adaptive_deadlines,
+            ),
+            *_stream_interceptors(credential_provider.auth_token, ClientType.CACHE),
+        ]
         if credential_provider.port == 443:
-            self._channel = grpc.aio.secure_channel(
+            return grpc.aio.secure_channel(
                 target=credential_provider.cache_endpoint,
                 credentials=channel_credentials_from_root_certs_or_default(configuration),
-                interceptors=_interceptors(
-                    credential_provider.auth_token,
-                    ClientType.CACHE,
-                    configuration.get_async_middlewares(),
-                    configuration.get_retry_strategy(),
-                ),
+                interceptors=interceptors,
                 # Here is where you would pass override configuration to the underlying C gRPC layer.
                 # However, I have tried several different tuning options here and did not see any
                 # performance improvements, so sticking with the defaults for now.
@@ -111,19 +167,13 @@ class _DataGrpcManager:
                     configuration.get_transport_strategy().get_grpc_configuration()
                 ),
             )
-        else:
-            self._channel = grpc.aio.insecure_channel(
-                target=f"{credential_provider.cache_endpoint}:{credential_provider.port}",
-                interceptors=_interceptors(
-                    credential_provider.auth_token,
-                    ClientType.CACHE,
-                    configuration.get_async_middlewares(),
-                    configuration.get_retry_strategy(),
-                ),
-                options=grpc_data_channel_options_from_grpc_config(
-                    configuration.get_transport_strategy().get_grpc_configuration()
-                ),
-            )
+        return grpc.aio.insecure_channel(
+            target=f"{credential_provider.cache_endpoint}:{credential_provider.port}",
+            interceptors=interceptors,
+            options=grpc_data_channel_options_from_grpc_config(
+                configuration.get_transport_strategy().get_grpc_configuration()
+            ),
+        )
 
     async def eagerly_connect(self, timeout_seconds: float) -> None:
         self._logger.debug(
@@ -132,7 +182,7 @@ class _DataGrpcManager:
         try:
             await asyncio.wait_for(self.wait_for_ready(), timeout_seconds)
         except Exception as error:
-            await self._channel.close()
+            await self.close()
             self._logger.debug(f"Failed to connect to the server within the given timeout. {error}")
             raise ConnectionException(
                 message=f"Failed to connect to Momento's server within given eager connection timeout: {error}",
@@ -140,7 +190,10 @@ class _DataGrpcManager:
             ) from error
 
     async def wait_for_ready(self) -> None:
-        latest_state = self._channel.get_state(True)  # try_to_connect
+        await asyncio.gather(*(self._wait_for_channel_ready(channel) for channel in self._channels))
+
+    async def _wait_for_channel_ready(self, channel: grpc.aio.Channel) -> None:
+        latest_state = channel.get_state(True)  # try_to_connect
         ready: grpc.ChannelConnectivity = grpc.ChannelConnectivity.READY
         connecting: grpc.ChannelConnectivity = grpc.ChannelConnectivity.CONNECTING
         idle: grpc.ChannelConnectivity = grpc.ChannelConnectivity.IDLE
@@ -156,18 +209,45 @@ class _DataGrpcManager:
 
             # This is a gRPC callback helper that prevents us from repeatedly polling on the state
             # which is highly inefficient.
-            await self._channel.wait_for_state_change(latest_state)
-            latest_state = self._channel.get_state(False)  # no need to reconnect
+            await channel.wait_for_state_change(latest_state)
+            latest_state = channel.get_state(False)  # no need to reconnect
 
         if latest_state == ready:
             self._logger.debug("Connected to Momento's server! Happy Caching!")
 
     async def close(self) -> None:
-        self._logger.debug("Closing and tearing down gRPC channel")
-        await self._channel.close()
-
-    def async_stub(self) -> cache_client.ScsStub:
-        return cache_client.ScsStub(self._channel)  # type: ignore[no-untyped-call]
+        self._logger.debug("Closing and tearing down gRPC channels")
+        for channel in self._channels:
+            await channel.close()
+
+    def in_flight_counts(self) -> list[int]:
+        """Returns the number of requests in flight on each data channel."""
+        return [in_flight_counter.in_flight for in_flight_counter in self._in_flight_counters]
+
+    def _least_loaded_channel_index(self, avoid: Optional[int] = None) -> int:
+        num_channels = len(self._channels)
+        start = self._next_channel_index
+        self._next_channel_index = (start + 1) % num_channels
+        best: Optional[int] = None
+        best_load = (True, 0)
+        for offset in range(num_channels):
+            index = (start + offset) % num_channels
+            if index == avoid:
+                continue
+            # A channel whose circuit breaker is open only gets requests, which then fail fast, when
+            # every channel's breaker is open.
+            circuit_breaker = self._circuit_breakers[index]
+            rejecting = circuit_breaker is not None and not circuit_breaker.is_accepting_requests()
+            load = (rejecting, self._in_flight_counters[index].in_flight)
+            if best is None or load < best_load:
+                best, best_load = index, load
+        # With a single channel there is nothing else to pick.
+        return best if best is not None else start
+
+    def async_stub(self, avoid: Optional[cache_client.ScsStub] = None) -> cache_client.ScsStub:
+        """Returns the stub of the least loaded channel, other than the channel of `avoid` if there is another."""
+        avoid_index = self._stubs.index(avoid) if avoid is not None else None
+        return self._stubs[self._least_loaded_channel_index(avoid_index)]
 
 
 class _PubsubGrpcManager:
@@ -192,11 +272,13 @@ class _PubsubGrpcManager:
                 ),
             )
 
+        self._stub = pubsub_client.PubsubStub(self._channel)  # type: ignore[no-untyped-call]
+
     async def close(self) -> None:
         await self._channel.close()
 
     def async_stub(self) -> pubsub_client.PubsubStub:
-        return pubsub_client.PubsubStub(self._channel)  # type: ignore[no-untyped-call]
+        return self._stub
 
 
 class _PubsubGrpcStreamManager:
@@ -221,6 +303,7 @@ class _PubsubGrpcStreamManager:
                 ),
             )
         self._active_streams_count = 0
+        self._stub = pubsub_client.PubsubStub(self._channel)  # type: ignore[no-untyped-call]
 
     async def close(self) -> None:
         await self._channel.close()
@@ -232,7 +315,7 @@ class _PubsubGrpcStreamManager:
                 service=Service.TOPICS,
             )
         self._active_streams_count += 1
-        return pubsub_client.PubsubStub(self._channel)  # type: ignore[no-untyped-call]
+        return self._stub
 
     def decrement_stream_count(self) -> None:
         self._active_streams_count -= 1
@@ -264,11 +347,33 @@ class _TokenGrpcManager:
                 ),
             )
 
+        self._stub = token_client.TokenStub(self._channel)  # type: ignore[no-untyped-call]
+
     async def close(self) -> None:
         await self._channel.close()
 
     def async_stub(self) -> token_client.TokenStub:
-        return token_client.TokenStub(self._channel)  # type: ignore[no-untyped-call]
+        return self._stub
+
+
+def _retry_token_bucket(configuration: Configuration) -> Optional[_RetryTokenBucket]:
+    retry_budget = configuration.get_retry_budget()
+    return _RetryTokenBucket(retry_budget) if retry_budget is not None else None
+
+
+def _adaptive_deadlines(configuration: Configuration) -> Optional[_AdaptiveDeadlines]:
+    transport_strategy = configuration.get_transport_strategy()
+    if isinstance(transport_strategy, AdaptiveTransportStrategy):
+        return _AdaptiveDeadlines(transport_strategy)
+    return None
+
+
+def _circuit_breaker(configuration: Configuration, channel_index: int) -> Optional[_CircuitBreaker]:
+    circuit_breaker_policy = configuration.get_circuit_breaker_policy()
+    if circuit_breaker_policy is None:
+        return None
+    listeners = [middleware.on_circuit_breaker_state_change for middleware in configuration.get_async_middlewares()]
+    return _CircuitBreaker(circuit_breaker_policy, channel_index, listeners)
 
 
 def _interceptors(
@@ -276,6 +381,9 @@ def _interceptors(
     client_type: ClientType,
     middleware: List[Middleware],
     retry_strategy: Optional[RetryStrategy] = None,
+    retry_token_bucket: Optional[_RetryTokenBucket] = None,
+    circuit_breaker: Optional[_CircuitBreaker] = None,
+    adaptive_deadlines: Optional[_AdaptiveDeadlines] = None,
 ) -> list[grpc.aio.ClientInterceptor]:
     from momento import __version__ as momento_version
 
@@ -291,7 +399,8 @@ def _interceptors(
             None,
             [
                 AddHeaderClientInterceptor(headers),
-                RetryInterceptor(retry_strategy) if retry_strategy else None,
+                CircuitBreakerInterceptor(circuit_breaker) if circuit_breaker else None,
+                RetryInterceptor(retry_strategy, retry_token_bucket, adaptive_deadlines) if retry_strategy else None,
                 MiddlewareInterceptor(middleware, context) if middleware else None,
             ],
         )
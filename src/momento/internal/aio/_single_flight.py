@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class _SingleFlight:
+    """Shares one execution among concurrent calls made with the same key.
+
+    The first caller for a key starts the work; callers arriving while it is in flight
+    await the same task and receive the same result object. The key is forgotten as
+    soon as the work completes, so nothing is cached beyond the call itself.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[Hashable, asyncio.Future[object]] = {}
+        self._coalesced_count = 0
+
+    @property
+    def coalesced_count(self) -> int:
+        """The number of calls that were answered by another caller's in-flight work."""
+        return self._coalesced_count
+
+    async def do(self, key: Hashable, work: Callable[[], Awaitable[T]]) -> T:
+        try:
+            task = cast("asyncio.Future[T] | None", self._in_flight.get(key))
+        except (TypeError, ValueError):  # unhashable key, e.g. an invalid argument or a writable memoryview
+            return await work()
+
+        if task is not None:
+            self._coalesced_count += 1
+        else:
+            task = asyncio.ensure_future(work())
+            self._in_flight[key] = cast("asyncio.Future[object]", task)
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # Shielded so that a cancelled caller does not cancel the work shared with the others.
+        return await asyncio.shield(task)
@@ -1,4 +1,5 @@
-from typing import Optional
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, TypeVar, Union
 
 import grpc
 from grpc.aio import ClientCallDetails, Metadata
@@ -6,11 +7,49 @@ from grpc.aio import ClientCallDetails, Metadata
 from momento.errors import InvalidArgumentException
 from momento.internal.services import Service
 
+T = TypeVar("T")
+
 
 def make_metadata(cache_name: str) -> Metadata:
     return Metadata(("cache", cache_name))
 
 
+async def await_status_code(call: grpc.aio.Call) -> grpc.StatusCode:
+    """Waits for a call to complete and returns its status code.
+
+    Unlike awaiting the call itself, awaiting `call.code()` does not cancel the RPC when the awaiting
+    task is cancelled, so interceptors use this to stop the RPC along with the task, e.g. when a
+    hedged read abandons its losing attempt.
+    """
+    try:
+        return await call.code()
+    except asyncio.CancelledError:
+        call.cancel()
+        raise
+
+
+async def gen_chunks(items: Union[Iterable[T], AsyncIterable[T]], chunk_size: int) -> AsyncIterator[List[T]]:
+    """Groups the items of an iterable or async iterable into lists of at most `chunk_size` items.
+
+    Only one chunk is held in memory at a time, so arbitrarily large inputs can be consumed.
+    """
+    chunk: List[T] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
 def sanitize_client_call_details(client_call_details: grpc.aio.ClientCallDetails) -> grpc.aio.ClientCallDetails:
     """Defensive function meant to handle inbound gRPC client request objects.
 
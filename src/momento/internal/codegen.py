@@ -9,6 +9,7 @@ traverse and transform the tree, and emit the corresponding code. To produce the
 code from the async code, we do the following transformations:
 - convert async functions into synchronous ones,
 - convert async context managers into synchronous ones,
+- convert async for loops into synchronous ones,
 - lift expressions from an await expression
 - perform adhoc name replacements
 """
@@ -38,6 +39,11 @@ class AsyncToSyncTransformer(cst.CSTTransformer):
         updated_node = updated_node.with_changes(asynchronous=None)
         return updated_node
 
+    def leave_For(self, original_node: cst.For, updated_node: cst.For) -> cst.For:
+        """Remove the async keyword from for loops."""
+        updated_node = updated_node.with_changes(asynchronous=None)
+        return updated_node
+
     def leave_Subscript(self, original_node: cst.Subscript, updated_node: cst.Subscript) -> cst.BaseExpression:
         """Removes "Awaitable" from type hints and lifts the awaited types one level higher."""
         # You only await one thing so we test the slice is length one
@@ -123,7 +129,8 @@ name_replacements = NameReplacement(
         ("(.*?)_async_(.*)", "\\1_\\2"),
         ("(.*?)_async$", "\\1"),
         ("^((?:Cache|Auth|Topic)Client)Async$", "\\1"),
-        ("^(TUnique(?:Cache)Name)Async$", "\\1"),
+        ("^Async(Iterator|Iterable)$", "\\1"),
+        ("^(TUnique(?:Cache)Name|TSetBatchItems)Async$", "\\1"),
         ("__aenter__", "__enter__"),
         ("__aexit__", "__exit__"),
         ("^aio$", "synchronous"),
@@ -133,6 +140,7 @@ name_replacements = NameReplacement(
 simple_string_replacements = SimpleStringReplacement(
     [
         ("((?:Cache|Auth|Topic)Client)Async", "\\1"),
+        ("(TSetBatchItems)Async", "\\1"),
         (r"(.*?)Async(\s+(?:Cache|Auth|Topic)\s+Client.*?)", "\\1Synchronous\\2"),
         (r"(.*?)\bawait\s+(.*?)", "\\1\\2"),
     ]
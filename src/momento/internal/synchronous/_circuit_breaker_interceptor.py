@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+import grpc
+
+from momento.internal._utilities._circuit_breaker import _CircuitBreaker
+
+RequestType = TypeVar("RequestType")
+
+
+class CircuitBreakerInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """Fails calls fast while the channel's circuit breaker is open.
+
+    It sits outside the retry interceptor, so a call, its retries and its adaptive re-send count as one request.
+    """
+
+    def __init__(self, circuit_breaker: _CircuitBreaker):
+        self._circuit_breaker = circuit_breaker
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, RequestType], grpc.Call],
+        client_call_details: grpc.ClientCallDetails,
+        request: RequestType,
+    ) -> grpc.Call:
+        probe = self._circuit_breaker.acquire()
+        try:
+            call = continuation(client_call_details, request)
+        except BaseException:
+            self._circuit_breaker.record(grpc.StatusCode.CANCELLED, probe)
+            raise
+        # Blocking calls are already complete here and run the callback immediately.
+        call.add_done_callback(lambda done_call: self._circuit_breaker.record(done_call.code(), probe))
+        return call
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import queue
+import time
+from typing import List, Optional, Tuple
+
+import grpc
+from google.protobuf.message import Message
+
+from momento.config.hedging import HedgingPolicy, HedgingStats
+from momento.internal._utilities._hedging import _HedgingState
+from momento.internal.synchronous._scs_grpc_manager import _DataGrpcManager
+
+
+class _Hedger:
+    """Sends a second attempt of a slow idempotent read on another data channel.
+
+    Attempts are issued with the stubs' future API, so the calling thread only waits for whichever
+    attempt completes first. The first to succeed is returned and the other is cancelled. If the
+    first attempt to complete failed, the other one is waited for instead.
+    """
+
+    def __init__(self, policy: HedgingPolicy, grpc_manager: _DataGrpcManager):
+        self._state = _HedgingState(policy)
+        self._grpc_manager = grpc_manager
+
+    def stats(self) -> HedgingStats:
+        return self._state.stats()
+
+    def call(
+        self,
+        rpc_name: str,
+        request: Message,
+        metadata: List[Tuple[str, str]],
+        timeout: float,
+    ) -> Message:
+        primary_stub = self._grpc_manager.stub()
+        if not self._state.is_hedgeable(rpc_name):
+            return getattr(primary_stub, rpc_name)(request, metadata=metadata, timeout=timeout)
+
+        delay = self._state.hedge_delay(rpc_name)
+        start = time.monotonic()
+        completed: queue.SimpleQueue[grpc.Future] = queue.SimpleQueue()
+        primary = getattr(primary_stub, rpc_name).future(request, metadata=metadata, timeout=timeout)
+        primary.add_done_callback(completed.put)
+        hedge: Optional[grpc.Future] = None
+        num_pending = 1
+        try:
+            while True:
+                try:
+                    attempt = completed.get(timeout=delay if hedge is None else None)
+                except queue.Empty:
+                    # The primary attempt is slower than the hedge delay.
+                    hedge_stub = self._grpc_manager.stub(avoid=primary_stub)
+                    hedge = getattr(hedge_stub, rpc_name).future(request, metadata=metadata, timeout=timeout)
+                    hedge.add_done_callback(completed.put)
+                    num_pending += 1
+                    continue
+                num_pending -= 1
+                if attempt.exception() is None or num_pending == 0:
+                    winner = attempt
+                    break
+        finally:
+            for future in (primary, hedge):
+                if future is not None and not future.done():
+                    future.cancel()
+
+        self._state.record(rpc_name, time.monotonic() - start, hedge is not None, winner is hedge)
+        return winner.result()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+from typing import Callable, TypeVar
+
+import grpc
+
+RequestType = TypeVar("RequestType")
+ResponseType = TypeVar("ResponseType")
+
+
+class InFlightCountInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """Counts the calls on a channel that have started but not yet completed.
+
+    It must be the outermost interceptor so that retries count as part of the original call.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _increment(self) -> None:
+        with self._lock:
+            self._in_flight += 1
+
+    def _on_done(self, _call: object) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def _intercept(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, RequestType], grpc.Call],
+        client_call_details: grpc.ClientCallDetails,
+        request: RequestType,
+    ) -> grpc.Call:
+        self._increment()
+        try:
+            call = continuation(client_call_details, request)
+        except BaseException:
+            self._on_done(None)
+            raise
+        # Blocking calls are already complete here and run the callback immediately.
+        call.add_done_callback(self._on_done)
+        return call
+
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, RequestType], grpc.Call],
+        client_call_details: grpc.ClientCallDetails,
+        request: RequestType,
+    ) -> grpc.Call:
+        return self._intercept(continuation, client_call_details, request)
+
+    def intercept_unary_stream(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, RequestType], grpc.Call],
+        client_call_details: grpc.ClientCallDetails,
+        request: RequestType,
+    ) -> grpc.Call | ResponseType:
+        return self._intercept(continuation, client_call_details, request)
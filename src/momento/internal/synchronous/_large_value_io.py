@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import Callable, List, Sequence
+
+from momento_wire_types import cacheclient_pb2 as cache_pb
+from momento_wire_types import cacheclient_pb2_grpc as cache_grpc
+
+from momento.internal.synchronous._utilities import make_metadata
+
+
+def set_chunks(
+    build_stub: Callable[[], cache_grpc.ScsStub],
+    cache_name: str,
+    requests: Sequence[cache_pb._SetRequest],
+    timeout: float,
+) -> None:
+    """Stores the chunks of a large value concurrently, spread over the data channels.
+
+    The requests are all issued with the stubs' future API before any is waited for.
+    Raises the error of the first request to fail.
+    """
+    metadata = make_metadata(cache_name)
+    calls = [build_stub().Set.future(request, metadata=metadata, timeout=timeout) for request in requests]
+    for call in calls:
+        call.result()
+
+
+def get_chunks(
+    build_stub: Callable[[], cache_grpc.ScsStub],
+    cache_name: str,
+    keys: Sequence[bytes],
+    timeout: float,
+) -> List[cache_pb._GetResponse]:
+    """Reads the chunks of a large value concurrently, returning the responses in the order of `keys`."""
+    metadata = make_metadata(cache_name)
+    calls = [
+        build_stub().Get.future(cache_pb._GetRequest(cache_key=key), metadata=metadata, timeout=timeout) for key in keys
+    ]
+    return [call.result() for call in calls]
+
+
+def delete_chunks(
+    build_stub: Callable[[], cache_grpc.ScsStub],
+    cache_name: str,
+    keys: Sequence[bytes],
+    timeout: float,
+) -> None:
+    """Deletes the chunks of a large value concurrently, spread over the data channels."""
+    metadata = make_metadata(cache_name)
+    calls = [
+        build_stub().Delete.future(cache_pb._DeleteRequest(cache_key=key), metadata=metadata, timeout=timeout)
+        for key in keys
+    ]
+    for call in calls:
+        call.result()
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
+import threading
 import time
+import types
 from datetime import datetime, timedelta
-from typing import Callable, TypeVar
+from typing import Callable, Optional, TypeVar, cast
 
 import grpc
 
+from momento.internal._utilities._adaptive_deadlines import _AdaptiveDeadlines
+from momento.internal._utilities._retry_token_bucket import _RetryTokenBucket
 from momento.retry import RetryableProps, RetryStrategy
 
 RequestType = TypeVar("RequestType")
-InterceptorCall = TypeVar("InterceptorCall")
-ResponseType = TypeVar("ResponseType")
 
 # TODO: This is very duplicative of the asyncio retry interceptor; we need to
 # DRY these up, but for now I am prioritizing getting a fix out for a customer.
@@ -22,56 +26,427 @@ logger = logging.getLogger("retry-interceptor")
 # TODO: We need to send retry count information to the server so that we
 # will have some visibility into how often this is happening to customers:
 # https://github.com/momentohq/client-sdk-javascript/issues/80
-# TODO: we need to add backoff/jitter for the retries:
-# https://github.com/momentohq/client-sdk-javascript/issues/81
 
 
 class RetryInterceptor(grpc.UnaryUnaryClientInterceptor):
-    def __init__(self, retry_strategy: RetryStrategy):
+    """Retries failed unary calls without holding up callers of a stub's `future` method.
+
+    The interceptor returns a call that is also a future. Callers of a stub's `future` method
+    get it back immediately and can do other work while retries proceed: a retry with no delay
+    is sent from the callback of the failed attempt, and a delayed one from the thread shared by
+    all retrying calls, even when the attempt failed before the `future` method returned.
+    Blocking callers retry on their own thread, which waits for the outcome either way, so
+    retries start no threads.
+    """
+
+    def __init__(
+        self,
+        retry_strategy: RetryStrategy,
+        retry_token_bucket: Optional[_RetryTokenBucket] = None,
+        adaptive_deadlines: Optional[_AdaptiveDeadlines] = None,
+    ):
         self._retry_strategy = retry_strategy
+        self._retry_token_bucket = retry_token_bucket
+        self.adaptive_deadlines = adaptive_deadlines
 
     def intercept_unary_unary(
         self,
-        continuation: Callable[[grpc.ClientCallDetails, RequestType], InterceptorCall],
+        continuation: Callable[[grpc.ClientCallDetails, RequestType], grpc.Call],
         client_call_details: grpc.ClientCallDetails,
         request: RequestType,
-    ) -> InterceptorCall | ResponseType:
-        call = None
-        attempt_number = 1
+    ) -> grpc.Call:
+        if self._retry_token_bucket is not None:
+            self._retry_token_bucket.record_request()
+        call = _RetryingCall(self, continuation, client_call_details, request, _is_blocking(continuation))
+        call.start_attempts()
+        return call
+
+    def determine_when_to_retry(
+        self,
+        call: grpc.Call,
+        method: str,
+        attempt_number: int,
+        overall_deadline: datetime,
+        previous_retry_delay: Optional[float],
+        has_deadline: bool = True,
+    ) -> Optional[float]:
+        """Returns the delay in seconds before retrying a failed attempt, or None to give up."""
+        retry_time = self._retry_strategy.determine_when_to_retry(
+            # Note: the async interceptor gets `client_call_details.method` as a binary string that needs to be decoded
+            # but the sync interceptor gets it as a string.
+            RetryableProps(call.code(), method, attempt_number, overall_deadline, previous_retry_delay)
+        )
+        if retry_time is None:
+            return None
+        if has_deadline and datetime.now() + timedelta(seconds=retry_time) >= overall_deadline:
+            logger.debug("Overall deadline would pass before retrying %s; not retrying", method)
+            return None
+        if not self.try_acquire_retry(method):
+            return None
+        return retry_time
+
+    def try_acquire_retry(self, method: str) -> bool:
+        """Spends a token of the retry budget, if any, for another attempt; returns False if it is exhausted."""
+        if self._retry_token_bucket is not None and not self._retry_token_bucket.try_acquire_retry():
+            logger.debug("Retry budget exhausted; not retrying %s", method)
+            return False
+        return True
+
+    def calculate_retry_deadline(self, overall_deadline: datetime) -> Optional[float]:
+        return self._retry_strategy.calculate_retry_deadline(overall_deadline)
+
+
+class _ScheduledRetry:
+    """A retry waiting on the retry scheduler, which can be cancelled until it runs."""
+
+    def __init__(self, start_attempts: Callable[[], None]):
+        self._start_attempts = start_attempts
+        self._lock = threading.Lock()
+        self._state = "pending"
+
+    def cancel(self) -> bool:
+        """Cancels the retry, returning whether it had not run yet."""
+        with self._lock:
+            if self._state != "pending":
+                return False
+            self._state = "cancelled"
+            return True
+
+    def run(self) -> None:
+        with self._lock:
+            if self._state != "pending":
+                return
+            self._state = "run"
+        self._start_attempts()
+
+
+class _RetryScheduler:
+    """Runs the delayed retries of all calls made through a stub's `future` method on one thread.
+
+    The thread only starts attempts, which return at once, so one is enough however many calls retry.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._heap: list[tuple[float, int, _ScheduledRetry]] = []
+        self._sequence = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, delay: float, start_attempts: Callable[[], None]) -> _ScheduledRetry:
+        retry = _ScheduledRetry(start_attempts)
+        with self._condition:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._sequence), retry))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="momento-retry-scheduler", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return retry
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._heap or self._heap[0][0] > time.monotonic():
+                    self._condition.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                _, _, retry = heapq.heappop(self._heap)
+            try:
+                retry.run()
+            except Exception:
+                logger.exception("Exception starting a scheduled retry")
+
+
+_retry_scheduler = _RetryScheduler()
+
+
+class _RetryingCall(grpc.Call, grpc.Future):
+    """The outcome of a unary call across all of its attempts.
+
+    Completes with the first successful attempt, or with the failed attempt that was not retried.
+    Until then, the Call methods block like those of an in-progress gRPC call.
+    """
+
+    def __init__(
+        self,
+        interceptor: RetryInterceptor,
+        continuation: Callable[[grpc.ClientCallDetails, RequestType], grpc.Call],
+        client_call_details: grpc.ClientCallDetails,
+        request: RequestType,
+        blocking: bool,
+    ):
+        self._interceptor = interceptor
+        self._continuation = continuation
+        self._client_call_details = client_call_details
+        self._request = request
         # The overall deadline is calculated from the timeout set on the client call details.
         # That value is set in our gRPC configurations and, while typed as optional, will never be None here.
-        overall_deadline = datetime.now() + timedelta(seconds=client_call_details.timeout or 0.0)
-        # variable to capture the penultimate call to a deadline-aware retry strategy, which
+        self._overall_deadline = datetime.now() + timedelta(seconds=client_call_details.timeout or 0.0)
+        # Calls made without a timeout, such as token requests, have no overall budget to enforce.
+        self._has_deadline = client_call_details.timeout is not None
+        self._attempt_number = 1
+        self._retry_time: Optional[float] = None
+        # the timeout and start of the current attempt, and whether it is being sent again
+        # after it was abandoned at its adaptive deadline
+        self._attempt_timeout = client_call_details.timeout or 0.0
+        self._attempt_start = 0.0
+        self._resending = False
+
+        self._condition = threading.Condition()
+        self._attempt: Optional[grpc.Call] = None
+        # the penultimate call to a deadline-aware retry strategy, which
         # will hold the call object before a terminal DEADLINE_EXCEEDED response is returned
-        last_call = None
+        self._last_call: Optional[grpc.Call] = None
+        self._outcome: Optional[grpc.Call] = None
+        self._error: Optional[BaseException] = None
+        self._scheduled_retry: Optional[_ScheduledRetry] = None
+        # Whether the call was made through a blocking method of the stub rather than `future`.
+        # Only the attempts of a blocking call wait for their retry delay on the calling thread.
+        self._blocking = blocking
+        # Whether this thread is running `start_attempts`. An attempt that completes on it is sent
+        # again from there too rather than from its done callback.
+        self._local = threading.local()
+        self._cancelled = False
+        self._done = False
+        self._done_callbacks: list[Callable[[grpc.Future], None]] = []
 
-        while True:
-            if attempt_number > 1:
-                retry_deadline = self._retry_strategy.calculate_retry_deadline(overall_deadline)
+    def start_attempts(self) -> None:
+        """Sends attempts until one completes later than it is sent, or the call is done."""
+        self._local.attempting = True
+        try:
+            self._local.attempt_again = True
+            while self._local.attempt_again:
+                self._local.attempt_again = False
+                self._start_attempt()
+        finally:
+            self._local.attempting = False
+
+    def _start_attempt(self) -> None:
+        try:
+            if self._attempt_number > 1 and not self._resending:
+                retry_deadline = self._interceptor.calculate_retry_deadline(self._overall_deadline)
                 if retry_deadline is not None:
-                    client_call_details = grpc.aio._interceptor.ClientCallDetails(
-                        client_call_details.method,
-                        retry_deadline,
-                        client_call_details.metadata,
-                        client_call_details.credentials,
-                        client_call_details.wait_for_ready,
-                    )
-                    last_call = call
-
-            call = continuation(client_call_details, request)
-            response_code = call.code()  # type: ignore[attr-defined]  # noqa: F401
-
-            if response_code == grpc.StatusCode.OK:
-                return call
-
-            retryTime = self._retry_strategy.determine_when_to_retry(
-                # Note: the async interceptor gets `client_call_details.method` as a binary string that needs to be decoded
-                # but the sync interceptor gets it as a string.
-                RetryableProps(response_code, client_call_details.method, attempt_number, overall_deadline)
+                    self._last_call = self._attempt
+                if self._has_deadline:
+                    # Every attempt shares the overall deadline, so a retry only gets the time that is left.
+                    remaining = (self._overall_deadline - datetime.now()).total_seconds()
+                    retry_deadline = remaining if retry_deadline is None else min(retry_deadline, remaining)
+                if retry_deadline is not None:
+                    self._client_call_details = _with_timeout(self._client_call_details, retry_deadline)
+
+            attempt_call_details = self._client_call_details
+            timeout = self._client_call_details.timeout or 0.0
+            adaptive_deadlines = self._interceptor.adaptive_deadlines
+            if self._resending:
+                self._attempt_timeout = timeout - (time.monotonic() - self._attempt_start)
+                attempt_call_details = _with_timeout(self._client_call_details, self._attempt_timeout)
+            elif adaptive_deadlines is not None:
+                self._attempt_timeout = adaptive_deadlines.attempt_timeout(self._client_call_details.method, timeout)
+                attempt_call_details = _with_timeout(self._client_call_details, self._attempt_timeout)
+            self._attempt_start = time.monotonic()
+            attempt = self._continuation(attempt_call_details, self._request)
+        except BaseException as e:
+            self._complete(self._attempt, e)
+            return
+
+        with self._condition:
+            self._attempt = attempt
+            cancelled = self._cancelled
+        if cancelled:
+            attempt.cancel()
+        # Blocking calls are already complete here and run the callback immediately.
+        attempt.add_done_callback(self._on_attempt_done)
+
+    def _on_attempt_done(self, attempt: grpc.Call) -> None:
+        try:
+            adaptive_deadlines = self._interceptor.adaptive_deadlines
+            if adaptive_deadlines is not None:
+                elapsed = time.monotonic() - self._attempt_start
+                adaptive_deadlines.record(self._client_call_details.method, attempt.code(), elapsed)
+                if self._should_resend(attempt, elapsed):
+                    # The attempt is slower than recent ones; try again with the rest of its deadline.
+                    self._resending = True
+                    self._retry_after(0.0)
+                    return
+            self._resending = False
+
+            if attempt.code() == grpc.StatusCode.OK:
+                self._complete(attempt)
+                return
+
+            retry_time = self._interceptor.determine_when_to_retry(
+                attempt,
+                self._client_call_details.method,
+                self._attempt_number,
+                self._overall_deadline,
+                self._retry_time,
+                self._has_deadline,
             )
+            with self._condition:
+                retrying = retry_time is not None and not self._cancelled
+            if retry_time is not None and retrying:
+                self._attempt_number += 1
+                self._retry_time = retry_time
+                self._retry_after(retry_time)
+                return
+            self._complete(self._last_call or attempt)
+        except BaseException as e:
+            self._complete(attempt, e)
+
+    def _retry_after(self, delay: float) -> None:
+        if delay > 0 and not self._blocking:
+            with self._condition:
+                self._scheduled_retry = _retry_scheduler.schedule(delay, self.start_attempts)
+            return
+        if delay > 0:
+            # The caller of a blocking call is waiting for the outcome on this thread anyway.
+            time.sleep(delay)
+        if getattr(self._local, "attempting", False):
+            self._local.attempt_again = True
+        else:
+            self.start_attempts()
+
+    def _should_resend(self, attempt: grpc.Call, elapsed: float) -> bool:
+        timeout = self._client_call_details.timeout or 0.0
+        with self._condition:
+            cancelled = self._cancelled
+        return (
+            not self._resending
+            and not cancelled
+            and attempt.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+            and self._attempt_timeout < timeout
+            and elapsed < timeout
+            and self._interceptor.try_acquire_retry(self._client_call_details.method)
+        )
+
+    def _complete(self, outcome: Optional[grpc.Call], error: Optional[BaseException] = None) -> None:
+        with self._condition:
+            if self._done:
+                return
+            self._outcome = outcome
+            self._error = error
+            self._done = True
+            self._condition.notify_all()
+            callbacks, self._done_callbacks = self._done_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                logger.exception("Exception calling a done callback of a retried call")
+
+    def _wait(self, timeout: Optional[float] = None) -> None:
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._done, timeout):
+                raise grpc.FutureTimeoutError()
+
+    def _wait_for_outcome(self, timeout: Optional[float]) -> grpc.Call:
+        self._wait(timeout)
+        if self._error is not None:
+            raise self._error
+        if self._outcome is None:
+            raise grpc.FutureCancelledError()
+        return self._outcome
+
+    # grpc.Future
+
+    def cancel(self) -> bool:
+        with self._condition:
+            if self._done:
+                return False
+            self._cancelled = True
+            attempt, scheduled_retry = self._attempt, self._scheduled_retry
+        if scheduled_retry is not None and scheduled_retry.cancel():
+            # Waiting to retry: give up now.
+            self._complete(None)
+        elif attempt is not None:
+            # The attempt completes as CANCELLED and is not retried.
+            attempt.cancel()
+        return True
+
+    def cancelled(self) -> bool:
+        with self._condition:
+            return self._cancelled
+
+    def running(self) -> bool:
+        with self._condition:
+            return not self._done
+
+    def done(self) -> bool:
+        with self._condition:
+            return self._done
+
+    def result(self, timeout: Optional[float] = None) -> object:
+        return self._wait_for_outcome(timeout).result()
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        try:
+            return cast(Optional[BaseException], self._wait_for_outcome(timeout).exception())
+        except (grpc.FutureTimeoutError, grpc.FutureCancelledError):
+            raise
+        except BaseException as e:
+            return e
+
+    def traceback(self, timeout: Optional[float] = None) -> Optional[types.TracebackType]:
+        try:
+            return cast(Optional[types.TracebackType], self._wait_for_outcome(timeout).traceback())
+        except (grpc.FutureTimeoutError, grpc.FutureCancelledError):
+            raise
+        except BaseException as e:
+            return e.__traceback__
+
+    def add_done_callback(self, fn: Callable[[grpc.Future], None]) -> None:
+        with self._condition:
+            if not self._done:
+                self._done_callbacks.append(fn)
+                return
+        fn(self)
+
+    # grpc.Call
+
+    def initial_metadata(self) -> object:
+        self._wait()
+        return self._outcome.initial_metadata() if self._outcome is not None else None
+
+    def trailing_metadata(self) -> object:
+        self._wait()
+        return self._outcome.trailing_metadata() if self._outcome is not None else None
+
+    def code(self) -> grpc.StatusCode:
+        self._wait()
+        if self._outcome is not None:
+            return self._outcome.code()
+        return grpc.StatusCode.CANCELLED if self._error is None else grpc.StatusCode.UNKNOWN
+
+    def details(self) -> Optional[str]:
+        self._wait()
+        if self._outcome is not None:
+            return cast(Optional[str], self._outcome.details())
+        return "Locally cancelled by application!" if self._error is None else str(self._error)
+
+    def is_active(self) -> bool:
+        return self.running()
+
+    def time_remaining(self) -> Optional[float]:
+        return max(0.0, (self._overall_deadline - datetime.now()).total_seconds())
+
+    def add_callback(self, callback: Callable[[], None]) -> bool:
+        with self._condition:
+            if self._done:
+                return False
+            self._done_callbacks.append(lambda _: callback())
+            return True
+
+
+def _is_blocking(continuation: object) -> bool:
+    """Returns whether gRPC made the continuation for a blocking call rather than a `future` one.
+
+    gRPC makes the continuation of a blocking call in `_with_call`, and that of a `future` call in `future`.
+    """
+    return "._with_call.<locals>." in getattr(continuation, "__qualname__", "")
 
-            if retryTime is None:
-                return last_call or call
 
-            attempt_number += 1
-            time.sleep(retryTime)
+def _with_timeout(client_call_details: grpc.ClientCallDetails, timeout: float) -> grpc.ClientCallDetails:
+    return grpc.aio._interceptor.ClientCallDetails(
+        client_call_details.method,
+        timeout,
+        client_call_details.metadata,
+        client_call_details.credentials,
+        client_call_details.wait_for_ready,
+    )
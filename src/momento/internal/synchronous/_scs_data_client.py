@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional, Union
 
+from google.protobuf.message import Message
 from momento_wire_types import cacheclient_pb2 as cache_pb
 from momento_wire_types import cacheclient_pb2_grpc as cache_grpc
 from momento_wire_types import common_pb2 as common_pb
 
 from momento import logs
 from momento.auth import CredentialProvider
-from momento.config import Configuration
-from momento.errors import UnknownException, convert_error
+from momento.config import Configuration, HedgingStats, NearCacheStats
+from momento.errors import InvalidArgumentException, SerializationException, UnknownException, convert_error
 from momento.internal._utilities import (
     _as_bytes,
     _gen_dictionary_fields_as_bytes,
@@ -21,20 +22,37 @@ from momento.internal._utilities import (
     _validate_cache_name,
     _validate_dictionary_name,
     _validate_list_name,
+    _validate_positive_int,
     _validate_set_name,
+    _validate_timedelta_ttl,
     _validate_ttl,
 )
+from momento.internal._utilities._compression import _Compressor
 from momento.internal._utilities._data_validation import (
+    _as_buffer,
+    _gen_scalar_keys_as_bytes,
     _gen_sorted_set_elements_as_bytes,
     _gen_sorted_set_values_as_bytes,
     _validate_sorted_set_name,
     _validate_sorted_set_score,
 )
+from momento.internal._utilities._large_values import (
+    _LargeValueManifest,
+    _LargeValueWriter,
+    escape_stored_value,
+    unescape_stored_value,
+)
+from momento.internal._utilities._near_cache import _NearCache
 from momento.internal.services import Service
+from momento.internal.synchronous._hedger import _Hedger
+from momento.internal.synchronous._large_value_io import delete_chunks, get_chunks, set_chunks
 from momento.internal.synchronous._scs_grpc_manager import _DataGrpcManager
-from momento.internal.synchronous._utilities import make_metadata
+from momento.internal.synchronous._single_flight import _SingleFlight
+from momento.internal.synchronous._utilities import gen_chunks, make_metadata
 from momento.requests import CollectionTtl, SortOrder
 from momento.responses import (
+    CacheDecreaseTtl,
+    CacheDecreaseTtlResponse,
     CacheDelete,
     CacheDeleteResponse,
     CacheDictionaryFetch,
@@ -50,9 +68,23 @@ from momento.responses import (
     CacheDictionarySetFields,
     CacheDictionarySetFieldsResponse,
     CacheGet,
+    CacheGetBatch,
+    CacheGetBatchResponse,
+    CacheGetLarge,
+    CacheGetLargeResponse,
     CacheGetResponse,
+    CacheIncreaseTtl,
+    CacheIncreaseTtlResponse,
     CacheIncrement,
     CacheIncrementResponse,
+    CacheItemGetTtl,
+    CacheItemGetTtlResponse,
+    CacheItemGetType,
+    CacheItemGetTypeResponse,
+    CacheKeyExists,
+    CacheKeyExistsResponse,
+    CacheKeysExist,
+    CacheKeysExistResponse,
     CacheListConcatenateBack,
     CacheListConcatenateBackResponse,
     CacheListConcatenateFront,
@@ -71,16 +103,37 @@ from momento.responses import (
     CacheListPushFrontResponse,
     CacheListRemoveValue,
     CacheListRemoveValueResponse,
+    CacheListRetain,
+    CacheListRetainResponse,
     CacheSet,
     CacheSetAddElements,
     CacheSetAddElementsResponse,
+    CacheSetBatch,
+    CacheSetBatchResponse,
     CacheSetFetch,
     CacheSetFetchResponse,
+    CacheSetIfAbsent,
+    CacheSetIfAbsentOrEqual,
+    CacheSetIfAbsentOrEqualResponse,
+    CacheSetIfAbsentResponse,
+    CacheSetIfEqual,
+    CacheSetIfEqualResponse,
+    CacheSetIfNotEqual,
+    CacheSetIfNotEqualResponse,
     CacheSetIfNotExists,
     CacheSetIfNotExistsResponse,
+    CacheSetIfPresent,
+    CacheSetIfPresentAndNotEqual,
+    CacheSetIfPresentAndNotEqualResponse,
+    CacheSetIfPresentResponse,
+    CacheSetLarge,
+    CacheSetLargeResponse,
     CacheSetRemoveElements,
     CacheSetRemoveElementsResponse,
     CacheSetResponse,
+    CacheUpdateTtl,
+    CacheUpdateTtlResponse,
+    ItemType,
 )
 from momento.responses.data.sorted_set.fetch import (
     CacheSortedSetFetch,
@@ -111,16 +164,18 @@ from momento.responses.data.sorted_set.remove_elements import (
     CacheSortedSetRemoveElementsResponse,
 )
 from momento.typing import (
+    TBytesLike,
     TCacheName,
     TDictionaryField,
     TDictionaryFields,
     TDictionaryItems,
     TDictionaryName,
+    TLargeValueDestination,
     TListName,
-    TListValue,
-    TListValuesInput,
     TScalarKey,
-    TScalarValue,
+    TScalarKeys,
+    TSetBatchItem,
+    TSetBatchItems,
     TSetElementsInput,
     TSetName,
     TSortedSetElements,
@@ -130,6 +185,37 @@ from momento.typing import (
     TSortedSetValues,
 )
 
+_ITEM_TYPES = {
+    cache_pb._ItemGetTypeResponse.SCALAR: ItemType.SCALAR,
+    cache_pb._ItemGetTypeResponse.DICTIONARY: ItemType.DICTIONARY,
+    cache_pb._ItemGetTypeResponse.LIST: ItemType.LIST,
+    cache_pb._ItemGetTypeResponse.SET: ItemType.SET,
+    cache_pb._ItemGetTypeResponse.SORTED_SET: ItemType.SORTED_SET,
+}
+
+
+def _set_list_range(
+    request: Union[cache_pb._ListFetchRequest, cache_pb._ListRetainRequest],
+    start_index: Optional[int],
+    end_index: Optional[int],
+) -> None:
+    """Sets the index range of a list request. Negative indices count from the end of the list."""
+    if start_index is not None:
+        request.inclusive_start = start_index
+    else:
+        request.unbounded_start.CopyFrom(common_pb._Unbounded())
+    if end_index is not None:
+        request.exclusive_end = end_index
+    else:
+        request.unbounded_end.CopyFrom(common_pb._Unbounded())
+
+
+def _collection_ttl_milliseconds(
+    request: Union[cache_pb._DictionaryIncrementRequest, cache_pb._DictionarySetRequest, cache_pb._SetUnionRequest],
+) -> Optional[int]:
+    """Returns the TTL a collection write gives the collection, or None if it keeps the TTL the collection had."""
+    return request.ttl_milliseconds if request.refresh_ttl else None
+
 
 class _ScsDataClient:
     """Internal data client."""
@@ -143,6 +229,15 @@ class _ScsDataClient:
     __UNSUPPORTED_SORTED_SET_ELEMENTS_TYPE_MSG = "Unsupported type for sorted set elements: "
     __UNSUPPORTED_SORTED_SET_VALUE_TYPE_MSG = "Unsupported type for sorted set value: "
     __UNSUPPORTED_SORTED_SET_VALUES_TYPE_MSG = "Unsupported type for sorted set values: "
+    __UNSUPPORTED_SET_BATCH_ITEM_TYPE_MSG = "Unsupported type for set batch item: "
+
+    # Bounds how many items a single SetBatch request carries, and so how much of
+    # a `set_batch` input is held in memory at once.
+    _SET_BATCH_MAX_ITEMS_PER_REQUEST = 100
+
+    # Bounds how many chunks of a large value are sent or received at once, and so how much
+    # of the value is held in request and response messages at a time.
+    _LARGE_VALUE_MAX_CONCURRENT_CHUNKS = 8
 
     __UNSUPPORTED_DICTIONARY_NAME_TYPE_MSG = "Unsupported type for dictionary_name: "
     __UNSUPPORTED_DICTIONARY_FIELD_TYPE_MSG = "Unsupported type for field: "
@@ -162,6 +257,14 @@ class _ScsDataClient:
         _validate_ttl(default_ttl)
         self._default_ttl = default_ttl
 
+        near_cache_configuration = configuration.get_near_cache_configuration()
+        self._near_cache = _NearCache(near_cache_configuration) if near_cache_configuration is not None else None
+        self._single_flight = _SingleFlight() if configuration.get_request_coalescing() else None
+        hedging_policy = configuration.get_hedging_policy()
+        self._hedger = _Hedger(hedging_policy, self._grpc_manager) if hedging_policy is not None else None
+        compression_configuration = configuration.get_compression_configuration()
+        self._compressor = _Compressor(compression_configuration) if compression_configuration is not None else None
+
     def connect(self, eager_connection_timeout: timedelta) -> None:
         self._grpc_manager.eagerly_connect(eager_connection_timeout.total_seconds())
 
@@ -169,11 +272,27 @@ class _ScsDataClient:
     def endpoint(self) -> str:
         return self._endpoint
 
+    def in_flight_counts(self) -> list[int]:
+        """Returns the number of requests in flight on each data channel."""
+        return self._grpc_manager.in_flight_counts()
+
+    def near_cache_stats(self) -> Optional[NearCacheStats]:
+        """Returns the near cache counters, or None if the near cache is disabled."""
+        return self._near_cache.stats() if self._near_cache is not None else None
+
+    def coalesced_request_count(self) -> int:
+        """Returns how many reads were answered by an identical request already in flight."""
+        return self._single_flight.coalesced_count if self._single_flight is not None else 0
+
+    def hedging_stats(self) -> Optional[HedgingStats]:
+        """Returns the hedging counters, or None if reads are not hedged."""
+        return self._hedger.stats() if self._hedger is not None else None
+
     def increment(
         self, cache_name: TCacheName, key: TScalarKey, amount: int = 1, ttl: Optional[timedelta] = None
     ) -> CacheIncrementResponse:
         try:
-            self._log_issuing_request("Increment", {"key": str(key), "amount": str(amount)})
+            self._log_issuing_request("Increment", key=key, amount=amount)
             _validate_cache_name(cache_name)
             _validate_ttl(ttl)
 
@@ -188,7 +307,8 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("Increment", {"key": str(key), "amount": str(amount)})
+            self._invalidate_near_cache(cache_name, request.cache_key, request.ttl_milliseconds)
+            self._log_received_response("Increment", key=key, amount=amount)
             return CacheIncrement.Success(response.value)
         except Exception as e:
             self._log_request_error("increment", e)
@@ -197,49 +317,179 @@ class _ScsDataClient:
     def set(
         self,
         cache_name: str,
-        key: TScalarKey,
-        value: TScalarValue,
+        key: TBytesLike,
+        value: TBytesLike,
         ttl: Optional[timedelta],
     ) -> CacheSetResponse:
         try:
-            self._log_issuing_request("Set", {"key": str(key)})
+            self._log_issuing_request("Set", key=key)
             _validate_cache_name(cache_name)
             _validate_ttl(ttl)
             request = cache_pb._SetRequest(
                 cache_key=_as_bytes(key, "Unsupported type for key: "),
-                cache_body=_as_bytes(value, "Unsupported type for value: "),
+                cache_body=self._value_as_bytes(value, "Unsupported type for value: "),
                 ttl_milliseconds=self._ttl_or_default_milliseconds(ttl),
             )
 
             self._build_stub().Set(request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds)
+            self._invalidate_near_cache(cache_name, request.cache_key, request.ttl_milliseconds)
 
-            self._log_received_response("Set", {"key": str(key)})
+            self._log_received_response("Set", key=key)
             return CacheSet.Success()
         except Exception as e:
             self._log_request_error("set", e)
             return CacheSet.Error(convert_error(e, Service.CACHE))
 
+    def set_batch(
+        self,
+        cache_name: TCacheName,
+        items: TSetBatchItems,
+        ttl: Optional[timedelta],
+    ) -> CacheSetBatchResponse:
+        try:
+            self._log_issuing_request("SetBatch")
+            _validate_cache_name(cache_name)
+            _validate_ttl(ttl)
+
+            results: list[CacheSetResponse] = []
+            for chunk in gen_chunks(items, self._SET_BATCH_MAX_ITEMS_PER_REQUEST):
+                results.extend(self._set_batch_chunk(cache_name, chunk, ttl))
+
+            self._log_received_response("SetBatch", num_items=len(results))
+            return CacheSetBatch.Success(results)
+        except Exception as e:
+            self._log_request_error("set_batch", e)
+            return CacheSetBatch.Error(convert_error(e, Service.CACHE))
+
+    def _set_batch_chunk(
+        self, cache_name: TCacheName, chunk: list[TSetBatchItem], ttl: Optional[timedelta]
+    ) -> list[CacheSetResponse]:
+        """Stores one chunk of a `set_batch` input with a single SetBatch request.
+
+        Items that fail validation get an error result and are left out of the request.
+        Raises if the request itself fails.
+        """
+        success = CacheSet.Success()
+        results: list[CacheSetResponse] = [success] * len(chunk)
+        requests: list[cache_pb._SetRequest] = []
+        for position, item in enumerate(chunk):
+            try:
+                requests.append(self._set_batch_item_as_request(item, ttl))
+            except Exception as e:
+                results[position] = CacheSet.Error(convert_error(e, Service.CACHE))
+
+        if len(requests) == 0:
+            return results
+
+        call = self._build_stub().SetBatch(
+            cache_pb._SetBatchRequest(items=requests),
+            metadata=make_metadata(cache_name),
+            timeout=self._default_deadline_seconds,
+        )
+        num_acknowledged = 0
+        for _ in call:
+            num_acknowledged += 1
+        if num_acknowledged != len(requests):
+            raise UnknownException(f"SetBatch acknowledged {num_acknowledged} of {len(requests)} items")
+        for request in requests:
+            self._invalidate_near_cache(cache_name, request.cache_key, request.ttl_milliseconds)
+        return results
+
+    def _set_batch_item_as_request(self, item: TSetBatchItem, ttl: Optional[timedelta]) -> cache_pb._SetRequest:
+        if not isinstance(item, tuple) or len(item) not in (2, 3):
+            raise InvalidArgumentException(f"{self.__UNSUPPORTED_SET_BATCH_ITEM_TYPE_MSG}{type(item)}", Service.CACHE)
+        key, value = item[0], item[1]
+        item_ttl = item[2] if len(item) == 3 else None
+        _validate_ttl(item_ttl)
+        return cache_pb._SetRequest(
+            cache_key=_as_bytes(key, "Unsupported type for key: "),
+            cache_body=self._value_as_bytes(value, "Unsupported type for value: "),
+            ttl_milliseconds=self._ttl_or_default_milliseconds(item_ttl if item_ttl is not None else ttl),
+        )
+
+    def set_large(
+        self,
+        cache_name: TCacheName,
+        key: TBytesLike,
+        value: TBytesLike,
+        ttl: Optional[timedelta],
+        chunk_size: int,
+    ) -> CacheSetLargeResponse:
+        try:
+            self._log_issuing_request("SetLarge", key=key)
+            _validate_cache_name(cache_name)
+            _validate_ttl(ttl)
+            _validate_positive_int(chunk_size, "Chunk size")
+            cache_key = _as_bytes(key, "Unsupported type for key: ")
+            data = memoryview(_as_buffer(value, "Unsupported type for value: "))
+            ttl_milliseconds = self._ttl_or_default_milliseconds(ttl)
+            replaced_manifest = self._large_value_manifest(cache_name, cache_key)
+
+            if len(data) <= chunk_size:
+                # A value that fits in one request is stored under its key as is.
+                cache_body = self._value_as_bytes(escape_stored_value(data), "Unsupported type for value: ")
+            else:
+                manifest = _LargeValueManifest.for_value(data, chunk_size)
+                for start in range(0, manifest.num_chunks, self._LARGE_VALUE_MAX_CONCURRENT_CHUNKS):
+                    requests = [
+                        cache_pb._SetRequest(
+                            cache_key=manifest.chunk_key(cache_key, index),
+                            cache_body=self._value_as_bytes(
+                                manifest.chunk(data, index), "Unsupported type for value: "
+                            ),
+                            ttl_milliseconds=ttl_milliseconds,
+                        )
+                        for index in range(
+                            start, min(start + self._LARGE_VALUE_MAX_CONCURRENT_CHUNKS, manifest.num_chunks)
+                        )
+                    ]
+                    set_chunks(self._build_stub, cache_name, requests, self._default_deadline_seconds)
+                # The manifest is stored last, so the value is only visible once all of its chunks are.
+                cache_body = manifest.encode()
+
+            self._build_stub().Set(
+                cache_pb._SetRequest(cache_key=cache_key, cache_body=cache_body, ttl_milliseconds=ttl_milliseconds),
+                metadata=make_metadata(cache_name),
+                timeout=self._default_deadline_seconds,
+            )
+            self._invalidate_near_cache(cache_name, cache_key, ttl_milliseconds)
+            if replaced_manifest is not None:
+                try:
+                    self._delete_large_value_chunks(cache_name, cache_key, replaced_manifest)
+                except Exception as e:
+                    # The new value is stored; the chunks left behind only take space until they expire.
+                    self._logger.warning("Could not delete the chunks of the value set_large replaced: %s", e)
+
+            self._log_received_response("SetLarge", key=key, size=len(data))
+            return CacheSetLarge.Success()
+        except Exception as e:
+            self._log_request_error("set_large", e)
+            return CacheSetLarge.Error(convert_error(e, Service.CACHE))
+
     def set_if_not_exists(
-        self, cache_name: TCacheName, key: TScalarKey, value: TScalarValue, ttl: Optional[timedelta]
+        self, cache_name: TCacheName, key: TBytesLike, value: TBytesLike, ttl: Optional[timedelta]
     ) -> CacheSetIfNotExistsResponse:
         try:
-            self._log_issuing_request("SetIfNotExists", {"key": str(key)})
+            self._log_issuing_request("SetIfNotExists", key=key)
 
             _validate_cache_name(cache_name)
             _validate_ttl(ttl)
             request = cache_pb._SetIfNotExistsRequest(
                 cache_key=_as_bytes(key, "Unsupported type for key: "),
-                cache_body=_as_bytes(value, "Unsupported type for value: "),
+                cache_body=self._value_as_bytes(value, "Unsupported type for value: "),
                 ttl_milliseconds=self._ttl_or_default_milliseconds(ttl),
             )
 
             response = self._build_stub().SetIfNotExists(
                 request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
             )
+            result = response.WhichOneof("result")
+            self._invalidate_near_cache(
+                cache_name, request.cache_key, request.ttl_milliseconds if result == "stored" else None
+            )
 
-            self._log_received_response("SetIfNotExists", {"key": str(key)})
+            self._log_received_response("SetIfNotExists", key=key)
 
-            result = response.WhichOneof("result")
             if result == "stored":
                 return CacheSetIfNotExists.Stored()
             elif result == "not_stored":
@@ -250,21 +500,198 @@ class _ScsDataClient:
             self._log_request_error("set_if_not_exists", e)
             return CacheSetIfNotExists.Error(convert_error(e, Service.CACHE))
 
+    def set_if_absent(
+        self,
+        cache_name: TCacheName,
+        key: TBytesLike,
+        value: TBytesLike,
+        ttl: Optional[timedelta],
+    ) -> CacheSetIfAbsentResponse:
+        try:
+            self._log_issuing_request("SetIfAbsent", key=key)
+            condition = common_pb.Absent()
+            if self._set_if(cache_name, key, value, ttl, "absent", condition):
+                result: CacheSetIfAbsentResponse = CacheSetIfAbsent.Stored()
+            else:
+                result = CacheSetIfAbsent.NotStored()
+            self._log_received_response("SetIfAbsent", key=key)
+            return result
+        except Exception as e:
+            self._log_request_error("set_if_absent", e)
+            return CacheSetIfAbsent.Error(convert_error(e, Service.CACHE))
+
+    def set_if_present(
+        self,
+        cache_name: TCacheName,
+        key: TBytesLike,
+        value: TBytesLike,
+        ttl: Optional[timedelta],
+    ) -> CacheSetIfPresentResponse:
+        try:
+            self._log_issuing_request("SetIfPresent", key=key)
+            condition = common_pb.Present()
+            if self._set_if(cache_name, key, value, ttl, "present", condition):
+                result: CacheSetIfPresentResponse = CacheSetIfPresent.Stored()
+            else:
+                result = CacheSetIfPresent.NotStored()
+            self._log_received_response("SetIfPresent", key=key)
+            return result
+        except Exception as e:
+            self._log_request_error("set_if_present", e)
+            return CacheSetIfPresent.Error(convert_error(e, Service.CACHE))
+
+    def set_if_equal(
+        self,
+        cache_name: TCacheName,
+        key: TBytesLike,
+        value: TBytesLike,
+        equal: TBytesLike,
+        ttl: Optional[timedelta],
+    ) -> CacheSetIfEqualResponse:
+        try:
+            self._log_issuing_request("SetIfEqual", key=key)
+            condition = common_pb.Equal(value_to_check=self._value_as_bytes(equal, "Unsupported type for equal: "))
+            if self._set_if(cache_name, key, value, ttl, "equal", condition):
+                result: CacheSetIfEqualResponse = CacheSetIfEqual.Stored()
+            else:
+                result = CacheSetIfEqual.NotStored()
+            self._log_received_response("SetIfEqual", key=key)
+            return result
+        except Exception as e:
+            self._log_request_error("set_if_equal", e)
+            return CacheSetIfEqual.Error(convert_error(e, Service.CACHE))
+
+    def set_if_not_equal(
+        self,
+        cache_name: TCacheName,
+        key: TBytesLike,
+        value: TBytesLike,
+        not_equal: TBytesLike,
+        ttl: Optional[timedelta],
+    ) -> CacheSetIfNotEqualResponse:
+        try:
+            self._log_issuing_request("SetIfNotEqual", key=key)
+            condition = common_pb.NotEqual(
+                value_to_check=self._value_as_bytes(not_equal, "Unsupported type for not_equal: ")
+            )
+            if self._set_if(cache_name, key, value, ttl, "not_equal", condition):
+                result: CacheSetIfNotEqualResponse = CacheSetIfNotEqual.Stored()
+            else:
+                result = CacheSetIfNotEqual.NotStored()
+            self._log_received_response("SetIfNotEqual", key=key)
+            return result
+        except Exception as e:
+            self._log_request_error("set_if_not_equal", e)
+            return CacheSetIfNotEqual.Error(convert_error(e, Service.CACHE))
+
+    def set_if_present_and_not_equal(
+        self,
+        cache_name: TCacheName,
+        key: TBytesLike,
+        value: TBytesLike,
+        not_equal: TBytesLike,
+        ttl: Optional[timedelta],
+    ) -> CacheSetIfPresentAndNotEqualResponse:
+        try:
+            self._log_issuing_request("SetIfPresentAndNotEqual", key=key)
+            condition = common_pb.PresentAndNotEqual(
+                value_to_check=self._value_as_bytes(not_equal, "Unsupported type for not_equal: ")
+            )
+            if self._set_if(cache_name, key, value, ttl, "present_and_not_equal", condition):
+                result: CacheSetIfPresentAndNotEqualResponse = CacheSetIfPresentAndNotEqual.Stored()
+            else:
+                result = CacheSetIfPresentAndNotEqual.NotStored()
+            self._log_received_response("SetIfPresentAndNotEqual", key=key)
+            return result
+        except Exception as e:
+            self._log_request_error("set_if_present_and_not_equal", e)
+            return CacheSetIfPresentAndNotEqual.Error(convert_error(e, Service.CACHE))
+
+    def set_if_absent_or_equal(
+        self,
+        cache_name: TCacheName,
+        key: TBytesLike,
+        value: TBytesLike,
+        equal: TBytesLike,
+        ttl: Optional[timedelta],
+    ) -> CacheSetIfAbsentOrEqualResponse:
+        try:
+            self._log_issuing_request("SetIfAbsentOrEqual", key=key)
+            condition = common_pb.AbsentOrEqual(
+                value_to_check=self._value_as_bytes(equal, "Unsupported type for equal: ")
+            )
+            if self._set_if(cache_name, key, value, ttl, "absent_or_equal", condition):
+                result: CacheSetIfAbsentOrEqualResponse = CacheSetIfAbsentOrEqual.Stored()
+            else:
+                result = CacheSetIfAbsentOrEqual.NotStored()
+            self._log_received_response("SetIfAbsentOrEqual", key=key)
+            return result
+        except Exception as e:
+            self._log_request_error("set_if_absent_or_equal", e)
+            return CacheSetIfAbsentOrEqual.Error(convert_error(e, Service.CACHE))
+
+    def _set_if(
+        self,
+        cache_name: TCacheName,
+        key: TBytesLike,
+        value: TBytesLike,
+        ttl: Optional[timedelta],
+        condition_name: str,
+        condition: Message,
+    ) -> bool:
+        """Issues a SetIf request with the given condition and returns whether the value was stored.
+
+        Values to check against are encoded like stored values, compression included, so that the server
+        compares them to the bytes it holds.
+        """
+        _validate_cache_name(cache_name)
+        _validate_ttl(ttl)
+        request = cache_pb._SetIfRequest(
+            cache_key=_as_bytes(key, "Unsupported type for key: "),
+            cache_body=self._value_as_bytes(value, "Unsupported type for value: "),
+            ttl_milliseconds=self._ttl_or_default_milliseconds(ttl),
+        )
+        getattr(request, condition_name).CopyFrom(condition)
+
+        response = self._build_stub().SetIf(
+            request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+        )
+        result = response.WhichOneof("result")
+        self._invalidate_near_cache(
+            cache_name, request.cache_key, request.ttl_milliseconds if result == "stored" else None
+        )
+        if result == "stored":
+            return True
+        elif result == "not_stored":
+            return False
+        else:
+            raise UnknownException("SetIf responded with an unknown result")
+
     def get(self, cache_name: str, key: TScalarKey) -> CacheGetResponse:
+        if self._single_flight is None:
+            return self._get(cache_name, key)
+        return self._single_flight.do(("Get", cache_name, key), lambda: self._get(cache_name, key))
+
+    def _get(self, cache_name: str, key: TScalarKey) -> CacheGetResponse:
         try:
-            self._log_issuing_request("Get", {"key": str(key)})
+            self._log_issuing_request("Get", key=key)
 
             _validate_cache_name(cache_name)
             request = cache_pb._GetRequest(cache_key=_as_bytes(key, "Unsupported type for key: "))
+            if self._near_cache is not None:
+                cached = self._near_cache.get(cache_name, request.cache_key, CacheGet.Hit)
+                if cached is not None:
+                    return cached
 
-            response = self._build_stub().Get(
-                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
-            )
+            response = self._send_read("Get", request, cache_name)
 
-            self._log_received_response("Get", {"key": str(key)})
+            self._log_received_response("Get", key=key)
 
             if response.result == cache_pb.Hit:
-                return CacheGet.Hit(response.cache_body)
+                hit = CacheGet.Hit(self._decompress(response.cache_body))
+                if self._near_cache is not None:
+                    self._near_cache.put(cache_name, request.cache_key, hit, len(hit.value_bytes))
+                return hit
             elif response.result == cache_pb.Miss:
                 return CacheGet.Miss()
             else:
@@ -273,31 +700,351 @@ class _ScsDataClient:
             self._log_request_error("get", e)
             return CacheGet.Error(convert_error(e, Service.CACHE))
 
+    def get_batch(self, cache_name: TCacheName, keys: TScalarKeys) -> CacheGetBatchResponse:
+        try:
+            self._log_issuing_request("GetBatch")
+            _validate_cache_name(cache_name)
+            bytes_keys = list(_gen_scalar_keys_as_bytes(keys, "Unsupported type for keys: "))
+
+            results: list[CacheGetResponse] = []
+            for result in self._get_batch_results(cache_name, bytes_keys):
+                results.append(result)
+
+            self._log_received_response("GetBatch", num_keys=len(bytes_keys))
+            return CacheGetBatch.Success(results)
+        except Exception as e:
+            self._log_request_error("get_batch", e)
+            return CacheGetBatch.Error(convert_error(e, Service.CACHE))
+
+    def get_batch_stream(self, cache_name: TCacheName, keys: TScalarKeys) -> Iterator[CacheGetResponse]:
+        try:
+            bytes_keys = list(_gen_scalar_keys_as_bytes(keys, "Unsupported type for keys: "))
+        except Exception as e:
+            self._log_request_error("get_batch_stream", e)
+            yield CacheGet.Error(convert_error(e, Service.CACHE))
+            return
+
+        num_results = 0
+        try:
+            self._log_issuing_request("GetBatch")
+            _validate_cache_name(cache_name)
+            for result in self._get_batch_results(cache_name, bytes_keys):
+                num_results += 1
+                yield result
+            self._log_received_response("GetBatch", num_keys=len(bytes_keys))
+        except Exception as e:
+            self._log_request_error("get_batch_stream", e)
+            # The keys we have not yet answered for all share the failure of the stream.
+            error = CacheGet.Error(convert_error(e, Service.CACHE))
+            for _ in range(num_results, len(bytes_keys)):
+                yield error
+
+    def _get_batch_results(self, cache_name: TCacheName, bytes_keys: list[bytes]) -> Iterator[CacheGetResponse]:
+        """Issues a GetBatch request and yields a result per key as the responses stream in.
+
+        The server answers in request order, so the i-th response belongs to the i-th key.
+        Raises if the stream itself fails.
+        """
+        if len(bytes_keys) == 0:
+            return
+
+        request = cache_pb._GetBatchRequest(items=[cache_pb._GetRequest(cache_key=key) for key in bytes_keys])
+        call = self._build_stub().GetBatch(
+            request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+        )
+        try:
+            for response in call:
+                if response.result == cache_pb.Hit:
+                    try:
+                        yield CacheGet.Hit(self._decompress(response.cache_body))
+                    except SerializationException as e:
+                        yield CacheGet.Error(e)
+                elif response.result == cache_pb.Miss:
+                    yield CacheGet.Miss()
+                else:
+                    yield CacheGet.Error(
+                        UnknownException(f"GetBatch responded with an unknown result: {response.message}")
+                    )
+        finally:
+            # No-op once the stream is exhausted; stops the server sending if the caller stopped reading early.
+            call.cancel()
+
+    def get_large(
+        self, cache_name: TCacheName, key: TScalarKey, destination: Optional[TLargeValueDestination]
+    ) -> CacheGetLargeResponse:
+        try:
+            get_response = self.get(cache_name, key)
+            if isinstance(get_response, CacheGet.Miss):
+                return CacheGetLarge.Miss()
+            if isinstance(get_response, CacheGet.Error):
+                return CacheGetLarge.Error(get_response.inner_exception)
+            if not isinstance(get_response, CacheGet.Hit):
+                raise UnknownException(f"Unknown get response: {get_response}")
+
+            value = get_response.value_bytes
+            if not _LargeValueManifest.is_manifest(value):
+                value = unescape_stored_value(value)
+                writer = _LargeValueWriter(destination, len(value))
+                writer.write(value)
+                return CacheGetLarge.Hit(len(value), writer.value())
+
+            self._log_issuing_request("GetLarge", key=key)
+            manifest = _LargeValueManifest.decode(value)
+            writer = _LargeValueWriter(destination, manifest.size)
+            cache_key = _as_bytes(key, "Unsupported type for key: ")
+            for start in range(0, manifest.num_chunks, self._LARGE_VALUE_MAX_CONCURRENT_CHUNKS):
+                indices = range(start, min(start + self._LARGE_VALUE_MAX_CONCURRENT_CHUNKS, manifest.num_chunks))
+                responses = get_chunks(
+                    self._build_stub,
+                    cache_name,
+                    [manifest.chunk_key(cache_key, index) for index in indices],
+                    self._default_deadline_seconds,
+                )
+                for index, response in zip(indices, responses):
+                    if response.result != cache_pb.Hit:
+                        # A chunk expired or was evicted, so the value is gone.
+                        self._log_received_response("GetLarge", key=key, missing_chunk=index)
+                        return CacheGetLarge.Miss()
+                    chunk = self._decompress(response.cache_body)
+                    manifest.verify_chunk(index, chunk)
+                    writer.write(chunk)
+
+            self._log_received_response("GetLarge", key=key, size=manifest.size)
+            return CacheGetLarge.Hit(manifest.size, writer.value())
+        except Exception as e:
+            self._log_request_error("get_large", e)
+            return CacheGetLarge.Error(convert_error(e, Service.CACHE))
+
+    def delete_large(self, cache_name: TCacheName, key: TScalarKey) -> CacheDeleteResponse:
+        try:
+            self._log_issuing_request("DeleteLarge", key=key)
+            _validate_cache_name(cache_name)
+            cache_key = _as_bytes(key, "Unsupported type for key: ")
+            manifest = self._large_value_manifest(cache_name, cache_key)
+
+            # The manifest is deleted first, so readers never find it with some of its chunks gone.
+            self._build_stub().Delete(
+                cache_pb._DeleteRequest(cache_key=cache_key),
+                metadata=make_metadata(cache_name),
+                timeout=self._default_deadline_seconds,
+            )
+            self._invalidate_near_cache(cache_name, cache_key)
+            if manifest is not None:
+                self._delete_large_value_chunks(cache_name, cache_key, manifest)
+
+            self._log_received_response("DeleteLarge", key=key)
+            return CacheDelete.Success()
+        except Exception as e:
+            self._log_request_error("delete_large", e)
+            return CacheDelete.Error(convert_error(e, Service.CACHE))
+
     def delete(self, cache_name: str, key: TScalarKey) -> CacheDeleteResponse:
         try:
-            self._log_issuing_request("Delete", {"key": str(key)})
+            self._log_issuing_request("Delete", key=key)
             _validate_cache_name(cache_name)
             request = cache_pb._DeleteRequest(cache_key=_as_bytes(key, "Unsupported type for key: "))
 
             self._build_stub().Delete(
                 request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
             )
+            self._invalidate_near_cache(cache_name, request.cache_key)
 
-            self._log_received_response("Delete", {"key": str(key)})
+            self._log_received_response("Delete", key=key)
             return CacheDelete.Success()
         except Exception as e:
             self._log_request_error("delete", e)
             return CacheDelete.Error(convert_error(e, Service.CACHE))
 
+    def keys_exist(self, cache_name: TCacheName, keys: TScalarKeys) -> CacheKeysExistResponse:
+        try:
+            self._log_issuing_request("KeysExist")
+            _validate_cache_name(cache_name)
+            bytes_keys = list(_gen_scalar_keys_as_bytes(keys, "Unsupported type for keys: "))
+            if len(bytes_keys) == 0:
+                return CacheKeysExist.Success([])
+
+            request = cache_pb._KeysExistRequest(cache_keys=bytes_keys)
+            response = self._build_stub().KeysExist(
+                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+            )
+
+            self._log_received_response("KeysExist", num_keys=len(bytes_keys))
+            return CacheKeysExist.Success(list(response.exists))
+        except Exception as e:
+            self._log_request_error("keys_exist", e)
+            return CacheKeysExist.Error(convert_error(e, Service.CACHE))
+
+    def key_exists(self, cache_name: TCacheName, key: TScalarKey) -> CacheKeyExistsResponse:
+        try:
+            self._log_issuing_request("KeysExist", key=key)
+            _validate_cache_name(cache_name)
+            request = cache_pb._KeysExistRequest(cache_keys=[_as_bytes(key, "Unsupported type for key: ")])
+            response = self._build_stub().KeysExist(
+                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+            )
+
+            self._log_received_response("KeysExist", key=key)
+            return CacheKeyExists.Success(response.exists[0])
+        except Exception as e:
+            self._log_request_error("key_exists", e)
+            return CacheKeyExists.Error(convert_error(e, Service.CACHE))
+
+    def item_get_ttl(self, cache_name: TCacheName, key: TScalarKey) -> CacheItemGetTtlResponse:
+        try:
+            self._log_issuing_request("ItemGetTtl", key=key)
+            _validate_cache_name(cache_name)
+            request = cache_pb._ItemGetTtlRequest(cache_key=_as_bytes(key, "Unsupported type for key: "))
+            response = self._build_stub().ItemGetTtl(
+                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+            )
+
+            self._log_received_response("ItemGetTtl", key=key)
+            result = response.WhichOneof("result")
+            if result == "found":
+                return CacheItemGetTtl.Hit(timedelta(milliseconds=response.found.remaining_ttl_millis))
+            elif result == "missing":
+                return CacheItemGetTtl.Miss()
+            else:
+                raise UnknownException("ItemGetTtl responded with an unknown result")
+        except Exception as e:
+            self._log_request_error("item_get_ttl", e)
+            return CacheItemGetTtl.Error(convert_error(e, Service.CACHE))
+
+    def item_get_type(self, cache_name: TCacheName, key: TScalarKey) -> CacheItemGetTypeResponse:
+        try:
+            self._log_issuing_request("ItemGetType", key=key)
+            _validate_cache_name(cache_name)
+            request = cache_pb._ItemGetTypeRequest(cache_key=_as_bytes(key, "Unsupported type for key: "))
+            response = self._build_stub().ItemGetType(
+                request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+            )
+
+            self._log_received_response("ItemGetType", key=key)
+            result = response.WhichOneof("result")
+            if result == "found":
+                item_type = _ITEM_TYPES.get(response.found.item_type)
+                if item_type is None:
+                    raise UnknownException(
+                        f"ItemGetType responded with an unknown item type: {response.found.item_type}"
+                    )
+                return CacheItemGetType.Hit(item_type)
+            elif result == "missing":
+                return CacheItemGetType.Miss()
+            else:
+                raise UnknownException("ItemGetType responded with an unknown result")
+        except Exception as e:
+            self._log_request_error("item_get_type", e)
+            return CacheItemGetType.Error(convert_error(e, Service.CACHE))
+
+    def update_ttl(self, cache_name: TCacheName, key: TScalarKey, ttl: timedelta) -> CacheUpdateTtlResponse:
+        try:
+            self._log_issuing_request("UpdateTtl", key=key)
+            _validate_cache_name(cache_name)
+            _validate_timedelta_ttl(ttl, "TTL")
+            request = cache_pb._UpdateTtlRequest(
+                cache_key=_as_bytes(key, "Unsupported type for key: "),
+                overwrite_to_milliseconds=_timedelta_to_ms(ttl),
+            )
+
+            response = self._send_update_ttl(cache_name, request)
+            self._log_received_response("UpdateTtl", key=key)
+            result = response.WhichOneof("result")
+            if result == "set":
+                return CacheUpdateTtl.Set()
+            elif result == "missing":
+                return CacheUpdateTtl.Miss()
+            else:
+                raise UnknownException("UpdateTtl responded with an unknown result")
+        except Exception as e:
+            self._log_request_error("update_ttl", e)
+            return CacheUpdateTtl.Error(convert_error(e, Service.CACHE))
+
+    def increase_ttl(self, cache_name: TCacheName, key: TScalarKey, ttl: timedelta) -> CacheIncreaseTtlResponse:
+        try:
+            self._log_issuing_request("UpdateTtl", key=key)
+            _validate_cache_name(cache_name)
+            _validate_timedelta_ttl(ttl, "TTL")
+            request = cache_pb._UpdateTtlRequest(
+                cache_key=_as_bytes(key, "Unsupported type for key: "),
+                increase_to_milliseconds=_timedelta_to_ms(ttl),
+            )
+
+            response = self._send_update_ttl(cache_name, request)
+            self._log_received_response("UpdateTtl", key=key)
+            result = response.WhichOneof("result")
+            if result == "set":
+                return CacheIncreaseTtl.Set()
+            elif result == "not_set":
+                return CacheIncreaseTtl.NotSet()
+            elif result == "missing":
+                return CacheIncreaseTtl.Miss()
+            else:
+                raise UnknownException("UpdateTtl responded with an unknown result")
+        except Exception as e:
+            self._log_request_error("increase_ttl", e)
+            return CacheIncreaseTtl.Error(convert_error(e, Service.CACHE))
+
+    def decrease_ttl(self, cache_name: TCacheName, key: TScalarKey, ttl: timedelta) -> CacheDecreaseTtlResponse:
+        try:
+            self._log_issuing_request("UpdateTtl", key=key)
+            _validate_cache_name(cache_name)
+            _validate_timedelta_ttl(ttl, "TTL")
+            request = cache_pb._UpdateTtlRequest(
+                cache_key=_as_bytes(key, "Unsupported type for key: "),
+                decrease_to_milliseconds=_timedelta_to_ms(ttl),
+            )
+
+            response = self._send_update_ttl(cache_name, request)
+            self._log_received_response("UpdateTtl", key=key)
+            result = response.WhichOneof("result")
+            if result == "set":
+                return CacheDecreaseTtl.Set()
+            elif result == "not_set":
+                return CacheDecreaseTtl.NotSet()
+            elif result == "missing":
+                return CacheDecreaseTtl.Miss()
+            else:
+                raise UnknownException("UpdateTtl responded with an unknown result")
+        except Exception as e:
+            self._log_request_error("decrease_ttl", e)
+            return CacheDecreaseTtl.Error(convert_error(e, Service.CACHE))
+
+    def _send_update_ttl(
+        self, cache_name: TCacheName, request: cache_pb._UpdateTtlRequest
+    ) -> cache_pb._UpdateTtlResponse:
+        response: cache_pb._UpdateTtlResponse = self._build_stub().UpdateTtl(
+            request, metadata=make_metadata(cache_name), timeout=self._default_deadline_seconds
+        )
+        # A near cache entry must not outlive the item once its TTL may have been shortened.
+        ttl_milliseconds = None
+        if response.WhichOneof("result") == "set":
+            ttl_milliseconds = getattr(request, request.WhichOneof("update_ttl"))
+        self._invalidate_near_cache(cache_name, request.cache_key, ttl_milliseconds)
+        return response
+
     # DICTIONARY COLLECTION METHODS
     def dictionary_get_fields(
         self,
         cache_name: TCacheName,
         dictionary_name: TDictionaryName,
         fields: TDictionaryFields,
+    ) -> CacheDictionaryGetFieldsResponse:
+        if self._single_flight is None or not isinstance(fields, Iterable):
+            return self._dictionary_get_fields(cache_name, dictionary_name, fields)
+        fields = tuple(fields)
+        return self._single_flight.do(
+            ("DictionaryGetFields", cache_name, dictionary_name, fields),
+            lambda: self._dictionary_get_fields(cache_name, dictionary_name, fields),
+        )
+
+    def _dictionary_get_fields(
+        self,
+        cache_name: TCacheName,
+        dictionary_name: TDictionaryName,
+        fields: TDictionaryFields,
     ) -> CacheDictionaryGetFieldsResponse:
         try:
-            self._log_issuing_request("DictionaryGet", {"dictionary_name": dictionary_name})
+            self._log_issuing_request("DictionaryGet", dictionary_name=dictionary_name)
             _validate_cache_name(cache_name)
             _validate_dictionary_name(dictionary_name)
 
@@ -312,7 +1059,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("DictionaryGet", {"dictionary_name": dictionary_name})
+            self._log_received_response("DictionaryGet", dictionary_name=dictionary_name)
 
             type = response.WhichOneof("dictionary")
             if type == "found":
@@ -321,7 +1068,9 @@ class _ScsDataClient:
                     if get_response.result == cache_pb.Miss:
                         get_responses.append(CacheDictionaryGetField.Miss())
                     else:
-                        get_responses.append(CacheDictionaryGetField.Hit(get_response.cache_body, field))
+                        get_responses.append(
+                            CacheDictionaryGetField.Hit(self._decompress(get_response.cache_body), field)
+                        )
                 return CacheDictionaryGetFields.Hit(get_responses)
             elif type == "missing":
                 return CacheDictionaryGetFields.Miss()
@@ -335,24 +1084,32 @@ class _ScsDataClient:
         self, cache_name: TCacheName, dictionary_name: TDictionaryName
     ) -> CacheDictionaryFetchResponse:
         try:
-            self._log_issuing_request("DictionaryFetch", {"dictionary_name": dictionary_name})
+            self._log_issuing_request("DictionaryFetch", dictionary_name=dictionary_name)
             _validate_cache_name(cache_name)
             _validate_dictionary_name(dictionary_name)
             request = cache_pb._DictionaryFetchRequest(
                 dictionary_name=_as_bytes(dictionary_name, self.__UNSUPPORTED_DICTIONARY_NAME_TYPE_MSG)
             )
-            response = self._build_stub().DictionaryFetch(
-                request,
-                metadata=make_metadata(cache_name),
-                timeout=self._default_deadline_seconds,
-            )
-            self._log_received_response("DictionaryFetch", {"dictionary_name": dictionary_name})
+            if self._near_cache is not None:
+                cached = self._near_cache.get(cache_name, request.dictionary_name, CacheDictionaryFetch.Hit)
+                if cached is not None:
+                    return cached
+            response = self._send_read("DictionaryFetch", request, cache_name)
+            self._log_received_response("DictionaryFetch", dictionary_name=dictionary_name)
 
             type = response.WhichOneof("dictionary")
             if type == "missing":
                 return CacheDictionaryFetch.Miss()
             elif type == "found":
-                return CacheDictionaryFetch.Hit({item.field: item.value for item in response.found.items})
+                hit = CacheDictionaryFetch.Hit(
+                    {item.field: self._decompress(item.value) for item in response.found.items}
+                )
+                if self._near_cache is not None:
+                    size_bytes = sum(
+                        len(field) + len(value) for field, value in hit.value_dictionary_bytes_bytes.items()
+                    )
+                    self._near_cache.put(cache_name, request.dictionary_name, hit, size_bytes)
+                return hit
             else:
                 raise UnknownException("Unknown dictionary field")
         except Exception as e:
@@ -368,7 +1125,7 @@ class _ScsDataClient:
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
     ) -> CacheDictionaryIncrementResponse:
         try:
-            self._log_issuing_request("DictionaryIncrement", {"dictionary_name": dictionary_name})
+            self._log_issuing_request("DictionaryIncrement", dictionary_name=dictionary_name)
             _validate_cache_name(cache_name)
             _validate_dictionary_name(dictionary_name)
 
@@ -384,7 +1141,8 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("DictionaryIncrement", {"dictionary_name": dictionary_name})
+            self._invalidate_near_cache(cache_name, request.dictionary_name, _collection_ttl_milliseconds(request))
+            self._log_received_response("DictionaryIncrement", dictionary_name=dictionary_name)
             return CacheDictionaryIncrement.Success(response.value)
         except Exception as e:
             self._log_request_error("dictionary_increment", e)
@@ -397,7 +1155,7 @@ class _ScsDataClient:
         fields: TDictionaryFields,
     ) -> CacheDictionaryRemoveFieldsResponse:
         try:
-            self._log_issuing_request("DictionaryDelete", {"dictionary_name": dictionary_name})
+            self._log_issuing_request("DictionaryDelete", dictionary_name=dictionary_name)
             _validate_cache_name(cache_name)
             _validate_dictionary_name(dictionary_name)
 
@@ -413,7 +1171,8 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("DictionaryDelete", {"dictionary_name": dictionary_name})
+            self._invalidate_near_cache(cache_name, request.dictionary_name)
+            self._log_received_response("DictionaryDelete", dictionary_name=dictionary_name)
             return CacheDictionaryRemoveFields.Success()
         except Exception as e:
             self._log_request_error("dictionary_remove_fields", e)
@@ -427,14 +1186,14 @@ class _ScsDataClient:
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
     ) -> CacheDictionarySetFieldsResponse:
         try:
-            self._log_issuing_request("DictionarySet", {"dictionary_name": dictionary_name})
+            self._log_issuing_request("DictionarySet", dictionary_name=dictionary_name)
             _validate_cache_name(cache_name)
             _validate_dictionary_name(dictionary_name)
 
             request = cache_pb._DictionarySetRequest(
                 dictionary_name=_as_bytes(dictionary_name, self.__UNSUPPORTED_DICTIONARY_NAME_TYPE_MSG),
                 items=[
-                    cache_pb._DictionaryFieldValuePair(field=field, value=value)
+                    cache_pb._DictionaryFieldValuePair(field=field, value=self._compress(value))
                     for field, value in _gen_dictionary_items_as_bytes(
                         items, self.__UNSUPPORTED_DICTIONARY_ITEMS_TYPE_MSG
                     )
@@ -447,7 +1206,8 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("DictionarySet", {"dictionary_name": dictionary_name})
+            self._invalidate_near_cache(cache_name, request.dictionary_name, _collection_ttl_milliseconds(request))
+            self._log_received_response("DictionarySet", dictionary_name=dictionary_name)
             return CacheDictionarySetFields.Success()
         except Exception as e:
             self._log_request_error("dictionary_set_fields", e)
@@ -458,18 +1218,18 @@ class _ScsDataClient:
         self,
         cache_name: TCacheName,
         list_name: TListName,
-        values: TListValuesInput,
+        values: Iterable[TBytesLike],
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
         truncate_front_to_size: Optional[int] = None,
     ) -> CacheListConcatenateBackResponse:
         try:
-            self._log_issuing_request("ListConcatenateBack", {})
+            self._log_issuing_request("ListConcatenateBack")
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
 
             request = cache_pb._ListConcatenateBackRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG),
-                values=_gen_list_as_bytes(values, self.__UNSUPPORTED_LIST_VALUES_TYPE_MSG),
+                values=self._compress_all(_gen_list_as_bytes(values, self.__UNSUPPORTED_LIST_VALUES_TYPE_MSG)),
                 truncate_front_to_size=truncate_front_to_size,
                 **self._prepare_collection_ttl_for_request(ttl),
             )
@@ -479,7 +1239,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListConcatenateBack", {"list_name": str(request.list_name)})
+            self._log_received_response("ListConcatenateBack", list_name=request.list_name)
             return CacheListConcatenateBack.Success(response.list_length)
         except Exception as e:
             self._log_request_error("list_concatenate_back", e)
@@ -489,18 +1249,18 @@ class _ScsDataClient:
         self,
         cache_name: TCacheName,
         list_name: TListName,
-        values: TListValuesInput,
+        values: Iterable[TBytesLike],
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
         truncate_back_to_size: Optional[int] = None,
     ) -> CacheListConcatenateFrontResponse:
         try:
-            self._log_issuing_request("ListConcatenateFront", {})
+            self._log_issuing_request("ListConcatenateFront")
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
 
             request = cache_pb._ListConcatenateFrontRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG),
-                values=_gen_list_as_bytes(values, self.__UNSUPPORTED_LIST_VALUES_TYPE_MSG),
+                values=self._compress_all(_gen_list_as_bytes(values, self.__UNSUPPORTED_LIST_VALUES_TYPE_MSG)),
                 truncate_back_to_size=truncate_back_to_size,
                 **self._prepare_collection_ttl_for_request(ttl),
             )
@@ -510,30 +1270,51 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListConcatenateFront", {"list_name": str(request.list_name)})
+            self._log_received_response("ListConcatenateFront", list_name=request.list_name)
             return CacheListConcatenateFront.Success(response.list_length)
         except Exception as e:
             self._log_request_error("list_concatenate_front", e)
             return CacheListConcatenateFront.Error(convert_error(e, Service.CACHE))
 
-    def list_fetch(self, cache_name: TCacheName, list_name: TListName) -> CacheListFetchResponse:
+    def list_fetch(
+        self,
+        cache_name: TCacheName,
+        list_name: TListName,
+        start_index: Optional[int] = None,
+        end_index: Optional[int] = None,
+    ) -> CacheListFetchResponse:
+        if self._single_flight is None:
+            return self._list_fetch(cache_name, list_name, start_index, end_index)
+        return self._single_flight.do(
+            ("ListFetch", cache_name, list_name, start_index, end_index),
+            lambda: self._list_fetch(cache_name, list_name, start_index, end_index),
+        )
+
+    def _list_fetch(
+        self,
+        cache_name: TCacheName,
+        list_name: TListName,
+        start_index: Optional[int],
+        end_index: Optional[int],
+    ) -> CacheListFetchResponse:
         try:
-            self._log_issuing_request("ListFetch", {"list_name": str(list_name)})
+            self._log_issuing_request("ListFetch", list_name=list_name)
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
             request = cache_pb._ListFetchRequest(list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG))
+            _set_list_range(request, start_index, end_index)
             response = self._build_stub().ListFetch(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListFetch", {"list_name": str(request.list_name)})
+            self._log_received_response("ListFetch", list_name=request.list_name)
 
             type = response.WhichOneof("list")
             if type == "missing":
                 return CacheListFetch.Miss()
             elif type == "found":
-                return CacheListFetch.Hit(list(response.found.values))
+                return CacheListFetch.Hit([self._decompress(value) for value in response.found.values])
             else:
                 raise UnknownException("Unknown list field")
         except Exception as e:
@@ -542,7 +1323,7 @@ class _ScsDataClient:
 
     def list_length(self, cache_name: TCacheName, list_name: TListName) -> CacheListLengthResponse:
         try:
-            self._log_issuing_request("ListLength", {"list_name": str(list_name)})
+            self._log_issuing_request("ListLength", list_name=list_name)
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
             request = cache_pb._ListLengthRequest(list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG))
@@ -551,7 +1332,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListLength", {"list_name": str(request.list_name)})
+            self._log_received_response("ListLength", list_name=request.list_name)
 
             type = response.WhichOneof("list")
             if type == "missing":
@@ -564,9 +1345,44 @@ class _ScsDataClient:
             self._log_request_error("list_length", e)
             return CacheListLength.Error(convert_error(e, Service.CACHE))
 
+    def list_retain(
+        self,
+        cache_name: TCacheName,
+        list_name: TListName,
+        start_index: Optional[int] = None,
+        end_index: Optional[int] = None,
+        ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
+    ) -> CacheListRetainResponse:
+        try:
+            self._log_issuing_request("ListRetain", list_name=list_name)
+            _validate_cache_name(cache_name)
+            _validate_list_name(list_name)
+            request = cache_pb._ListRetainRequest(
+                list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG),
+                **self._prepare_collection_ttl_for_request(ttl),
+            )
+            _set_list_range(request, start_index, end_index)
+            response = self._build_stub().ListRetain(
+                request,
+                metadata=make_metadata(cache_name),
+                timeout=self._default_deadline_seconds,
+            )
+            self._log_received_response("ListRetain", list_name=request.list_name)
+
+            type = response.WhichOneof("list")
+            if type == "missing":
+                return CacheListRetain.Miss()
+            elif type == "found":
+                return CacheListRetain.Success(response.found.list_length)
+            else:
+                raise UnknownException("Unknown list field")
+        except Exception as e:
+            self._log_request_error("list_retain", e)
+            return CacheListRetain.Error(convert_error(e, Service.CACHE))
+
     def list_pop_back(self, cache_name: TCacheName, list_name: TListName) -> CacheListPopBackResponse:
         try:
-            self._log_issuing_request("ListPopBack", {"list_name": str(list_name)})
+            self._log_issuing_request("ListPopBack", list_name=list_name)
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
             request = cache_pb._ListPopBackRequest(
@@ -577,13 +1393,13 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListPopBack", {"list_name": str(request.list_name)})
+            self._log_received_response("ListPopBack", list_name=request.list_name)
 
             type = response.WhichOneof("list")
             if type == "missing":
                 return CacheListPopBack.Miss()
             elif type == "found":
-                return CacheListPopBack.Hit(response.found.back)
+                return CacheListPopBack.Hit(self._decompress(response.found.back))
             else:
                 raise UnknownException("Unknown list field")
         except Exception as e:
@@ -592,7 +1408,7 @@ class _ScsDataClient:
 
     def list_pop_front(self, cache_name: TCacheName, list_name: TListName) -> CacheListPopFrontResponse:
         try:
-            self._log_issuing_request("ListPopFront", {"list_name": str(list_name)})
+            self._log_issuing_request("ListPopFront", list_name=list_name)
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
             request = cache_pb._ListPopFrontRequest(
@@ -603,13 +1419,13 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListPopFront", {"list_name": str(request.list_name)})
+            self._log_received_response("ListPopFront", list_name=request.list_name)
 
             type = response.WhichOneof("list")
             if type == "missing":
                 return CacheListPopFront.Miss()
             elif type == "found":
-                return CacheListPopFront.Hit(response.found.front)
+                return CacheListPopFront.Hit(self._decompress(response.found.front))
             else:
                 raise UnknownException("Unknown list field")
         except Exception as e:
@@ -620,18 +1436,18 @@ class _ScsDataClient:
         self,
         cache_name: TCacheName,
         list_name: TListName,
-        value: TListValue,
+        value: TBytesLike,
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
         truncate_front_to_size: Optional[int] = None,
     ) -> CacheListPushBackResponse:
         try:
-            self._log_issuing_request("ListPushBack", {})
+            self._log_issuing_request("ListPushBack")
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
 
             request = cache_pb._ListPushBackRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG),
-                value=_as_bytes(value, self.__UNSUPPORTED_LIST_VALUE_TYPE_MSG),
+                value=self._value_as_bytes(value, self.__UNSUPPORTED_LIST_VALUE_TYPE_MSG),
                 truncate_front_to_size=truncate_front_to_size,
                 **self._prepare_collection_ttl_for_request(ttl),
             )
@@ -641,7 +1457,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListPushBack", {"list_name": str(request.list_name)})
+            self._log_received_response("ListPushBack", list_name=request.list_name)
             return CacheListPushBack.Success(response.list_length)
         except Exception as e:
             self._log_request_error("list_push_back", e)
@@ -651,18 +1467,18 @@ class _ScsDataClient:
         self,
         cache_name: TCacheName,
         list_name: TListName,
-        value: TListValue,
+        value: TBytesLike,
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
         truncate_back_to_size: Optional[int] = None,
     ) -> CacheListPushFrontResponse:
         try:
-            self._log_issuing_request("ListPushFront", {})
+            self._log_issuing_request("ListPushFront")
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
 
             request = cache_pb._ListPushFrontRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG),
-                value=_as_bytes(value, self.__UNSUPPORTED_LIST_VALUE_TYPE_MSG),
+                value=self._value_as_bytes(value, self.__UNSUPPORTED_LIST_VALUE_TYPE_MSG),
                 truncate_back_to_size=truncate_back_to_size,
                 **self._prepare_collection_ttl_for_request(ttl),
             )
@@ -672,7 +1488,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListPushFront", {"list_name": str(request.list_name)})
+            self._log_received_response("ListPushFront", list_name=request.list_name)
             return CacheListPushFront.Success(response.list_length)
         except Exception as e:
             self._log_request_error("list_push_front", e)
@@ -682,16 +1498,16 @@ class _ScsDataClient:
         self,
         cache_name: TCacheName,
         list_name: TListName,
-        value: TListValue,
+        value: TBytesLike,
     ) -> CacheListRemoveValueResponse:
         try:
-            self._log_issuing_request("ListRemoveValue", {})
+            self._log_issuing_request("ListRemoveValue")
             _validate_cache_name(cache_name)
             _validate_list_name(list_name)
 
             request = cache_pb._ListRemoveRequest(
                 list_name=_as_bytes(list_name, self.__UNSUPPORTED_LIST_NAME_TYPE_MSG),
-                all_elements_with_value=_as_bytes(value, self.__UNSUPPORTED_LIST_VALUE_TYPE_MSG),
+                all_elements_with_value=self._value_as_bytes(value, self.__UNSUPPORTED_LIST_VALUE_TYPE_MSG),
             )
 
             self._build_stub().ListRemove(
@@ -699,7 +1515,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("ListRemoveValue", {"list_name": str(request.list_name)})
+            self._log_received_response("ListRemoveValue", list_name=request.list_name)
             return CacheListRemoveValue.Success()
         except Exception as e:
             self._log_request_error("list_remove_value", e)
@@ -710,11 +1526,11 @@ class _ScsDataClient:
         self,
         cache_name: TCacheName,
         set_name: TSetName,
-        elements: TSetElementsInput,
+        elements: Iterable[TBytesLike],
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
     ) -> CacheSetAddElementsResponse:
         try:
-            self._log_issuing_request("SetAddElements", {})
+            self._log_issuing_request("SetAddElements")
             _validate_cache_name(cache_name)
             _validate_set_name(set_name)
 
@@ -729,7 +1545,8 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SetAddElements", {"set_name": str(request.set_name)})
+            self._invalidate_near_cache(cache_name, request.set_name, _collection_ttl_milliseconds(request))
+            self._log_received_response("SetAddElements", set_name=request.set_name)
             return CacheSetAddElements.Success()
         except Exception as e:
             self._log_request_error("set_add_elements", e)
@@ -741,23 +1558,31 @@ class _ScsDataClient:
         set_name: TSetName,
     ) -> CacheSetFetchResponse:
         try:
-            self._log_issuing_request("SetFetch", {"set_name": str(set_name)})
+            self._log_issuing_request("SetFetch", set_name=set_name)
             _validate_cache_name(cache_name)
             _validate_set_name(set_name)
 
             request = cache_pb._SetFetchRequest(set_name=_as_bytes(set_name, "Unsupported type for set_name: "))
+            if self._near_cache is not None:
+                cached = self._near_cache.get(cache_name, request.set_name, CacheSetFetch.Hit)
+                if cached is not None:
+                    return cached
             response = self._build_stub().SetFetch(
                 request,
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SetFetch", {"set_name": str(request.set_name)})
+            self._log_received_response("SetFetch", set_name=request.set_name)
 
             type = response.WhichOneof("set")
             if type == "missing":
                 return CacheSetFetch.Miss()
             elif type == "found":
-                return CacheSetFetch.Hit(set(response.found.elements))
+                hit = CacheSetFetch.Hit(set(response.found.elements))
+                if self._near_cache is not None:
+                    size_bytes = sum(len(element) for element in hit.value_set_bytes)
+                    self._near_cache.put(cache_name, request.set_name, hit, size_bytes)
+                return hit
             else:
                 raise UnknownException(f"Unknown set field in response: {type}")
         except Exception as e:
@@ -768,7 +1593,7 @@ class _ScsDataClient:
         self, cache_name: TCacheName, set_name: TSetName, elements: TSetElementsInput
     ) -> CacheSetRemoveElementsResponse:
         try:
-            self._log_issuing_request("SetRemoveElements", {})
+            self._log_issuing_request("SetRemoveElements")
             _validate_cache_name(cache_name)
             _validate_set_name(set_name)
 
@@ -786,7 +1611,8 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SetRemoveElements", {"set_name": str(request.set_name)})
+            self._invalidate_near_cache(cache_name, request.set_name)
+            self._log_received_response("SetRemoveElements", set_name=request.set_name)
             return CacheSetRemoveElements.Success()
         except Exception as e:
             self._log_request_error("set_remove_elements", e)
@@ -800,7 +1626,7 @@ class _ScsDataClient:
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
     ) -> CacheSortedSetPutElementsResponse:
         try:
-            self._log_issuing_request("SortedSetPutElements", {})
+            self._log_issuing_request("SortedSetPutElements")
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
@@ -819,7 +1645,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetPutElements", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetPutElements", sorted_set_name=request.set_name)
             return CacheSortedSetPutElements.Success()
         except Exception as e:
             self._log_request_error("sorted_set_put_elements", e)
@@ -834,9 +1660,30 @@ class _ScsDataClient:
         sort_order: SortOrder,
         offset: Optional[int],
         count: Optional[int],
+    ) -> CacheSortedSetFetchResponse:
+        if self._single_flight is None:
+            return self._sorted_set_fetch_by_score(
+                cache_name, sorted_set_name, min_score, max_score, sort_order, offset, count
+            )
+        return self._single_flight.do(
+            ("SortedSetFetchByScore", cache_name, sorted_set_name, min_score, max_score, sort_order, offset, count),
+            lambda: self._sorted_set_fetch_by_score(
+                cache_name, sorted_set_name, min_score, max_score, sort_order, offset, count
+            ),
+        )
+
+    def _sorted_set_fetch_by_score(
+        self,
+        cache_name: TCacheName,
+        sorted_set_name: TSortedSetName,
+        min_score: Optional[float],
+        max_score: Optional[float],
+        sort_order: SortOrder,
+        offset: Optional[int],
+        count: Optional[int],
     ) -> CacheSortedSetFetchResponse:
         try:
-            self._log_issuing_request("SortedSetFetch", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetFetch", sorted_set_name=sorted_set_name)
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
@@ -869,12 +1716,8 @@ class _ScsDataClient:
             else:
                 request.order = cache_pb._SortedSetFetchRequest.DESCENDING
 
-            response = self._build_stub().SortedSetFetch(
-                request,
-                metadata=make_metadata(cache_name),
-                timeout=self._default_deadline_seconds,
-            )
-            self._log_received_response("SortedSetFetch", {"sorted_set_name": str(request.set_name)})
+            response = self._send_read("SortedSetFetch", request, cache_name)
+            self._log_received_response("SortedSetFetch", sorted_set_name=request.set_name)
 
             type = response.WhichOneof("sorted_set")
             if type == "missing":
@@ -894,9 +1737,24 @@ class _ScsDataClient:
         start_rank: Optional[int],
         end_rank: Optional[int],
         sort_order: SortOrder,
+    ) -> CacheSortedSetFetchResponse:
+        if self._single_flight is None:
+            return self._sorted_set_fetch_by_rank(cache_name, sorted_set_name, start_rank, end_rank, sort_order)
+        return self._single_flight.do(
+            ("SortedSetFetchByRank", cache_name, sorted_set_name, start_rank, end_rank, sort_order),
+            lambda: self._sorted_set_fetch_by_rank(cache_name, sorted_set_name, start_rank, end_rank, sort_order),
+        )
+
+    def _sorted_set_fetch_by_rank(
+        self,
+        cache_name: TCacheName,
+        sorted_set_name: TSortedSetName,
+        start_rank: Optional[int],
+        end_rank: Optional[int],
+        sort_order: SortOrder,
     ) -> CacheSortedSetFetchResponse:
         try:
-            self._log_issuing_request("SortedSetFetch", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetFetch", sorted_set_name=sorted_set_name)
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
@@ -919,12 +1777,8 @@ class _ScsDataClient:
             else:
                 request.order = cache_pb._SortedSetFetchRequest.DESCENDING
 
-            response = self._build_stub().SortedSetFetch(
-                request,
-                metadata=make_metadata(cache_name),
-                timeout=self._default_deadline_seconds,
-            )
-            self._log_received_response("SortedSetFetch", {"sorted_set_name": str(request.set_name)})
+            response = self._send_read("SortedSetFetch", request, cache_name)
+            self._log_received_response("SortedSetFetch", sorted_set_name=request.set_name)
 
             type = response.WhichOneof("sorted_set")
             if type == "missing":
@@ -941,7 +1795,7 @@ class _ScsDataClient:
         self, cache_name: TCacheName, sorted_set_name: TSortedSetName, values: TSortedSetValues
     ) -> CacheSortedSetGetScoresResponse:
         try:
-            self._log_issuing_request("SortedSetGetScores", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetGetScores", sorted_set_name=sorted_set_name)
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
@@ -955,7 +1809,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetGetScores", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetGetScores", sorted_set_name=request.set_name)
 
             type = response.WhichOneof("sorted_set")
             if type == "found":
@@ -982,7 +1836,7 @@ class _ScsDataClient:
         sort_order: SortOrder,
     ) -> CacheSortedSetGetRankResponse:
         try:
-            self._log_issuing_request("SortedSetGetRank", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetGetRank", sorted_set_name=sorted_set_name)
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
@@ -1001,7 +1855,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetGetRank", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetGetRank", sorted_set_name=request.set_name)
 
             if response.element_rank.result == cache_pb.Hit:
                 return CacheSortedSetGetRank.Hit(response.element_rank.rank)
@@ -1020,7 +1874,7 @@ class _ScsDataClient:
         values: TSortedSetValues,
     ) -> CacheSortedSetRemoveElementsResponse:
         try:
-            self._log_issuing_request("SortedSetRemoveElements", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetRemoveElements", sorted_set_name=sorted_set_name)
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
 
@@ -1036,7 +1890,7 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetRemoveElements", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetRemoveElements", sorted_set_name=request.set_name)
 
             return CacheSortedSetRemoveElements.Success()
         except Exception as e:
@@ -1052,7 +1906,7 @@ class _ScsDataClient:
         ttl: CollectionTtl = CollectionTtl.from_cache_ttl(),
     ) -> CacheSortedSetIncrementScoreResponse:
         try:
-            self._log_issuing_request("SortedSetIncrement", {"sorted_set_name": str(sorted_set_name)})
+            self._log_issuing_request("SortedSetIncrement", sorted_set_name=sorted_set_name)
             _validate_cache_name(cache_name)
             _validate_sorted_set_name(sorted_set_name)
             _validate_sorted_set_score(score)
@@ -1069,21 +1923,26 @@ class _ScsDataClient:
                 metadata=make_metadata(cache_name),
                 timeout=self._default_deadline_seconds,
             )
-            self._log_received_response("SortedSetIncrement", {"sorted_set_name": str(request.set_name)})
+            self._log_received_response("SortedSetIncrement", sorted_set_name=request.set_name)
 
             return CacheSortedSetIncrementScore.Success(response.score)
         except Exception as e:
             self._log_request_error("sorted_set_increment_score", e)
             return CacheSortedSetIncrementScore.Error(convert_error(e, Service.CACHE))
 
-    def _log_received_response(self, request_type: str, request_args: dict[str, str]) -> None:
-        self._logger.log(logs.TRACE, f"Received a {request_type} response for {request_args}")
+    # The request logging below runs on every call, so it must cost next to nothing when TRACE is off.
+    # `isEnabledFor` answers from the logger's level cache, which the logging module clears whenever
+    # a level changes, and the message is only formatted when a record is actually emitted.
+    def _log_received_response(self, request_type: str, **request_args: object) -> None:
+        if self._logger.isEnabledFor(logs.TRACE):
+            self._logger.log(logs.TRACE, "Received a %s response for %s", request_type, request_args)
 
-    def _log_issuing_request(self, request_type: str, request_args: dict[str, str]) -> None:
-        self._logger.log(logs.TRACE, f"Issuing a {request_type} request with {request_args}")
+    def _log_issuing_request(self, request_type: str, **request_args: object) -> None:
+        if self._logger.isEnabledFor(logs.TRACE):
+            self._logger.log(logs.TRACE, "Issuing a %s request with %s", request_type, request_args)
 
     def _log_request_error(self, request_type: str, e: Exception) -> None:
-        self._logger.warning(f"{request_type} failed with exception: {e}")
+        self._logger.warning("%s failed with exception: %s", request_type, e)
 
     def _prepare_collection_ttl_for_request(self, collection_ttl: CollectionTtl) -> dict[str, Any]:  # type: ignore
         """Converts a CollectionTtl object into a dictionary that can be used as kwargs for a request.
@@ -1109,8 +1968,66 @@ class _ScsDataClient:
 
         return _timedelta_to_ms(which_ttl)
 
+    def _value_as_bytes(self, value: TBytesLike, error_message: str) -> bytes:
+        if self._compressor is None:
+            return _as_bytes(value, error_message)
+        # The compressor reads buffers such as bytearray directly, so they are only copied if sent as is.
+        return self._compressor.compress(_as_buffer(value, error_message))
+
+    def _compress(self, value: bytes) -> bytes:
+        return self._compressor.compress(value) if self._compressor is not None else value
+
+    def _compress_all(self, values: Iterable[bytes]) -> Iterable[bytes]:
+        if self._compressor is None:
+            return values
+        return [self._compressor.compress(value) for value in values]
+
+    def _decompress(self, value: bytes) -> bytes:
+        return self._compressor.decompress(value) if self._compressor is not None else value
+
+    def _invalidate_near_cache(
+        self, cache_name: TCacheName, key: bytes, ttl_milliseconds: Optional[int] = None
+    ) -> None:
+        """Drops the near cache entry for a key this client wrote, along with the TTL of the write if known."""
+        if self._near_cache is not None:
+            ttl = timedelta(milliseconds=ttl_milliseconds) if ttl_milliseconds is not None else None
+            self._near_cache.invalidate(cache_name, key, ttl)
+
+    def _large_value_manifest(self, cache_name: TCacheName, cache_key: bytes) -> Optional[_LargeValueManifest]:
+        """Returns the manifest stored under a key by `set_large`, or None if the key holds no manifest."""
+        response = self._build_stub().Get(
+            cache_pb._GetRequest(cache_key=cache_key),
+            metadata=make_metadata(cache_name),
+            timeout=self._default_deadline_seconds,
+        )
+        if response.result != cache_pb.Hit or not _LargeValueManifest.is_manifest(response.cache_body):
+            return None
+        try:
+            return _LargeValueManifest.decode(response.cache_body)
+        except SerializationException:
+            return None
+
+    def _delete_large_value_chunks(
+        self, cache_name: TCacheName, cache_key: bytes, manifest: _LargeValueManifest
+    ) -> None:
+        for start in range(0, manifest.num_chunks, self._LARGE_VALUE_MAX_CONCURRENT_CHUNKS):
+            indices = range(start, min(start + self._LARGE_VALUE_MAX_CONCURRENT_CHUNKS, manifest.num_chunks))
+            delete_chunks(
+                self._build_stub,
+                cache_name,
+                [manifest.chunk_key(cache_key, index) for index in indices],
+                self._default_deadline_seconds,
+            )
+
     def _build_stub(self) -> cache_grpc.ScsStub:
         return self._grpc_manager.stub()
 
+    def _send_read(self, rpc_name: str, request: Message, cache_name: TCacheName) -> Message:
+        """Sends an idempotent read, hedged if the configuration has a hedging policy."""
+        metadata = make_metadata(cache_name)
+        if self._hedger is not None:
+            return self._hedger.call(rpc_name, request, metadata, self._default_deadline_seconds)
+        return getattr(self._build_stub(), rpc_name)(request, metadata=metadata, timeout=self._default_deadline_seconds)
+
     def close(self) -> None:
         self._grpc_manager.close()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import time
 import uuid
-from threading import Event
-from typing import List, Optional
+from threading import Event, Lock
+from typing import Callable, List, Optional
 
 import grpc
 from momento_wire_types import cacheclient_pb2_grpc as cache_client
@@ -17,22 +18,28 @@ from momento.config.auth_configuration import AuthConfiguration
 from momento.config.middleware import MiddlewareRequestHandlerContext
 from momento.config.middleware.models import CONNECTION_ID_KEY
 from momento.config.middleware.synchronous import Middleware
+from momento.config.transport.transport_strategy import AdaptiveTransportStrategy
 from momento.errors.exceptions import ClientResourceExhaustedException, ConnectionException
 from momento.internal._utilities import PYTHON_RUNTIME_VERSION, ClientType
+from momento.internal._utilities._adaptive_deadlines import _AdaptiveDeadlines
 from momento.internal._utilities._channel_credentials import (
     channel_credentials_from_root_certs_or_default,
 )
+from momento.internal._utilities._circuit_breaker import _CircuitBreaker
 from momento.internal._utilities._grpc_channel_options import (
     grpc_control_channel_options_from_grpc_config,
     grpc_data_channel_options_from_grpc_config,
     grpc_topic_channel_options_from_grpc_config,
 )
+from momento.internal._utilities._retry_token_bucket import _RetryTokenBucket
 from momento.internal.services import Service
 from momento.internal.synchronous._add_header_client_interceptor import (
     AddHeaderClientInterceptor,
     AddHeaderStreamingClientInterceptor,
     Header,
 )
+from momento.internal.synchronous._circuit_breaker_interceptor import CircuitBreakerInterceptor
+from momento.internal.synchronous._in_flight_count_interceptor import InFlightCountInterceptor
 from momento.internal.synchronous._middleware_interceptor import MiddlewareInterceptor
 from momento.internal.synchronous._retry_interceptor import RetryInterceptor
 from momento.retry import RetryStrategy
@@ -64,6 +71,7 @@ class _ControlGrpcManager:
                 ClientType.CACHE,
                 configuration.get_sync_middlewares(),
                 configuration.get_retry_strategy(),
+                _retry_token_bucket(configuration),
             ),
         )
         self._stub = control_client.ScsControlStub(intercept_channel)  # type: ignore[no-untyped-call]
@@ -76,36 +84,65 @@ class _ControlGrpcManager:
 
 
 class _DataGrpcManager:
-    """Internal gRPC data manager."""
+    """Internal gRPC data manager.
+
+    Holds the configured number of data channels and sends each request on the channel
+    with the fewest requests in flight, skipping channels whose circuit breaker is open.
+    """
 
     def __init__(self, configuration: Configuration, credential_provider: CredentialProvider):
         self._logger = logs.logger
+        num_channels = configuration.get_transport_strategy().get_grpc_configuration().get_num_channels()
+        self._channels: list[grpc.Channel] = []
+        self._in_flight_counters: list[InFlightCountInterceptor] = []
+        self._stubs: list[cache_client.ScsStub] = []
+        self._circuit_breakers: list[Optional[_CircuitBreaker]] = []
+        # One bucket for all channels, so the retry budget applies to the client as a whole.
+        retry_token_bucket = _retry_token_bucket(configuration)
+        # One set of latencies for all channels, since they all reach the same server.
+        adaptive_deadlines = _adaptive_deadlines(configuration)
+        for channel_index in range(num_channels):
+            channel = self._create_channel(configuration, credential_provider)
+            in_flight_counter = InFlightCountInterceptor()
+            circuit_breaker = _circuit_breaker(configuration, channel_index)
+            intercept_channel = grpc.intercept_channel(
+                channel,
+                in_flight_counter,
+                *_interceptors(
+                    credential_provider.auth_token,
+                    ClientType.CACHE,
+                    configuration.get_sync_middlewares(),
+                    configuration.get_retry_strategy(),
+                    retry_token_bucket,
+                    circuit_breaker,
+                    adaptive_deadlines,
+                ),
+                *_stream_interceptors(credential_provider.auth_token, ClientType.CACHE),
+            )
+            self._channels.append(channel)
+            self._in_flight_counters.append(in_flight_counter)
+            self._circuit_breakers.append(circuit_breaker)
+            self._stubs.append(cache_client.ScsStub(intercept_channel))  # type: ignore[no-untyped-call]
+        # Where the search for the least loaded channel starts, so ties are spread across the channels.
+        self._next_channel_index = 0
+        self._next_channel_index_lock = Lock()
+
+    @staticmethod
+    def _create_channel(configuration: Configuration, credential_provider: CredentialProvider) -> grpc.Channel:
         if credential_provider.port == 443:
-            self._channel = grpc.secure_channel(
+            return grpc.secure_channel(
                 target=credential_provider.cache_endpoint,
                 credentials=channel_credentials_from_root_certs_or_default(configuration),
                 options=grpc_data_channel_options_from_grpc_config(
                     configuration.get_transport_strategy().get_grpc_configuration()
                 ),
             )
-        else:
-            self._channel = grpc.insecure_channel(
-                target=f"{credential_provider.cache_endpoint}:{credential_provider.port}",
-                options=grpc_data_channel_options_from_grpc_config(
-                    configuration.get_transport_strategy().get_grpc_configuration()
-                ),
-            )
-
-        intercept_channel = grpc.intercept_channel(
-            self._channel,
-            *_interceptors(
-                credential_provider.auth_token,
-                ClientType.CACHE,
-                configuration.get_sync_middlewares(),
-                configuration.get_retry_strategy(),
+        return grpc.insecure_channel(
+            target=f"{credential_provider.cache_endpoint}:{credential_provider.port}",
+            options=grpc_data_channel_options_from_grpc_config(
+                configuration.get_transport_strategy().get_grpc_configuration()
             ),
         )
-        self._stub = cache_client.ScsStub(intercept_channel)  # type: ignore[no-untyped-call]
 
     """
         This method tries to eagerly connect to Momento's server until
@@ -116,25 +153,34 @@ class _DataGrpcManager:
         self._logger.debug(
             "Attempting to create an eager connection with Momento's server within " f"{timeout_seconds} seconds"
         )
-
+        # Subscribing asks a channel to connect without waiting for it, so all channels connect
+        # concurrently and share the one timeout.
+        subscriptions = [(channel, *self._subscribe_to_connection(channel)) for channel in self._channels]
+        deadline = time.monotonic() + timeout_seconds
+        for _, connection_event, _ in subscriptions:
+            if not connection_event.wait(max(deadline - time.monotonic(), 0.0)):
+                self._logger.debug(
+                    "We could not establish an eager connection within %d seconds",
+                    timeout_seconds,
+                )
+                # the subscriptions are no longer needed; they were only meant to watch if we could connect eagerly
+                for channel, _, on_state_change in subscriptions:
+                    channel.unsubscribe(on_state_change)
+                self.close()
+                raise ConnectionException(
+                    message="Failed to connect to Momento's server within given eager connection timeout",
+                    service=Service.CACHE,
+                )
+
+    def _subscribe_to_connection(
+        self, channel: grpc.Channel
+    ) -> tuple[Event, Callable[[grpc.ChannelConnectivity], None]]:
+        """Asks the channel to connect, returning an event set once it is ready, and the subscribed callback."""
         # An event to track whether we were able to establish an eager connection
         # This is required as we create a subscription to eagerly connect and observe the state changes
         # We do NOT want the subscription to lurk around after it's job is done.
         connection_event = Event()
 
-        def on_timeout() -> None:
-            self._logger.debug(
-                "We could not establish an eager connection within %d seconds",
-                timeout_seconds,
-            )
-            # the subscription is no longer needed; it was only meant to watch if we could connect eagerly
-            self._channel.unsubscribe(on_state_change)
-            self._channel.close()
-            raise ConnectionException(
-                message="Failed to connect to Momento's server within given eager connection timeout",
-                service=Service.CACHE,
-            )
-
         """
         A callback that is triggered whenever a connection's state changes. We explicitly subscribe to
         to the channel to notify us of state transitions. This method essentially handles unsubscribing
@@ -149,7 +195,7 @@ class _DataGrpcManager:
             if state == ready:
                 self._logger.debug("Connected to Momento's server! Happy Caching!")
                 # we successfully connected within the timeout and we no longer need this subscription
-                self._channel.unsubscribe(on_state_change)
+                channel.unsubscribe(on_state_change)
                 # this indicates to the connection event that we were successful in establishing an eager connection
                 connection_event.set()
 
@@ -160,23 +206,48 @@ class _DataGrpcManager:
             else:
                 self._logger.warning(f"Unexpected connection state while trying to eagerly connect: {state}")
                 # we could not connect within the timeout and we no longer need this subscription
-                self._channel.unsubscribe(on_state_change)
+                channel.unsubscribe(on_state_change)
                 connection_event.set()
 
-        # we subscribe to the channel that notifies us of state transitions, and the connection event above will take
+        # we subscribe to the channel that notifies us of state transitions, and eagerly_connect will take
         # care of unsubscribing from the channel incase the timeout has elapsed.
-        self._channel.subscribe(on_state_change, try_to_connect=True)
-
-        connection_established = connection_event.wait(timeout_seconds)
-        if not connection_established:
-            on_timeout()
+        channel.subscribe(on_state_change, try_to_connect=True)
+        return connection_event, on_state_change
 
     def close(self) -> None:
-        self._logger.debug("Closing and tearing down gRPC channel")
-        self._channel.close()
-
-    def stub(self) -> cache_client.ScsStub:
-        return self._stub
+        self._logger.debug("Closing and tearing down gRPC channels")
+        for channel in self._channels:
+            channel.close()
+
+    def in_flight_counts(self) -> list[int]:
+        """Returns the number of requests in flight on each data channel."""
+        return [in_flight_counter.in_flight for in_flight_counter in self._in_flight_counters]
+
+    def _least_loaded_channel_index(self, avoid: Optional[int] = None) -> int:
+        num_channels = len(self._stubs)
+        with self._next_channel_index_lock:
+            start = self._next_channel_index
+            self._next_channel_index = (start + 1) % num_channels
+        best: Optional[int] = None
+        best_load = (True, 0)
+        for offset in range(num_channels):
+            index = (start + offset) % num_channels
+            if index == avoid:
+                continue
+            # A channel whose circuit breaker is open only gets requests, which then fail fast, when
+            # every channel's breaker is open.
+            circuit_breaker = self._circuit_breakers[index]
+            rejecting = circuit_breaker is not None and not circuit_breaker.is_accepting_requests()
+            load = (rejecting, self._in_flight_counters[index].in_flight)
+            if best is None or load < best_load:
+                best, best_load = index, load
+        # With a single channel there is nothing else to pick.
+        return best if best is not None else start
+
+    def stub(self, avoid: Optional[cache_client.ScsStub] = None) -> cache_client.ScsStub:
+        """Returns the stub of the least loaded channel, other than the channel of `avoid` if there is another."""
+        avoid_index = self._stubs.index(avoid) if avoid is not None else None
+        return self._stubs[self._least_loaded_channel_index(avoid_index)]
 
 
 class _PubsubGrpcManager:
@@ -283,11 +354,34 @@ class _TokenGrpcManager:
         return self._stub
 
 
+def _retry_token_bucket(configuration: Configuration) -> Optional[_RetryTokenBucket]:
+    retry_budget = configuration.get_retry_budget()
+    return _RetryTokenBucket(retry_budget) if retry_budget is not None else None
+
+
+def _adaptive_deadlines(configuration: Configuration) -> Optional[_AdaptiveDeadlines]:
+    transport_strategy = configuration.get_transport_strategy()
+    if isinstance(transport_strategy, AdaptiveTransportStrategy):
+        return _AdaptiveDeadlines(transport_strategy)
+    return None
+
+
+def _circuit_breaker(configuration: Configuration, channel_index: int) -> Optional[_CircuitBreaker]:
+    circuit_breaker_policy = configuration.get_circuit_breaker_policy()
+    if circuit_breaker_policy is None:
+        return None
+    listeners = [middleware.on_circuit_breaker_state_change for middleware in configuration.get_sync_middlewares()]
+    return _CircuitBreaker(circuit_breaker_policy, channel_index, listeners)
+
+
 def _interceptors(
     auth_token: str,
     client_type: ClientType,
     middleware: List[Middleware],
     retry_strategy: Optional[RetryStrategy] = None,
+    retry_token_bucket: Optional[_RetryTokenBucket] = None,
+    circuit_breaker: Optional[_CircuitBreaker] = None,
+    adaptive_deadlines: Optional[_AdaptiveDeadlines] = None,
 ) -> list[grpc.UnaryUnaryClientInterceptor]:
     from momento import __version__ as momento_version
 
@@ -303,7 +397,8 @@ def _interceptors(
             None,
             [
                 AddHeaderClientInterceptor(headers),
-                RetryInterceptor(retry_strategy) if retry_strategy else None,
+                CircuitBreakerInterceptor(circuit_breaker) if circuit_breaker else None,
+                RetryInterceptor(retry_strategy, retry_token_bucket, adaptive_deadlines) if retry_strategy else None,
                 MiddlewareInterceptor(middleware, context) if middleware else None,
             ],
         )
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, Hashable, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class _SingleFlight:
+    """Shares one execution among concurrent calls made with the same key.
+
+    The first thread to call with a key runs the work; threads arriving while it is in
+    flight wait for it and receive the same result object. The key is forgotten as soon
+    as the work completes, so nothing is cached beyond the call itself.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._in_flight: Dict[Hashable, Future[object]] = {}
+        self._coalesced_count = 0
+
+    @property
+    def coalesced_count(self) -> int:
+        """The number of calls that were answered by another caller's in-flight work."""
+        with self._lock:
+            return self._coalesced_count
+
+    def do(self, key: Hashable, work: Callable[[], T]) -> T:
+        try:
+            hash(key)
+        except (TypeError, ValueError):  # unhashable key, e.g. an invalid argument or a writable memoryview
+            return work()
+
+        future: Future[T] = Future()
+        with self._lock:
+            shared = self._in_flight.get(key)
+            if shared is None:
+                self._in_flight[key] = cast("Future[object]", future)
+            else:
+                self._coalesced_count += 1
+        if shared is not None:
+            return cast("Future[T]", shared).result()
+
+        try:
+            result = work()
+        except BaseException as e:
+            self._forget(key)
+            future.set_exception(e)
+            raise
+        self._forget(key)
+        future.set_result(result)
+        return result
+
+    def _forget(self, key: Hashable) -> None:
+        with self._lock:
+            del self._in_flight[key]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import collections
-from typing import Optional, Tuple
+from typing import Iterable, Iterator, Optional, Tuple, TypeVar
 
 import grpc
 from grpc import CallCredentials
@@ -10,11 +10,28 @@ from grpc._typing import MetadataType
 from momento.errors import InvalidArgumentException
 from momento.internal.services import Service
 
+T = TypeVar("T")
+
 
 def make_metadata(cache_name: str) -> list[Tuple[str, str]]:
     return [("cache", cache_name)]
 
 
+def gen_chunks(items: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    """Groups the items of an iterable into lists of at most `chunk_size` items.
+
+    Only one chunk is held in memory at a time, so arbitrarily large inputs can be consumed.
+    """
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
 class _ClientCallDetails(
     collections.namedtuple("_ClientCallDetails", ("method", "timeout", "metadata", "credentials")),
     grpc.ClientCallDetails,
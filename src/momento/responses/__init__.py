@@ -25,6 +25,7 @@ from .control.signing_key.list import (
 )
 from .control.signing_key.revoke import RevokeSigningKey, RevokeSigningKeyResponse
 from .data.dictionary.fetch import CacheDictionaryFetch, CacheDictionaryFetchResponse
+from .data.dictionary.fetch_objects import CacheDictionaryFetchObjects, CacheDictionaryFetchObjectsResponse
 from .data.dictionary.get_field import (
     CacheDictionaryGetField,
     CacheDictionaryGetFieldResponse,
@@ -62,23 +63,44 @@ from .data.list.concatenate_front import (
     CacheListConcatenateFrontResponse,
 )
 from .data.list.fetch import CacheListFetch, CacheListFetchResponse
+from .data.list.fetch_objects import CacheListFetchObjects, CacheListFetchObjectsResponse
 from .data.list.length import CacheListLength, CacheListLengthResponse
 from .data.list.pop_back import CacheListPopBack, CacheListPopBackResponse
 from .data.list.pop_front import CacheListPopFront, CacheListPopFrontResponse
 from .data.list.push_back import CacheListPushBack, CacheListPushBackResponse
 from .data.list.push_front import CacheListPushFront, CacheListPushFrontResponse
 from .data.list.remove_value import CacheListRemoveValue, CacheListRemoveValueResponse
+from .data.list.retain import CacheListRetain, CacheListRetainResponse
+from .data.scalar.decrease_ttl import CacheDecreaseTtl, CacheDecreaseTtlResponse
 from .data.scalar.delete import CacheDelete, CacheDeleteResponse
 from .data.scalar.get import CacheGet, CacheGetResponse
+from .data.scalar.get_batch import CacheGetBatch, CacheGetBatchResponse
+from .data.scalar.get_large import CacheGetLarge, CacheGetLargeResponse
+from .data.scalar.get_object import CacheGetObject, CacheGetObjectResponse
+from .data.scalar.increase_ttl import CacheIncreaseTtl, CacheIncreaseTtlResponse
 from .data.scalar.increment import CacheIncrement, CacheIncrementResponse
+from .data.scalar.item_get_ttl import CacheItemGetTtl, CacheItemGetTtlResponse
+from .data.scalar.item_get_type import CacheItemGetType, CacheItemGetTypeResponse, ItemType
+from .data.scalar.key_exists import CacheKeyExists, CacheKeyExistsResponse
+from .data.scalar.keys_exist import CacheKeysExist, CacheKeysExistResponse
 from .data.scalar.set import CacheSet, CacheSetResponse
+from .data.scalar.set_batch import CacheSetBatch, CacheSetBatchResponse
+from .data.scalar.set_if_absent import CacheSetIfAbsent, CacheSetIfAbsentResponse
+from .data.scalar.set_if_absent_or_equal import CacheSetIfAbsentOrEqual, CacheSetIfAbsentOrEqualResponse
+from .data.scalar.set_if_equal import CacheSetIfEqual, CacheSetIfEqualResponse
+from .data.scalar.set_if_not_equal import CacheSetIfNotEqual, CacheSetIfNotEqualResponse
 from .data.scalar.set_if_not_exists import (
     CacheSetIfNotExists,
     CacheSetIfNotExistsResponse,
 )
+from .data.scalar.set_if_present import CacheSetIfPresent, CacheSetIfPresentResponse
+from .data.scalar.set_if_present_and_not_equal import CacheSetIfPresentAndNotEqual, CacheSetIfPresentAndNotEqualResponse
+from .data.scalar.set_large import CacheSetLarge, CacheSetLargeResponse
+from .data.scalar.update_ttl import CacheUpdateTtl, CacheUpdateTtlResponse
 from .data.set.add_element import CacheSetAddElement, CacheSetAddElementResponse
 from .data.set.add_elements import CacheSetAddElements, CacheSetAddElementsResponse
 from .data.set.fetch import CacheSetFetch, CacheSetFetchResponse
+from .data.set.fetch_objects import CacheSetFetchObjects, CacheSetFetchObjectsResponse
 from .data.set.remove_element import (
     CacheSetRemoveElement,
     CacheSetRemoveElementResponse,
@@ -146,6 +168,8 @@ __all__ = [
     "RevokeSigningKeyResponse",
     "CacheDictionaryFetch",
     "CacheDictionaryFetchResponse",
+    "CacheDictionaryFetchObjects",
+    "CacheDictionaryFetchObjectsResponse",
     "CacheDictionaryGetField",
     "CacheDictionaryGetFieldResponse",
     "CacheDictionaryGetFields",
@@ -166,6 +190,8 @@ __all__ = [
     "CacheListConcatenateFrontResponse",
     "CacheListFetch",
     "CacheListFetchResponse",
+    "CacheListFetchObjects",
+    "CacheListFetchObjectsResponse",
     "CacheListLength",
     "CacheListLengthResponse",
     "CacheListPopBack",
@@ -178,22 +204,63 @@ __all__ = [
     "CacheListPushFrontResponse",
     "CacheListRemoveValue",
     "CacheListRemoveValueResponse",
+    "CacheListRetain",
+    "CacheListRetainResponse",
     "CacheDelete",
     "CacheDeleteResponse",
+    "CacheDecreaseTtl",
+    "CacheDecreaseTtlResponse",
     "CacheGet",
     "CacheGetResponse",
+    "CacheGetBatch",
+    "CacheGetBatchResponse",
+    "CacheGetLarge",
+    "CacheGetLargeResponse",
+    "CacheGetObject",
+    "CacheGetObjectResponse",
     "CacheIncrement",
     "CacheIncrementResponse",
+    "CacheIncreaseTtl",
+    "CacheIncreaseTtlResponse",
+    "CacheItemGetTtl",
+    "CacheItemGetTtlResponse",
+    "CacheItemGetType",
+    "CacheItemGetTypeResponse",
+    "ItemType",
+    "CacheKeyExists",
+    "CacheKeyExistsResponse",
+    "CacheKeysExist",
+    "CacheKeysExistResponse",
     "CacheSet",
     "CacheSetResponse",
+    "CacheSetBatch",
+    "CacheSetBatchResponse",
+    "CacheSetLarge",
+    "CacheSetLargeResponse",
+    "CacheSetIfAbsent",
+    "CacheSetIfAbsentResponse",
+    "CacheSetIfAbsentOrEqual",
+    "CacheSetIfAbsentOrEqualResponse",
+    "CacheSetIfEqual",
+    "CacheSetIfEqualResponse",
+    "CacheSetIfNotEqual",
+    "CacheSetIfNotEqualResponse",
+    "CacheSetIfPresent",
+    "CacheSetIfPresentResponse",
+    "CacheSetIfPresentAndNotEqual",
+    "CacheSetIfPresentAndNotEqualResponse",
     "CacheSetIfNotExists",
     "CacheSetIfNotExistsResponse",
+    "CacheUpdateTtl",
+    "CacheUpdateTtlResponse",
     "CacheSetAddElement",
     "CacheSetAddElementResponse",
     "CacheSetAddElements",
     "CacheSetAddElementsResponse",
     "CacheSetFetch",
     "CacheSetFetchResponse",
+    "CacheSetFetchObjects",
+    "CacheSetFetchObjectsResponse",
     "CacheSetRemoveElement",
     "CacheSetRemoveElementResponse",
     "CacheSetRemoveElements",
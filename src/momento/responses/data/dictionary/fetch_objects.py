@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheDictionaryFetchObjectsResponse(CacheResponse):
+    """Response type for a `dictionary_fetch_objects` request.
+
+    Its subtypes are:
+    - `CacheDictionaryFetchObjects.Hit`
+    - `CacheDictionaryFetchObjects.Miss`
+    - `CacheDictionaryFetchObjects.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheDictionaryFetchObjects(ABC):
+    """Groups all `CacheDictionaryFetchObjectsResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Hit(CacheDictionaryFetchObjectsResponse):
+        """Indicates the dictionary exists and its items were fetched."""
+
+        value_dictionary: dict[str, object]
+        """The items for the fetched dictionary, as a mapping from utf-8 encoded fields to deserialized values."""
+
+    class Miss(CacheDictionaryFetchObjectsResponse):
+        """Indicates the dictionary does not exist."""
+
+    class Error(CacheDictionaryFetchObjectsResponse, ErrorResponseMixin):
+        """Indicates an error occured in the request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheListFetchObjectsResponse(CacheResponse):
+    """Response type for a `list_fetch_objects` request.
+
+    Its subtypes are:
+    - `CacheListFetchObjects.Hit`
+    - `CacheListFetchObjects.Miss`
+    - `CacheListFetchObjects.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheListFetchObjects(ABC):
+    """Groups all `CacheListFetchObjectsResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Hit(CacheListFetchObjectsResponse):
+        """Indicates the list exists and its values were fetched."""
+
+        value_list: list[object]
+        """The values for the fetched list, as deserialized by the serializer."""
+
+    class Miss(CacheListFetchObjectsResponse):
+        """Indicates the list does not exist."""
+
+    class Error(CacheListFetchObjectsResponse, ErrorResponseMixin):
+        """Indicates an error occured in the request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,39 @@
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheListRetainResponse(CacheResponse):
+    """Response type for a `list_retain` request.
+
+    Its subtypes are:
+    - `CacheListRetain.Success`
+    - `CacheListRetain.Miss`
+    - `CacheListRetain.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheListRetain(ABC):
+    """Groups all `CacheListRetainResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Success(CacheListRetainResponse):
+        """Indicates the list exists and now holds only the values in the given range."""
+
+        list_length: int
+        """The number of values left in the list."""
+
+    class Miss(CacheListRetainResponse):
+        """Indicates the list does not exist."""
+
+    class Error(CacheListRetainResponse, ErrorResponseMixin):
+        """Indicates an error occured in the request.
+
+        This includes
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,38 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheDecreaseTtlResponse(CacheResponse):
+    """Parent response type for a cache `decrease_ttl` request.
+
+    Its subtypes are:
+    - `CacheDecreaseTtl.Set`
+    - `CacheDecreaseTtl.NotSet`
+    - `CacheDecreaseTtl.Miss`
+    - `CacheDecreaseTtl.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheDecreaseTtl(ABC):
+    """Groups all `CacheDecreaseTtlResponse` derived types under a common namespace."""
+
+    class Set(CacheDecreaseTtlResponse):
+        """Indicates the TTL of the item was decreased."""
+
+    class NotSet(CacheDecreaseTtlResponse):
+        """Indicates the TTL was left unchanged because the requested TTL is not shorter than the remaining one."""
+
+    class Miss(CacheDecreaseTtlResponse):
+        """Indicates the key does not exist."""
+
+    class Error(CacheDecreaseTtlResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
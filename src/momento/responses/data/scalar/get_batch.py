@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+from .get import CacheGetResponse
+
+
+class CacheGetBatchResponse(CacheResponse):
+    """Parent response type for a cache `get_batch` request.
+
+    Its subtypes are:
+    - `CacheGetBatch.Success`
+    - `CacheGetBatch.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheGetBatch(ABC):
+    """Groups all `CacheGetBatchResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Success(CacheGetBatchResponse):
+        """Contains the result of a batch get."""
+
+        results: list[CacheGetResponse]
+        """The `get` response for each requested key, in the order the keys were given.
+        Each one is a `CacheGet.Hit`, `CacheGet.Miss` or `CacheGet.Error`."""
+
+    class Error(CacheGetBatchResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
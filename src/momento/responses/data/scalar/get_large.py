@@ -0,0 +1,43 @@
+from abc import ABC
+from dataclasses import dataclass
+from typing import Optional
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheGetLargeResponse(CacheResponse):
+    """Parent response type for a cache `get_large` request.
+
+    Its subtypes are:
+    - `CacheGetLarge.Hit`
+    - `CacheGetLarge.Miss`
+    - `CacheGetLarge.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheGetLarge(ABC):
+    """Groups all `CacheGetLargeResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Hit(CacheGetLargeResponse):
+        """Contains the result of a cache hit."""
+
+        size: int
+        """The size of the value in bytes."""
+        value_bytes: Optional[bytes] = None
+        """The value returned from the cache for the specified key, or None if
+        it was written to the destination passed to `get_large`."""
+
+    class Miss(CacheGetLargeResponse):
+        """Contains the results of a cache miss, including a value with chunks that are no longer in the cache."""
+
+    class Error(CacheGetLargeResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
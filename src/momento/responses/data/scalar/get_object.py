@@ -0,0 +1,39 @@
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheGetObjectResponse(CacheResponse):
+    """Parent response type for a cache `get_object` request.
+
+    Its subtypes are:
+    - `CacheGetObject.Hit`
+    - `CacheGetObject.Miss`
+    - `CacheGetObject.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheGetObject(ABC):
+    """Groups all `CacheGetObjectResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Hit(CacheGetObjectResponse):
+        """Contains the result of a cache hit."""
+
+        value: object
+        """The value returned from the cache for the specified key, as deserialized by the serializer."""
+
+    class Miss(CacheGetObjectResponse):
+        """Contains the results of a cache miss."""
+
+    class Error(CacheGetObjectResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,38 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheIncreaseTtlResponse(CacheResponse):
+    """Parent response type for a cache `increase_ttl` request.
+
+    Its subtypes are:
+    - `CacheIncreaseTtl.Set`
+    - `CacheIncreaseTtl.NotSet`
+    - `CacheIncreaseTtl.Miss`
+    - `CacheIncreaseTtl.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheIncreaseTtl(ABC):
+    """Groups all `CacheIncreaseTtlResponse` derived types under a common namespace."""
+
+    class Set(CacheIncreaseTtlResponse):
+        """Indicates the TTL of the item was increased."""
+
+    class NotSet(CacheIncreaseTtlResponse):
+        """Indicates the TTL was left unchanged because the requested TTL is not longer than the remaining one."""
+
+    class Miss(CacheIncreaseTtlResponse):
+        """Indicates the key does not exist."""
+
+    class Error(CacheIncreaseTtlResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,40 @@
+from abc import ABC
+from dataclasses import dataclass
+from datetime import timedelta
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheItemGetTtlResponse(CacheResponse):
+    """Parent response type for a cache `item_get_ttl` request.
+
+    Its subtypes are:
+    - `CacheItemGetTtl.Hit`
+    - `CacheItemGetTtl.Miss`
+    - `CacheItemGetTtl.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheItemGetTtl(ABC):
+    """Groups all `CacheItemGetTtlResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Hit(CacheItemGetTtlResponse):
+        """Indicates the key exists."""
+
+        remaining_ttl: timedelta
+        """How long until the item expires."""
+
+    class Miss(CacheItemGetTtlResponse):
+        """Indicates the key does not exist."""
+
+    class Error(CacheItemGetTtlResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,50 @@
+from abc import ABC
+from dataclasses import dataclass
+from enum import Enum
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class ItemType(Enum):
+    """The type of data stored under a key."""
+
+    SCALAR = "scalar"
+    DICTIONARY = "dictionary"
+    LIST = "list"
+    SET = "set"
+    SORTED_SET = "sorted_set"
+
+
+class CacheItemGetTypeResponse(CacheResponse):
+    """Parent response type for a cache `item_get_type` request.
+
+    Its subtypes are:
+    - `CacheItemGetType.Hit`
+    - `CacheItemGetType.Miss`
+    - `CacheItemGetType.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheItemGetType(ABC):
+    """Groups all `CacheItemGetTypeResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Hit(CacheItemGetTypeResponse):
+        """Indicates the key exists."""
+
+        item_type: ItemType
+        """The type of data stored under the key."""
+
+    class Miss(CacheItemGetTypeResponse):
+        """Indicates the key does not exist."""
+
+    class Error(CacheItemGetTypeResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
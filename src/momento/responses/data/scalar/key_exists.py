@@ -0,0 +1,35 @@
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheKeyExistsResponse(CacheResponse):
+    """Parent response type for a cache `key_exists` request.
+
+    Its subtypes are:
+    - `CacheKeyExists.Success`
+    - `CacheKeyExists.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheKeyExists(ABC):
+    """Groups all `CacheKeyExistsResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Success(CacheKeyExistsResponse):
+        """Indicates the request was successful."""
+
+        exists: bool
+        """Whether the key exists."""
+
+    class Error(CacheKeyExistsResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
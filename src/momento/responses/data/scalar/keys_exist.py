@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheKeysExistResponse(CacheResponse):
+    """Parent response type for a cache `keys_exist` request.
+
+    Its subtypes are:
+    - `CacheKeysExist.Success`
+    - `CacheKeysExist.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheKeysExist(ABC):
+    """Groups all `CacheKeysExistResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Success(CacheKeysExistResponse):
+        """Indicates the request was successful."""
+
+        exists: list[bool]
+        """Whether each requested key exists, in the order the keys were given."""
+
+    class Error(CacheKeysExistResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
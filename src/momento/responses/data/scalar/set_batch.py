@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+from .set import CacheSetResponse
+
+
+class CacheSetBatchResponse(CacheResponse):
+    """Parent response type for a cache `set_batch` request.
+
+    Its subtypes are:
+    - `CacheSetBatch.Success`
+    - `CacheSetBatch.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetBatch(ABC):
+    """Groups all `CacheSetBatchResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Success(CacheSetBatchResponse):
+        """Contains the result of a batch set."""
+
+        results: list[CacheSetResponse]
+        """The `set` response for each item, in the order the items were given.
+        Each one is a `CacheSet.Success` or `CacheSet.Error`."""
+
+    class Error(CacheSetBatchResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
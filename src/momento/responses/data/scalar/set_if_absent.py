@@ -0,0 +1,34 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheSetIfAbsentResponse(CacheResponse):
+    """Parent response type for a cache `set_if_absent` request.
+
+    Its subtypes are:
+    - `CacheSetIfAbsent.Stored`
+    - `CacheSetIfAbsent.NotStored`
+    - `CacheSetIfAbsent.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetIfAbsent(ABC):
+    """Groups all `CacheSetIfAbsentResponse` derived types under a common namespace."""
+
+    class Stored(CacheSetIfAbsentResponse):
+        """Indicates the key did not exist and the value was set."""
+
+    class NotStored(CacheSetIfAbsentResponse):
+        """Indicates the key existed and no value was set."""
+
+    class Error(CacheSetIfAbsentResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
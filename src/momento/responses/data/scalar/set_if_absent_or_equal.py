@@ -0,0 +1,34 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheSetIfAbsentOrEqualResponse(CacheResponse):
+    """Parent response type for a cache `set_if_absent_or_equal` request.
+
+    Its subtypes are:
+    - `CacheSetIfAbsentOrEqual.Stored`
+    - `CacheSetIfAbsentOrEqual.NotStored`
+    - `CacheSetIfAbsentOrEqual.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetIfAbsentOrEqual(ABC):
+    """Groups all `CacheSetIfAbsentOrEqualResponse` derived types under a common namespace."""
+
+    class Stored(CacheSetIfAbsentOrEqualResponse):
+        """Indicates the key did not exist or its value was equal to the one given and the value was set."""
+
+    class NotStored(CacheSetIfAbsentOrEqualResponse):
+        """Indicates the key existed and its value was not equal to the one given and no value was set."""
+
+    class Error(CacheSetIfAbsentOrEqualResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,34 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheSetIfEqualResponse(CacheResponse):
+    """Parent response type for a cache `set_if_equal` request.
+
+    Its subtypes are:
+    - `CacheSetIfEqual.Stored`
+    - `CacheSetIfEqual.NotStored`
+    - `CacheSetIfEqual.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetIfEqual(ABC):
+    """Groups all `CacheSetIfEqualResponse` derived types under a common namespace."""
+
+    class Stored(CacheSetIfEqualResponse):
+        """Indicates the key's value was equal to the one given and the value was set."""
+
+    class NotStored(CacheSetIfEqualResponse):
+        """Indicates the key did not exist or its value was not equal to the one given and no value was set."""
+
+    class Error(CacheSetIfEqualResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
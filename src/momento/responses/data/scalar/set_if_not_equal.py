@@ -0,0 +1,34 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheSetIfNotEqualResponse(CacheResponse):
+    """Parent response type for a cache `set_if_not_equal` request.
+
+    Its subtypes are:
+    - `CacheSetIfNotEqual.Stored`
+    - `CacheSetIfNotEqual.NotStored`
+    - `CacheSetIfNotEqual.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetIfNotEqual(ABC):
+    """Groups all `CacheSetIfNotEqualResponse` derived types under a common namespace."""
+
+    class Stored(CacheSetIfNotEqualResponse):
+        """Indicates the key did not exist or its value was not equal to the one given and the value was set."""
+
+    class NotStored(CacheSetIfNotEqualResponse):
+        """Indicates the key's value was equal to the one given and no value was set."""
+
+    class Error(CacheSetIfNotEqualResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
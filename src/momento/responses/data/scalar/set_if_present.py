@@ -0,0 +1,34 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheSetIfPresentResponse(CacheResponse):
+    """Parent response type for a cache `set_if_present` request.
+
+    Its subtypes are:
+    - `CacheSetIfPresent.Stored`
+    - `CacheSetIfPresent.NotStored`
+    - `CacheSetIfPresent.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetIfPresent(ABC):
+    """Groups all `CacheSetIfPresentResponse` derived types under a common namespace."""
+
+    class Stored(CacheSetIfPresentResponse):
+        """Indicates the key existed and the value was set."""
+
+    class NotStored(CacheSetIfPresentResponse):
+        """Indicates the key did not exist and no value was set."""
+
+    class Error(CacheSetIfPresentResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
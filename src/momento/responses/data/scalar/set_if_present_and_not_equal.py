@@ -0,0 +1,34 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheSetIfPresentAndNotEqualResponse(CacheResponse):
+    """Parent response type for a cache `set_if_present_and_not_equal` request.
+
+    Its subtypes are:
+    - `CacheSetIfPresentAndNotEqual.Stored`
+    - `CacheSetIfPresentAndNotEqual.NotStored`
+    - `CacheSetIfPresentAndNotEqual.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetIfPresentAndNotEqual(ABC):
+    """Groups all `CacheSetIfPresentAndNotEqualResponse` derived types under a common namespace."""
+
+    class Stored(CacheSetIfPresentAndNotEqualResponse):
+        """Indicates the key existed and its value was not equal to the one given and the value was set."""
+
+    class NotStored(CacheSetIfPresentAndNotEqualResponse):
+        """Indicates the key did not exist or its value was equal to the one given and no value was set."""
+
+    class Error(CacheSetIfPresentAndNotEqualResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
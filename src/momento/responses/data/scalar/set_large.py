@@ -0,0 +1,30 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheSetLargeResponse(CacheResponse):
+    """Parent response type for a cache `set_large` request.
+
+    Its subtypes are:
+    - `CacheSetLarge.Success`
+    - `CacheSetLarge.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetLarge(ABC):
+    """Groups all `CacheSetLargeResponse` derived types under a common namespace."""
+
+    class Success(CacheSetLargeResponse):
+        """Indicates the request was successful."""
+
+    class Error(CacheSetLargeResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,34 @@
+from abc import ABC
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheUpdateTtlResponse(CacheResponse):
+    """Parent response type for a cache `update_ttl` request.
+
+    Its subtypes are:
+    - `CacheUpdateTtl.Set`
+    - `CacheUpdateTtl.Miss`
+    - `CacheUpdateTtl.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheUpdateTtl(ABC):
+    """Groups all `CacheUpdateTtlResponse` derived types under a common namespace."""
+
+    class Set(CacheUpdateTtlResponse):
+        """Indicates the TTL of the item was set."""
+
+    class Miss(CacheUpdateTtlResponse):
+        """Indicates the key does not exist."""
+
+    class Error(CacheUpdateTtlResponse, ErrorResponseMixin):
+        """Contains information about an error returned from a request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from abc import ABC
+from dataclasses import dataclass
+
+from ...mixins import ErrorResponseMixin
+from ...response import CacheResponse
+
+
+class CacheSetFetchObjectsResponse(CacheResponse):
+    """Parent response type for a `set_fetch_objects` request.
+
+    Its subtypes are:
+    - `CacheSetFetchObjects.Hit`
+    - `CacheSetFetchObjects.Miss`
+    - `CacheSetFetchObjects.Error`
+
+    See `CacheClient` for how to work with responses.
+    """
+
+
+class CacheSetFetchObjects(ABC):
+    """Groups all `CacheSetFetchObjectsResponse` derived types under a common namespace."""
+
+    @dataclass
+    class Hit(CacheSetFetchObjectsResponse):
+        """Indicates the set exists and its values were fetched."""
+
+        value_list: list[object]
+        """The deserialized elements of the set, in no particular order.
+
+        They are returned as a list because deserialized values, such as dicts, may not be hashable.
+        """
+
+    class Miss(CacheSetFetchObjectsResponse):
+        """Indicates the set does not exist."""
+
+    class Error(CacheSetFetchObjectsResponse, ErrorResponseMixin):
+        """Indicates an error occured in the request.
+
+        This includes:
+        - `error_code`: `MomentoErrorCode` value for the error.
+        - `messsage`: a detailed error message.
+        """
@@ -1,13 +1,17 @@
 from .default_eligibility_strategy import DefaultEligibilityStrategy
 from .eligibility_strategy import EligibilityStrategy
+from .exponential_backoff_retry_strategy import ExponentialBackoffRetryStrategy
 from .fixed_count_retry_strategy import FixedCountRetryStrategy
+from .retry_budget import RetryBudget
 from .retry_strategy import RetryStrategy
 from .retryable_props import RetryableProps
 
 __all__ = [
     "DefaultEligibilityStrategy",
     "EligibilityStrategy",
+    "ExponentialBackoffRetryStrategy",
     "FixedCountRetryStrategy",
+    "RetryBudget",
     "RetryStrategy",
     "RetryableProps",
 ]
@@ -0,0 +1,80 @@
+import logging
+import random
+from typing import Optional
+
+from .default_eligibility_strategy import DefaultEligibilityStrategy
+from .eligibility_strategy import EligibilityStrategy
+from .retry_strategy import RetryStrategy
+from .retryable_props import RetryableProps
+
+logger = logging.getLogger("exponential-backoff-retry-strategy")
+
+
+class ExponentialBackoffRetryStrategy(RetryStrategy):
+    """Retries eligible requests after an exponentially growing, randomized delay.
+
+    Delays use decorrelated jitter: each delay is drawn uniformly between the initial delay
+    and three times the previous delay, capped at the maximum delay. Clients that failed
+    together therefore spread their retries out instead of retrying in lockstep.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        initial_delay_millis: int = 50,
+        max_delay_millis: int = 2000,
+        eligibility_strategy: DefaultEligibilityStrategy = DefaultEligibilityStrategy(),
+    ):
+        self._eligibility_strategy: EligibilityStrategy = eligibility_strategy
+        self._max_attempts: int = max_attempts
+        self._initial_delay_millis: int = initial_delay_millis
+        self._max_delay_millis: int = max_delay_millis
+
+    def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+        """Determines whether a grpc call can be retried and how long to wait before that retry.
+
+        Args:
+            props (RetryableProps): Information about the grpc call, its last invocation, and how many times the call
+            has been made.
+
+        :Returns
+            The time in seconds before the next retry should occur or None if no retry should be attempted.
+        """
+        if self._eligibility_strategy.is_eligible_for_retry(props) is False:
+            logger.debug(
+                "Request path: %s; retryable status code: %s. Request is not retryable.",
+                props.grpc_method,
+                props.grpc_status,  # type: ignore[misc]
+            )
+            return None
+
+        if props.attempt_number > self._max_attempts:
+            logger.debug(
+                "Request path: %s; retryable status code: %s; number of attempts (%i) "
+                "has exceeded max (%i); not retrying.",
+                props.grpc_method,
+                props.grpc_status,  # type: ignore[misc]
+                props.attempt_number,
+                self._max_attempts,
+            )
+            return None
+
+        delay_millis = self._decorrelated_jitter_millis(props.previous_retry_delay)
+        logger.debug(
+            "Request path: %s; retryable status code: %s; number of attempts (%i) is not above max (%i); "
+            "retrying after %d ms.",
+            props.grpc_method,
+            props.grpc_status,  # type: ignore[misc]
+            props.attempt_number,
+            self._max_attempts,
+            delay_millis,
+        )
+        return delay_millis / 1000.0
+
+    def _decorrelated_jitter_millis(self, previous_delay_seconds: Optional[float]) -> float:
+        previous_delay_millis = (
+            self._initial_delay_millis if previous_delay_seconds is None else previous_delay_seconds * 1000
+        )
+        upper_bound = max(self._initial_delay_millis, previous_delay_millis * 3)
+        return min(self._max_delay_millis, random.uniform(self._initial_delay_millis, upper_bound))
@@ -86,12 +86,12 @@ class FixedTimeoutRetryStrategy(RetryStrategy):
             overall_deadline (datetime): The overall deadline for the operation.
 
         Returns:
-            float: The calculated retry deadline.
+            float: The calculated retry deadline in seconds.
         """
         logger.debug(
             f"Calculating retry deadline:\nnow: {datetime.now()}\noverall deadline: {overall_deadline}\n"
             + f"retry timeout millis: {self._retry_timeout_millis}"
         )
         if datetime.now() + timedelta(milliseconds=self._retry_timeout_millis) > overall_deadline:
-            return (overall_deadline - datetime.now()).total_seconds() * 1000
-        return self._retry_timeout_millis
+            return (overall_deadline - datetime.now()).total_seconds()
+        return self._retry_timeout_millis / 1000.0
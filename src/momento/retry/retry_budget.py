@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from momento.errors import InvalidArgumentException
+from momento.internal.services import Service
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent request volume.
+
+    Every request adds `retry_ratio` tokens to a bucket that holds at most `max_tokens`, and
+    every retry spends one token. When less than a token is left, failed requests are returned
+    to the caller instead of being retried, so an outage cannot multiply the load a client sends
+    by more than roughly `1 + retry_ratio`. The bucket starts full, which allows a burst of up to
+    `max_tokens` retries regardless of recent volume.
+
+    Each client keeps its own bucket; the budget only describes its size.
+    """
+
+    def __init__(self, *, retry_ratio: float = 0.1, max_tokens: float = 10.0):
+        """Instantiate a retry budget.
+
+        Args:
+            retry_ratio (float): the number of retries each request earns. 0.1 allows one retry per ten requests.
+            max_tokens (float): the most retries that can be banked. Must be at least 1.
+        """
+        if retry_ratio <= 0:
+            raise InvalidArgumentException("Retry ratio must be positive.", Service.CACHE)
+        if max_tokens < 1:
+            raise InvalidArgumentException("Max tokens must be at least 1.", Service.CACHE)
+        self._retry_ratio = retry_ratio
+        self._max_tokens = max_tokens
+
+    def get_retry_ratio(self) -> float:
+        return self._retry_ratio
+
+    def get_max_tokens(self) -> float:
+        return self._max_tokens
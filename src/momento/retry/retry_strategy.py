@@ -10,6 +10,9 @@ class RetryStrategy(ABC):
     def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
         pass
 
-    # Currently used only by the FixedTimeoutRetryStrategy
     def calculate_retry_deadline(self, overall_deadline: datetime) -> Optional[float]:
+        """Returns the timeout in seconds for a retry attempt, or None to give it the rest of the overall deadline.
+
+        Retry attempts never run past the overall deadline, whatever this returns.
+        """
         return None
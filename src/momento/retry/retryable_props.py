@@ -12,3 +12,5 @@ class RetryableProps:
     grpc_method: str
     attempt_number: int
     overall_deadline: Optional[datetime] = None
+    # The delay in seconds before the attempt that just failed, if it was a retry.
+    previous_retry_delay: Optional[float] = None
@@ -0,0 +1,13 @@
+"""Serializers that convert values to and from the bytes stored in the cache."""
+
+from .json_serializer import JsonSerializer
+from .msgpack_serializer import MsgpackSerializer
+from .pickle_serializer import PickleSerializer
+from .serializer import Serializer
+
+__all__ = [
+    "JsonSerializer",
+    "MsgpackSerializer",
+    "PickleSerializer",
+    "Serializer",
+]
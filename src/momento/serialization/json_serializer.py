@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from typing import Callable, Dict, Optional
+
+from .serializer import Serializer
+
+
+class JsonSerializer(Serializer):
+    """Serializes values as utf-8 encoded JSON.
+
+    Dataclass instances are written as JSON objects and read back as dicts; pass an `object_hook`
+    to rebuild them. Object keys are sorted, so equal dicts serialize to equal bytes, which keeps
+    set elements and values compared by the server consistent.
+    """
+
+    def __init__(
+        self,
+        *,
+        default: Optional[Callable[[object], object]] = None,
+        object_hook: Optional[Callable[[Dict[str, object]], object]] = None,
+    ):
+        """Instantiate a JSON serializer.
+
+        Args:
+            default (Optional[Callable[[object], object]]): converts values JSON cannot represent,
+            such as datetimes, into ones it can. Dataclasses are converted without it.
+            object_hook (Optional[Callable[[Dict[str, object]], object]]): converts each decoded
+            JSON object, for example back into a dataclass.
+        """
+        self._default = default
+        self._object_hook = object_hook
+
+    def serialize(self, value: object) -> bytes:
+        return json.dumps(value, default=self._convert, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+    def deserialize(self, data: bytes) -> object:
+        return json.loads(data, object_hook=self._object_hook)
+
+    def _convert(self, value: object) -> object:
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return dataclasses.asdict(value)
+        if self._default is not None:
+            return self._default(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import cast
+
+from .serializer import Serializer
+
+
+class MsgpackSerializer(Serializer):
+    """Serializes values with MessagePack, a compact binary format readable from many languages.
+
+    Requires the `msgpack` package, which is not a dependency of the SDK: install it with
+    `pip install msgpack`. Dataclass instances are written as maps and read back as dicts.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError("MsgpackSerializer requires the msgpack package: pip install msgpack") from e
+        self._msgpack = msgpack
+
+    def serialize(self, value: object) -> bytes:
+        # `packb` rather than a shared `Packer`, which keeps a buffer that is not safe to use from several threads.
+        return cast(bytes, self._msgpack.packb(value, default=self._convert))
+
+    def deserialize(self, data: bytes) -> object:
+        return self._msgpack.unpackb(data)
+
+    @staticmethod
+    def _convert(value: object) -> object:
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return dataclasses.asdict(value)
+        raise TypeError(f"Object of type {type(value).__name__} is not MessagePack serializable")
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pickle
+
+from .serializer import Serializer
+
+
+class PickleSerializer(Serializer):
+    """Serializes values with `pickle`, which round-trips most Python objects, including dataclasses.
+
+    Unpickling can run arbitrary code. Only use this serializer for caches that are written
+    exclusively by trusted clients.
+    """
+
+    def __init__(self, *, protocol: int = pickle.HIGHEST_PROTOCOL):
+        """Instantiate a pickle serializer.
+
+        Args:
+            protocol (int): the pickle protocol version to write. Readers must support it, so lower it
+            when older Python versions read the same cache.
+        """
+        self._protocol = protocol
+
+    def serialize(self, value: object) -> bytes:
+        return pickle.dumps(value, protocol=self._protocol)
+
+    def deserialize(self, data: bytes) -> object:
+        return pickle.loads(data)
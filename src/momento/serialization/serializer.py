@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+
+class Serializer(ABC):
+    """Converts values to and from the bytes stored in the cache.
+
+    The `*_object` methods of the cache clients use the serializer of the client's configuration,
+    or the one passed to the call. Implementations raise on values they cannot handle; the client
+    returns those failures as `Error` responses with a `SerializationException`.
+    """
+
+    @abstractmethod
+    def serialize(self, value: object) -> bytes:
+        """Converts a value to bytes.
+
+        Args:
+            value (object): the value to convert.
+
+        Returns:
+            bytes: the serialized value.
+        """
+
+    @abstractmethod
+    def deserialize(self, data: bytes) -> object:
+        """Converts bytes written by `serialize` back to a value.
+
+        Args:
+            data (bytes): the serialized value.
+
+        Returns:
+            object: the value.
+        """
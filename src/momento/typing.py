@@ -1,15 +1,31 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Mapping, Set, Union
+from datetime import timedelta
+from typing import IO, TYPE_CHECKING, AsyncIterable, Iterable, List, Mapping, Optional, Set, Tuple, Union
+
+if TYPE_CHECKING:
+    from typing_extensions import Buffer
 
 TCacheName = str
 TTopicName = str
 
 TMomentoValue = Union[str, bytes]
+# Keys and values that are written may also be any object supporting the buffer protocol,
+# such as bytearray, memoryview or mmap, whose contents are sent as bytes.
+TBytesLike = Union[str, bytes, "Buffer"]
 
 # Scalar Types
 TScalarKey = Union[str, bytes]
 TScalarValue = TMomentoValue
+TScalarKeys = Iterable[TScalarKey]
+TSetBatchItem = Union[
+    Tuple[TScalarKey, TScalarValue],
+    Tuple[TScalarKey, TScalarValue, Optional[timedelta]],
+]
+TSetBatchItems = Iterable[TSetBatchItem]
+TSetBatchItemsAsync = Union[TSetBatchItems, AsyncIterable[TSetBatchItem]]
+# Where `get_large` writes a value: a writable buffer such as a bytearray or mmap, or a binary file.
+TLargeValueDestination = Union["Buffer", IO[bytes]]
 
 # Collections
 TCollectionName = str
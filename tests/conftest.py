@@ -42,6 +42,7 @@ from momento.typing import (
     TTopicName,
 )
 
+from tests.momento.in_memory_scs_server import InMemoryScsServer
 from tests.momento.local.momento_local_async_middleware import MomentoLocalAsyncMiddleware, MomentoLocalMiddlewareArgs
 from tests.momento.local.momento_local_middleware import MomentoLocalMiddleware
 from tests.utils import (
@@ -500,3 +501,13 @@ async def unique_cache_name_async(
     finally:
         for cache_name in cache_names:
             await client_async.delete_cache(cache_name)
+
+
+@pytest.fixture
+def in_memory_scs_server() -> Iterator[InMemoryScsServer]:
+    """Runs an in-memory cache server for the test, for unit tests that need a real gRPC channel."""
+    server = InMemoryScsServer()
+    try:
+        yield server
+    finally:
+        server.stop()
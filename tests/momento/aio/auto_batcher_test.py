@@ -0,0 +1,189 @@
+import asyncio
+from datetime import timedelta
+from typing import List, Mapping, Optional, Tuple, cast
+
+import pytest
+from momento import AutoBatcher, CacheClientAsync
+from momento.errors import InvalidArgumentException, MomentoErrorCode, UnknownException
+from momento.requests import CollectionTtl
+from momento.responses import (
+    CacheDictionarySetField,
+    CacheDictionarySetFields,
+    CacheListConcatenateBack,
+    CacheListPushBack,
+    CacheSetAddElement,
+    CacheSetAddElements,
+    CacheSortedSetPutElement,
+    CacheSortedSetPutElements,
+)
+from momento.responses.response import CacheResponse
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str, str, object]] = []
+        self.list_length = 0
+        self.fail = False
+        # The seconds each of the next writes takes.
+        self.delays: List[float] = []
+
+    async def _record(self, method: str, cache_name: str, name: str, elements: object) -> None:
+        await asyncio.sleep(self.delays.pop(0) if self.delays else 0)
+        self.calls.append((method, cache_name, name, elements))
+
+    async def sorted_set_put_elements(
+        self, cache_name: str, name: str, elements: Mapping[bytes, float], *, ttl: CollectionTtl
+    ) -> CacheResponse:
+        await self._record("sorted_set_put_elements", cache_name, name, dict(elements))
+        if self.fail:
+            return CacheSortedSetPutElements.Error(UnknownException("failed"))
+        return CacheSortedSetPutElements.Success()
+
+    async def dictionary_set_fields(
+        self, cache_name: str, name: str, items: Mapping[bytes, bytes], *, ttl: CollectionTtl
+    ) -> CacheResponse:
+        await self._record("dictionary_set_fields", cache_name, name, dict(items))
+        return CacheDictionarySetFields.Success()
+
+    async def set_add_elements(
+        self, cache_name: str, name: str, elements: List[bytes], *, ttl: CollectionTtl
+    ) -> CacheResponse:
+        await self._record("set_add_elements", cache_name, name, list(elements))
+        return CacheSetAddElements.Success()
+
+    async def list_concatenate_back(
+        self,
+        cache_name: str,
+        name: str,
+        values: List[bytes],
+        *,
+        ttl: CollectionTtl,
+        truncate_front_to_size: Optional[int],
+    ) -> CacheResponse:
+        await self._record("list_concatenate_back", cache_name, name, list(values))
+        self.list_length += len(values)
+        return CacheListConcatenateBack.Success(self.list_length)
+
+
+def _batcher(client: FakeClient, max_batch_size: int = 100, max_delay: timedelta = timedelta(hours=1)) -> AutoBatcher:
+    return AutoBatcher(cast(CacheClientAsync, client), max_delay=max_delay, max_batch_size=max_batch_size)
+
+
+async def test_writes_concurrent_calls_for_a_collection_as_one_batch() -> None:
+    client = FakeClient()
+    batcher = _batcher(client, max_delay=timedelta(milliseconds=1))
+
+    responses = await asyncio.gather(
+        batcher.set_add_element("cache", "set", "a"),
+        batcher.set_add_element("cache", "set", b"b"),
+        batcher.set_add_element("cache", "set", bytearray(b"c")),
+    )
+
+    assert all(isinstance(response, CacheSetAddElement.Success) for response in responses)
+    assert client.calls == [("set_add_elements", "cache", "set", [b"a", b"b", b"c"])]
+
+
+async def test_batches_per_collection_and_operation() -> None:
+    client = FakeClient()
+    batcher = _batcher(client)
+
+    calls = [
+        asyncio.ensure_future(batcher.dictionary_set_field("cache", "one", "field", "first")),
+        asyncio.ensure_future(batcher.dictionary_set_field("cache", "one", "field", "second")),
+        asyncio.ensure_future(batcher.dictionary_set_field("cache", "two", "field", "value")),
+        asyncio.ensure_future(batcher.sorted_set_put_element("cache", "one", "element", 1.0)),
+        asyncio.ensure_future(batcher.list_push_back("other-cache", "one", "value")),
+    ]
+    await asyncio.sleep(0)
+    assert client.calls == []
+    await batcher.flush()
+    responses = await asyncio.gather(*calls)
+
+    assert isinstance(responses[0], CacheDictionarySetField.Success)
+    assert isinstance(responses[3], CacheSortedSetPutElement.Success)
+    assert responses[4] == CacheListPushBack.Success(1)
+    assert sorted(client.calls) == [
+        ("dictionary_set_fields", "cache", "one", {b"field": b"second"}),
+        ("dictionary_set_fields", "cache", "two", {b"field": b"value"}),
+        ("list_concatenate_back", "other-cache", "one", [b"value"]),
+        ("sorted_set_put_elements", "cache", "one", {b"element": 1.0}),
+    ]
+
+
+async def test_writes_a_batch_once_it_is_full() -> None:
+    client = FakeClient()
+    batcher = _batcher(client, max_batch_size=2)
+
+    responses = await asyncio.gather(*(batcher.list_push_back("cache", "list", str(i)) for i in range(4)))
+
+    assert responses == [CacheListPushBack.Success(2)] * 2 + [CacheListPushBack.Success(4)] * 2
+    assert client.calls == [
+        ("list_concatenate_back", "cache", "list", [b"0", b"1"]),
+        ("list_concatenate_back", "cache", "list", [b"2", b"3"]),
+    ]
+
+
+async def test_a_full_batch_waits_for_the_previous_batch_of_its_collection() -> None:
+    client = FakeClient()
+    client.delays = [0.05]
+    batcher = _batcher(client, max_batch_size=2, max_delay=timedelta(milliseconds=1))
+
+    responses = await asyncio.gather(
+        *(batcher.list_push_back("cache", "list", str(i)) for i in range(4)),
+        batcher.set_add_element("cache", "set", "element"),
+    )
+
+    assert responses[:4] == [CacheListPushBack.Success(2)] * 2 + [CacheListPushBack.Success(4)] * 2
+    assert client.calls == [
+        # Other collections do not wait for the slow batch.
+        ("set_add_elements", "cache", "set", [b"element"]),
+        ("list_concatenate_back", "cache", "list", [b"0", b"1"]),
+        ("list_concatenate_back", "cache", "list", [b"2", b"3"]),
+    ]
+    assert batcher._latest_sends == {}
+
+
+async def test_every_call_in_a_batch_gets_its_error() -> None:
+    client = FakeClient()
+    client.fail = True
+    batcher = _batcher(client, max_delay=timedelta(milliseconds=1))
+
+    responses = await asyncio.gather(
+        batcher.sorted_set_put_element("cache", "sorted-set", "a", 1.0),
+        batcher.sorted_set_put_element("cache", "sorted-set", "b", 2.0),
+    )
+
+    assert all(isinstance(response, CacheSortedSetPutElement.Error) for response in responses)
+    assert len(client.calls) == 1
+
+
+async def test_an_invalid_element_only_fails_its_own_call() -> None:
+    client = FakeClient()
+    batcher = _batcher(client, max_delay=timedelta(milliseconds=1))
+
+    invalid, valid = await asyncio.gather(
+        batcher.set_add_element("cache", "set", 1),  # type: ignore[arg-type]
+        batcher.set_add_element("cache", "set", "valid"),
+    )
+
+    assert isinstance(invalid, CacheSetAddElement.Error)
+    assert invalid.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+    assert isinstance(valid, CacheSetAddElement.Success)
+    assert client.calls == [("set_add_elements", "cache", "set", [b"valid"])]
+
+
+async def test_close_writes_buffered_elements() -> None:
+    client = FakeClient()
+    async with _batcher(client) as batcher:
+        call = asyncio.ensure_future(batcher.set_add_element("cache", "set", "a"))
+        await asyncio.sleep(0)
+
+    assert isinstance(await call, CacheSetAddElement.Success)
+    assert client.calls == [("set_add_elements", "cache", "set", [b"a"])]
+
+
+def test_rejects_invalid_limits() -> None:
+    with pytest.raises(InvalidArgumentException):
+        _batcher(FakeClient(), max_batch_size=0)
+    with pytest.raises(InvalidArgumentException):
+        _batcher(FakeClient(), max_delay=timedelta(0))
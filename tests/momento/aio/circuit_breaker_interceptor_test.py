@@ -0,0 +1,80 @@
+import asyncio
+from datetime import timedelta
+from typing import List
+
+import grpc
+import pytest
+from momento.config import CircuitBreakerPolicy
+from momento.config.middleware import CircuitBreakerState
+from momento.errors import CircuitBreakerOpenException
+from momento.internal._utilities._circuit_breaker import _CircuitBreaker
+from momento.internal.aio._circuit_breaker_interceptor import CircuitBreakerInterceptor
+
+
+class _FakeCall:
+    """Just enough of an aio gRPC call for the interceptor."""
+
+    def __init__(self) -> None:
+        self._code: asyncio.Future[grpc.StatusCode] = asyncio.get_running_loop().create_future()
+        self.cancelled = False
+
+    def finish(self, code: grpc.StatusCode) -> None:
+        self._code.set_result(code)
+
+    async def code(self) -> grpc.StatusCode:
+        return await self._code
+
+    def cancel(self) -> bool:
+        self.cancelled = True
+        return True
+
+
+def _interceptor() -> CircuitBreakerInterceptor:
+    policy = CircuitBreakerPolicy(minimum_requests=2, open_duration=timedelta(minutes=1))
+    return CircuitBreakerInterceptor(_CircuitBreaker(policy, 0, []))
+
+
+async def _send(interceptor: CircuitBreakerInterceptor, code: grpc.StatusCode) -> None:
+    call = _FakeCall()
+    call.finish(code)
+
+    async def continuation(_details: object, _request: object) -> _FakeCall:
+        return call
+
+    assert await interceptor.intercept_unary_unary(continuation, object(), "request") is call
+
+
+async def test_opens_the_circuit_once_enough_calls_fail_and_then_fails_fast() -> None:
+    interceptor = _interceptor()
+    await _send(interceptor, grpc.StatusCode.OK)
+    await _send(interceptor, grpc.StatusCode.UNAVAILABLE)
+    assert interceptor._circuit_breaker.state == CircuitBreakerState.OPEN
+
+    continuation_calls: List[object] = []
+
+    async def continuation(_details: object, request: object) -> _FakeCall:
+        continuation_calls.append(request)
+        return _FakeCall()
+
+    with pytest.raises(CircuitBreakerOpenException):
+        await interceptor.intercept_unary_unary(continuation, object(), "request")
+    assert continuation_calls == []
+
+
+async def test_a_cancelled_call_is_cancelled_and_does_not_count_as_a_failure() -> None:
+    interceptor = _interceptor()
+    calls: List[_FakeCall] = []
+
+    async def continuation(_details: object, _request: object) -> _FakeCall:
+        calls.append(_FakeCall())
+        return calls[-1]
+
+    for _ in range(2):
+        intercepted = asyncio.ensure_future(interceptor.intercept_unary_unary(continuation, object(), "request"))
+        await asyncio.sleep(0)
+        intercepted.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await intercepted
+
+    assert [call.cancelled for call in calls] == [True, True]
+    assert interceptor._circuit_breaker.state == CircuitBreakerState.CLOSED
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from typing import AsyncIterator
+
+import pytest
+from momento import CacheClientAsync, Configurations, CredentialProvider
+from momento.config import CompressionConfiguration
+from momento.responses import (
+    CacheDictionaryFetch,
+    CacheGet,
+    CacheListFetch,
+    CacheSetFetch,
+    CacheSetIfEqual,
+)
+
+from tests.momento.in_memory_scs_server import InMemoryScsServer
+
+_COMPRESSIBLE = "<div class='fragment'>momento</div>" * 100
+
+
+@pytest.fixture
+def server(in_memory_scs_server: InMemoryScsServer) -> InMemoryScsServer:
+    return in_memory_scs_server
+
+
+@pytest.fixture
+async def client(in_memory_scs_server: InMemoryScsServer) -> AsyncIterator[CacheClientAsync]:
+    configuration = Configurations.Laptop.latest().with_compression(CompressionConfiguration())
+    async with CacheClientAsync(
+        configuration, CredentialProvider.for_momento_local(port=in_memory_scs_server.port), timedelta(minutes=10)
+    ) as client:
+        yield client
+
+
+async def test_round_trips_compressed_scalar_values(client: CacheClientAsync, server: InMemoryScsServer) -> None:
+    await client.set("cache", "key", _COMPRESSIBLE)
+    await client.set("cache", "small", "value")
+
+    assert server.items[b"key"].startswith(b"\xffMC\x01")
+    assert len(server.items[b"key"]) < len(_COMPRESSIBLE) / 10
+    assert server.items[b"small"] == b"value"
+    get_resp = await client.get("cache", "key")
+    assert isinstance(get_resp, CacheGet.Hit)
+    assert get_resp.value_string == _COMPRESSIBLE
+
+
+async def test_round_trips_binary_values_that_start_with_the_header(
+    client: CacheClientAsync, server: InMemoryScsServer
+) -> None:
+    value = b"\xffMC\x01not compressed"
+    await client.set("cache", "key", value)
+
+    assert server.items[b"key"] == b"\xffMC\x00" + value
+    get_resp = await client.get("cache", "key")
+    assert isinstance(get_resp, CacheGet.Hit)
+    assert get_resp.value_bytes == value
+
+
+async def test_round_trips_compressed_collection_values(client: CacheClientAsync, server: InMemoryScsServer) -> None:
+    await client.dictionary_set_field("cache", "dictionary", "field", _COMPRESSIBLE)
+    await client.list_concatenate_back("cache", "list", [_COMPRESSIBLE, "small"])
+
+    assert server.dictionaries[b"dictionary"][b"field"].startswith(b"\xffMC\x01")
+    assert server.lists[b"list"][0].startswith(b"\xffMC\x01")
+    dictionary_fetch_resp = await client.dictionary_fetch("cache", "dictionary")
+    assert isinstance(dictionary_fetch_resp, CacheDictionaryFetch.Hit)
+    assert dictionary_fetch_resp.value_dictionary_string_string == {"field": _COMPRESSIBLE}
+    list_fetch_resp = await client.list_fetch("cache", "list")
+    assert isinstance(list_fetch_resp, CacheListFetch.Hit)
+    assert list_fetch_resp.value_list_string == [_COMPRESSIBLE, "small"]
+
+
+async def test_set_elements_are_not_compressed(client: CacheClientAsync, server: InMemoryScsServer) -> None:
+    await client.set_add_elements("cache", "set", [_COMPRESSIBLE, b"\xffMC\x01binary"])
+
+    assert server.sets[b"set"] == {_COMPRESSIBLE.encode("utf-8"), b"\xffMC\x01binary"}
+    set_fetch_resp = await client.set_fetch("cache", "set")
+    assert isinstance(set_fetch_resp, CacheSetFetch.Hit)
+    assert set_fetch_resp.value_set_bytes == {_COMPRESSIBLE.encode("utf-8"), b"\xffMC\x01binary"}
+
+
+async def test_compared_values_match_values_compressed_with_the_same_settings(
+    client: CacheClientAsync, server: InMemoryScsServer
+) -> None:
+    await client.set("cache", "key", _COMPRESSIBLE)
+    set_if_resp = await client.set_if_equal("cache", "key", "new", _COMPRESSIBLE)
+    assert isinstance(set_if_resp, CacheSetIfEqual.Stored)
+    assert server.items[b"key"] == b"new"
+
+    await client.list_concatenate_back("cache", "list", [_COMPRESSIBLE, "small"])
+    await client.list_remove_value("cache", "list", _COMPRESSIBLE)
+    assert server.lists[b"list"] == [b"small"]
@@ -0,0 +1,178 @@
+import asyncio
+from datetime import timedelta
+from typing import List, Optional, Tuple, cast
+
+import pytest
+from momento import CacheClientAsync, CounterAggregatorAsync, CounterDeliveryPolicy
+from momento.errors import (
+    FailedPreconditionException,
+    InvalidArgumentException,
+    NotFoundException,
+    TimeoutException,
+)
+from momento.internal.services import Service
+from momento.requests import CollectionTtl
+from momento.responses import CacheDictionaryIncrement, CacheIncrement
+from momento.responses.response import CacheResponse
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Optional[str], bytes, int]] = []
+        self.errors: List[Exception] = []
+
+    async def increment(
+        self, cache_name: str, key: bytes, amount: int = 1, ttl: Optional[timedelta] = None
+    ) -> CacheResponse:
+        await asyncio.sleep(0)
+        self.calls.append((cache_name, None, key, amount))
+        if self.errors:
+            return CacheIncrement.Error(self.errors.pop(0))  # type: ignore[arg-type]
+        return CacheIncrement.Success(amount)
+
+    async def dictionary_increment(
+        self, cache_name: str, dictionary_name: str, field: bytes, amount: int = 1, *, ttl: CollectionTtl
+    ) -> CacheResponse:
+        await asyncio.sleep(0)
+        self.calls.append((cache_name, dictionary_name, field, amount))
+        return CacheDictionaryIncrement.Success(amount)
+
+
+def _aggregator(
+    client: FakeClient,
+    flush_interval: timedelta = timedelta(hours=1),
+    flush_threshold: int = 1000,
+    delivery: CounterDeliveryPolicy = CounterDeliveryPolicy.AT_MOST_ONCE,
+    flush_on_close: bool = True,
+) -> CounterAggregatorAsync:
+    return CounterAggregatorAsync(
+        cast(CacheClientAsync, client),
+        flush_interval=flush_interval,
+        flush_threshold=flush_threshold,
+        delivery=delivery,
+        flush_on_close=flush_on_close,
+    )
+
+
+async def test_sums_increments_per_key_and_field() -> None:
+    client = FakeClient()
+    counters = _aggregator(client)
+
+    for _ in range(3):
+        counters.increment("cache", "views")
+    counters.increment("cache", b"views", 5)
+    counters.increment("cache", "clicks", -1)
+    counters.dictionary_increment("cache", "counts", "views", 2)
+    counters.dictionary_increment("cache", "counts", "views", 2)
+    await counters.flush()
+
+    assert sorted(client.calls, key=repr) == sorted(
+        [
+            ("cache", None, b"views", 8),
+            ("cache", None, b"clicks", -1),
+            ("cache", "counts", b"views", 4),
+        ],
+        key=repr,
+    )
+    stats = counters.get_stats()
+    assert (stats.increments, stats.requests, stats.flushes, stats.pending_increments) == (7, 3, 1, 0)
+    assert stats.coalescing_ratio == pytest.approx(7 / 3)
+    assert stats.last_flush_latency == stats.max_flush_latency == stats.total_flush_latency
+
+
+async def test_flushes_after_the_interval() -> None:
+    client = FakeClient()
+    counters = _aggregator(client, flush_interval=timedelta(milliseconds=1))
+
+    counters.increment("cache", "views")
+    counters.increment("cache", "views")
+    await asyncio.sleep(0.05)
+
+    assert client.calls == [("cache", None, b"views", 2)]
+
+
+async def test_flushes_at_the_threshold() -> None:
+    client = FakeClient()
+    counters = _aggregator(client, flush_threshold=3)
+
+    for _ in range(3):
+        counters.increment("cache", "views")
+    await asyncio.sleep(0.01)
+    counters.increment("cache", "views")
+
+    assert client.calls == [("cache", None, b"views", 3)]
+    assert counters.get_stats().pending_increments == 1
+
+
+async def test_at_most_once_drops_the_increments_of_a_failed_request() -> None:
+    client = FakeClient()
+    client.errors.append(TimeoutException("timed out", Service.CACHE))
+    counters = _aggregator(client)
+
+    counters.increment("cache", "views", 2)
+    await counters.flush()
+    await counters.flush()
+
+    assert client.calls == [("cache", None, b"views", 2)]
+    stats = counters.get_stats()
+    assert (stats.failed_requests, stats.dropped_increments) == (1, 1)
+
+
+async def test_at_least_once_retries_the_increments_of_a_failed_request() -> None:
+    client = FakeClient()
+    client.errors.append(TimeoutException("timed out", Service.CACHE))
+    counters = _aggregator(client, delivery=CounterDeliveryPolicy.AT_LEAST_ONCE)
+
+    counters.increment("cache", "views", 2)
+    await counters.flush()
+    counters.increment("cache", "views", 3)
+    await counters.flush()
+
+    assert client.calls == [("cache", None, b"views", 2), ("cache", None, b"views", 5)]
+    stats = counters.get_stats()
+    assert (stats.failed_requests, stats.dropped_increments, stats.flushed_increments) == (1, 0, 3)
+
+
+async def test_at_least_once_drops_increments_that_cannot_succeed() -> None:
+    client = FakeClient()
+    client.errors.append(NotFoundException("no such cache", Service.CACHE))
+    counters = _aggregator(client, delivery=CounterDeliveryPolicy.AT_LEAST_ONCE)
+
+    counters.increment("cache", "views")
+    await counters.flush()
+
+    assert counters.get_stats().dropped_increments == 1
+    assert counters.get_stats().pending_increments == 0
+
+
+async def test_close_flushes_and_rejects_further_increments() -> None:
+    client = FakeClient()
+    async with _aggregator(client) as counters:
+        counters.increment("cache", "views")
+
+    assert client.calls == [("cache", None, b"views", 1)]
+    with pytest.raises(FailedPreconditionException):
+        counters.increment("cache", "views")
+
+
+async def test_close_can_drop_pending_increments() -> None:
+    client = FakeClient()
+    counters = _aggregator(client, flush_on_close=False)
+
+    counters.increment("cache", "views")
+    await counters.close()
+
+    assert client.calls == []
+    assert counters.get_stats().dropped_increments == 1
+
+
+async def test_rejects_invalid_increments() -> None:
+    counters = _aggregator(FakeClient())
+
+    with pytest.raises(InvalidArgumentException):
+        counters.increment("", "views")
+    with pytest.raises(InvalidArgumentException):
+        counters.increment("cache", "views", 1.5)  # type: ignore[arg-type]
+    with pytest.raises(InvalidArgumentException):
+        counters.dictionary_increment("cache", "counts", 1)  # type: ignore[arg-type]
+    assert counters.get_stats().increments == 0
@@ -0,0 +1,82 @@
+from datetime import timedelta
+from typing import AsyncIterator
+
+import grpc
+import pytest
+from momento import Configurations, CredentialProvider
+from momento.config import CircuitBreakerPolicy
+from momento.internal.aio._scs_grpc_manager import _DataGrpcManager
+
+
+@pytest.fixture
+async def grpc_manager() -> AsyncIterator[_DataGrpcManager]:
+    # Channels connect lazily, so nothing needs to listen on the port.
+    grpc_manager = _DataGrpcManager(
+        Configurations.Laptop.latest().with_num_channels(3), CredentialProvider.for_momento_local(port=1)
+    )
+    yield grpc_manager
+    await grpc_manager.close()
+
+
+def _set_in_flight(grpc_manager: _DataGrpcManager, *counts: int) -> None:
+    for in_flight_counter, count in zip(grpc_manager._in_flight_counters, counts):
+        in_flight_counter.in_flight = count
+
+
+async def test_picks_the_channel_with_the_fewest_requests_in_flight(grpc_manager: _DataGrpcManager) -> None:
+    _set_in_flight(grpc_manager, 2, 0, 1)
+
+    assert [grpc_manager._least_loaded_channel_index() for _ in range(3)] == [1, 1, 1]
+    assert grpc_manager.in_flight_counts() == [2, 0, 1]
+
+
+async def test_spreads_ties_across_the_channels(grpc_manager: _DataGrpcManager) -> None:
+    assert [grpc_manager._least_loaded_channel_index() for _ in range(3)] == [0, 1, 2]
+
+
+async def test_avoids_the_given_channel(grpc_manager: _DataGrpcManager) -> None:
+    _set_in_flight(grpc_manager, 2, 0, 1)
+
+    assert grpc_manager._least_loaded_channel_index(avoid=1) == 2
+    assert grpc_manager.async_stub(avoid=grpc_manager._stubs[1]) is grpc_manager._stubs[2]
+
+
+@pytest.fixture
+async def grpc_manager_with_circuit_breakers() -> AsyncIterator[_DataGrpcManager]:
+    configuration = (
+        Configurations.Laptop.latest()
+        .with_num_channels(3)
+        .with_circuit_breaker(CircuitBreakerPolicy(minimum_requests=1, open_duration=timedelta(minutes=1)))
+    )
+    grpc_manager = _DataGrpcManager(configuration, CredentialProvider.for_momento_local(port=1))
+    yield grpc_manager
+    await grpc_manager.close()
+
+
+def _open_circuit(grpc_manager: _DataGrpcManager, *channel_indexes: int) -> None:
+    for channel_index in channel_indexes:
+        circuit_breaker = grpc_manager._circuit_breakers[channel_index]
+        assert circuit_breaker is not None
+        circuit_breaker.record(grpc.StatusCode.UNAVAILABLE, circuit_breaker.acquire())
+
+
+async def test_skips_channels_whose_circuit_is_open(grpc_manager_with_circuit_breakers: _DataGrpcManager) -> None:
+    grpc_manager = grpc_manager_with_circuit_breakers
+    _set_in_flight(grpc_manager, 0, 1, 2)
+    _open_circuit(grpc_manager, 0)
+
+    assert [grpc_manager._least_loaded_channel_index() for _ in range(3)] == [1, 1, 1]
+    _open_circuit(grpc_manager, 1)
+    assert [grpc_manager._least_loaded_channel_index() for _ in range(3)] == [2, 2, 2]
+    # A hedge avoiding the only healthy channel goes to an open one and fails fast.
+    assert grpc_manager._least_loaded_channel_index(avoid=2) == 0
+
+
+async def test_uses_open_channels_when_every_circuit_is_open(
+    grpc_manager_with_circuit_breakers: _DataGrpcManager,
+) -> None:
+    grpc_manager = grpc_manager_with_circuit_breakers
+    _set_in_flight(grpc_manager, 1, 0, 2)
+    _open_circuit(grpc_manager, 0, 1, 2)
+
+    assert grpc_manager._least_loaded_channel_index() == 1
@@ -0,0 +1,69 @@
+import asyncio
+from typing import Callable, List
+
+import grpc
+import pytest
+from momento.internal.aio._in_flight_count_interceptor import InFlightCountInterceptor
+
+
+class _FakeCall:
+    """Just enough of an aio gRPC call for the interceptor."""
+
+    def __init__(self) -> None:
+        self._code: asyncio.Future[grpc.StatusCode] = asyncio.get_running_loop().create_future()
+        self._done_callbacks: List[Callable[[object], None]] = []
+
+    def finish(self, code: grpc.StatusCode) -> None:
+        self._code.set_result(code)
+        for callback in self._done_callbacks:
+            callback(self)
+
+    async def code(self) -> grpc.StatusCode:
+        return await self._code
+
+    def add_done_callback(self, callback: Callable[[object], None]) -> None:
+        self._done_callbacks.append(callback)
+
+
+@pytest.mark.parametrize("code", [grpc.StatusCode.OK, grpc.StatusCode.UNAVAILABLE])
+async def test_counts_a_unary_call_until_it_completes(code: grpc.StatusCode) -> None:
+    interceptor = InFlightCountInterceptor()
+    call = _FakeCall()
+
+    async def continuation(_details: object, _request: object) -> _FakeCall:
+        return call
+
+    intercepted = asyncio.ensure_future(interceptor.intercept_unary_unary(continuation, object(), "request"))
+    await asyncio.sleep(0)
+    assert interceptor.in_flight == 1
+
+    call.finish(code)
+    assert await intercepted is call
+    assert interceptor.in_flight == 0
+
+
+async def test_counts_a_stream_until_it_completes() -> None:
+    interceptor = InFlightCountInterceptor()
+    call = _FakeCall()
+
+    async def continuation(_details: object, _request: object) -> _FakeCall:
+        return call
+
+    await interceptor.intercept_unary_stream(continuation, object(), "request")
+    assert interceptor.in_flight == 1
+
+    call.finish(grpc.StatusCode.OK)
+    assert interceptor.in_flight == 0
+
+
+async def test_stops_counting_a_call_whose_continuation_raises() -> None:
+    interceptor = InFlightCountInterceptor()
+
+    async def continuation(_details: object, _request: object) -> _FakeCall:
+        raise RuntimeError("channel closed")
+
+    with pytest.raises(RuntimeError):
+        await interceptor.intercept_unary_unary(continuation, object(), "request")
+    with pytest.raises(RuntimeError):
+        await interceptor.intercept_unary_stream(continuation, object(), "request")
+    assert interceptor.in_flight == 0
@@ -0,0 +1,90 @@
+from datetime import timedelta
+from typing import AsyncIterator, Set
+
+import grpc
+import pytest
+from momento import CacheClientAsync, Configurations, CredentialProvider
+from momento.responses import CacheDelete, CacheGetLarge, CacheSetLarge
+
+from tests.momento.in_memory_scs_server import InMemoryScsServer
+
+
+@pytest.fixture
+def server(in_memory_scs_server: InMemoryScsServer) -> InMemoryScsServer:
+    return in_memory_scs_server
+
+
+@pytest.fixture
+async def client(in_memory_scs_server: InMemoryScsServer) -> AsyncIterator[CacheClientAsync]:
+    async with CacheClientAsync(
+        Configurations.Laptop.latest(),
+        CredentialProvider.for_momento_local(port=in_memory_scs_server.port),
+        timedelta(minutes=10),
+    ) as client:
+        yield client
+
+
+def _chunk_keys(server: InMemoryScsServer) -> Set[bytes]:
+    return {key for key in server.items if b"\x00chunk\x00" in key}
+
+
+async def test_overwriting_a_value_deletes_its_chunks(client: CacheClientAsync, server: InMemoryScsServer) -> None:
+    await client.set_large("cache", "key", b"a" * 100, chunk_size=10)
+    first_chunks = _chunk_keys(server)
+    assert len(first_chunks) == 10
+
+    set_resp = await client.set_large("cache", "key", b"b" * 50, chunk_size=10)
+    assert isinstance(set_resp, CacheSetLarge.Success)
+    second_chunks = _chunk_keys(server)
+    assert len(second_chunks) == 5
+    assert not first_chunks & second_chunks
+    get_resp = await client.get_large("cache", "key")
+    assert isinstance(get_resp, CacheGetLarge.Hit)
+    assert get_resp.value_bytes == b"b" * 50
+
+    await client.set_large("cache", "key", b"small", chunk_size=10)
+    assert _chunk_keys(server) == set()
+    assert server.items == {b"key": b"small"}
+
+
+async def test_a_failed_chunk_delete_does_not_fail_the_write(
+    client: CacheClientAsync, server: InMemoryScsServer
+) -> None:
+    await client.set_large("cache", "key", b"a" * 20, chunk_size=10)
+    server.failures["Delete"] = [grpc.StatusCode.NOT_FOUND]
+
+    set_resp = await client.set_large("cache", "key", b"b" * 20, chunk_size=10)
+    assert isinstance(set_resp, CacheSetLarge.Success)
+    get_resp = await client.get_large("cache", "key")
+    assert isinstance(get_resp, CacheGetLarge.Hit)
+    assert get_resp.value_bytes == b"b" * 20
+
+
+async def test_delete_large_deletes_the_value_and_its_chunks(
+    client: CacheClientAsync, server: InMemoryScsServer
+) -> None:
+    await client.set_large("cache", "key", b"a" * 100, chunk_size=10)
+
+    delete_resp = await client.delete_large("cache", "key")
+    assert isinstance(delete_resp, CacheDelete.Success)
+    assert server.items == {}
+    assert isinstance(await client.get_large("cache", "key"), CacheGetLarge.Miss)
+
+    await client.set("cache", "plain", "value")
+    assert isinstance(await client.delete_large("cache", "plain"), CacheDelete.Success)
+    assert server.items == {}
+
+
+@pytest.mark.parametrize("value", [b"\xffML\x01not a manifest", b"\xffML\x00header-like", b"\xffML"])
+async def test_reads_back_small_values_that_start_like_a_manifest(
+    client: CacheClientAsync, server: InMemoryScsServer, value: bytes
+) -> None:
+    await client.set_large("cache", "key", value)
+
+    get_resp = await client.get_large("cache", "key")
+    assert isinstance(get_resp, CacheGetLarge.Hit)
+    assert get_resp.value_bytes == value
+    # Overwriting the value does not take it for the manifest of chunks to delete.
+    set_resp = await client.set_large("cache", "key", b"a" * 20, chunk_size=10)
+    assert isinstance(set_resp, CacheSetLarge.Success)
+    assert server.calls["Delete"] == 0
@@ -0,0 +1,112 @@
+import asyncio
+from datetime import timedelta
+from typing import AsyncIterator
+
+import pytest
+from momento import CacheClientAsync, Configurations, CredentialProvider
+from momento.config import NearCacheConfiguration
+from momento.requests import CollectionTtl
+from momento.responses import CacheDictionaryFetch, CacheGet, CacheSetFetch
+
+from tests.momento.in_memory_scs_server import InMemoryScsServer
+
+
+@pytest.fixture
+def server(in_memory_scs_server: InMemoryScsServer) -> InMemoryScsServer:
+    return in_memory_scs_server
+
+
+@pytest.fixture
+async def client(in_memory_scs_server: InMemoryScsServer) -> AsyncIterator[CacheClientAsync]:
+    configuration = Configurations.Laptop.latest().with_near_cache(NearCacheConfiguration(timedelta(minutes=1)))
+    async with CacheClientAsync(
+        configuration, CredentialProvider.for_momento_local(port=in_memory_scs_server.port), timedelta(minutes=10)
+    ) as client:
+        yield client
+
+
+async def test_serves_repeated_reads_from_memory(client: CacheClientAsync, server: InMemoryScsServer) -> None:
+    server.items[b"key"] = b"value"
+
+    for _ in range(3):
+        get_resp = await client.get("cache", "key")
+        assert isinstance(get_resp, CacheGet.Hit)
+        assert get_resp.value_string == "value"
+
+    assert server.calls["Get"] == 1
+    near_cache_stats = client.get_near_cache_stats()
+    assert near_cache_stats is not None
+    assert near_cache_stats.hits == 2
+
+
+async def test_writes_through_the_client_invalidate_the_entry(
+    client: CacheClientAsync, server: InMemoryScsServer
+) -> None:
+    await client.set("cache", "key", "old")
+    await client.get("cache", "key")
+    await client.set("cache", "key", "new")
+
+    get_resp = await client.get("cache", "key")
+    assert isinstance(get_resp, CacheGet.Hit)
+    assert get_resp.value_string == "new"
+
+    await client.delete("cache", "key")
+    assert isinstance(await client.get("cache", "key"), CacheGet.Miss)
+    assert server.calls["Get"] == 3
+
+
+async def test_collection_writes_invalidate_the_entry(client: CacheClientAsync, server: InMemoryScsServer) -> None:
+    await client.dictionary_set_field("cache", "dictionary", "a", "1")
+    await client.set_add_element("cache", "set", "a")
+    await client.dictionary_fetch("cache", "dictionary")
+    await client.set_fetch("cache", "set")
+
+    await client.dictionary_set_field("cache", "dictionary", "b", "2")
+    await client.set_add_element("cache", "set", "b")
+
+    dictionary_fetch_resp = await client.dictionary_fetch("cache", "dictionary")
+    assert isinstance(dictionary_fetch_resp, CacheDictionaryFetch.Hit)
+    assert dictionary_fetch_resp.value_dictionary_string_string == {"a": "1", "b": "2"}
+    set_fetch_resp = await client.set_fetch("cache", "set")
+    assert isinstance(set_fetch_resp, CacheSetFetch.Hit)
+    assert set_fetch_resp.value_set_string == {"a", "b"}
+    assert server.calls["DictionaryFetch"] == 2
+    assert server.calls["SetFetch"] == 2
+
+
+async def test_changing_a_hit_does_not_change_later_hits(client: CacheClientAsync, server: InMemoryScsServer) -> None:
+    server.sets[b"set"] = {b"a"}
+    server.dictionaries[b"dictionary"] = {b"a": b"1"}
+
+    for _ in range(2):
+        set_fetch_resp = await client.set_fetch("cache", "set")
+        assert isinstance(set_fetch_resp, CacheSetFetch.Hit)
+        assert set_fetch_resp.value_set_bytes == {b"a"}
+        set_fetch_resp.value_set_bytes.add(b"b")
+
+        dictionary_fetch_resp = await client.dictionary_fetch("cache", "dictionary")
+        assert isinstance(dictionary_fetch_resp, CacheDictionaryFetch.Hit)
+        assert dictionary_fetch_resp.value_dictionary_bytes_bytes == {b"a": b"1"}
+        dictionary_fetch_resp.value_dictionary_bytes_bytes[b"b"] = b"2"
+
+    assert server.calls["SetFetch"] == 1
+    assert server.calls["DictionaryFetch"] == 1
+
+
+async def test_entries_expire_with_the_ttl_this_client_wrote(
+    client: CacheClientAsync, server: InMemoryScsServer
+) -> None:
+    await client.set("cache", "key", "value", ttl=timedelta(milliseconds=50))
+    await client.dictionary_set_field("cache", "dictionary", "a", "1", ttl=CollectionTtl.of(timedelta(milliseconds=50)))
+    await client.get("cache", "key")
+    await client.dictionary_fetch("cache", "dictionary")
+    await client.get("cache", "key")
+    await client.dictionary_fetch("cache", "dictionary")
+    assert server.calls["Get"] == 1
+    assert server.calls["DictionaryFetch"] == 1
+
+    await asyncio.sleep(0.1)
+    await client.get("cache", "key")
+    await client.dictionary_fetch("cache", "dictionary")
+    assert server.calls["Get"] == 2
+    assert server.calls["DictionaryFetch"] == 2
@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+from typing import Callable, Coroutine, List, Optional
+
+import grpc
+from momento.config.transport.transport_strategy import AdaptiveTransportStrategy, StaticGrpcConfiguration
+from momento.internal._utilities._adaptive_deadlines import _AdaptiveDeadlines
+from momento.internal._utilities._retry_token_bucket import _RetryTokenBucket
+from momento.internal.aio._retry_interceptor import RetryInterceptor
+from momento.retry import RetryableProps, RetryBudget, RetryStrategy
+
+GET_METHOD = "/cache_client.Scs/Get"
+
+
+class _FakeCall:
+    """Just enough of an aio gRPC call for the interceptor."""
+
+    def __init__(self, code: grpc.StatusCode) -> None:
+        self._code = code
+
+    async def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def cancel(self) -> bool:
+        return False
+
+
+class _FakeDetails:
+    method = GET_METHOD.encode("utf-8")
+    timeout: Optional[float] = 5.0
+    metadata = None
+    credentials = None
+    wait_for_ready = None
+
+
+class _NeverRetryStrategy(RetryStrategy):
+    def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+        return None
+
+
+class _RetryTwiceStrategy(RetryStrategy):
+    def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+        return 0.01 if props.attempt_number <= 2 else None
+
+    def calculate_retry_deadline(self, overall_deadline: datetime) -> Optional[float]:
+        return None
+
+
+def _continuation(
+    codes: List[grpc.StatusCode], timeouts: List[Optional[float]]
+) -> Callable[[grpc.aio.ClientCallDetails, object], Coroutine[object, object, _FakeCall]]:
+    async def continuation(details: grpc.aio.ClientCallDetails, _request: object) -> _FakeCall:
+        timeouts.append(details.timeout)
+        return _FakeCall(codes.pop(0))
+
+    return continuation
+
+
+def _adaptive_deadlines() -> _AdaptiveDeadlines:
+    transport_strategy = AdaptiveTransportStrategy(
+        StaticGrpcConfiguration(deadline=timedelta(seconds=5)), min_deadline=timedelta(milliseconds=1)
+    )
+    adaptive_deadlines = _AdaptiveDeadlines(transport_strategy)
+    for _ in range(100):
+        adaptive_deadlines.record(GET_METHOD, grpc.StatusCode.OK, 0.010)
+    return adaptive_deadlines
+
+
+async def test_resends_an_attempt_abandoned_at_its_adaptive_deadline() -> None:
+    codes = [grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.OK]
+    timeouts: List[Optional[float]] = []
+    interceptor = RetryInterceptor(_NeverRetryStrategy(), adaptive_deadlines=_adaptive_deadlines())
+
+    call = await interceptor.intercept_unary_unary(_continuation(codes, timeouts), _FakeDetails(), "request")
+
+    assert await call.code() == grpc.StatusCode.OK
+    assert len(timeouts) == 2
+    assert timeouts[0] is not None and 0.020 <= timeouts[0] <= 0.023
+    assert timeouts[1] is not None and 4.9 <= timeouts[1] <= 5.0
+
+
+async def test_resends_spend_the_retry_budget() -> None:
+    retry_token_bucket = _RetryTokenBucket(RetryBudget(retry_ratio=0.1, max_tokens=1))
+    codes = [grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.OK, grpc.StatusCode.DEADLINE_EXCEEDED]
+    interceptor = RetryInterceptor(_NeverRetryStrategy(), retry_token_bucket, _adaptive_deadlines())
+
+    call = await interceptor.intercept_unary_unary(_continuation(codes, []), _FakeDetails(), "request")
+    assert await call.code() == grpc.StatusCode.OK
+
+    # The first re-send spent the only token, so the next abandoned attempt is not sent again.
+    call = await interceptor.intercept_unary_unary(_continuation(codes, []), _FakeDetails(), "request")
+    assert await call.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert codes == []
+
+
+async def test_retries_only_get_the_rest_of_the_overall_deadline() -> None:
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    timeouts: List[Optional[float]] = []
+    interceptor = RetryInterceptor(_RetryTwiceStrategy())
+
+    call = await interceptor.intercept_unary_unary(_continuation(codes, timeouts), _FakeDetails(), "request")
+
+    assert await call.code() == grpc.StatusCode.OK
+    assert timeouts[0] == 5.0
+    assert len(timeouts) == 3
+    assert all(timeout is not None and timeout < 5.0 for timeout in timeouts[1:])
+
+
+async def test_does_not_retry_when_the_delay_would_pass_the_overall_deadline() -> None:
+    class _ShortDetails(_FakeDetails):
+        timeout = 0.005
+
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    interceptor = RetryInterceptor(_RetryTwiceStrategy())
+
+    call = await interceptor.intercept_unary_unary(_continuation(codes, []), _ShortDetails(), "request")
+
+    assert await call.code() == grpc.StatusCode.UNAVAILABLE
+    assert len(codes) == 1
+
+
+async def test_retries_calls_without_a_timeout_without_limiting_their_attempts() -> None:
+    class _NoTimeoutDetails(_FakeDetails):
+        timeout = None
+
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    timeouts: List[Optional[float]] = []
+    interceptor = RetryInterceptor(_RetryTwiceStrategy())
+
+    call = await interceptor.intercept_unary_unary(_continuation(codes, timeouts), _NoTimeoutDetails(), "request")
+
+    assert await call.code() == grpc.StatusCode.OK
+    assert timeouts == [None, None, None]
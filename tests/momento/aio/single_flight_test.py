@@ -0,0 +1,66 @@
+import asyncio
+
+from momento.internal.aio._single_flight import _SingleFlight
+
+
+async def test_concurrent_calls_with_the_same_key_share_one_execution() -> None:
+    single_flight = _SingleFlight()
+    executions = 0
+    release = asyncio.Event()
+
+    async def work() -> object:
+        nonlocal executions
+        executions += 1
+        await release.wait()
+        return object()
+
+    calls = [asyncio.ensure_future(single_flight.do("key", work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    assert executions == 1
+    assert all(result is results[0] for result in results)
+    assert single_flight.coalesced_count == 4
+
+
+async def test_calls_with_different_keys_or_after_completion_run_separately() -> None:
+    single_flight = _SingleFlight()
+
+    async def work() -> object:
+        await asyncio.sleep(0)
+        return object()
+
+    first, second = await asyncio.gather(single_flight.do("a", work), single_flight.do("b", work))
+    third = await single_flight.do("a", work)
+
+    assert first is not second
+    assert first is not third
+    assert single_flight.coalesced_count == 0
+
+
+async def test_a_cancelled_caller_does_not_cancel_the_shared_work() -> None:
+    single_flight = _SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        return "done"
+
+    cancelled = asyncio.ensure_future(single_flight.do("key", work))
+    waiting = asyncio.ensure_future(single_flight.do("key", work))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    release.set()
+
+    assert await waiting == "done"
+    assert cancelled.cancelled()
+
+
+async def test_unhashable_keys_are_not_coalesced() -> None:
+    single_flight = _SingleFlight()
+
+    async def work() -> str:
+        return "done"
+
+    assert await single_flight.do(("key", ["unhashable"]), work) == "done"
@@ -13,6 +13,7 @@ from momento.internal._utilities import _gen_dictionary_items_as_bytes
 from momento.requests import CollectionTtl
 from momento.responses import (
     CacheDictionaryFetch,
+    CacheDictionaryFetchObjects,
     CacheDictionaryGetField,
     CacheDictionaryGetFieldResponse,
     CacheDictionaryGetFields,
@@ -568,6 +569,29 @@ def describe_dictionary_fetch() -> None:
         assert isinstance(fetch_response, CacheDictionaryFetch.Miss)
 
 
+def describe_dictionary_set_object_fields_and_dictionary_fetch_objects() -> None:
+    async def round_trips_the_field_values(
+        client_async: CacheClientAsync, cache_name: TCacheName, dictionary_name: TDictionaryName
+    ) -> None:
+        items: dict[str | bytes, object] = {"profile": {"name": "momento", "age": 5}, "tags": ["a", "b"], b"count": 3}
+        set_resp = await client_async.dictionary_set_object_fields(cache_name, dictionary_name, items)
+        assert isinstance(set_resp, CacheDictionarySetFields.Success)
+
+        fetch_resp = await client_async.dictionary_fetch_objects(cache_name, dictionary_name)
+        assert isinstance(fetch_resp, CacheDictionaryFetchObjects.Hit)
+        assert fetch_resp.value_dictionary == {
+            "profile": {"name": "momento", "age": 5},
+            "tags": ["a", "b"],
+            "count": 3,
+        }
+
+    async def misses_when_the_dictionary_does_not_exist(
+        client_async: CacheClientAsync, cache_name: TCacheName, dictionary_name: TDictionaryName
+    ) -> None:
+        fetch_resp = await client_async.dictionary_fetch_objects(cache_name, dictionary_name)
+        assert isinstance(fetch_resp, CacheDictionaryFetchObjects.Miss)
+
+
 @behaves_like(
     a_cache_name_validator,
     a_connection_validator,
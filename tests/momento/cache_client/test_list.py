@@ -15,11 +15,13 @@ from momento.responses import (
     CacheListConcatenateBack,
     CacheListConcatenateFront,
     CacheListFetch,
+    CacheListFetchObjects,
     CacheListLength,
     CacheListPopBack,
     CacheListPopFront,
     CacheListPushBack,
     CacheListPushFront,
+    CacheListRetain,
     CacheResponse,
 )
 from momento.responses.mixins import ErrorResponseMixin
@@ -475,6 +477,55 @@ def describe_list_fetch() -> None:
         resp = client.list_fetch(cache_name, list_name)
         assert isinstance(resp, CacheListFetch.Miss)
 
+    @pytest.mark.parametrize(
+        "start_index, end_index, expected_values",
+        [
+            (None, None, ["a", "b", "c", "d", "e"]),
+            (1, 3, ["b", "c"]),
+            (2, None, ["c", "d", "e"]),
+            (None, 2, ["a", "b"]),
+            (-2, None, ["d", "e"]),
+            (1, -1, ["b", "c", "d"]),
+        ],
+    )
+    def it_fetches_the_index_range(
+        start_index: int | None,
+        end_index: int | None,
+        expected_values: list[str],
+        client: CacheClient,
+        cache_name: TCacheName,
+        list_name: TListName,
+    ) -> None:
+        client.list_concatenate_back(cache_name, list_name, ["a", "b", "c", "d", "e"])
+
+        fetch_resp = client.list_fetch(cache_name, list_name, start_index, end_index)
+        assert isinstance(fetch_resp, CacheListFetch.Hit)
+        assert fetch_resp.value_list_string == expected_values
+
+
+def describe_list_concatenate_back_objects_and_list_fetch_objects() -> None:
+    def round_trips_the_values_in_order(client: CacheClient, cache_name: TCacheName, list_name: TListName) -> None:
+        values = [{"id": 1}, [2, 3], "four", None]
+        concatenate_resp = client.list_concatenate_back_objects(cache_name, list_name, values)
+        assert isinstance(concatenate_resp, CacheListConcatenateBack.Success)
+        assert concatenate_resp.list_length == len(values)
+
+        fetch_resp = client.list_fetch_objects(cache_name, list_name)
+        assert isinstance(fetch_resp, CacheListFetchObjects.Hit)
+        assert fetch_resp.value_list == values
+
+    def misses_when_the_list_does_not_exist(client: CacheClient, cache_name: TCacheName, list_name: TListName) -> None:
+        fetch_resp = client.list_fetch_objects(cache_name, list_name)
+        assert isinstance(fetch_resp, CacheListFetchObjects.Miss)
+
+    def fetches_the_index_range(client: CacheClient, cache_name: TCacheName, list_name: TListName) -> None:
+        values = [{"id": 1}, [2, 3], "four", None]
+        client.list_concatenate_back_objects(cache_name, list_name, values)
+
+        fetch_resp = client.list_fetch_objects(cache_name, list_name, 1, 3)
+        assert isinstance(fetch_resp, CacheListFetchObjects.Hit)
+        assert fetch_resp.value_list == values[1:3]
+
 
 @behaves_like(
     a_cache_name_validator,
@@ -771,3 +822,59 @@ def describe_list_remove_value() -> None:
             assert fetch_resp.value_list_string == expected_values
         else:
             raise AssertionError("Expected a CacheListFetch.Hit")
+
+
+@behaves_like(
+    a_cache_name_validator,
+    a_connection_validator,
+    a_list_name_validator,
+)
+def describe_list_retain() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        list_name = uuid_str()
+        return partial(client.list_retain, list_name=list_name)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, list_name: TListName) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.list_retain(cache_name, list_name)
+
+        return _connection_validator
+
+    @fixture
+    def list_name_validator(client: CacheClient, cache_name: TCacheName) -> TListNameValidator:
+        return partial(client.list_retain, cache_name=cache_name)
+
+    @pytest.mark.parametrize(
+        "start_index, end_index, expected_values",
+        [
+            (None, None, ["a", "b", "c", "d", "e"]),
+            (1, 3, ["b", "c"]),
+            (-2, None, ["d", "e"]),
+            (1, -1, ["b", "c", "d"]),
+        ],
+    )
+    def it_keeps_only_the_index_range(
+        start_index: int | None,
+        end_index: int | None,
+        expected_values: list[str],
+        client: CacheClient,
+        cache_name: TCacheName,
+        list_name: TListName,
+    ) -> None:
+        client.list_concatenate_back(cache_name, list_name, ["a", "b", "c", "d", "e"])
+
+        retain_resp = client.list_retain(cache_name, list_name, start_index, end_index)
+        assert isinstance(retain_resp, CacheListRetain.Success)
+        assert retain_resp.list_length == len(expected_values)
+
+        fetch_resp = client.list_fetch(cache_name, list_name)
+        assert isinstance(fetch_resp, CacheListFetch.Hit)
+        assert fetch_resp.value_list_string == expected_values
+
+    def it_misses_when_the_list_does_not_exist(
+        client: CacheClient, cache_name: TCacheName, list_name: TListName
+    ) -> None:
+        resp = client.list_retain(cache_name, list_name, 0, 1)
+        assert isinstance(resp, CacheListRetain.Miss)
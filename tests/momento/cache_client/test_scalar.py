@@ -1,13 +1,41 @@
+import io
+import os
 import time
 from datetime import timedelta
 from functools import partial
-from typing import Optional
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
 
 from momento import CacheClient
 from momento.errors import MomentoErrorCode
-from momento.responses import CacheDelete, CacheGet, CacheSet, CacheSetIfNotExists
+from momento.responses import (
+    CacheDecreaseTtl,
+    CacheDelete,
+    CacheGet,
+    CacheGetBatch,
+    CacheGetLarge,
+    CacheGetObject,
+    CacheIncreaseTtl,
+    CacheItemGetTtl,
+    CacheItemGetType,
+    CacheKeyExists,
+    CacheKeysExist,
+    CacheSet,
+    CacheSetBatch,
+    CacheSetIfAbsent,
+    CacheSetIfAbsentOrEqual,
+    CacheSetIfEqual,
+    CacheSetIfNotEqual,
+    CacheSetIfNotExists,
+    CacheSetIfPresent,
+    CacheSetIfPresentAndNotEqual,
+    CacheSetLarge,
+    CacheUpdateTtl,
+    ItemType,
+)
 from momento.responses.mixins import ErrorResponseMixin
 from momento.responses.response import CacheResponse
+from momento.serialization import PickleSerializer
 from momento.typing import TCacheName, TScalarKey, TScalarValue
 from pytest import fixture
 from pytest_describe import behaves_like
@@ -122,6 +150,139 @@ def describe_set_and_get() -> None:
         assert isinstance(get_resp, CacheGet.Hit)
         assert get_resp.value_bytes == value
 
+    def with_buffer_key_values(client: CacheClient, cache_name: str) -> None:
+        key = bytearray(uuid_bytes())
+        value = memoryview(bytearray(uuid_bytes()))
+
+        set_resp = client.set(cache_name, key, value)
+        assert isinstance(set_resp, CacheSet.Success)
+
+        get_resp = client.get(cache_name, bytes(key))
+        assert isinstance(get_resp, CacheGet.Hit)
+        assert get_resp.value_bytes == value
+
+
+def describe_set_object_and_get_object() -> None:
+    def round_trips_values_with_the_configured_serializer(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        value = {"name": uuid_str(), "scores": [1, 2.5], "active": True}
+
+        set_resp = client.set_object(cache_name, key, value)
+        assert isinstance(set_resp, CacheSet.Success)
+
+        get_resp = client.get_object(cache_name, key)
+        assert isinstance(get_resp, CacheGetObject.Hit)
+        assert get_resp.value == value
+
+        # The default serializer writes JSON, which other clients can read as a string.
+        raw_get_resp = client.get(cache_name, key)
+        assert isinstance(raw_get_resp, CacheGet.Hit)
+        assert raw_get_resp.value_string.startswith("{")
+
+    def round_trips_values_with_a_per_call_serializer(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        value = (timedelta(seconds=1), {1, 2})
+
+        set_resp = client.set_object(cache_name, key, value, serializer=PickleSerializer())
+        assert isinstance(set_resp, CacheSet.Success)
+
+        get_resp = client.get_object(cache_name, key, serializer=PickleSerializer())
+        assert isinstance(get_resp, CacheGetObject.Hit)
+        assert get_resp.value == value
+
+    def returns_an_error_for_bytes_the_serializer_cannot_read(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        client.set(cache_name, key, b"\x80 not json")
+
+        get_resp = client.get_object(cache_name, key)
+        assert isinstance(get_resp, CacheGetObject.Error)
+        assert get_resp.error_code == MomentoErrorCode.SERIALIZATION_ERROR
+
+    def misses_when_the_key_does_not_exist(client: CacheClient, cache_name: str) -> None:
+        get_resp = client.get_object(cache_name, uuid_str())
+        assert isinstance(get_resp, CacheGetObject.Miss)
+
+
+def describe_set_large_and_get_large() -> None:
+    def with_a_value_over_the_max_message_size(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        value = os.urandom(6 * 1024 * 1024)
+
+        set_resp = client.set_large(cache_name, key, bytearray(value), chunk_size=1024 * 1024)
+        assert isinstance(set_resp, CacheSetLarge.Success)
+
+        get_resp = client.get_large(cache_name, key)
+        assert isinstance(get_resp, CacheGetLarge.Hit)
+        assert get_resp.size == len(value)
+        assert get_resp.value_bytes == value
+
+        destination = bytearray(len(value))
+        get_resp = client.get_large(cache_name, key, destination)
+        assert isinstance(get_resp, CacheGetLarge.Hit)
+        assert get_resp.value_bytes is None
+        assert destination == value
+
+        file = io.BytesIO()
+        get_resp = client.get_large(cache_name, key, file)
+        assert isinstance(get_resp, CacheGetLarge.Hit)
+        assert file.getvalue() == value
+
+    def with_files(client: CacheClient, cache_name: str, tmp_path: Path) -> None:
+        key = uuid_str()
+        value = os.urandom(3 * 1024 * 1024)
+        source = tmp_path / "source"
+        source.write_bytes(value)
+
+        set_resp = client.set_large_from_file(cache_name, key, source, chunk_size=1024 * 1024)
+        assert isinstance(set_resp, CacheSetLarge.Success)
+
+        destination = tmp_path / "destination"
+        get_resp = client.get_large_to_file(cache_name, key, destination)
+        assert isinstance(get_resp, CacheGetLarge.Hit)
+        assert get_resp.size == len(value)
+        assert destination.read_bytes() == value
+
+        get_resp = client.get_large_to_file(cache_name, uuid_str(), destination)
+        assert isinstance(get_resp, CacheGetLarge.Miss)
+        assert destination.read_bytes() == value
+
+    def errors_when_the_file_does_not_exist(client: CacheClient, cache_name: str, tmp_path: Path) -> None:
+        set_resp = client.set_large_from_file(cache_name, uuid_str(), tmp_path / "missing")
+        assert isinstance(set_resp, CacheSetLarge.Error)
+        assert set_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+    def with_a_small_value(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+
+        set_resp = client.set_large(cache_name, key, "value")
+        assert isinstance(set_resp, CacheSetLarge.Success)
+
+        get_resp = client.get(cache_name, key)
+        assert isinstance(get_resp, CacheGet.Hit)
+        assert get_resp.value_string == "value"
+        get_large_resp = client.get_large(cache_name, key)
+        assert isinstance(get_large_resp, CacheGetLarge.Hit)
+        assert get_large_resp.value_bytes == b"value"
+
+    def misses_when_the_key_does_not_exist(client: CacheClient, cache_name: str) -> None:
+        assert isinstance(client.get_large(cache_name, uuid_str()), CacheGetLarge.Miss)
+
+    def errors_when_the_destination_is_too_small(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        client.set_large(cache_name, key, b"x" * 100, chunk_size=10)
+
+        get_resp = client.get_large(cache_name, key, bytearray(99))
+        assert isinstance(get_resp, CacheGetLarge.Error)
+        assert get_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+    def delete_large_removes_the_value(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        client.set_large(cache_name, key, b"x" * 100, chunk_size=10)
+
+        delete_resp = client.delete_large(cache_name, key)
+        assert isinstance(delete_resp, CacheDelete.Success)
+        assert isinstance(client.get_large(cache_name, key), CacheGetLarge.Miss)
+
 
 def describe_set_and_get_eager_connection_client() -> None:
     def with_hit(client_eager_connection: CacheClient, cache_name: str) -> None:
@@ -175,6 +336,71 @@ def describe_get() -> None:
         assert isinstance(get_resp, CacheGet.Miss)
 
 
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_get_batch() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        keys = [uuid_str()]
+        return partial(client.get_batch, keys=keys)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.get_batch(cache_name, [key])
+
+        return _connection_validator
+
+    def returns_results_in_key_order(client: CacheClient, cache_name: str) -> None:
+        hit_key, miss_key, bytes_key = uuid_str(), uuid_str(), uuid_bytes()
+        client.set(cache_name, hit_key, "hit")
+        client.set(cache_name, bytes_key, b"bytes")
+
+        get_batch_resp = client.get_batch(cache_name, [hit_key, miss_key, bytes_key])
+        assert isinstance(get_batch_resp, CacheGetBatch.Success)
+        hit, miss, bytes_hit = get_batch_resp.results
+        assert isinstance(hit, CacheGet.Hit)
+        assert hit.value_string == "hit"
+        assert isinstance(miss, CacheGet.Miss)
+        assert isinstance(bytes_hit, CacheGet.Hit)
+        assert bytes_hit.value_bytes == b"bytes"
+
+    def with_no_keys_returns_no_results(client: CacheClient, cache_name: str) -> None:
+        get_batch_resp = client.get_batch(cache_name, [])
+        assert isinstance(get_batch_resp, CacheGetBatch.Success)
+        assert get_batch_resp.results == []
+
+    def with_bad_key_throws_exception(client: CacheClient, cache_name: str) -> None:
+        get_batch_resp = client.get_batch(cache_name, [uuid_str(), 1])  # type: ignore[list-item]
+        assert isinstance(get_batch_resp, CacheGetBatch.Error)
+        assert get_batch_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert get_batch_resp.inner_exception.message == "Unsupported type for keys: <class 'int'>"
+
+
+def describe_get_batch_stream() -> None:
+    def yields_results_in_key_order(client: CacheClient, cache_name: str) -> None:
+        hit_key, miss_key = uuid_str(), uuid_str()
+        client.set(cache_name, hit_key, "hit")
+
+        results = []
+        for result in client.get_batch_stream(cache_name, [hit_key, miss_key]):
+            results.append(result)
+
+        hit, miss = results
+        assert isinstance(hit, CacheGet.Hit)
+        assert hit.value_string == "hit"
+        assert isinstance(miss, CacheGet.Miss)
+
+    def yields_an_error_per_key_for_a_bad_cache_name(client: CacheClient) -> None:
+        results = []
+        for result in client.get_batch_stream("", [uuid_str(), uuid_str()]):
+            results.append(result)
+
+        assert len(results) == 2
+        for result in results:
+            assert isinstance(result, CacheGet.Error)
+            assert result.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+
 @behaves_like(a_cache_name_validator)
 @behaves_like(a_key_validator)
 @behaves_like(a_connection_validator)
@@ -245,6 +471,78 @@ def describe_set() -> None:
         return partial(client.set, value=uuid_str())
 
 
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_set_batch() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        items = [(uuid_str(), uuid_str())]
+        return partial(client.set_batch, items=items)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.set_batch(cache_name, [(key, value)])
+
+        return _connection_validator
+
+    def sets_every_item(client: CacheClient, cache_name: str) -> None:
+        items = [(uuid_str(), uuid_str()) for _ in range(250)]
+
+        set_batch_resp = client.set_batch(cache_name, items)
+        assert isinstance(set_batch_resp, CacheSetBatch.Success)
+        assert len(set_batch_resp.results) == len(items)
+        assert all(isinstance(result, CacheSet.Success) for result in set_batch_resp.results)
+
+        get_batch_resp = client.get_batch(cache_name, [key for key, _ in items])
+        assert isinstance(get_batch_resp, CacheGetBatch.Success)
+        for (_, value), get_resp in zip(items, get_batch_resp.results):
+            assert isinstance(get_resp, CacheGet.Hit)
+            assert get_resp.value_string == value
+
+    def sets_items_from_an_iterable(client: CacheClient, cache_name: str) -> None:
+        keys = [uuid_str() for _ in range(3)]
+
+        def gen_items() -> Iterator[Tuple[str, str]]:
+            for key in keys:
+                yield key, key
+
+        set_batch_resp = client.set_batch(cache_name, gen_items())
+        assert isinstance(set_batch_resp, CacheSetBatch.Success)
+        assert len(set_batch_resp.results) == len(keys)
+
+        get_resp = client.get(cache_name, keys[-1])
+        assert isinstance(get_resp, CacheGet.Hit)
+        assert get_resp.value_string == keys[-1]
+
+    def with_per_item_ttl(client: CacheClient, cache_name: str) -> None:
+        short_key, long_key = uuid_str(), uuid_str()
+
+        client.set_batch(
+            cache_name, [(short_key, "short", timedelta(seconds=2)), (long_key, "long")], ttl=timedelta(seconds=60)
+        )
+        time.sleep(4)
+
+        assert isinstance(client.get(cache_name, short_key), CacheGet.Miss)
+        assert isinstance(client.get(cache_name, long_key), CacheGet.Hit)
+
+    def with_bad_item_returns_an_error_for_that_item(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+
+        set_batch_resp = client.set_batch(cache_name, [(1, "bad"), (key, "good")])  # type: ignore[list-item]
+        assert isinstance(set_batch_resp, CacheSetBatch.Success)
+        bad, good = set_batch_resp.results
+        assert isinstance(bad, CacheSet.Error)
+        assert bad.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert bad.inner_exception.message == "Unsupported type for key: <class 'int'>"
+        assert isinstance(good, CacheSet.Success)
+
+    def with_negative_ttl_throws_exception(client: CacheClient, cache_name: str) -> None:
+        set_batch_resp = client.set_batch(cache_name, [(uuid_str(), "value")], ttl=timedelta(seconds=-1))
+        assert isinstance(set_batch_resp, CacheSetBatch.Error)
+        assert set_batch_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert set_batch_resp.inner_exception.message == "TTL must be a positive amount of time."
+
+
 @behaves_like(a_cache_name_validator)
 @behaves_like(a_key_validator)
 @behaves_like(a_connection_validator)
@@ -302,9 +600,403 @@ def describe_set_if_not_exists() -> None:
         assert get_resp.value_string == str(value)
 
 
+def assert_value(client: CacheClient, cache_name: TCacheName, key: str, value: str) -> None:
+    get_resp = client.get(cache_name, key)
+    assert isinstance(get_resp, CacheGet.Hit)
+    assert get_resp.value_string == value
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_absent() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        return partial(client.set_if_absent, key=uuid_str(), value=uuid_str())
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.set_if_absent, cache_name=cache_name, value=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.set_if_absent(cache_name, key, value)
+
+        return _connection_validator
+
+    @fixture
+    def setter(client: CacheClient) -> TSetter:
+        return partial(client.set_if_absent)
+
+    def only_sets_when_the_key_does_not_exist(client: CacheClient, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        assert isinstance(client.set_if_absent(cache_name, key, "first"), CacheSetIfAbsent.Stored)
+        assert isinstance(client.set_if_absent(cache_name, key, "second"), CacheSetIfAbsent.NotStored)
+        assert_value(client, cache_name, key, "first")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_present() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        return partial(client.set_if_present, key=uuid_str(), value=uuid_str())
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.set_if_present, cache_name=cache_name, value=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.set_if_present(cache_name, key, value)
+
+        return _connection_validator
+
+    @fixture
+    def setter(client: CacheClient) -> TSetter:
+        return partial(client.set_if_present)
+
+    def only_sets_when_the_key_exists(client: CacheClient, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        assert isinstance(client.set_if_present(cache_name, key, "first"), CacheSetIfPresent.NotStored)
+        client.set(cache_name, key, "first")
+        assert isinstance(client.set_if_present(cache_name, key, "second"), CacheSetIfPresent.Stored)
+        assert_value(client, cache_name, key, "second")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_equal() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        return partial(client.set_if_equal, key=uuid_str(), value=uuid_str(), equal=uuid_str())
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.set_if_equal, cache_name=cache_name, value=uuid_str(), equal=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.set_if_equal(cache_name, key, value, uuid_str())
+
+        return _connection_validator
+
+    @fixture
+    def setter(client: CacheClient) -> TSetter:
+        return partial(client.set_if_equal, equal=uuid_str())
+
+    def only_sets_when_the_value_is_equal(client: CacheClient, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        set_resp = client.set_if_equal(cache_name, key, "second", "first")
+        assert isinstance(set_resp, CacheSetIfEqual.NotStored)
+        client.set(cache_name, key, "first")
+        set_resp = client.set_if_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfEqual.NotStored)
+        set_resp = client.set_if_equal(cache_name, key, "second", b"first")
+        assert isinstance(set_resp, CacheSetIfEqual.Stored)
+        assert_value(client, cache_name, key, "second")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_not_equal() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        return partial(client.set_if_not_equal, key=uuid_str(), value=uuid_str(), not_equal=uuid_str())
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.set_if_not_equal, cache_name=cache_name, value=uuid_str(), not_equal=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.set_if_not_equal(cache_name, key, value, uuid_str())
+
+        return _connection_validator
+
+    @fixture
+    def setter(client: CacheClient) -> TSetter:
+        return partial(client.set_if_not_equal, not_equal=uuid_str())
+
+    def only_sets_when_the_value_is_not_equal(client: CacheClient, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        set_resp = client.set_if_not_equal(cache_name, key, "first", "other")
+        assert isinstance(set_resp, CacheSetIfNotEqual.Stored)
+        set_resp = client.set_if_not_equal(cache_name, key, "second", "first")
+        assert isinstance(set_resp, CacheSetIfNotEqual.NotStored)
+        set_resp = client.set_if_not_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfNotEqual.Stored)
+        assert_value(client, cache_name, key, "second")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_present_and_not_equal() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        return partial(client.set_if_present_and_not_equal, key=uuid_str(), value=uuid_str(), not_equal=uuid_str())
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(
+            client.set_if_present_and_not_equal, cache_name=cache_name, value=uuid_str(), not_equal=uuid_str()
+        )
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.set_if_present_and_not_equal(cache_name, key, value, uuid_str())
+
+        return _connection_validator
+
+    @fixture
+    def setter(client: CacheClient) -> TSetter:
+        return partial(client.set_if_present_and_not_equal, not_equal=uuid_str())
+
+    def only_sets_when_the_key_exists_with_another_value(client: CacheClient, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        set_resp = client.set_if_present_and_not_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfPresentAndNotEqual.NotStored)
+        client.set(cache_name, key, "first")
+        set_resp = client.set_if_present_and_not_equal(cache_name, key, "second", "first")
+        assert isinstance(set_resp, CacheSetIfPresentAndNotEqual.NotStored)
+        set_resp = client.set_if_present_and_not_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfPresentAndNotEqual.Stored)
+        assert_value(client, cache_name, key, "second")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_absent_or_equal() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        return partial(client.set_if_absent_or_equal, key=uuid_str(), value=uuid_str(), equal=uuid_str())
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.set_if_absent_or_equal, cache_name=cache_name, value=uuid_str(), equal=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.set_if_absent_or_equal(cache_name, key, value, uuid_str())
+
+        return _connection_validator
+
+    @fixture
+    def setter(client: CacheClient) -> TSetter:
+        return partial(client.set_if_absent_or_equal, equal=uuid_str())
+
+    def only_sets_when_the_key_is_absent_or_equal(client: CacheClient, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        set_resp = client.set_if_absent_or_equal(cache_name, key, "first", "other")
+        assert isinstance(set_resp, CacheSetIfAbsentOrEqual.Stored)
+        set_resp = client.set_if_absent_or_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfAbsentOrEqual.NotStored)
+        set_resp = client.set_if_absent_or_equal(cache_name, key, "second", "first")
+        assert isinstance(set_resp, CacheSetIfAbsentOrEqual.Stored)
+        assert_value(client, cache_name, key, "second")
+
+
 @behaves_like(a_cache_name_validator)
 @behaves_like(a_key_validator)
 @behaves_like(a_connection_validator)
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_keys_exist() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        keys = [uuid_str()]
+        return partial(client.keys_exist, keys=keys)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.keys_exist(cache_name, [key])
+
+        return _connection_validator
+
+    def returns_existence_in_key_order(client: CacheClient, cache_name: str) -> None:
+        existing_key, missing_key, bytes_key = uuid_str(), uuid_str(), uuid_bytes()
+        client.set(cache_name, existing_key, "value")
+        client.set(cache_name, bytes_key, b"value")
+
+        keys_exist_resp = client.keys_exist(cache_name, [existing_key, missing_key, bytes_key])
+        assert keys_exist_resp == CacheKeysExist.Success([True, False, True])
+
+    def with_no_keys_returns_no_results(client: CacheClient, cache_name: str) -> None:
+        keys_exist_resp = client.keys_exist(cache_name, [])
+        assert keys_exist_resp == CacheKeysExist.Success([])
+
+    def with_bad_key_throws_exception(client: CacheClient, cache_name: str) -> None:
+        keys_exist_resp = client.keys_exist(cache_name, [uuid_str(), 1])  # type: ignore[list-item]
+        assert isinstance(keys_exist_resp, CacheKeysExist.Error)
+        assert keys_exist_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert keys_exist_resp.inner_exception.message == "Unsupported type for keys: <class 'int'>"
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator)
+def describe_key_exists() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        key = uuid_str()
+        return partial(client.key_exists, key=key)
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.key_exists, cache_name=cache_name)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.key_exists(cache_name, key)
+
+        return _connection_validator
+
+    def returns_whether_the_key_exists(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        assert client.key_exists(cache_name, key) == CacheKeyExists.Success(False)
+
+        client.set(cache_name, key, "value")
+        assert client.key_exists(cache_name, key) == CacheKeyExists.Success(True)
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator)
+def describe_item_get_ttl() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        key = uuid_str()
+        return partial(client.item_get_ttl, key=key)
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.item_get_ttl, cache_name=cache_name)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.item_get_ttl(cache_name, key)
+
+        return _connection_validator
+
+    def returns_the_remaining_ttl(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        client.set(cache_name, key, "value", ttl=timedelta(seconds=60))
+
+        item_get_ttl_resp = client.item_get_ttl(cache_name, key)
+        assert isinstance(item_get_ttl_resp, CacheItemGetTtl.Hit)
+        assert timedelta(seconds=50) < item_get_ttl_resp.remaining_ttl <= timedelta(seconds=60)
+
+    def returns_miss_for_a_missing_key(client: CacheClient, cache_name: str) -> None:
+        item_get_ttl_resp = client.item_get_ttl(cache_name, uuid_str())
+        assert isinstance(item_get_ttl_resp, CacheItemGetTtl.Miss)
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator)
+def describe_item_get_type() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        key = uuid_str()
+        return partial(client.item_get_type, key=key)
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.item_get_type, cache_name=cache_name)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.item_get_type(cache_name, key)
+
+        return _connection_validator
+
+    def returns_the_type_of_each_kind_of_item(client: CacheClient, cache_name: str) -> None:
+        scalar, dictionary, list_, set_, sorted_set = (uuid_str() for _ in range(5))
+        client.set(cache_name, scalar, "value")
+        client.dictionary_set_field(cache_name, dictionary, "field", "value")
+        client.list_push_back(cache_name, list_, "value")
+        client.set_add_element(cache_name, set_, "value")
+        client.sorted_set_put_element(cache_name, sorted_set, "value", 1.0)
+
+        for key, item_type in (
+            (scalar, ItemType.SCALAR),
+            (dictionary, ItemType.DICTIONARY),
+            (list_, ItemType.LIST),
+            (set_, ItemType.SET),
+            (sorted_set, ItemType.SORTED_SET),
+        ):
+            assert client.item_get_type(cache_name, key) == CacheItemGetType.Hit(item_type)
+
+    def returns_miss_for_a_missing_key(client: CacheClient, cache_name: str) -> None:
+        item_get_type_resp = client.item_get_type(cache_name, uuid_str())
+        assert isinstance(item_get_type_resp, CacheItemGetType.Miss)
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator)
+def describe_update_ttl() -> None:
+    @fixture
+    def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
+        key = uuid_str()
+        return partial(client.update_ttl, key=key, ttl=timedelta(seconds=60))
+
+    @fixture
+    def key_validator(client: CacheClient, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client.update_ttl, cache_name=cache_name, ttl=timedelta(seconds=60))
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        def _connection_validator(client: CacheClient) -> CacheResponse:
+            return client.update_ttl(cache_name, key, timedelta(seconds=60))
+
+        return _connection_validator
+
+    def sets_the_ttl(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        client.set(cache_name, key, "value", ttl=timedelta(seconds=60))
+
+        update_ttl_resp = client.update_ttl(cache_name, key, timedelta(seconds=600))
+        assert isinstance(update_ttl_resp, CacheUpdateTtl.Set)
+        item_get_ttl_resp = client.item_get_ttl(cache_name, key)
+        assert isinstance(item_get_ttl_resp, CacheItemGetTtl.Hit)
+        assert item_get_ttl_resp.remaining_ttl > timedelta(seconds=60)
+
+    def returns_miss_for_a_missing_key(client: CacheClient, cache_name: str) -> None:
+        update_ttl_resp = client.update_ttl(cache_name, uuid_str(), timedelta(seconds=60))
+        assert isinstance(update_ttl_resp, CacheUpdateTtl.Miss)
+
+    def with_negative_ttl_throws_exception(client: CacheClient, cache_name: str) -> None:
+        update_ttl_resp = client.update_ttl(cache_name, uuid_str(), timedelta(seconds=-1))
+        assert isinstance(update_ttl_resp, CacheUpdateTtl.Error)
+        assert update_ttl_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert update_ttl_resp.inner_exception.message == "TTL must be a positive amount of time."
+
+
+def describe_increase_ttl() -> None:
+    def only_makes_the_item_expire_later(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        client.set(cache_name, key, "value", ttl=timedelta(seconds=60))
+
+        increase_ttl_resp = client.increase_ttl(cache_name, key, timedelta(seconds=30))
+        assert isinstance(increase_ttl_resp, CacheIncreaseTtl.NotSet)
+        increase_ttl_resp = client.increase_ttl(cache_name, key, timedelta(seconds=600))
+        assert isinstance(increase_ttl_resp, CacheIncreaseTtl.Set)
+
+    def returns_miss_for_a_missing_key(client: CacheClient, cache_name: str) -> None:
+        increase_ttl_resp = client.increase_ttl(cache_name, uuid_str(), timedelta(seconds=60))
+        assert isinstance(increase_ttl_resp, CacheIncreaseTtl.Miss)
+
+
+def describe_decrease_ttl() -> None:
+    def only_makes_the_item_expire_sooner(client: CacheClient, cache_name: str) -> None:
+        key = uuid_str()
+        client.set(cache_name, key, "value", ttl=timedelta(seconds=60))
+
+        decrease_ttl_resp = client.decrease_ttl(cache_name, key, timedelta(seconds=600))
+        assert isinstance(decrease_ttl_resp, CacheDecreaseTtl.NotSet)
+        decrease_ttl_resp = client.decrease_ttl(cache_name, key, timedelta(seconds=30))
+        assert isinstance(decrease_ttl_resp, CacheDecreaseTtl.Set)
+
+    def returns_miss_for_a_missing_key(client: CacheClient, cache_name: str) -> None:
+        decrease_ttl_resp = client.decrease_ttl(cache_name, uuid_str(), timedelta(seconds=60))
+        assert isinstance(decrease_ttl_resp, CacheDecreaseTtl.Miss)
+
+
 def describe_delete() -> None:
     @fixture
     def cache_name_validator(client: CacheClient) -> TCacheNameValidator:
@@ -1,13 +1,41 @@
+import io
+import os
 import time
 from datetime import timedelta
 from functools import partial
-from typing import Awaitable, Optional
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Optional, Tuple
 
 from momento import CacheClientAsync
 from momento.errors import MomentoErrorCode
-from momento.responses import CacheDelete, CacheGet, CacheSet, CacheSetIfNotExists
+from momento.responses import (
+    CacheDecreaseTtl,
+    CacheDelete,
+    CacheGet,
+    CacheGetBatch,
+    CacheGetLarge,
+    CacheGetObject,
+    CacheIncreaseTtl,
+    CacheItemGetTtl,
+    CacheItemGetType,
+    CacheKeyExists,
+    CacheKeysExist,
+    CacheSet,
+    CacheSetBatch,
+    CacheSetIfAbsent,
+    CacheSetIfAbsentOrEqual,
+    CacheSetIfEqual,
+    CacheSetIfNotEqual,
+    CacheSetIfNotExists,
+    CacheSetIfPresent,
+    CacheSetIfPresentAndNotEqual,
+    CacheSetLarge,
+    CacheUpdateTtl,
+    ItemType,
+)
 from momento.responses.mixins import ErrorResponseMixin
 from momento.responses.response import CacheResponse
+from momento.serialization import PickleSerializer
 from momento.typing import TCacheName, TScalarKey, TScalarValue
 from pytest import fixture
 from pytest_describe import behaves_like
@@ -132,6 +160,145 @@ def describe_set_and_get() -> None:
         assert isinstance(get_resp, CacheGet.Hit)
         assert get_resp.value_bytes == value
 
+    async def with_buffer_key_values(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = bytearray(uuid_bytes())
+        value = memoryview(bytearray(uuid_bytes()))
+
+        set_resp = await client_async.set(cache_name, key, value)
+        assert isinstance(set_resp, CacheSet.Success)
+
+        get_resp = await client_async.get(cache_name, bytes(key))
+        assert isinstance(get_resp, CacheGet.Hit)
+        assert get_resp.value_bytes == value
+
+
+def describe_set_object_and_get_object() -> None:
+    async def round_trips_values_with_the_configured_serializer(
+        client_async: CacheClientAsync, cache_name: str
+    ) -> None:
+        key = uuid_str()
+        value = {"name": uuid_str(), "scores": [1, 2.5], "active": True}
+
+        set_resp = await client_async.set_object(cache_name, key, value)
+        assert isinstance(set_resp, CacheSet.Success)
+
+        get_resp = await client_async.get_object(cache_name, key)
+        assert isinstance(get_resp, CacheGetObject.Hit)
+        assert get_resp.value == value
+
+        # The default serializer writes JSON, which other clients can read as a string.
+        raw_get_resp = await client_async.get(cache_name, key)
+        assert isinstance(raw_get_resp, CacheGet.Hit)
+        assert raw_get_resp.value_string.startswith("{")
+
+    async def round_trips_values_with_a_per_call_serializer(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        value = (timedelta(seconds=1), {1, 2})
+
+        set_resp = await client_async.set_object(cache_name, key, value, serializer=PickleSerializer())
+        assert isinstance(set_resp, CacheSet.Success)
+
+        get_resp = await client_async.get_object(cache_name, key, serializer=PickleSerializer())
+        assert isinstance(get_resp, CacheGetObject.Hit)
+        assert get_resp.value == value
+
+    async def returns_an_error_for_bytes_the_serializer_cannot_read(
+        client_async: CacheClientAsync, cache_name: str
+    ) -> None:
+        key = uuid_str()
+        await client_async.set(cache_name, key, b"\x80 not json")
+
+        get_resp = await client_async.get_object(cache_name, key)
+        assert isinstance(get_resp, CacheGetObject.Error)
+        assert get_resp.error_code == MomentoErrorCode.SERIALIZATION_ERROR
+
+    async def misses_when_the_key_does_not_exist(client_async: CacheClientAsync, cache_name: str) -> None:
+        get_resp = await client_async.get_object(cache_name, uuid_str())
+        assert isinstance(get_resp, CacheGetObject.Miss)
+
+
+def describe_set_large_and_get_large() -> None:
+    async def with_a_value_over_the_max_message_size(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        value = os.urandom(6 * 1024 * 1024)
+
+        set_resp = await client_async.set_large(cache_name, key, bytearray(value), chunk_size=1024 * 1024)
+        assert isinstance(set_resp, CacheSetLarge.Success)
+
+        get_resp = await client_async.get_large(cache_name, key)
+        assert isinstance(get_resp, CacheGetLarge.Hit)
+        assert get_resp.size == len(value)
+        assert get_resp.value_bytes == value
+
+        destination = bytearray(len(value))
+        get_resp = await client_async.get_large(cache_name, key, destination)
+        assert isinstance(get_resp, CacheGetLarge.Hit)
+        assert get_resp.value_bytes is None
+        assert destination == value
+
+        file = io.BytesIO()
+        get_resp = await client_async.get_large(cache_name, key, file)
+        assert isinstance(get_resp, CacheGetLarge.Hit)
+        assert file.getvalue() == value
+
+    async def with_files(client_async: CacheClientAsync, cache_name: str, tmp_path: Path) -> None:
+        key = uuid_str()
+        value = os.urandom(3 * 1024 * 1024)
+        source = tmp_path / "source"
+        source.write_bytes(value)
+
+        set_resp = await client_async.set_large_from_file(cache_name, key, source, chunk_size=1024 * 1024)
+        assert isinstance(set_resp, CacheSetLarge.Success)
+
+        destination = tmp_path / "destination"
+        get_resp = await client_async.get_large_to_file(cache_name, key, destination)
+        assert isinstance(get_resp, CacheGetLarge.Hit)
+        assert get_resp.size == len(value)
+        assert destination.read_bytes() == value
+
+        get_resp = await client_async.get_large_to_file(cache_name, uuid_str(), destination)
+        assert isinstance(get_resp, CacheGetLarge.Miss)
+        assert destination.read_bytes() == value
+
+    async def errors_when_the_file_does_not_exist(
+        client_async: CacheClientAsync, cache_name: str, tmp_path: Path
+    ) -> None:
+        set_resp = await client_async.set_large_from_file(cache_name, uuid_str(), tmp_path / "missing")
+        assert isinstance(set_resp, CacheSetLarge.Error)
+        assert set_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+    async def with_a_small_value(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+
+        set_resp = await client_async.set_large(cache_name, key, "value")
+        assert isinstance(set_resp, CacheSetLarge.Success)
+
+        get_resp = await client_async.get(cache_name, key)
+        assert isinstance(get_resp, CacheGet.Hit)
+        assert get_resp.value_string == "value"
+        get_large_resp = await client_async.get_large(cache_name, key)
+        assert isinstance(get_large_resp, CacheGetLarge.Hit)
+        assert get_large_resp.value_bytes == b"value"
+
+    async def misses_when_the_key_does_not_exist(client_async: CacheClientAsync, cache_name: str) -> None:
+        assert isinstance(await client_async.get_large(cache_name, uuid_str()), CacheGetLarge.Miss)
+
+    async def errors_when_the_destination_is_too_small(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        await client_async.set_large(cache_name, key, b"x" * 100, chunk_size=10)
+
+        get_resp = await client_async.get_large(cache_name, key, bytearray(99))
+        assert isinstance(get_resp, CacheGetLarge.Error)
+        assert get_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+    async def delete_large_removes_the_value(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        await client_async.set_large(cache_name, key, b"x" * 100, chunk_size=10)
+
+        delete_resp = await client_async.delete_large(cache_name, key)
+        assert isinstance(delete_resp, CacheDelete.Success)
+        assert isinstance(await client_async.get_large(cache_name, key), CacheGetLarge.Miss)
+
 
 def describe_set_and_get_eager_connection_client() -> None:
     async def with_hit(client_async_eager_connection: CacheClientAsync, cache_name: str) -> None:
@@ -185,6 +352,71 @@ def describe_get() -> None:
         assert isinstance(get_resp, CacheGet.Miss)
 
 
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_get_batch() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        keys = [uuid_str()]
+        return partial(client_async.get_batch, keys=keys)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.get_batch(cache_name, [key])
+
+        return _connection_validator
+
+    async def returns_results_in_key_order(client_async: CacheClientAsync, cache_name: str) -> None:
+        hit_key, miss_key, bytes_key = uuid_str(), uuid_str(), uuid_bytes()
+        await client_async.set(cache_name, hit_key, "hit")
+        await client_async.set(cache_name, bytes_key, b"bytes")
+
+        get_batch_resp = await client_async.get_batch(cache_name, [hit_key, miss_key, bytes_key])
+        assert isinstance(get_batch_resp, CacheGetBatch.Success)
+        hit, miss, bytes_hit = get_batch_resp.results
+        assert isinstance(hit, CacheGet.Hit)
+        assert hit.value_string == "hit"
+        assert isinstance(miss, CacheGet.Miss)
+        assert isinstance(bytes_hit, CacheGet.Hit)
+        assert bytes_hit.value_bytes == b"bytes"
+
+    async def with_no_keys_returns_no_results(client_async: CacheClientAsync, cache_name: str) -> None:
+        get_batch_resp = await client_async.get_batch(cache_name, [])
+        assert isinstance(get_batch_resp, CacheGetBatch.Success)
+        assert get_batch_resp.results == []
+
+    async def with_bad_key_throws_exception(client_async: CacheClientAsync, cache_name: str) -> None:
+        get_batch_resp = await client_async.get_batch(cache_name, [uuid_str(), 1])  # type: ignore[list-item]
+        assert isinstance(get_batch_resp, CacheGetBatch.Error)
+        assert get_batch_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert get_batch_resp.inner_exception.message == "Unsupported type for keys: <class 'int'>"
+
+
+def describe_get_batch_stream() -> None:
+    async def yields_results_in_key_order(client_async: CacheClientAsync, cache_name: str) -> None:
+        hit_key, miss_key = uuid_str(), uuid_str()
+        await client_async.set(cache_name, hit_key, "hit")
+
+        results = []
+        async for result in client_async.get_batch_stream(cache_name, [hit_key, miss_key]):
+            results.append(result)
+
+        hit, miss = results
+        assert isinstance(hit, CacheGet.Hit)
+        assert hit.value_string == "hit"
+        assert isinstance(miss, CacheGet.Miss)
+
+    async def yields_an_error_per_key_for_a_bad_cache_name(client_async: CacheClientAsync) -> None:
+        results = []
+        async for result in client_async.get_batch_stream("", [uuid_str(), uuid_str()]):
+            results.append(result)
+
+        assert len(results) == 2
+        for result in results:
+            assert isinstance(result, CacheGet.Error)
+            assert result.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+
+
 @behaves_like(a_cache_name_validator)
 @behaves_like(a_key_validator)
 @behaves_like(a_connection_validator)
@@ -255,6 +487,78 @@ def describe_set() -> None:
         return partial(client_async.set, value=uuid_str())
 
 
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_set_batch() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        items = [(uuid_str(), uuid_str())]
+        return partial(client_async.set_batch, items=items)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.set_batch(cache_name, [(key, value)])
+
+        return _connection_validator
+
+    async def sets_every_item(client_async: CacheClientAsync, cache_name: str) -> None:
+        items = [(uuid_str(), uuid_str()) for _ in range(250)]
+
+        set_batch_resp = await client_async.set_batch(cache_name, items)
+        assert isinstance(set_batch_resp, CacheSetBatch.Success)
+        assert len(set_batch_resp.results) == len(items)
+        assert all(isinstance(result, CacheSet.Success) for result in set_batch_resp.results)
+
+        get_batch_resp = await client_async.get_batch(cache_name, [key for key, _ in items])
+        assert isinstance(get_batch_resp, CacheGetBatch.Success)
+        for (_, value), get_resp in zip(items, get_batch_resp.results):
+            assert isinstance(get_resp, CacheGet.Hit)
+            assert get_resp.value_string == value
+
+    async def sets_items_from_an_async_iterable(client_async: CacheClientAsync, cache_name: str) -> None:
+        keys = [uuid_str() for _ in range(3)]
+
+        async def gen_items() -> AsyncIterator[Tuple[str, str]]:
+            for key in keys:
+                yield key, key
+
+        set_batch_resp = await client_async.set_batch(cache_name, gen_items())
+        assert isinstance(set_batch_resp, CacheSetBatch.Success)
+        assert len(set_batch_resp.results) == len(keys)
+
+        get_resp = await client_async.get(cache_name, keys[-1])
+        assert isinstance(get_resp, CacheGet.Hit)
+        assert get_resp.value_string == keys[-1]
+
+    async def with_per_item_ttl(client_async: CacheClientAsync, cache_name: str) -> None:
+        short_key, long_key = uuid_str(), uuid_str()
+
+        await client_async.set_batch(
+            cache_name, [(short_key, "short", timedelta(seconds=2)), (long_key, "long")], ttl=timedelta(seconds=60)
+        )
+        time.sleep(4)
+
+        assert isinstance(await client_async.get(cache_name, short_key), CacheGet.Miss)
+        assert isinstance(await client_async.get(cache_name, long_key), CacheGet.Hit)
+
+    async def with_bad_item_returns_an_error_for_that_item(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+
+        set_batch_resp = await client_async.set_batch(cache_name, [(1, "bad"), (key, "good")])  # type: ignore[list-item]
+        assert isinstance(set_batch_resp, CacheSetBatch.Success)
+        bad, good = set_batch_resp.results
+        assert isinstance(bad, CacheSet.Error)
+        assert bad.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert bad.inner_exception.message == "Unsupported type for key: <class 'int'>"
+        assert isinstance(good, CacheSet.Success)
+
+    async def with_negative_ttl_throws_exception(client_async: CacheClientAsync, cache_name: str) -> None:
+        set_batch_resp = await client_async.set_batch(cache_name, [(uuid_str(), "value")], ttl=timedelta(seconds=-1))
+        assert isinstance(set_batch_resp, CacheSetBatch.Error)
+        assert set_batch_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert set_batch_resp.inner_exception.message == "TTL must be a positive amount of time."
+
+
 @behaves_like(a_cache_name_validator)
 @behaves_like(a_key_validator)
 @behaves_like(a_connection_validator)
@@ -312,9 +616,407 @@ def describe_set_if_not_exists() -> None:
         assert get_resp.value_string == str(value)
 
 
+async def assert_value(client_async: CacheClientAsync, cache_name: TCacheName, key: str, value: str) -> None:
+    get_resp = await client_async.get(cache_name, key)
+    assert isinstance(get_resp, CacheGet.Hit)
+    assert get_resp.value_string == value
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_absent() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        return partial(client_async.set_if_absent, key=uuid_str(), value=uuid_str())
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.set_if_absent, cache_name=cache_name, value=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.set_if_absent(cache_name, key, value)
+
+        return _connection_validator
+
+    @fixture
+    def setter(client_async: CacheClientAsync) -> TSetter:
+        return partial(client_async.set_if_absent)
+
+    async def only_sets_when_the_key_does_not_exist(client_async: CacheClientAsync, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        assert isinstance(await client_async.set_if_absent(cache_name, key, "first"), CacheSetIfAbsent.Stored)
+        assert isinstance(await client_async.set_if_absent(cache_name, key, "second"), CacheSetIfAbsent.NotStored)
+        await assert_value(client_async, cache_name, key, "first")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_present() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        return partial(client_async.set_if_present, key=uuid_str(), value=uuid_str())
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.set_if_present, cache_name=cache_name, value=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.set_if_present(cache_name, key, value)
+
+        return _connection_validator
+
+    @fixture
+    def setter(client_async: CacheClientAsync) -> TSetter:
+        return partial(client_async.set_if_present)
+
+    async def only_sets_when_the_key_exists(client_async: CacheClientAsync, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        assert isinstance(await client_async.set_if_present(cache_name, key, "first"), CacheSetIfPresent.NotStored)
+        await client_async.set(cache_name, key, "first")
+        assert isinstance(await client_async.set_if_present(cache_name, key, "second"), CacheSetIfPresent.Stored)
+        await assert_value(client_async, cache_name, key, "second")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_equal() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        return partial(client_async.set_if_equal, key=uuid_str(), value=uuid_str(), equal=uuid_str())
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.set_if_equal, cache_name=cache_name, value=uuid_str(), equal=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.set_if_equal(cache_name, key, value, uuid_str())
+
+        return _connection_validator
+
+    @fixture
+    def setter(client_async: CacheClientAsync) -> TSetter:
+        return partial(client_async.set_if_equal, equal=uuid_str())
+
+    async def only_sets_when_the_value_is_equal(client_async: CacheClientAsync, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        set_resp = await client_async.set_if_equal(cache_name, key, "second", "first")
+        assert isinstance(set_resp, CacheSetIfEqual.NotStored)
+        await client_async.set(cache_name, key, "first")
+        set_resp = await client_async.set_if_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfEqual.NotStored)
+        set_resp = await client_async.set_if_equal(cache_name, key, "second", b"first")
+        assert isinstance(set_resp, CacheSetIfEqual.Stored)
+        await assert_value(client_async, cache_name, key, "second")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_not_equal() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        return partial(client_async.set_if_not_equal, key=uuid_str(), value=uuid_str(), not_equal=uuid_str())
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.set_if_not_equal, cache_name=cache_name, value=uuid_str(), not_equal=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.set_if_not_equal(cache_name, key, value, uuid_str())
+
+        return _connection_validator
+
+    @fixture
+    def setter(client_async: CacheClientAsync) -> TSetter:
+        return partial(client_async.set_if_not_equal, not_equal=uuid_str())
+
+    async def only_sets_when_the_value_is_not_equal(client_async: CacheClientAsync, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        set_resp = await client_async.set_if_not_equal(cache_name, key, "first", "other")
+        assert isinstance(set_resp, CacheSetIfNotEqual.Stored)
+        set_resp = await client_async.set_if_not_equal(cache_name, key, "second", "first")
+        assert isinstance(set_resp, CacheSetIfNotEqual.NotStored)
+        set_resp = await client_async.set_if_not_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfNotEqual.Stored)
+        await assert_value(client_async, cache_name, key, "second")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_present_and_not_equal() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        return partial(
+            client_async.set_if_present_and_not_equal, key=uuid_str(), value=uuid_str(), not_equal=uuid_str()
+        )
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(
+            client_async.set_if_present_and_not_equal, cache_name=cache_name, value=uuid_str(), not_equal=uuid_str()
+        )
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.set_if_present_and_not_equal(cache_name, key, value, uuid_str())
+
+        return _connection_validator
+
+    @fixture
+    def setter(client_async: CacheClientAsync) -> TSetter:
+        return partial(client_async.set_if_present_and_not_equal, not_equal=uuid_str())
+
+    async def only_sets_when_the_key_exists_with_another_value(
+        client_async: CacheClientAsync, cache_name: TCacheName
+    ) -> None:
+        key = uuid_str()
+        set_resp = await client_async.set_if_present_and_not_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfPresentAndNotEqual.NotStored)
+        await client_async.set(cache_name, key, "first")
+        set_resp = await client_async.set_if_present_and_not_equal(cache_name, key, "second", "first")
+        assert isinstance(set_resp, CacheSetIfPresentAndNotEqual.NotStored)
+        set_resp = await client_async.set_if_present_and_not_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfPresentAndNotEqual.Stored)
+        await assert_value(client_async, cache_name, key, "second")
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator, a_setter)
+def describe_set_if_absent_or_equal() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        return partial(client_async.set_if_absent_or_equal, key=uuid_str(), value=uuid_str(), equal=uuid_str())
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.set_if_absent_or_equal, cache_name=cache_name, value=uuid_str(), equal=uuid_str())
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey, value: TScalarValue) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.set_if_absent_or_equal(cache_name, key, value, uuid_str())
+
+        return _connection_validator
+
+    @fixture
+    def setter(client_async: CacheClientAsync) -> TSetter:
+        return partial(client_async.set_if_absent_or_equal, equal=uuid_str())
+
+    async def only_sets_when_the_key_is_absent_or_equal(client_async: CacheClientAsync, cache_name: TCacheName) -> None:
+        key = uuid_str()
+        set_resp = await client_async.set_if_absent_or_equal(cache_name, key, "first", "other")
+        assert isinstance(set_resp, CacheSetIfAbsentOrEqual.Stored)
+        set_resp = await client_async.set_if_absent_or_equal(cache_name, key, "second", "other")
+        assert isinstance(set_resp, CacheSetIfAbsentOrEqual.NotStored)
+        set_resp = await client_async.set_if_absent_or_equal(cache_name, key, "second", "first")
+        assert isinstance(set_resp, CacheSetIfAbsentOrEqual.Stored)
+        await assert_value(client_async, cache_name, key, "second")
+
+
 @behaves_like(a_cache_name_validator)
 @behaves_like(a_key_validator)
 @behaves_like(a_connection_validator)
+@behaves_like(a_cache_name_validator, a_connection_validator)
+def describe_keys_exist() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        keys = [uuid_str()]
+        return partial(client_async.keys_exist, keys=keys)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.keys_exist(cache_name, [key])
+
+        return _connection_validator
+
+    async def returns_existence_in_key_order(client_async: CacheClientAsync, cache_name: str) -> None:
+        existing_key, missing_key, bytes_key = uuid_str(), uuid_str(), uuid_bytes()
+        await client_async.set(cache_name, existing_key, "value")
+        await client_async.set(cache_name, bytes_key, b"value")
+
+        keys_exist_resp = await client_async.keys_exist(cache_name, [existing_key, missing_key, bytes_key])
+        assert keys_exist_resp == CacheKeysExist.Success([True, False, True])
+
+    async def with_no_keys_returns_no_results(client_async: CacheClientAsync, cache_name: str) -> None:
+        keys_exist_resp = await client_async.keys_exist(cache_name, [])
+        assert keys_exist_resp == CacheKeysExist.Success([])
+
+    async def with_bad_key_throws_exception(client_async: CacheClientAsync, cache_name: str) -> None:
+        keys_exist_resp = await client_async.keys_exist(cache_name, [uuid_str(), 1])  # type: ignore[list-item]
+        assert isinstance(keys_exist_resp, CacheKeysExist.Error)
+        assert keys_exist_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert keys_exist_resp.inner_exception.message == "Unsupported type for keys: <class 'int'>"
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator)
+def describe_key_exists() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        key = uuid_str()
+        return partial(client_async.key_exists, key=key)
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.key_exists, cache_name=cache_name)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.key_exists(cache_name, key)
+
+        return _connection_validator
+
+    async def returns_whether_the_key_exists(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        assert await client_async.key_exists(cache_name, key) == CacheKeyExists.Success(False)
+
+        await client_async.set(cache_name, key, "value")
+        assert await client_async.key_exists(cache_name, key) == CacheKeyExists.Success(True)
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator)
+def describe_item_get_ttl() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        key = uuid_str()
+        return partial(client_async.item_get_ttl, key=key)
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.item_get_ttl, cache_name=cache_name)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.item_get_ttl(cache_name, key)
+
+        return _connection_validator
+
+    async def returns_the_remaining_ttl(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        await client_async.set(cache_name, key, "value", ttl=timedelta(seconds=60))
+
+        item_get_ttl_resp = await client_async.item_get_ttl(cache_name, key)
+        assert isinstance(item_get_ttl_resp, CacheItemGetTtl.Hit)
+        assert timedelta(seconds=50) < item_get_ttl_resp.remaining_ttl <= timedelta(seconds=60)
+
+    async def returns_miss_for_a_missing_key(client_async: CacheClientAsync, cache_name: str) -> None:
+        item_get_ttl_resp = await client_async.item_get_ttl(cache_name, uuid_str())
+        assert isinstance(item_get_ttl_resp, CacheItemGetTtl.Miss)
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator)
+def describe_item_get_type() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        key = uuid_str()
+        return partial(client_async.item_get_type, key=key)
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.item_get_type, cache_name=cache_name)
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.item_get_type(cache_name, key)
+
+        return _connection_validator
+
+    async def returns_the_type_of_each_kind_of_item(client_async: CacheClientAsync, cache_name: str) -> None:
+        scalar, dictionary, list_, set_, sorted_set = (uuid_str() for _ in range(5))
+        await client_async.set(cache_name, scalar, "value")
+        await client_async.dictionary_set_field(cache_name, dictionary, "field", "value")
+        await client_async.list_push_back(cache_name, list_, "value")
+        await client_async.set_add_element(cache_name, set_, "value")
+        await client_async.sorted_set_put_element(cache_name, sorted_set, "value", 1.0)
+
+        for key, item_type in (
+            (scalar, ItemType.SCALAR),
+            (dictionary, ItemType.DICTIONARY),
+            (list_, ItemType.LIST),
+            (set_, ItemType.SET),
+            (sorted_set, ItemType.SORTED_SET),
+        ):
+            assert await client_async.item_get_type(cache_name, key) == CacheItemGetType.Hit(item_type)
+
+    async def returns_miss_for_a_missing_key(client_async: CacheClientAsync, cache_name: str) -> None:
+        item_get_type_resp = await client_async.item_get_type(cache_name, uuid_str())
+        assert isinstance(item_get_type_resp, CacheItemGetType.Miss)
+
+
+@behaves_like(a_cache_name_validator, a_key_validator, a_connection_validator)
+def describe_update_ttl() -> None:
+    @fixture
+    def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
+        key = uuid_str()
+        return partial(client_async.update_ttl, key=key, ttl=timedelta(seconds=60))
+
+    @fixture
+    def key_validator(client_async: CacheClientAsync, cache_name: TCacheName) -> TKeyValidator:
+        return partial(client_async.update_ttl, cache_name=cache_name, ttl=timedelta(seconds=60))
+
+    @fixture
+    def connection_validator(cache_name: TCacheName, key: TScalarKey) -> TConnectionValidator:
+        async def _connection_validator(client_async: CacheClientAsync) -> CacheResponse:
+            return await client_async.update_ttl(cache_name, key, timedelta(seconds=60))
+
+        return _connection_validator
+
+    async def sets_the_ttl(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        await client_async.set(cache_name, key, "value", ttl=timedelta(seconds=60))
+
+        update_ttl_resp = await client_async.update_ttl(cache_name, key, timedelta(seconds=600))
+        assert isinstance(update_ttl_resp, CacheUpdateTtl.Set)
+        item_get_ttl_resp = await client_async.item_get_ttl(cache_name, key)
+        assert isinstance(item_get_ttl_resp, CacheItemGetTtl.Hit)
+        assert item_get_ttl_resp.remaining_ttl > timedelta(seconds=60)
+
+    async def returns_miss_for_a_missing_key(client_async: CacheClientAsync, cache_name: str) -> None:
+        update_ttl_resp = await client_async.update_ttl(cache_name, uuid_str(), timedelta(seconds=60))
+        assert isinstance(update_ttl_resp, CacheUpdateTtl.Miss)
+
+    async def with_negative_ttl_throws_exception(client_async: CacheClientAsync, cache_name: str) -> None:
+        update_ttl_resp = await client_async.update_ttl(cache_name, uuid_str(), timedelta(seconds=-1))
+        assert isinstance(update_ttl_resp, CacheUpdateTtl.Error)
+        assert update_ttl_resp.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+        assert update_ttl_resp.inner_exception.message == "TTL must be a positive amount of time."
+
+
+def describe_increase_ttl() -> None:
+    async def only_makes_the_item_expire_later(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        await client_async.set(cache_name, key, "value", ttl=timedelta(seconds=60))
+
+        increase_ttl_resp = await client_async.increase_ttl(cache_name, key, timedelta(seconds=30))
+        assert isinstance(increase_ttl_resp, CacheIncreaseTtl.NotSet)
+        increase_ttl_resp = await client_async.increase_ttl(cache_name, key, timedelta(seconds=600))
+        assert isinstance(increase_ttl_resp, CacheIncreaseTtl.Set)
+
+    async def returns_miss_for_a_missing_key(client_async: CacheClientAsync, cache_name: str) -> None:
+        increase_ttl_resp = await client_async.increase_ttl(cache_name, uuid_str(), timedelta(seconds=60))
+        assert isinstance(increase_ttl_resp, CacheIncreaseTtl.Miss)
+
+
+def describe_decrease_ttl() -> None:
+    async def only_makes_the_item_expire_sooner(client_async: CacheClientAsync, cache_name: str) -> None:
+        key = uuid_str()
+        await client_async.set(cache_name, key, "value", ttl=timedelta(seconds=60))
+
+        decrease_ttl_resp = await client_async.decrease_ttl(cache_name, key, timedelta(seconds=600))
+        assert isinstance(decrease_ttl_resp, CacheDecreaseTtl.NotSet)
+        decrease_ttl_resp = await client_async.decrease_ttl(cache_name, key, timedelta(seconds=30))
+        assert isinstance(decrease_ttl_resp, CacheDecreaseTtl.Set)
+
+    async def returns_miss_for_a_missing_key(client_async: CacheClientAsync, cache_name: str) -> None:
+        decrease_ttl_resp = await client_async.decrease_ttl(cache_name, uuid_str(), timedelta(seconds=60))
+        assert isinstance(decrease_ttl_resp, CacheDecreaseTtl.Miss)
+
+
 def describe_delete() -> None:
     @fixture
     def cache_name_validator(client_async: CacheClientAsync) -> TCacheNameValidator:
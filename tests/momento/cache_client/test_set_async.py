@@ -15,6 +15,7 @@ from momento.responses import (
     CacheSetAddElement,
     CacheSetAddElements,
     CacheSetFetch,
+    CacheSetFetchObjects,
     CacheSetRemoveElement,
     CacheSetRemoveElements,
 )
@@ -399,6 +400,27 @@ def describe_set_fetch() -> None:
         assert isinstance(resp, CacheSetFetch.Miss)
 
 
+def describe_set_add_object_elements_and_set_fetch_objects() -> None:
+    async def stores_equal_elements_once(
+        client_async: CacheClientAsync, cache_name: TCacheName, set_name: TSetName
+    ) -> None:
+        elements = [{"a": 1, "b": 2}, {"b": 2, "a": 1}, [1, 2]]
+        add_resp = await client_async.set_add_object_elements(cache_name, set_name, elements)
+        assert isinstance(add_resp, CacheSetAddElements.Success)
+
+        fetch_resp = await client_async.set_fetch_objects(cache_name, set_name)
+        assert isinstance(fetch_resp, CacheSetFetchObjects.Hit)
+        assert len(fetch_resp.value_list) == 2
+        assert {"a": 1, "b": 2} in fetch_resp.value_list
+        assert [1, 2] in fetch_resp.value_list
+
+    async def misses_when_the_set_does_not_exist(
+        client_async: CacheClientAsync, cache_name: TCacheName, set_name: TSetName
+    ) -> None:
+        fetch_resp = await client_async.set_fetch_objects(cache_name, set_name)
+        assert isinstance(fetch_resp, CacheSetFetchObjects.Miss)
+
+
 @behaves_like(
     a_cache_name_validator,
     a_connection_validator,
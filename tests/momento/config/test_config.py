@@ -1,12 +1,25 @@
 from datetime import timedelta
 from pathlib import Path
+from typing import Optional
 
 import pytest
 from momento import CacheClient, CacheClientAsync, Configurations, CredentialProvider
-from momento.config import Configuration
-from momento.config.transport.transport_strategy import StaticGrpcConfiguration
-from momento.errors import MomentoErrorCode
+from momento.config import (
+    CircuitBreakerPolicy,
+    CompressionConfiguration,
+    Configuration,
+    HedgingPolicy,
+    NearCacheConfiguration,
+)
+from momento.config.transport.grpc_configuration import GrpcConfiguration
+from momento.config.transport.transport_strategy import (
+    AdaptiveTransportStrategy,
+    StaticGrpcConfiguration,
+)
+from momento.errors import InvalidArgumentException, MomentoErrorCode
 from momento.responses import CacheGet, ListCaches
+from momento.retry import ExponentialBackoffRetryStrategy, RetryBudget
+from momento.serialization import JsonSerializer, PickleSerializer
 
 from tests.utils import unique_test_cache_name
 
@@ -117,3 +130,187 @@ def test_laptop_config_enables_keepalive() -> None:
     assert keepalive_timeout is not None
     if keepalive_timeout is not None:
         assert keepalive_timeout.seconds == 1
+
+
+def test_configuration_num_channels_copy_constructor(configuration: Configuration) -> None:
+    def snag_num_channels(config: Configuration) -> int:
+        return config.get_transport_strategy().get_grpc_configuration().get_num_channels()
+
+    assert snag_num_channels(configuration) == 1
+    configuration = configuration.with_num_channels(4)
+    assert snag_num_channels(configuration) == 4
+    # Changing another setting keeps the channel count.
+    configuration = configuration.with_client_timeout(timedelta(seconds=600))
+    assert snag_num_channels(configuration) == 4
+
+
+def test_configuration_num_channels_must_be_positive(configuration: Configuration) -> None:
+    with pytest.raises(InvalidArgumentException) as e:
+        configuration.with_num_channels(0)
+
+    assert "Number of channels must be a positive integer." in str(e.value)
+
+
+def test_grpc_configurations_without_channel_support_use_one_channel() -> None:
+    class _GrpcConfiguration(GrpcConfiguration):
+        def get_deadline(self) -> timedelta:
+            return timedelta(seconds=5)
+
+        def with_deadline(self, deadline: timedelta) -> GrpcConfiguration:
+            return self
+
+        def with_root_certificates_pem(self, root_certificates_pem_path: Path) -> GrpcConfiguration:
+            return self
+
+        def get_root_certificates_pem(self) -> Optional[bytes]:
+            return None
+
+        def get_max_send_message_length(self) -> Optional[int]:
+            return None
+
+        def get_max_receive_message_length(self) -> Optional[int]:
+            return None
+
+        def get_keepalive_permit_without_calls(self) -> Optional[int]:
+            return None
+
+        def get_keepalive_time(self) -> Optional[timedelta]:
+            return None
+
+        def get_keepalive_timeout(self) -> Optional[timedelta]:
+            return None
+
+    grpc_configuration = _GrpcConfiguration()
+    assert grpc_configuration.get_num_channels() == 1
+    assert grpc_configuration.with_num_channels(1) is grpc_configuration
+    with pytest.raises(InvalidArgumentException) as e:
+        grpc_configuration.with_num_channels(2)
+
+    assert "does not support 2 channels" in str(e.value)
+
+
+def test_configuration_near_cache_copy_constructor(configuration: Configuration) -> None:
+    assert configuration.get_near_cache_configuration() is None
+    near_cache = NearCacheConfiguration(timedelta(seconds=5), max_entries=100)
+    configuration = configuration.with_near_cache(near_cache)
+    assert configuration.get_near_cache_configuration() is near_cache
+    # Changing another setting keeps the near cache.
+    configuration = configuration.with_client_timeout(timedelta(seconds=600)).with_num_channels(2)
+    assert configuration.get_near_cache_configuration() is near_cache
+    assert configuration.with_near_cache(None).get_near_cache_configuration() is None
+
+
+def test_near_cache_configuration_validates_limits() -> None:
+    with pytest.raises(InvalidArgumentException) as e:
+        NearCacheConfiguration(timedelta(seconds=5), max_entries=0)
+    assert "Max entries must be a positive integer." in str(e.value)
+
+    with pytest.raises(InvalidArgumentException) as e:
+        NearCacheConfiguration(timedelta(seconds=-1))
+    assert "Max staleness" in str(e.value)
+
+
+def test_configuration_request_coalescing_copy_constructor(configuration: Configuration) -> None:
+    assert configuration.get_request_coalescing() is False
+    configuration = configuration.with_request_coalescing()
+    assert configuration.get_request_coalescing() is True
+    # Changing another setting keeps request coalescing.
+    configuration = configuration.with_client_timeout(timedelta(seconds=600)).with_near_cache(None)
+    assert configuration.get_request_coalescing() is True
+    assert configuration.with_request_coalescing(False).get_request_coalescing() is False
+
+
+def test_configuration_retry_budget_copy_constructor(configuration: Configuration) -> None:
+    assert configuration.get_retry_budget() is None
+    retry_budget = RetryBudget(retry_ratio=0.2)
+    configuration = configuration.with_retry_budget(retry_budget)
+    assert configuration.get_retry_budget() is retry_budget
+    # Changing another setting keeps the retry budget.
+    configuration = configuration.with_retry_strategy(ExponentialBackoffRetryStrategy()).with_request_coalescing()
+    assert configuration.get_retry_budget() is retry_budget
+
+
+def test_configuration_hedging_policy_copy_constructor(configuration: Configuration) -> None:
+    assert configuration.get_hedging_policy() is None
+    hedging_policy = HedgingPolicy(latency_percentile=99.0)
+    configuration = configuration.with_hedging_policy(hedging_policy)
+    assert configuration.get_hedging_policy() is hedging_policy
+    # Changing another setting keeps the hedging policy.
+    configuration = configuration.with_retry_budget(RetryBudget()).with_num_channels(2)
+    assert configuration.get_hedging_policy() is hedging_policy
+
+
+def test_hedging_policy_validates_its_arguments() -> None:
+    with pytest.raises(InvalidArgumentException) as e:
+        HedgingPolicy(latency_percentile=100.0)
+    assert e.value.error_code == MomentoErrorCode.INVALID_ARGUMENT_ERROR
+    assert "Latency percentile" in str(e.value)
+    with pytest.raises(InvalidArgumentException):
+        HedgingPolicy(min_delay=timedelta(milliseconds=-1))
+
+
+def test_configuration_circuit_breaker_copy_constructor(configuration: Configuration) -> None:
+    assert configuration.get_circuit_breaker_policy() is None
+    circuit_breaker_policy = CircuitBreakerPolicy(minimum_requests=50)
+    configuration = configuration.with_circuit_breaker(circuit_breaker_policy)
+    assert configuration.get_circuit_breaker_policy() is circuit_breaker_policy
+    # Changing another setting keeps the circuit breaker policy.
+    configuration = configuration.with_hedging_policy(HedgingPolicy()).with_client_timeout(timedelta(seconds=5))
+    assert configuration.get_circuit_breaker_policy() is circuit_breaker_policy
+
+
+def test_circuit_breaker_policy_validates_its_arguments() -> None:
+    with pytest.raises(InvalidArgumentException) as e:
+        CircuitBreakerPolicy(failure_rate_threshold=0)
+    assert "Failure rate threshold" in str(e.value)
+    with pytest.raises(InvalidArgumentException) as e:
+        CircuitBreakerPolicy(half_open_max_probes=0)
+    assert "Half-open max probes" in str(e.value)
+
+
+def test_configuration_serializer_copy_constructor(configuration: Configuration) -> None:
+    assert isinstance(configuration.get_serializer(), JsonSerializer)
+    serializer = PickleSerializer()
+    configuration = configuration.with_serializer(serializer)
+    assert configuration.get_serializer() is serializer
+    # Changing another setting keeps the serializer.
+    configuration = configuration.with_circuit_breaker(CircuitBreakerPolicy()).with_client_timeout(timedelta(seconds=5))
+    assert configuration.get_serializer() is serializer
+
+
+def test_configuration_compression_copy_constructor(configuration: Configuration) -> None:
+    assert configuration.get_compression_configuration() is None
+    compression_configuration = CompressionConfiguration(threshold_bytes=4096)
+    configuration = configuration.with_compression(compression_configuration)
+    assert configuration.get_compression_configuration() is compression_configuration
+    # Changing another setting keeps the compression configuration.
+    configuration = configuration.with_serializer(PickleSerializer()).with_client_timeout(timedelta(seconds=5))
+    assert configuration.get_compression_configuration() is compression_configuration
+
+
+def test_adaptive_transport_strategy_copy_constructors_keep_its_settings() -> None:
+    transport_strategy = AdaptiveTransportStrategy(
+        StaticGrpcConfiguration(deadline=timedelta(milliseconds=1100)),
+        latency_percentile=99.9,
+        deadline_factor=3.0,
+        min_deadline=timedelta(milliseconds=20),
+    )
+    configuration = Configuration(transport_strategy, ExponentialBackoffRetryStrategy()).with_client_timeout(
+        timedelta(seconds=2)
+    )
+
+    copied = configuration.get_transport_strategy()
+    assert isinstance(copied, AdaptiveTransportStrategy)
+    assert copied.get_grpc_configuration().get_deadline() == timedelta(seconds=2)
+    assert copied.get_latency_percentile() == 99.9
+    assert copied.get_deadline_factor() == 3.0
+    assert copied.get_min_deadline() == timedelta(milliseconds=20)
+
+
+def test_adaptive_transport_strategy_validates_its_arguments() -> None:
+    grpc_configuration = StaticGrpcConfiguration(deadline=timedelta(seconds=1))
+    with pytest.raises(InvalidArgumentException) as e:
+        AdaptiveTransportStrategy(grpc_configuration, deadline_factor=0.5)
+    assert "Deadline factor" in str(e.value)
+    with pytest.raises(InvalidArgumentException):
+        AdaptiveTransportStrategy(grpc_configuration, min_deadline=timedelta(0))
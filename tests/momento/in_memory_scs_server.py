@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import DefaultDict, Dict, List, Set
+
+import grpc
+from momento_wire_types import cacheclient_pb2 as cache_pb
+from momento_wire_types import cacheclient_pb2_grpc as cache_grpc
+
+# The name every thread that answers calls starts with.
+SERVER_THREAD_NAME_PREFIX = "in-memory-scs-server"
+
+
+class InMemoryScsServer:
+    """A cache server on a local port that keeps items in memory, for tests that need a real gRPC channel.
+
+    Cache names and TTLs are recorded but not acted on: items never expire. Tests can delay or
+    fail the next calls of a method through `delays` and `failures`.
+    """
+
+    def __init__(self) -> None:
+        self.items: Dict[bytes, bytes] = {}
+        self.ttls: Dict[bytes, int] = {}
+        self.dictionaries: DefaultDict[bytes, Dict[bytes, bytes]] = defaultdict(dict)
+        self.sets: DefaultDict[bytes, Set[bytes]] = defaultdict(set)
+        self.lists: DefaultDict[bytes, List[bytes]] = defaultdict(list)
+        self.calls: Counter[str] = Counter()
+        self.cancelled: Counter[str] = Counter()
+        # The seconds to wait before answering each of the next calls of a method.
+        self.delays: DefaultDict[str, List[float]] = defaultdict(list)
+        # The status codes to fail each of the next calls of a method with.
+        self.failures: DefaultDict[str, List[grpc.StatusCode]] = defaultdict(list)
+        self._lock = threading.Lock()
+        self._server = grpc.server(ThreadPoolExecutor(max_workers=16, thread_name_prefix=SERVER_THREAD_NAME_PREFIX))
+        cache_grpc.add_ScsServicer_to_server(_Servicer(self), self._server)  # type: ignore[no-untyped-call]
+        self.port: int = self._server.add_insecure_port("127.0.0.1:0")
+        self._server.start()
+
+    def stop(self) -> None:
+        self._server.stop(None)
+
+    def before(self, method: str, context: grpc.ServicerContext) -> None:
+        """Counts a call, then delays or fails it as the test asked."""
+        with self._lock:
+            self.calls[method] += 1
+            delay = self.delays[method].pop(0) if self.delays[method] else 0.0
+            failure = self.failures[method].pop(0) if self.failures[method] else None
+        if delay and not _sleep_unless_cancelled(context, delay):
+            with self._lock:
+                self.cancelled[method] += 1
+            context.abort(grpc.StatusCode.CANCELLED, "cancelled by the client")
+        if failure is not None:
+            context.abort(failure, f"{method} failed by the test")
+
+
+def _sleep_unless_cancelled(context: grpc.ServicerContext, seconds: float) -> bool:
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        if not context.is_active():
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class _Servicer(cache_grpc.ScsServicer):
+    def __init__(self, server: InMemoryScsServer):
+        self._server = server
+
+    def Get(self, request: cache_pb._GetRequest, context: grpc.ServicerContext) -> cache_pb._GetResponse:
+        self._server.before("Get", context)
+        value = self._server.items.get(request.cache_key)
+        if value is None:
+            return cache_pb._GetResponse(result=cache_pb.Miss)
+        return cache_pb._GetResponse(result=cache_pb.Hit, cache_body=value)
+
+    def Set(self, request: cache_pb._SetRequest, context: grpc.ServicerContext) -> cache_pb._SetResponse:
+        self._server.before("Set", context)
+        self._server.items[request.cache_key] = request.cache_body
+        self._server.ttls[request.cache_key] = request.ttl_milliseconds
+        return cache_pb._SetResponse()
+
+    def Delete(self, request: cache_pb._DeleteRequest, context: grpc.ServicerContext) -> cache_pb._DeleteResponse:
+        self._server.before("Delete", context)
+        self._server.items.pop(request.cache_key, None)
+        self._server.ttls.pop(request.cache_key, None)
+        return cache_pb._DeleteResponse()
+
+    def UpdateTtl(
+        self, request: cache_pb._UpdateTtlRequest, context: grpc.ServicerContext
+    ) -> cache_pb._UpdateTtlResponse:
+        self._server.before("UpdateTtl", context)
+        if request.cache_key not in self._server.items:
+            return cache_pb._UpdateTtlResponse(missing=cache_pb._UpdateTtlResponse._Missing())
+        self._server.ttls[request.cache_key] = getattr(request, request.WhichOneof("update_ttl"))
+        return cache_pb._UpdateTtlResponse(set=cache_pb._UpdateTtlResponse._Set())
+
+    def SetIf(self, request: cache_pb._SetIfRequest, context: grpc.ServicerContext) -> cache_pb._SetIfResponse:
+        self._server.before("SetIf", context)
+        current = self._server.items.get(request.cache_key)
+        condition = request.WhichOneof("condition")
+        if condition == "equal":
+            stored = current == request.equal.value_to_check
+        elif condition == "absent":
+            stored = current is None
+        else:
+            context.abort(grpc.StatusCode.UNIMPLEMENTED, f"SetIf condition {condition} is not implemented")
+        if not stored:
+            return cache_pb._SetIfResponse(not_stored=cache_pb._SetIfResponse._NotStored())
+        self._server.items[request.cache_key] = request.cache_body
+        return cache_pb._SetIfResponse(stored=cache_pb._SetIfResponse._Stored())
+
+    def DictionaryFetch(
+        self, request: cache_pb._DictionaryFetchRequest, context: grpc.ServicerContext
+    ) -> cache_pb._DictionaryFetchResponse:
+        self._server.before("DictionaryFetch", context)
+        if request.dictionary_name not in self._server.dictionaries:
+            return cache_pb._DictionaryFetchResponse(missing=cache_pb._DictionaryFetchResponse._Missing())
+        items = [
+            cache_pb._DictionaryFieldValuePair(field=field, value=value)
+            for field, value in self._server.dictionaries[request.dictionary_name].items()
+        ]
+        return cache_pb._DictionaryFetchResponse(found=cache_pb._DictionaryFetchResponse._Found(items=items))
+
+    def DictionarySet(
+        self, request: cache_pb._DictionarySetRequest, context: grpc.ServicerContext
+    ) -> cache_pb._DictionarySetResponse:
+        self._server.before("DictionarySet", context)
+        for item in request.items:
+            self._server.dictionaries[request.dictionary_name][item.field] = item.value
+        return cache_pb._DictionarySetResponse()
+
+    def SetFetch(self, request: cache_pb._SetFetchRequest, context: grpc.ServicerContext) -> cache_pb._SetFetchResponse:
+        self._server.before("SetFetch", context)
+        if request.set_name not in self._server.sets:
+            return cache_pb._SetFetchResponse(missing=cache_pb._SetFetchResponse._Missing())
+        elements = list(self._server.sets[request.set_name])
+        return cache_pb._SetFetchResponse(found=cache_pb._SetFetchResponse._Found(elements=elements))
+
+    def SetUnion(self, request: cache_pb._SetUnionRequest, context: grpc.ServicerContext) -> cache_pb._SetUnionResponse:
+        self._server.before("SetUnion", context)
+        self._server.sets[request.set_name].update(request.elements)
+        return cache_pb._SetUnionResponse()
+
+    def ListConcatenateBack(
+        self, request: cache_pb._ListConcatenateBackRequest, context: grpc.ServicerContext
+    ) -> cache_pb._ListConcatenateBackResponse:
+        self._server.before("ListConcatenateBack", context)
+        self._server.lists[request.list_name].extend(request.values)
+        return cache_pb._ListConcatenateBackResponse(list_length=len(self._server.lists[request.list_name]))
+
+    def ListRemove(
+        self, request: cache_pb._ListRemoveRequest, context: grpc.ServicerContext
+    ) -> cache_pb._ListRemoveResponse:
+        self._server.before("ListRemove", context)
+        values = self._server.lists[request.list_name]
+        values[:] = [value for value in values if value != request.all_elements_with_value]
+        return cache_pb._ListRemoveResponse(found=cache_pb._ListRemoveResponse._Found(list_length=len(values)))
+
+    def ListFetch(
+        self, request: cache_pb._ListFetchRequest, context: grpc.ServicerContext
+    ) -> cache_pb._ListFetchResponse:
+        self._server.before("ListFetch", context)
+        if request.list_name not in self._server.lists:
+            return cache_pb._ListFetchResponse(missing=cache_pb._ListFetchResponse._Missing())
+        values = self._server.lists[request.list_name]
+        return cache_pb._ListFetchResponse(found=cache_pb._ListFetchResponse._Found(values=values))
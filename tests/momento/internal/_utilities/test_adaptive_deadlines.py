@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+import grpc
+from momento.config.transport.transport_strategy import AdaptiveTransportStrategy, StaticGrpcConfiguration
+from momento.internal._utilities._adaptive_deadlines import _AdaptiveDeadlines
+
+GET_METHOD = "/cache_client.Scs/Get"
+INCREMENT_METHOD = "/cache_client.Scs/Increment"
+
+
+def _adaptive_deadlines(min_deadline: timedelta = timedelta(milliseconds=1)) -> _AdaptiveDeadlines:
+    return _AdaptiveDeadlines(
+        AdaptiveTransportStrategy(
+            StaticGrpcConfiguration(deadline=timedelta(seconds=1)),
+            latency_percentile=99.0,
+            deadline_factor=3.0,
+            min_deadline=min_deadline,
+        )
+    )
+
+
+def test_uses_the_full_timeout_until_enough_latencies_are_recorded() -> None:
+    adaptive_deadlines = _adaptive_deadlines()
+    for _ in range(99):
+        adaptive_deadlines.record(GET_METHOD, grpc.StatusCode.OK, 0.010)
+    assert adaptive_deadlines.attempt_timeout(GET_METHOD, 1.1) == 1.1
+
+    adaptive_deadlines.record(GET_METHOD, grpc.StatusCode.OK, 0.010)
+    assert 0.030 <= adaptive_deadlines.attempt_timeout(GET_METHOD, 1.1) <= 0.033
+
+
+def test_clamps_the_deadline_between_the_min_deadline_and_the_timeout() -> None:
+    adaptive_deadlines = _adaptive_deadlines(min_deadline=timedelta(milliseconds=100))
+    for _ in range(100):
+        adaptive_deadlines.record(GET_METHOD, grpc.StatusCode.OK, 0.001)
+    assert adaptive_deadlines.attempt_timeout(GET_METHOD, 1.1) == 0.1
+
+    for _ in range(100):
+        adaptive_deadlines.record(GET_METHOD, grpc.StatusCode.DEADLINE_EXCEEDED, 1.0)
+    assert adaptive_deadlines.attempt_timeout(GET_METHOD, 1.1) == 1.1
+
+
+def test_only_adapts_idempotent_requests_and_ignores_other_errors() -> None:
+    adaptive_deadlines = _adaptive_deadlines()
+    for _ in range(100):
+        adaptive_deadlines.record(INCREMENT_METHOD, grpc.StatusCode.OK, 0.010)
+        adaptive_deadlines.record(GET_METHOD, grpc.StatusCode.UNAVAILABLE, 0.010)
+    assert adaptive_deadlines.attempt_timeout(INCREMENT_METHOD, 1.1) == 1.1
+    assert adaptive_deadlines.attempt_timeout(GET_METHOD, 1.1) == 1.1
@@ -0,0 +1,151 @@
+import time
+from datetime import timedelta
+from typing import List
+
+import grpc
+import pytest
+from momento.config import CircuitBreakerPolicy
+from momento.config.middleware import CircuitBreakerState, CircuitBreakerStateChange
+from momento.errors import CircuitBreakerOpenException, MomentoErrorCode
+from momento.internal._utilities._circuit_breaker import _CircuitBreaker
+
+
+def _circuit_breaker(state_changes: List[CircuitBreakerStateChange], **kwargs: object) -> _CircuitBreaker:
+    policy = CircuitBreakerPolicy(
+        failure_rate_threshold=0.5,
+        minimum_requests=4,
+        window=timedelta(seconds=10),
+        open_duration=timedelta(milliseconds=20),
+        **kwargs,  # type: ignore[arg-type]
+    )
+    return _CircuitBreaker(policy, 1, [state_changes.append])
+
+
+def _record(circuit_breaker: _CircuitBreaker, status_code: grpc.StatusCode) -> None:
+    circuit_breaker.record(status_code, circuit_breaker.acquire())
+
+
+def test_stays_closed_below_the_minimum_requests_or_failure_rate() -> None:
+    state_changes: List[CircuitBreakerStateChange] = []
+    circuit_breaker = _circuit_breaker(state_changes)
+    for _ in range(3):
+        _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    assert circuit_breaker.state == CircuitBreakerState.CLOSED
+
+    # Errors returned by the server do not count as failures.
+    for _ in range(10):
+        _record(circuit_breaker, grpc.StatusCode.NOT_FOUND)
+    _record(circuit_breaker, grpc.StatusCode.DEADLINE_EXCEEDED)
+    assert circuit_breaker.state == CircuitBreakerState.CLOSED
+    assert state_changes == []
+
+
+def test_opens_at_the_failure_rate_threshold_and_fails_fast() -> None:
+    state_changes: List[CircuitBreakerStateChange] = []
+    circuit_breaker = _circuit_breaker(state_changes)
+    _record(circuit_breaker, grpc.StatusCode.OK)
+    _record(circuit_breaker, grpc.StatusCode.OK)
+    _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+
+    assert circuit_breaker.state == CircuitBreakerState.OPEN
+    assert state_changes == [CircuitBreakerStateChange(1, CircuitBreakerState.CLOSED, CircuitBreakerState.OPEN)]
+    with pytest.raises(CircuitBreakerOpenException) as e:
+        circuit_breaker.acquire()
+    assert e.value.error_code == MomentoErrorCode.CIRCUIT_BREAKER_OPEN_ERROR
+
+
+def test_a_successful_probe_closes_the_circuit() -> None:
+    state_changes: List[CircuitBreakerStateChange] = []
+    circuit_breaker = _circuit_breaker(state_changes)
+    for _ in range(4):
+        _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    time.sleep(0.03)
+
+    probe = circuit_breaker.acquire()
+    assert probe is True
+    assert state_changes[-1].state == CircuitBreakerState.HALF_OPEN
+    # Only one probe may be in flight.
+    with pytest.raises(CircuitBreakerOpenException):
+        circuit_breaker.acquire()
+
+    circuit_breaker.record(grpc.StatusCode.OK, probe)
+    assert circuit_breaker.state == CircuitBreakerState.CLOSED
+    assert [state_change.state for state_change in state_changes] == [
+        CircuitBreakerState.OPEN,
+        CircuitBreakerState.HALF_OPEN,
+        CircuitBreakerState.CLOSED,
+    ]
+    # The failures from before the circuit opened are forgotten.
+    _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    assert circuit_breaker.state == CircuitBreakerState.CLOSED
+
+
+def test_a_failed_probe_opens_the_circuit_again() -> None:
+    state_changes: List[CircuitBreakerStateChange] = []
+    circuit_breaker = _circuit_breaker(state_changes, half_open_max_probes=2)
+    for _ in range(4):
+        _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    time.sleep(0.03)
+
+    first_probe = circuit_breaker.acquire()
+    second_probe = circuit_breaker.acquire()
+    circuit_breaker.record(grpc.StatusCode.DEADLINE_EXCEEDED, first_probe)
+    assert circuit_breaker.state == CircuitBreakerState.OPEN
+    # The other probe completing late does not change the state.
+    circuit_breaker.record(grpc.StatusCode.OK, second_probe)
+    assert circuit_breaker.state == CircuitBreakerState.OPEN
+    assert state_changes[-1] == CircuitBreakerStateChange(1, CircuitBreakerState.HALF_OPEN, CircuitBreakerState.OPEN)
+
+
+def test_a_cancelled_probe_frees_its_slot_without_closing_the_circuit() -> None:
+    state_changes: List[CircuitBreakerStateChange] = []
+    circuit_breaker = _circuit_breaker(state_changes)
+    for _ in range(4):
+        _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    time.sleep(0.03)
+
+    circuit_breaker.record(grpc.StatusCode.CANCELLED, circuit_breaker.acquire())
+    assert circuit_breaker.state == CircuitBreakerState.HALF_OPEN
+
+    # The next probe decides.
+    circuit_breaker.record(grpc.StatusCode.OK, circuit_breaker.acquire())
+    assert state_changes[-1] == CircuitBreakerStateChange(1, CircuitBreakerState.HALF_OPEN, CircuitBreakerState.CLOSED)
+
+
+def test_cancelled_requests_do_not_dilute_the_failure_rate() -> None:
+    circuit_breaker = _circuit_breaker([])
+    for _ in range(10):
+        _record(circuit_breaker, grpc.StatusCode.CANCELLED)
+    _record(circuit_breaker, grpc.StatusCode.OK)
+    for _ in range(3):
+        _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    assert circuit_breaker.state == CircuitBreakerState.OPEN
+
+
+def test_a_failing_listener_does_not_break_the_circuit_breaker() -> None:
+    def listener(state_change: CircuitBreakerStateChange) -> None:
+        raise ValueError("listener failed")
+
+    policy = CircuitBreakerPolicy(minimum_requests=1)
+    circuit_breaker = _CircuitBreaker(policy, 0, [listener])
+    _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    assert circuit_breaker.state == CircuitBreakerState.OPEN
+
+
+def test_reports_whether_it_accepts_requests() -> None:
+    circuit_breaker = _circuit_breaker([])
+    assert circuit_breaker.is_accepting_requests()
+    for _ in range(4):
+        _record(circuit_breaker, grpc.StatusCode.UNAVAILABLE)
+    assert not circuit_breaker.is_accepting_requests()
+
+    # Once the open duration has passed, a probe would be admitted.
+    time.sleep(0.03)
+    assert circuit_breaker.is_accepting_requests()
+    assert circuit_breaker.state == CircuitBreakerState.OPEN
+    probe = circuit_breaker.acquire()
+    assert not circuit_breaker.is_accepting_requests()
+
+    circuit_breaker.record(grpc.StatusCode.OK, probe)
+    assert circuit_breaker.is_accepting_requests()
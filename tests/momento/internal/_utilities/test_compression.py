@@ -0,0 +1,89 @@
+import importlib.util
+import zlib
+
+import pytest
+from momento.config import CompressionAlgorithm, CompressionConfiguration
+from momento.errors import InvalidArgumentException, MomentoErrorCode, SerializationException
+from momento.internal._utilities._compression import _Compressor
+
+_COMPRESSIBLE = b"<div class='fragment'>momento</div>" * 100
+
+
+def test_compresses_values_at_or_above_the_threshold() -> None:
+    compressor = _Compressor(CompressionConfiguration(threshold_bytes=len(_COMPRESSIBLE)))
+
+    compressed = compressor.compress(_COMPRESSIBLE)
+    assert compressed.startswith(b"\xffMC\x01")
+    assert len(compressed) < len(_COMPRESSIBLE) / 10
+    assert zlib.decompress(compressed[4:]) == _COMPRESSIBLE
+    assert compressor.decompress(compressed) == _COMPRESSIBLE
+
+    assert compressor.compress(_COMPRESSIBLE[:-1]) == _COMPRESSIBLE[:-1]
+
+
+def test_sends_values_that_do_not_shrink_uncompressed() -> None:
+    compressor = _Compressor(CompressionConfiguration(threshold_bytes=1))
+    value = bytes(range(256))
+    assert compressor.compress(value) == value
+
+
+def test_passes_uncompressed_values_through_on_read() -> None:
+    compressor = _Compressor(CompressionConfiguration())
+    for value in (b"", b"plain text", "café".encode("utf-8"), b"\xffMC", b"\xffMC\x09unknown algorithm"):
+        assert compressor.decompress(value) == value
+
+
+def test_raises_on_tagged_values_that_cannot_be_decompressed() -> None:
+    compressor = _Compressor(CompressionConfiguration())
+    with pytest.raises(SerializationException) as e:
+        compressor.decompress(b"\xffMC\x01not zlib")
+    assert e.value.error_code == MomentoErrorCode.SERIALIZATION_ERROR
+    assert "tagged as zlib" in e.value.message
+
+
+def test_reads_values_written_with_another_algorithm_and_level() -> None:
+    writer = _Compressor(CompressionConfiguration(threshold_bytes=1, level=9))
+    reader = _Compressor(CompressionConfiguration(threshold_bytes=1, level=1))
+    assert reader.decompress(writer.compress(_COMPRESSIBLE)) == _COMPRESSIBLE
+
+
+@pytest.mark.parametrize(
+    "algorithm, package", [(CompressionAlgorithm.ZSTD, "zstandard"), (CompressionAlgorithm.LZ4, "lz4")]
+)
+def test_optional_algorithms_round_trip_or_explain_how_to_install_them(
+    algorithm: CompressionAlgorithm, package: str
+) -> None:
+    if importlib.util.find_spec(package) is None:
+        with pytest.raises(ImportError) as e:
+            CompressionConfiguration(algorithm)
+        assert f"pip install {package}" in str(e.value)
+        return
+    compressor = _Compressor(CompressionConfiguration(algorithm, threshold_bytes=1))
+    compressed = compressor.compress(_COMPRESSIBLE)
+    assert len(compressed) < len(_COMPRESSIBLE)
+    assert _Compressor(CompressionConfiguration()).decompress(compressed) == _COMPRESSIBLE
+
+
+def test_threshold_must_be_positive() -> None:
+    with pytest.raises(InvalidArgumentException) as e:
+        CompressionConfiguration(threshold_bytes=0)
+    assert "Threshold bytes" in str(e.value)
+
+
+def test_compresses_buffers() -> None:
+    compressor = _Compressor(CompressionConfiguration(threshold_bytes=len(_COMPRESSIBLE)))
+
+    compressed = compressor.compress(memoryview(bytearray(_COMPRESSIBLE)))
+    assert compressor.decompress(compressed) == _COMPRESSIBLE
+
+    small = compressor.compress(memoryview(bytearray(_COMPRESSIBLE[:-1])))
+    assert isinstance(small, bytes)
+    assert small == _COMPRESSIBLE[:-1]
+
+
+def test_round_trips_uncompressed_values_that_start_with_the_header() -> None:
+    compressor = _Compressor(CompressionConfiguration())
+    for value in (b"\xffMC\x01not zlib", b"\xffMC\x00", b"\xffMC"):
+        sent = compressor.compress(value)
+        assert sent == b"\xffMC\x00" + value
+        assert compressor.decompress(sent) == value
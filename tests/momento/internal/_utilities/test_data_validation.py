@@ -0,0 +1,51 @@
+import array
+
+import pytest
+from momento.errors import InvalidArgumentException
+from momento.internal._utilities import _as_bytes
+from momento.internal._utilities._data_validation import _as_buffer
+
+
+def test_as_bytes_encodes_str_and_returns_bytes_as_is() -> None:
+    value = b"\x00value"
+    assert _as_bytes("välue") == "välue".encode("utf-8")
+    assert _as_bytes(value) is value
+
+
+@pytest.mark.parametrize(
+    "buffer",
+    [
+        bytearray(b"abcdef"),
+        memoryview(b"xxabcdefxx")[2:-2],
+        memoryview(bytearray(b"abcdef")),
+        array.array("B", b"abcdef"),
+    ],
+)
+def test_as_bytes_accepts_buffers(buffer: bytes) -> None:
+    assert _as_bytes(buffer) == b"abcdef"
+
+
+def test_as_bytes_reads_multi_byte_and_non_contiguous_buffers_in_order() -> None:
+    words = array.array("H", [1, 2, 3])
+    assert _as_bytes(words) == words.tobytes()
+    assert _as_bytes(memoryview(b"a-b-c")[::2]) == b"abc"
+
+
+def test_as_buffer_does_not_copy() -> None:
+    value = b"value"
+    assert _as_buffer(memoryview(value)) is value
+
+    data = bytearray(b"value")
+    view = _as_buffer(data)
+    assert isinstance(view, memoryview)
+    assert view.obj is data
+
+    words = array.array("H", [1, 2, 3])
+    view = _as_buffer(words)
+    assert isinstance(view, memoryview)
+    assert (view.ndim, view.format, view.nbytes) == (1, "B", 6)
+
+
+def test_as_bytes_rejects_non_buffers() -> None:
+    with pytest.raises(InvalidArgumentException, match="Unsupported type for value: <class 'int'>"):
+        _as_bytes(1, "Unsupported type for value: ")  # type: ignore[arg-type]
@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from momento.config import HedgingPolicy, HedgingStats
+from momento.internal._utilities._hedging import _HedgingState
+
+
+def test_only_idempotent_requests_are_hedgeable() -> None:
+    assert _HedgingState.is_hedgeable("Get")
+    assert _HedgingState.is_hedgeable("DictionaryFetch")
+    assert not _HedgingState.is_hedgeable("SetIfNotExists")
+    assert not _HedgingState.is_hedgeable("Increment")
+
+
+def test_does_not_hedge_until_enough_latencies_are_recorded() -> None:
+    state = _HedgingState(HedgingPolicy(latency_percentile=90.0))
+    for _ in range(99):
+        state.record("Get", 0.010, hedged=False, hedge_won=False)
+    assert state.hedge_delay("Get") is None
+
+    state.record("Get", 0.010, hedged=False, hedge_won=False)
+    delay = state.hedge_delay("Get")
+    assert delay is not None and 0.010 <= delay <= 0.011
+    assert state.hedge_delay("DictionaryFetch") is None
+
+
+def test_hedge_delay_is_at_least_the_min_delay() -> None:
+    state = _HedgingState(HedgingPolicy(min_delay=timedelta(milliseconds=50)))
+    for _ in range(100):
+        state.record("Get", 0.001, hedged=False, hedge_won=False)
+    assert state.hedge_delay("Get") == 0.050
+
+
+def test_counts_hedges_and_hedge_wins() -> None:
+    state = _HedgingState(HedgingPolicy())
+    state.record("Get", 0.001, hedged=False, hedge_won=False)
+    state.record("Get", 0.002, hedged=True, hedge_won=False)
+    state.record("Get", 0.003, hedged=True, hedge_won=True)
+    state.record("Get", 0.001, hedged=False, hedge_won=False)
+
+    stats = state.stats()
+    assert stats == HedgingStats(requests=4, hedges=2, hedge_wins=1)
+    assert stats.hedge_rate == 0.5
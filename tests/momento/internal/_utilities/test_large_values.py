@@ -0,0 +1,146 @@
+import io
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+from momento.errors import InvalidArgumentException, SerializationException
+from momento.internal._utilities._large_values import (
+    _FileReplacement,
+    _LargeValueManifest,
+    _LargeValueWriter,
+    _mapped_file,
+    escape_stored_value,
+    unescape_stored_value,
+)
+
+_VALUE = os.urandom(2500)
+
+
+def _chunks(manifest: _LargeValueManifest) -> List[bytes]:
+    return [manifest.chunk(memoryview(_VALUE), index).tobytes() for index in range(manifest.num_chunks)]
+
+
+def test_splits_a_value_into_chunks() -> None:
+    manifest = _LargeValueManifest.for_value(memoryview(_VALUE), 1000)
+
+    assert (manifest.size, manifest.chunk_size, manifest.num_chunks) == (2500, 1000, 3)
+    assert [len(chunk) for chunk in _chunks(manifest)] == [1000, 1000, 500]
+    for index, chunk in enumerate(_chunks(manifest)):
+        manifest.verify_chunk(index, chunk)
+
+
+def test_derives_distinct_chunk_keys_per_write() -> None:
+    first = _LargeValueManifest.for_value(memoryview(_VALUE), 1000)
+    second = _LargeValueManifest.for_value(memoryview(_VALUE), 1000)
+
+    keys = {manifest.chunk_key(b"key", index) for manifest in (first, second) for index in range(3)}
+    assert len(keys) == 6
+    assert all(key.startswith(b"key\x00chunk\x00") for key in keys)
+
+
+def test_round_trips_the_manifest() -> None:
+    manifest = _LargeValueManifest.for_value(memoryview(_VALUE), 1000)
+    encoded = manifest.encode()
+
+    assert _LargeValueManifest.is_manifest(encoded)
+    assert not _LargeValueManifest.is_manifest(_VALUE[:1] + b"not a manifest")
+    decoded = _LargeValueManifest.decode(encoded)
+    assert (decoded.write_id, decoded.size, decoded.chunk_size, decoded.checksums) == (
+        manifest.write_id,
+        manifest.size,
+        manifest.chunk_size,
+        manifest.checksums,
+    )
+
+
+@pytest.mark.parametrize(
+    "value", [b"\xffML\x01" + _VALUE, b"\xffML\x00" + _VALUE, b"\xffML", b"\xffMC\x01", b"plain", b""]
+)
+def test_round_trips_values_stored_as_is(value: bytes) -> None:
+    stored = bytes(escape_stored_value(memoryview(value)))
+
+    assert not _LargeValueManifest.is_manifest(stored)
+    assert unescape_stored_value(stored) == value
+    if not value.startswith(b"\xffML"):
+        assert stored == value
+
+
+@pytest.mark.parametrize("chunk", [b"x" + _VALUE[1:1000], _VALUE[:999]])
+def test_rejects_chunks_that_do_not_match(chunk: bytes) -> None:
+    manifest = _LargeValueManifest.for_value(memoryview(_VALUE), 1000)
+    with pytest.raises(SerializationException, match="Chunk 0 of a 2500 byte value does not match its checksum"):
+        manifest.verify_chunk(0, chunk)
+
+
+@pytest.mark.parametrize("document", [b"{", b'{"id":"a","size":2500,"chunk_size":1000,"crc32":[1]}', b'{"id":"a"}'])
+def test_rejects_malformed_manifests(document: bytes) -> None:
+    with pytest.raises(SerializationException):
+        _LargeValueManifest.decode(b"\xffML\x01" + document)
+
+
+def test_writes_into_a_buffer() -> None:
+    destination = bytearray(3000)
+    writer = _LargeValueWriter(destination, len(_VALUE))
+    writer.write(_VALUE[:1000])
+    writer.write(_VALUE[1000:])
+
+    assert writer.value() is None
+    assert destination[:2500] == _VALUE
+
+
+def test_writes_into_a_file() -> None:
+    destination = io.BytesIO()
+    writer = _LargeValueWriter(destination, len(_VALUE))
+    writer.write(_VALUE[:1000])
+    writer.write(_VALUE[1000:])
+
+    assert writer.value() is None
+    assert destination.getvalue() == _VALUE
+
+
+def test_returns_the_value_without_a_destination() -> None:
+    writer = _LargeValueWriter(None, len(_VALUE))
+    writer.write(_VALUE[:1000])
+    writer.write(_VALUE[1000:])
+    assert writer.value() == _VALUE
+
+
+@pytest.mark.parametrize("destination", [bytearray(10), b"\0" * 3000, 3000])
+def test_rejects_unusable_destinations(destination: bytearray) -> None:
+    with pytest.raises(InvalidArgumentException):
+        _LargeValueWriter(destination, len(_VALUE))
+
+
+@pytest.mark.parametrize("contents", [_VALUE, b""])
+def test_maps_a_file(tmp_path: Path, contents: bytes) -> None:
+    path = tmp_path / "value"
+    path.write_bytes(contents)
+
+    with _mapped_file(path) as mapped:
+        assert memoryview(mapped).tobytes() == contents
+
+
+def test_replaces_a_file_on_commit(tmp_path: Path) -> None:
+    path = tmp_path / "value"
+    path.write_bytes(b"old")
+
+    replacement = _FileReplacement(path)
+    replacement.file.write(_VALUE)
+    assert path.read_bytes() == b"old"
+    replacement.commit()
+
+    assert path.read_bytes() == _VALUE
+    assert os.listdir(tmp_path) == ["value"]
+
+
+def test_leaves_a_file_on_discard(tmp_path: Path) -> None:
+    path = tmp_path / "value"
+    path.write_bytes(b"old")
+
+    replacement = _FileReplacement(path)
+    replacement.file.write(_VALUE)
+    replacement.discard()
+
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["value"]
@@ -0,0 +1,32 @@
+from momento.internal._utilities._latency_histogram import _LatencyHistogram
+
+
+def test_has_no_percentile_until_a_latency_is_recorded() -> None:
+    histogram = _LatencyHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.count == 0
+
+
+def test_estimates_percentiles_within_the_bucket_growth() -> None:
+    histogram = _LatencyHistogram()
+    for millis in range(1, 101):
+        histogram.record(millis / 1000)
+
+    p50 = histogram.percentile(50)
+    p99 = histogram.percentile(99)
+    assert p50 is not None and 0.050 <= p50 <= 0.050 * 1.1
+    assert p99 is not None and 0.099 <= p99 <= 0.099 * 1.1
+    assert histogram.count == 100
+
+
+def test_halves_counts_to_favor_recent_latencies() -> None:
+    histogram = _LatencyHistogram(max_count=100)
+    for _ in range(99):
+        histogram.record(0.001)
+    histogram.record(0.5)
+    assert histogram.count == 49
+
+    for _ in range(60):
+        histogram.record(0.5)
+    p50 = histogram.percentile(50)
+    assert p50 is not None and p50 >= 0.5
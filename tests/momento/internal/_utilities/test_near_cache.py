@@ -0,0 +1,101 @@
+import time
+from datetime import timedelta
+
+from momento.config import NearCacheConfiguration, NearCacheStats
+from momento.internal._utilities._near_cache import _NearCache
+from momento.responses import CacheDictionaryFetch, CacheGet, CacheSetFetch
+
+
+def _near_cache(
+    max_staleness: timedelta = timedelta(minutes=1), max_entries: int = 100, max_size_bytes: int = 1024
+) -> _NearCache:
+    return _NearCache(NearCacheConfiguration(max_staleness, max_entries, max_size_bytes))
+
+
+def test_returns_a_stored_hit() -> None:
+    near_cache = _near_cache()
+    hit = CacheGet.Hit(b"value")
+    near_cache.put("cache", b"key", hit, len(b"value"))
+
+    assert near_cache.get("cache", b"key", CacheGet.Hit) == hit
+    assert near_cache.get("other-cache", b"key", CacheGet.Hit) is None
+    assert near_cache.stats() == NearCacheStats(hits=1, misses=1, evictions=0, entries=1, size_bytes=8)
+
+
+def test_ignores_entries_of_another_type() -> None:
+    near_cache = _near_cache()
+    near_cache.put("cache", b"name", CacheSetFetch.Hit({b"element"}), len(b"element"))
+
+    assert near_cache.get("cache", b"name", CacheDictionaryFetch.Hit) is None
+    assert near_cache.stats().entries == 0
+
+
+def test_expires_entries_after_max_staleness() -> None:
+    near_cache = _near_cache(max_staleness=timedelta(milliseconds=10))
+    near_cache.put("cache", b"key", CacheGet.Hit(b"value"), len(b"value"))
+    time.sleep(0.02)
+
+    assert near_cache.get("cache", b"key", CacheGet.Hit) is None
+    assert near_cache.stats() == NearCacheStats(hits=0, misses=1, evictions=0, entries=0, size_bytes=0)
+
+
+def test_returns_copies_of_collection_hits() -> None:
+    near_cache = _near_cache()
+    hit = CacheSetFetch.Hit({b"a"})
+    near_cache.put("cache", b"name", hit, 1)
+    hit.value_set_bytes.add(b"b")
+
+    cached = near_cache.get("cache", b"name", CacheSetFetch.Hit)
+    assert cached == CacheSetFetch.Hit({b"a"})
+    assert cached is not None
+    cached.value_set_bytes.add(b"c")
+    assert near_cache.get("cache", b"name", CacheSetFetch.Hit) == CacheSetFetch.Hit({b"a"})
+
+
+def test_expires_entries_with_the_ttl_of_the_last_write() -> None:
+    near_cache = _near_cache()
+    near_cache.invalidate("cache", b"short", timedelta(milliseconds=10))
+    near_cache.invalidate("cache", b"unknown", timedelta(milliseconds=10))
+    near_cache.invalidate("cache", b"unknown")
+    for key in (b"short", b"unknown"):
+        near_cache.put("cache", key, CacheGet.Hit(b"value"), len(b"value"))
+    time.sleep(0.02)
+
+    assert near_cache.get("cache", b"short", CacheGet.Hit) is None
+    assert near_cache.get("cache", b"unknown", CacheGet.Hit) is not None
+
+
+def test_evicts_the_least_recently_used_entry_over_max_entries() -> None:
+    near_cache = _near_cache(max_entries=2)
+    near_cache.put("cache", b"a", CacheGet.Hit(b"1"), 1)
+    near_cache.put("cache", b"b", CacheGet.Hit(b"2"), 1)
+    near_cache.get("cache", b"a", CacheGet.Hit)
+    near_cache.put("cache", b"c", CacheGet.Hit(b"3"), 1)
+
+    assert near_cache.get("cache", b"b", CacheGet.Hit) is None
+    assert near_cache.get("cache", b"a", CacheGet.Hit) is not None
+    assert near_cache.get("cache", b"c", CacheGet.Hit) is not None
+    assert near_cache.stats().evictions == 1
+
+
+def test_stays_within_max_size_bytes() -> None:
+    near_cache = _near_cache(max_size_bytes=20)
+    near_cache.put("cache", b"a", CacheGet.Hit(b"x" * 9), 9)
+    near_cache.put("cache", b"b", CacheGet.Hit(b"x" * 9), 9)
+    near_cache.put("cache", b"c", CacheGet.Hit(b"x" * 9), 9)
+    near_cache.put("cache", b"d", CacheGet.Hit(b"x" * 100), 100)
+
+    stats = near_cache.stats()
+    assert stats.entries == 2
+    assert stats.size_bytes == 20
+    assert stats.evictions == 1
+    assert near_cache.get("cache", b"d", CacheGet.Hit) is None
+
+
+def test_invalidate_removes_the_entry() -> None:
+    near_cache = _near_cache()
+    near_cache.put("cache", b"key", CacheGet.Hit(b"value"), len(b"value"))
+    near_cache.invalidate("cache", b"key")
+
+    assert near_cache.get("cache", b"key", CacheGet.Hit) is None
+    assert near_cache.stats().size_bytes == 0
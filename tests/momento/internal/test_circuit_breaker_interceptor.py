@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from datetime import timedelta
+from typing import Callable, List, Optional
+
+import grpc
+import pytest
+from momento.config import CircuitBreakerPolicy
+from momento.config.middleware import CircuitBreakerState
+from momento.errors import CircuitBreakerOpenException
+from momento.internal._utilities._circuit_breaker import _CircuitBreaker
+from momento.internal.synchronous._circuit_breaker_interceptor import CircuitBreakerInterceptor
+
+
+class _FakeCall:
+    """Just enough of a gRPC call-and-future for the interceptor."""
+
+    def __init__(self) -> None:
+        self._future: Future[grpc.StatusCode] = Future()
+
+    def finish(self, code: grpc.StatusCode) -> None:
+        self._future.set_result(code)
+
+    def code(self) -> grpc.StatusCode:
+        return self._future.result()
+
+    def add_done_callback(self, fn: Callable[[_FakeCall], None]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+def _interceptor() -> CircuitBreakerInterceptor:
+    policy = CircuitBreakerPolicy(minimum_requests=2, open_duration=timedelta(minutes=1))
+    return CircuitBreakerInterceptor(_CircuitBreaker(policy, 0, []))
+
+
+def _send(interceptor: CircuitBreakerInterceptor, code: Optional[grpc.StatusCode] = None) -> _FakeCall:
+    call = _FakeCall()
+    if code is not None:
+        call.finish(code)
+    interceptor.intercept_unary_unary(lambda _details, _request: call, object(), "request")
+    return call
+
+
+def test_opens_the_circuit_once_enough_calls_fail_and_then_fails_fast() -> None:
+    interceptor = _interceptor()
+    _send(interceptor, grpc.StatusCode.OK)
+    _send(interceptor, grpc.StatusCode.UNAVAILABLE)
+    assert interceptor._circuit_breaker.state == CircuitBreakerState.OPEN
+
+    continuation_calls: List[object] = []
+    with pytest.raises(CircuitBreakerOpenException):
+        interceptor.intercept_unary_unary(lambda _details, request: continuation_calls.append(request), object(), "r")
+    assert continuation_calls == []
+
+
+def test_records_future_calls_when_they_complete() -> None:
+    interceptor = _interceptor()
+    pending = [_send(interceptor) for _ in range(2)]
+    assert interceptor._circuit_breaker.is_accepting_requests()
+
+    for call in pending:
+        call.finish(grpc.StatusCode.DEADLINE_EXCEEDED)
+    assert interceptor._circuit_breaker.state == CircuitBreakerState.OPEN
+
+
+def test_a_continuation_that_raises_does_not_count_as_a_failure() -> None:
+    interceptor = _interceptor()
+
+    def continuation(_details: object, _request: object) -> _FakeCall:
+        raise RuntimeError("channel closed")
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            interceptor.intercept_unary_unary(continuation, object(), "request")
+    assert interceptor._circuit_breaker.state == CircuitBreakerState.CLOSED
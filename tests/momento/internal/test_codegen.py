@@ -61,6 +61,16 @@ async with slow_func():
             """
 with slow_func():
     pass
+""",
+        ),
+        (
+            """
+async for item in stream():
+    pass
+""",
+            """
+for item in stream():
+    pass
 """,
         ),
     ],
@@ -104,6 +114,16 @@ def ok():
             """
 def ok():
     pass
+""",
+        ),
+        (
+            """
+def stream() -> AsyncIterator[CacheGetResponse]:
+    pass
+""",
+            """
+def stream() -> Iterator[CacheGetResponse]:
+    pass
 """,
         ),
     ],
@@ -0,0 +1,88 @@
+import time
+from datetime import timedelta
+from threading import Lock
+from typing import List, Optional, Tuple, cast
+
+from momento import CacheClient, CounterAggregator
+from momento.requests import CollectionTtl
+from momento.responses import CacheDictionaryIncrement, CacheIncrement
+from momento.responses.response import CacheResponse
+
+
+class FakeClient:
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, Optional[str], bytes, int]] = []
+        # The seconds each increment takes.
+        self.delay = 0.0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = Lock()
+
+    def increment(self, cache_name: str, key: bytes, amount: int = 1, ttl: Optional[timedelta] = None) -> CacheResponse:
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self._in_flight -= 1
+            self.calls.append((cache_name, None, key, amount))
+        return CacheIncrement.Success(amount)
+
+    def dictionary_increment(
+        self, cache_name: str, dictionary_name: str, field: bytes, amount: int = 1, *, ttl: CollectionTtl
+    ) -> CacheResponse:
+        with self._lock:
+            self.calls.append((cache_name, dictionary_name, field, amount))
+        return CacheDictionaryIncrement.Success(amount)
+
+
+def _wait_for_calls(client: FakeClient, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while len(client.calls) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_flushes_sums_on_the_interval() -> None:
+    client = FakeClient()
+    with CounterAggregator(cast(CacheClient, client), flush_interval=timedelta(milliseconds=10)) as counters:
+        counters.increment("cache", "views")
+        counters.increment("cache", "views")
+        counters.dictionary_increment("cache", "counts", "views", 3)
+        _wait_for_calls(client, 2)
+
+        assert sorted(client.calls, key=repr) == [("cache", "counts", b"views", 3), ("cache", None, b"views", 2)]
+        assert counters.get_stats().coalescing_ratio == 1.5
+
+
+def test_flushes_at_the_threshold() -> None:
+    client = FakeClient()
+    with CounterAggregator(cast(CacheClient, client), flush_interval=timedelta(hours=1), flush_threshold=2) as counters:
+        counters.increment("cache", "views")
+        counters.increment("cache", "views")
+        _wait_for_calls(client, 1)
+
+        assert client.calls == [("cache", None, b"views", 2)]
+
+
+def test_close_flushes_pending_sums() -> None:
+    client = FakeClient()
+    counters = CounterAggregator(cast(CacheClient, client), flush_interval=timedelta(hours=1))
+
+    counters.increment("cache", "views", 5)
+    counters.close()
+
+    assert client.calls == [("cache", None, b"views", 5)]
+    assert counters.get_stats().flushes == 1
+
+
+def test_sends_the_requests_of_a_flush_concurrently() -> None:
+    client = FakeClient()
+    client.delay = 0.05
+    counters = CounterAggregator(cast(CacheClient, client), flush_interval=timedelta(hours=1))
+
+    for i in range(4):
+        counters.increment("cache", f"views-{i}")
+    counters.close()
+
+    assert len(client.calls) == 4
+    assert client.max_in_flight > 1
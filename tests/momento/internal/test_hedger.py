@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import time
+from datetime import timedelta
+from typing import Iterator
+
+import grpc
+import pytest
+from momento import Configurations, CredentialProvider
+from momento.config import HedgingPolicy
+from momento.internal.synchronous._hedger import _Hedger
+from momento.internal.synchronous._scs_grpc_manager import _DataGrpcManager
+from momento.internal.synchronous._utilities import make_metadata
+from momento_wire_types import cacheclient_pb2 as cache_pb
+
+from tests.momento.in_memory_scs_server import InMemoryScsServer
+
+
+@pytest.fixture
+def server(in_memory_scs_server: InMemoryScsServer) -> InMemoryScsServer:
+    in_memory_scs_server.items[b"key"] = b"value"
+    return in_memory_scs_server
+
+
+@pytest.fixture
+def hedger(server: InMemoryScsServer) -> Iterator[_Hedger]:
+    grpc_manager = _DataGrpcManager(
+        Configurations.Laptop.latest().with_num_channels(2), CredentialProvider.for_momento_local(port=server.port)
+    )
+    hedger = _Hedger(HedgingPolicy(min_delay=timedelta(milliseconds=50)), grpc_manager)
+    # Enough fast samples that the next Get is hedged after the min delay.
+    for _ in range(100):
+        hedger._state.record("Get", 0.001, hedged=False, hedge_won=False)
+    yield hedger
+    grpc_manager.close()
+
+
+def _get(hedger: _Hedger) -> cache_pb._GetResponse:
+    response: cache_pb._GetResponse = hedger.call(
+        "Get", cache_pb._GetRequest(cache_key=b"key"), make_metadata("cache"), 5
+    )
+    return response
+
+
+def _wait_for_cancellations(server: InMemoryScsServer, method: str, expected: int) -> None:
+    for _ in range(200):
+        if server.cancelled[method] == expected:
+            return
+        time.sleep(0.01)
+    assert server.cancelled[method] == expected
+
+
+def test_does_not_hedge_a_fast_read(hedger: _Hedger, server: InMemoryScsServer) -> None:
+    response = _get(hedger)
+
+    assert response.cache_body == b"value"
+    assert server.calls["Get"] == 1
+    assert hedger.stats().hedges == 0
+
+
+def test_returns_the_hedge_and_cancels_a_slow_first_attempt(hedger: _Hedger, server: InMemoryScsServer) -> None:
+    server.delays["Get"] = [5.0]
+
+    response = _get(hedger)
+
+    assert response.cache_body == b"value"
+    assert server.calls["Get"] == 2
+    stats = hedger.stats()
+    assert (stats.hedges, stats.hedge_wins) == (1, 1)
+    _wait_for_cancellations(server, "Get", 1)
+
+
+def test_waits_for_the_hedge_when_the_first_attempt_fails(hedger: _Hedger, server: InMemoryScsServer) -> None:
+    server.delays["Get"] = [0.2, 0.4]
+    server.failures["Get"] = [grpc.StatusCode.NOT_FOUND]
+
+    response = _get(hedger)
+
+    assert response.cache_body == b"value"
+    assert server.calls["Get"] == 2
+    assert hedger.stats().hedge_wins == 1
+    assert server.cancelled["Get"] == 0
+
+
+def test_raises_when_both_attempts_fail(hedger: _Hedger, server: InMemoryScsServer) -> None:
+    server.delays["Get"] = [0.2]
+    server.failures["Get"] = [grpc.StatusCode.NOT_FOUND, grpc.StatusCode.NOT_FOUND]
+
+    with pytest.raises(grpc.RpcError):
+        _get(hedger)
+    assert server.calls["Get"] == 2
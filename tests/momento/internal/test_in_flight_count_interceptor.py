@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from typing import Callable, List, Optional
+
+import grpc
+import pytest
+from momento.internal.synchronous._in_flight_count_interceptor import InFlightCountInterceptor
+
+
+class _FakeCall:
+    """Just enough of a gRPC call-and-future for the interceptor."""
+
+    def __init__(self) -> None:
+        self._future: Future[str] = Future()
+
+    def finish(self, code: grpc.StatusCode) -> None:
+        if code == grpc.StatusCode.OK:
+            self._future.set_result("response")
+        else:
+            self._future.set_exception(grpc.RpcError(code))
+
+    def result(self, timeout: Optional[float] = None) -> str:
+        return self._future.result(timeout)
+
+    def add_done_callback(self, fn: Callable[[_FakeCall], None]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+def _continuation(calls: List[_FakeCall]) -> Callable[[object, object], _FakeCall]:
+    def continuation(_details: object, _request: object) -> _FakeCall:
+        call = _FakeCall()
+        calls.append(call)
+        return call
+
+    return continuation
+
+
+@pytest.mark.parametrize("code", [grpc.StatusCode.OK, grpc.StatusCode.UNAVAILABLE])
+def test_counts_a_call_until_it_completes(code: grpc.StatusCode) -> None:
+    interceptor = InFlightCountInterceptor()
+    calls: List[_FakeCall] = []
+
+    interceptor.intercept_unary_unary(_continuation(calls), object(), "request")
+    interceptor.intercept_unary_stream(_continuation(calls), object(), "request")
+    assert interceptor.in_flight == 2
+
+    calls[0].finish(code)
+    assert interceptor.in_flight == 1
+    calls[1].finish(code)
+    assert interceptor.in_flight == 0
+
+
+def test_stops_counting_a_call_whose_continuation_raises() -> None:
+    interceptor = InFlightCountInterceptor()
+
+    def continuation(_details: object, _request: object) -> _FakeCall:
+        raise RuntimeError("channel closed")
+
+    with pytest.raises(RuntimeError):
+        interceptor.intercept_unary_unary(continuation, object(), "request")
+    assert interceptor.in_flight == 0
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+import grpc
+import pytest
+from momento import CacheClient, Configurations, CredentialProvider
+from momento.config.transport.transport_strategy import AdaptiveTransportStrategy, StaticGrpcConfiguration
+from momento.internal._utilities._adaptive_deadlines import _AdaptiveDeadlines
+from momento.internal._utilities._retry_token_bucket import _RetryTokenBucket
+from momento.internal.synchronous._retry_interceptor import RetryInterceptor
+from momento.internal.synchronous._utilities import make_metadata
+from momento.responses import CacheGet
+from momento.retry import FixedCountRetryStrategy, RetryableProps, RetryBudget, RetryStrategy
+from momento_wire_types import cacheclient_pb2 as cache_pb
+
+from tests.momento.in_memory_scs_server import SERVER_THREAD_NAME_PREFIX, InMemoryScsServer
+
+GET_METHOD = "/cache_client.Scs/Get"
+
+
+class _FakeCall:
+    """Just enough of a gRPC call-and-future for the interceptor."""
+
+    def __init__(self, code: grpc.StatusCode) -> None:
+        self._code = code
+        self._future: Future[str] = Future()
+
+    def finish(self) -> None:
+        if self._code == grpc.StatusCode.OK:
+            self._future.set_result("response")
+        else:
+            self._future.set_exception(grpc.RpcError(self._code))
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def result(self, timeout: Optional[float] = None) -> str:
+        return self._future.result(timeout)
+
+    def cancel(self) -> bool:
+        return False
+
+    def add_done_callback(self, fn: Callable[[_FakeCall], None]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
+
+class _FakeDetails:
+    method = GET_METHOD
+    timeout = 5.0
+    metadata = None
+    credentials = None
+    wait_for_ready = None
+
+
+class _NeverRetryStrategy(RetryStrategy):
+    def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+        return None
+
+
+class _RetryTwiceStrategy(RetryStrategy):
+    def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+        return 0.01 if props.attempt_number <= 2 else None
+
+    def calculate_retry_deadline(self, overall_deadline: datetime) -> Optional[float]:
+        return None
+
+
+Continuation = Callable[[grpc.ClientCallDetails, object], _FakeCall]
+
+
+def _blocking(continuation: Continuation) -> Continuation:
+    """Names a continuation like the one gRPC makes for a blocking call."""
+    continuation.__qualname__ = "_UnaryUnaryMultiCallable._with_call.<locals>.continuation"
+    return continuation
+
+
+def _future(continuation: Continuation) -> Continuation:
+    """Names a continuation like the one gRPC makes for a `future` call."""
+    continuation.__qualname__ = "_UnaryUnaryMultiCallable.future.<locals>.continuation"
+    return continuation
+
+
+def _continuation(codes: List[grpc.StatusCode], complete_immediately: bool, threads: List[str]) -> Continuation:
+    """A blocking call's continuation if `complete_immediately`, and a `future` call's otherwise."""
+
+    def continuation(_details: object, _request: object) -> _FakeCall:
+        threads.append(threading.current_thread().name)
+        call = _FakeCall(codes.pop(0))
+        if complete_immediately:
+            call.finish()
+        else:
+            threading.Timer(0.01, call.finish).start()
+        return call
+
+    return _blocking(continuation) if complete_immediately else _future(continuation)
+
+
+def test_blocking_calls_retry_on_the_calling_thread() -> None:
+    threads: List[str] = []
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    interceptor = RetryInterceptor(_RetryTwiceStrategy())
+
+    call = interceptor.intercept_unary_unary(_continuation(codes, True, threads), _FakeDetails(), "request")
+
+    assert call.done()
+    assert call.result() == "response"
+    assert call.code() == grpc.StatusCode.OK
+    assert threads == [threading.current_thread().name] * 3
+
+
+def test_future_calls_return_before_the_attempts_complete() -> None:
+    threads: List[str] = []
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    interceptor = RetryInterceptor(_RetryTwiceStrategy())
+
+    call = interceptor.intercept_unary_unary(_continuation(codes, False, threads), _FakeDetails(), "request")
+
+    assert not call.done()
+    done = threading.Event()
+    call.add_done_callback(lambda _: done.set())
+    assert done.wait(timeout=5)
+    assert call.result() == "response"
+    # The delayed retry is sent by the thread shared by all retrying calls.
+    assert threads == [threading.current_thread().name, "momento-retry-scheduler"]
+
+
+def test_future_calls_do_not_wait_for_the_delay_of_an_attempt_that_failed_right_away() -> None:
+    threads: List[str] = []
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+
+    class _RetryLaterStrategy(_RetryTwiceStrategy):
+        def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+            return 0.5
+
+    def continuation(_details: object, _request: object) -> _FakeCall:
+        threads.append(threading.current_thread().name)
+        call = _FakeCall(codes.pop(0))
+        call.finish()
+        return call
+
+    interceptor = RetryInterceptor(_RetryLaterStrategy())
+    start = time.monotonic()
+    call = interceptor.intercept_unary_unary(_future(continuation), _FakeDetails(), "request")
+
+    assert time.monotonic() - start < 0.25
+    assert not call.done()
+    assert call.result(timeout=5) == "response"
+    assert threads == [threading.current_thread().name, "momento-retry-scheduler"]
+
+
+def test_cancelling_a_future_call_waiting_to_retry_completes_it() -> None:
+    class _RetryLaterStrategy(_RetryTwiceStrategy):
+        def determine_when_to_retry(self, props: RetryableProps) -> Optional[float]:
+            return 5.0
+
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    interceptor = RetryInterceptor(_RetryLaterStrategy())
+
+    class _LongDetails(_FakeDetails):
+        timeout = 60.0
+
+    call = interceptor.intercept_unary_unary(_continuation(codes, False, []), _LongDetails(), "request")
+    for _ in range(100):
+        if call._scheduled_retry is not None:
+            break
+        time.sleep(0.01)
+
+    assert call.cancel()
+    assert call.code() == grpc.StatusCode.CANCELLED
+    assert len(codes) == 1
+
+
+def test_completes_with_the_last_failure_when_not_retried() -> None:
+    codes = [grpc.StatusCode.UNAVAILABLE] * 3
+    interceptor = RetryInterceptor(_RetryTwiceStrategy())
+
+    call = interceptor.intercept_unary_unary(_continuation(codes, True, []), _FakeDetails(), "request")
+
+    assert call.code() == grpc.StatusCode.UNAVAILABLE
+    with pytest.raises(grpc.RpcError):
+        call.result(timeout=5)
+
+
+def test_resends_an_attempt_abandoned_at_its_adaptive_deadline() -> None:
+    transport_strategy = AdaptiveTransportStrategy(
+        StaticGrpcConfiguration(deadline=timedelta(seconds=5)), min_deadline=timedelta(milliseconds=1)
+    )
+    adaptive_deadlines = _AdaptiveDeadlines(transport_strategy)
+    for _ in range(100):
+        adaptive_deadlines.record(GET_METHOD, grpc.StatusCode.OK, 0.010)
+    codes = [grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.OK]
+    timeouts: List[float] = []
+
+    def continuation(details: grpc.ClientCallDetails, _request: object) -> _FakeCall:
+        timeouts.append(details.timeout)
+        call = _FakeCall(codes.pop(0))
+        call.finish()
+        return call
+
+    interceptor = RetryInterceptor(_NeverRetryStrategy(), adaptive_deadlines=adaptive_deadlines)
+    call = interceptor.intercept_unary_unary(_blocking(continuation), _FakeDetails(), "request")
+
+    assert call.result(timeout=5) == "response"
+    assert len(timeouts) == 2
+    assert 0.020 <= timeouts[0] <= 0.023
+    assert 4.9 <= timeouts[1] <= 5.0
+
+
+def test_resends_spend_the_retry_budget() -> None:
+    transport_strategy = AdaptiveTransportStrategy(
+        StaticGrpcConfiguration(deadline=timedelta(seconds=5)), min_deadline=timedelta(milliseconds=1)
+    )
+    adaptive_deadlines = _AdaptiveDeadlines(transport_strategy)
+    for _ in range(100):
+        adaptive_deadlines.record(GET_METHOD, grpc.StatusCode.OK, 0.010)
+    retry_token_bucket = _RetryTokenBucket(RetryBudget(retry_ratio=0.1, max_tokens=1))
+    codes = [grpc.StatusCode.DEADLINE_EXCEEDED, grpc.StatusCode.OK, grpc.StatusCode.DEADLINE_EXCEEDED]
+    interceptor = RetryInterceptor(_NeverRetryStrategy(), retry_token_bucket, adaptive_deadlines)
+
+    call = interceptor.intercept_unary_unary(_continuation(codes, True, []), _FakeDetails(), "request")
+    assert call.result(timeout=5) == "response"
+
+    # The first re-send spent the only token, so the next abandoned attempt is not sent again.
+    call = interceptor.intercept_unary_unary(_continuation(codes, True, []), _FakeDetails(), "request")
+    assert call.code() == grpc.StatusCode.DEADLINE_EXCEEDED
+    assert codes == []
+
+
+def test_retries_only_get_the_rest_of_the_overall_deadline() -> None:
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    timeouts: List[Optional[float]] = []
+
+    def continuation(details: grpc.ClientCallDetails, _request: object) -> _FakeCall:
+        timeouts.append(details.timeout)
+        call = _FakeCall(codes.pop(0))
+        call.finish()
+        return call
+
+    interceptor = RetryInterceptor(_RetryTwiceStrategy())
+    call = interceptor.intercept_unary_unary(_blocking(continuation), _FakeDetails(), "request")
+
+    assert call.result(timeout=5) == "response"
+    assert timeouts[0] == 5.0
+    assert all(timeout is not None and timeout < 5.0 for timeout in timeouts[1:])
+
+
+def test_does_not_retry_when_the_delay_would_pass_the_overall_deadline() -> None:
+    class _ShortDetails(_FakeDetails):
+        timeout = 0.005
+
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    interceptor = RetryInterceptor(_RetryTwiceStrategy())
+
+    call = interceptor.intercept_unary_unary(_continuation(codes, True, []), _ShortDetails(), "request")
+
+    assert call.code() == grpc.StatusCode.UNAVAILABLE
+    assert len(codes) == 1
+
+
+def _retrying_client(server: InMemoryScsServer) -> CacheClient:
+    configuration = Configurations.Laptop.latest().with_retry_strategy(FixedCountRetryStrategy(max_attempts=3))
+    return CacheClient(configuration, CredentialProvider.for_momento_local(port=server.port), timedelta(minutes=1))
+
+
+def test_retries_blocking_calls_over_a_real_channel_without_starting_threads(
+    in_memory_scs_server: InMemoryScsServer,
+) -> None:
+    in_memory_scs_server.items[b"key"] = b"value"
+    with _retrying_client(in_memory_scs_server) as client:
+        assert isinstance(client.get("cache", "key"), CacheGet.Hit)
+        threads_before = set(threading.enumerate())
+
+        for _ in range(10):
+            in_memory_scs_server.failures["Get"] = [grpc.StatusCode.UNAVAILABLE] * 2
+            get_resp = client.get("cache", "key")
+            assert isinstance(get_resp, CacheGet.Hit)
+            assert get_resp.value_string == "value"
+
+        assert in_memory_scs_server.calls["Get"] == 31
+        started_threads = set(threading.enumerate()) - threads_before
+        assert [thread for thread in started_threads if not thread.name.startswith(SERVER_THREAD_NAME_PREFIX)] == []
+
+
+def test_retries_future_calls_over_a_real_channel(in_memory_scs_server: InMemoryScsServer) -> None:
+    in_memory_scs_server.items[b"key"] = b"value"
+    in_memory_scs_server.failures["Get"] = [grpc.StatusCode.UNAVAILABLE] * 2
+    with _retrying_client(in_memory_scs_server) as client:
+        stub = client._data_client._grpc_manager.stub()
+        future = stub.Get.future(cache_pb._GetRequest(cache_key=b"key"), metadata=make_metadata("cache"), timeout=5)
+
+        assert future.result(timeout=5).cache_body == b"value"
+        assert in_memory_scs_server.calls["Get"] == 3
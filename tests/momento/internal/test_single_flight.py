@@ -0,0 +1,51 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+
+from momento.internal.synchronous._single_flight import _SingleFlight
+
+
+def test_concurrent_calls_with_the_same_key_share_one_execution() -> None:
+    single_flight = _SingleFlight()
+    executions = 0
+    release = Event()
+
+    def work() -> object:
+        nonlocal executions
+        executions += 1
+        release.wait(timeout=5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        calls = [pool.submit(single_flight.do, "key", work) for _ in range(5)]
+        while single_flight.coalesced_count < 4:
+            pass
+        release.set()
+        results = [call.result() for call in calls]
+
+    assert executions == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_calls_after_completion_run_again() -> None:
+    single_flight = _SingleFlight()
+
+    first = single_flight.do("key", object)
+    second = single_flight.do("key", object)
+
+    assert first is not second
+    assert single_flight.coalesced_count == 0
+
+
+def test_failures_are_shared_and_forgotten() -> None:
+    single_flight = _SingleFlight()
+
+    def work() -> str:
+        raise ValueError("boom")
+
+    for _ in range(2):
+        try:
+            single_flight.do("key", work)
+        except ValueError as e:
+            assert str(e) == "boom"
+        else:
+            raise AssertionError("expected the failure to propagate")
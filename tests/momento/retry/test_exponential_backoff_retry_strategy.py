@@ -0,0 +1,39 @@
+from typing import Optional
+
+import grpc
+from momento.retry import ExponentialBackoffRetryStrategy, RetryableProps
+
+GET_METHOD = "/cache_client.Scs/Get"
+
+
+def _props(attempt_number: int, previous_retry_delay: Optional[float] = None) -> RetryableProps:
+    return RetryableProps(grpc.StatusCode.UNAVAILABLE, GET_METHOD, attempt_number, None, previous_retry_delay)
+
+
+def test_delays_grow_with_decorrelated_jitter_up_to_the_max() -> None:
+    strategy = ExponentialBackoffRetryStrategy(max_attempts=100, initial_delay_millis=100, max_delay_millis=1000)
+
+    first = strategy.determine_when_to_retry(_props(1))
+    assert first is not None
+    assert 0.1 <= first <= 0.3
+
+    previous = 0.5
+    for attempt_number in range(2, 50):
+        delay = strategy.determine_when_to_retry(_props(attempt_number, previous))
+        assert delay is not None
+        assert 0.1 <= delay <= min(1.0, previous * 3)
+        previous = delay
+
+
+def test_stops_after_max_attempts() -> None:
+    strategy = ExponentialBackoffRetryStrategy(max_attempts=2)
+
+    assert strategy.determine_when_to_retry(_props(2, 0.05)) is not None
+    assert strategy.determine_when_to_retry(_props(3, 0.05)) is None
+
+
+def test_does_not_retry_ineligible_requests() -> None:
+    strategy = ExponentialBackoffRetryStrategy()
+    props = RetryableProps(grpc.StatusCode.UNAVAILABLE, "/cache_client.Scs/Increment", 1)
+
+    assert strategy.determine_when_to_retry(props) is None
@@ -0,0 +1,14 @@
+from datetime import datetime, timedelta
+
+from momento.retry.fixed_timeout_retry_strategy import FixedTimeoutRetryStrategy
+
+
+def test_retry_deadline_is_the_retry_timeout_in_seconds() -> None:
+    strategy = FixedTimeoutRetryStrategy(retry_timeout_millis=500, retry_delay_interval_millis=10)
+    assert strategy.calculate_retry_deadline(datetime.now() + timedelta(seconds=5)) == 0.5
+
+
+def test_retry_deadline_is_clipped_to_the_overall_deadline() -> None:
+    strategy = FixedTimeoutRetryStrategy(retry_timeout_millis=500, retry_delay_interval_millis=10)
+    retry_deadline = strategy.calculate_retry_deadline(datetime.now() + timedelta(milliseconds=200))
+    assert retry_deadline is not None and 0.1 < retry_deadline <= 0.2
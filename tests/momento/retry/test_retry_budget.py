@@ -0,0 +1,35 @@
+import pytest
+from momento.errors import InvalidArgumentException
+from momento.internal._utilities._retry_token_bucket import _RetryTokenBucket
+from momento.retry import RetryBudget
+
+
+def test_retries_are_capped_by_the_tokens_earned_by_requests() -> None:
+    bucket = _RetryTokenBucket(RetryBudget(retry_ratio=0.5, max_tokens=2))
+
+    # The bucket starts full.
+    assert bucket.try_acquire_retry()
+    assert bucket.try_acquire_retry()
+    assert not bucket.try_acquire_retry()
+
+    bucket.record_request()
+    assert not bucket.try_acquire_retry()
+    bucket.record_request()
+    assert bucket.try_acquire_retry()
+    assert not bucket.try_acquire_retry()
+
+
+def test_tokens_do_not_accumulate_past_max_tokens() -> None:
+    bucket = _RetryTokenBucket(RetryBudget(retry_ratio=1, max_tokens=1))
+    for _ in range(10):
+        bucket.record_request()
+
+    assert bucket.try_acquire_retry()
+    assert not bucket.try_acquire_retry()
+
+
+def test_budget_validates_its_arguments() -> None:
+    with pytest.raises(InvalidArgumentException, match="Retry ratio must be positive."):
+        RetryBudget(retry_ratio=0)
+    with pytest.raises(InvalidArgumentException, match="Max tokens must be at least 1."):
+        RetryBudget(max_tokens=0.5)
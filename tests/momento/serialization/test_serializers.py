@@ -0,0 +1,107 @@
+import pickle
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Dict
+
+import pytest
+from momento import CacheClient, Configurations, CredentialProvider
+from momento.errors import MomentoErrorCode, SerializationException
+from momento.internal._utilities import _deserialize, _serialize
+from momento.responses import CacheDictionaryFetchObjects, CacheListConcatenateBack, CacheSet
+from momento.serialization import JsonSerializer, MsgpackSerializer, PickleSerializer, Serializer
+
+from tests.momento.in_memory_scs_server import InMemoryScsServer
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _point_hook(obj: Dict[str, object]) -> object:
+    return _Point(**obj) if obj.keys() == {"x", "y"} else obj  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("serializer", [JsonSerializer(), PickleSerializer()])
+def test_serializers_round_trip_common_values(serializer: Serializer) -> None:
+    value = {"name": "momento", "tags": ["a", "b"], "count": 3, "ratio": 0.5, "missing": None}
+    assert serializer.deserialize(serializer.serialize(value)) == value
+
+
+def test_json_serializer_writes_dataclasses_as_objects() -> None:
+    serializer = JsonSerializer(object_hook=_point_hook)
+    data = serializer.serialize(_Point(1, 2))
+    assert data == b'{"x":1,"y":2}'
+    assert serializer.deserialize(data) == _Point(1, 2)
+
+
+def test_json_serializer_writes_equal_dicts_as_equal_bytes() -> None:
+    serializer = JsonSerializer()
+    assert serializer.serialize({"a": 1, "b": 2}) == serializer.serialize({"b": 2, "a": 1})
+
+
+def test_json_serializer_uses_the_default_for_unsupported_values() -> None:
+    with pytest.raises(TypeError):
+        JsonSerializer().serialize(timedelta(seconds=1))
+    assert JsonSerializer(default=str).serialize(timedelta(seconds=1)) == b'"0:00:01"'
+
+
+def test_pickle_serializer_round_trips_dataclasses_with_the_given_protocol() -> None:
+    data = PickleSerializer(protocol=2).serialize(_Point(1, 2))
+    assert data[1] == 2
+    assert PickleSerializer().deserialize(data) == _Point(1, 2)
+    assert pickle.loads(data) == _Point(1, 2)
+
+
+def test_msgpack_serializer_round_trips_or_explains_how_to_install_msgpack() -> None:
+    try:
+        serializer = MsgpackSerializer()
+    except ImportError as e:
+        assert "pip install msgpack" in str(e)
+        return
+    assert serializer.deserialize(serializer.serialize({"point": _Point(1, 2)})) == {"point": {"x": 1, "y": 2}}
+
+
+def test_serialization_failures_raise_serialization_exceptions() -> None:
+    with pytest.raises(SerializationException) as e:
+        _serialize(JsonSerializer(), object())
+    assert e.value.error_code == MomentoErrorCode.SERIALIZATION_ERROR
+    assert "JsonSerializer could not serialize a value of type object" in e.value.message
+
+    with pytest.raises(SerializationException) as e:
+        _deserialize(JsonSerializer(), b"not json")
+    assert "could not deserialize 8 bytes" in e.value.message
+
+
+def test_client_returns_an_error_without_sending_values_it_cannot_serialize() -> None:
+    with CacheClient(
+        Configurations.Laptop.latest(), CredentialProvider.for_momento_local(), timedelta(seconds=60)
+    ) as client:
+        set_response = client.set_object("cache", "key", object())
+        assert isinstance(set_response, CacheSet.Error)
+        assert set_response.error_code == MomentoErrorCode.SERIALIZATION_ERROR
+
+        concatenate_response = client.list_concatenate_back_objects("cache", "list", [1, object()])
+        assert isinstance(concatenate_response, CacheListConcatenateBack.Error)
+        assert concatenate_response.error_code == MomentoErrorCode.SERIALIZATION_ERROR
+
+
+def test_client_returns_an_error_for_dictionary_fields_that_are_not_utf8(
+    in_memory_scs_server: InMemoryScsServer,
+) -> None:
+    in_memory_scs_server.dictionaries[b"dictionary"] = {b"name": b'"momento"', b"\xff": b"1"}
+    with CacheClient(
+        Configurations.Laptop.latest(),
+        CredentialProvider.for_momento_local(port=in_memory_scs_server.port),
+        timedelta(seconds=60),
+    ) as client:
+        fetch_response = client.dictionary_fetch_objects("cache", "dictionary")
+        assert isinstance(fetch_response, CacheDictionaryFetchObjects.Error)
+        assert fetch_response.error_code == MomentoErrorCode.SERIALIZATION_ERROR
+        assert "b'\\xff' is not valid utf-8" in fetch_response.message
+
+        del in_memory_scs_server.dictionaries[b"dictionary"][b"\xff"]
+        fetch_response = client.dictionary_fetch_objects("cache", "dictionary")
+        assert isinstance(fetch_response, CacheDictionaryFetchObjects.Hit)
+        assert fetch_response.value_dictionary == {"name": "momento"}